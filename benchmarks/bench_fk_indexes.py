@@ -0,0 +1,177 @@
+"""
+Benchmark de búsquedas de repositorio por clave foránea, con y sin sus índices.
+
+Carga el dataset sintético (escala `large` por defecto), ejecuta cada búsqueda con
+IDs aleatorios sin los índices de clave foránea ("before") y después de crearlos
+("after"), y emite un informe JSON con percentiles por búsqueda. Las búsquedas se
+hacen sin tenant, como las tareas programadas: los índices compuestos que empiezan
+por `tenant_id` no sirven aquí.
+
+Los índices medidos son los que `python -m src.db.index_audit` detectó sin cubrir.
+
+Uso:
+    python -m benchmarks.bench_fk_indexes --database-url sqlite+aiosqlite:///./big.db --scale large
+    # Reutilizando un dataset ya generado con benchmarks.dataset
+    python -m benchmarks.bench_fk_indexes --database-url sqlite+aiosqlite:///./big.db --manifest big-manifest.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from benchmarks.dataset import add_scale_arguments, scale_from_args, seed_dataset
+from benchmarks.report import PERCENTILES, percentile, write_report
+
+
+class Lookup(NamedTuple):
+    name: str
+    # Índice que sirve la búsqueda
+    table: str
+    column: str
+    # Tabla de la que se toman los IDs buscados (rango del manifiesto)
+    ids_from: str
+    call: Callable[[AsyncSession, int], Awaitable[Any]]
+
+
+def _lookups() -> List[Lookup]:
+    # Importación diferida: los repositorios leen la configuración al importarse
+    from src.db.repositories.base_repository import BaseRepository
+    from src.db.repositories.game_instance_repository import GameInstanceRepository
+    from src.db.repositories.level_repository import LevelRepository
+    from src.db.repositories.segment_level_repository import SegmentLevelRepository
+    from src.models import Feedback, GameInstance, Progress, SyncSession, TeacherSettings
+
+    def by(model, column: str):
+        return lambda db, value: BaseRepository(db, model).get_by_filters({column: value})
+
+    return [
+        Lookup("LevelRepository.get_by_game_id", "levels", "game_id", "games",
+               lambda db, value: LevelRepository(db).get_by_game_id(value)),
+        Lookup("SegmentLevelRepository.get_by_level_id", "segment_levels", "level_number_id", "levels",
+               lambda db, value: SegmentLevelRepository(db).get_by_level_id(value)),
+        Lookup("GameInstanceRepository.get_by_game_id", "game_instances", "game_id", "games",
+               lambda db, value: GameInstanceRepository(db).get_by_game_id(value)),
+        Lookup("GameInstance.get_by_filters(student_id)", "game_instances", "student_id", "students",
+               by(GameInstance, "student_id")),
+        Lookup("Progress.get_by_filters(segment_level_id)", "progresses", "segment_level_id", "segment_levels",
+               by(Progress, "segment_level_id")),
+        Lookup("SyncSession.get_by_filters(instance_id)", "sync_sessions", "instance_id", "game_instances",
+               by(SyncSession, "instance_id")),
+        Lookup("Feedback.get_by_filters(student_id)", "feedbacks", "student_id", "students",
+               by(Feedback, "student_id")),
+        Lookup("TeacherSettings.get_by_filters(user_id)", "teacher_settings", "user_id", "teacher_settings_users",
+               by(TeacherSettings, "user_id")),
+    ]
+
+
+def _summary(latencies: List[float]) -> Dict[str, Any]:
+    values = sorted(latencies)
+    summary = {f"p{pct}_ms": round(percentile(values, pct) * 1000, 3) for pct in PERCENTILES}
+    summary["mean_ms"] = round(sum(values) / len(values) * 1000, 3) if values else 0.0
+    return summary
+
+
+async def _set_indexes(engine, lookups: List[Lookup], present: bool) -> None:
+    from src.db.base import Base
+
+    async with engine.begin() as conn:
+        for lookup in lookups:
+            name = f"ix_{lookup.table}_{lookup.column}"
+            await conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+            if present:
+                index = next(index for index in Base.metadata.tables[lookup.table].indexes if index.name == name)
+                await conn.run_sync(lambda sync_conn: index.create(sync_conn))
+        if engine.dialect.name == "sqlite":
+            await conn.execute(text("ANALYZE"))
+
+
+async def _measure(sessions, lookup: Lookup, ids: List[int], iterations: int, rng: random.Random) -> List[float]:
+    latencies = []
+    async with sessions() as db:
+        for _ in range(iterations):
+            value = rng.choice(ids)
+            started = time.perf_counter()
+            await lookup.call(db, value)
+            latencies.append(time.perf_counter() - started)
+            # Sin identity map caliente entre iteraciones
+            db.expunge_all()
+    return latencies
+
+
+def _id_pool(manifest: Dict[str, Any], table: str, limit: int = 10_000) -> List[int]:
+    if table == "teacher_settings_users":
+        # Los ajustes de profesor pertenecen a los últimos usuarios (los profesores)
+        first, last = manifest["id_ranges"]["users"]
+        count = manifest["counts"]["teacher_settings"]
+        first = last - count + 1
+    else:
+        first, last = manifest["id_ranges"][table]
+    return list(range(first, last + 1))[:limit]
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    if args.manifest:
+        with open(args.manifest, encoding="utf-8") as fh:
+            manifest = json.load(fh)
+    else:
+        manifest = await seed_dataset(args.database_url, scale_from_args(args), args.seed, args.chunk_size)
+
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+    os.environ.setdefault("DATABASE_ECHO", "false")
+
+    lookups = _lookups()
+    engine = create_async_engine(args.database_url)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    results: Dict[str, Dict[str, Any]] = {lookup.name: {"index": f"ix_{lookup.table}_{lookup.column}"} for lookup in lookups}
+    try:
+        for phase, present in (("before", False), ("after", True)):
+            await _set_indexes(engine, lookups, present)
+            for lookup in lookups:
+                rng = random.Random(f"{args.seed}:{lookup.name}")
+                ids = _id_pool(manifest, lookup.ids_from)
+                # Calentamiento: caché de páginas y sentencias compiladas
+                await _measure(sessions, lookup, ids, min(args.iterations, 10), rng)
+                results[lookup.name][phase] = _summary(await _measure(sessions, lookup, ids, args.iterations, rng))
+    finally:
+        await engine.dispose()
+
+    for result in results.values():
+        before, after = result["before"]["mean_ms"], result["after"]["mean_ms"]
+        result["speedup"] = round(before / after, 1) if after else None
+    return {
+        "scale": manifest.get("scale"),
+        "counts": manifest.get("counts"),
+        "iterations": args.iterations,
+        "lookups": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--manifest", default=None)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--output", default=None)
+    add_scale_arguments(parser)
+    parser.set_defaults(scale="large")
+    args = parser.parse_args()
+
+    if args.database_url:
+        report = asyncio.run(run(args))
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            args.database_url = f"sqlite+aiosqlite:///{tmp}/fk-indexes.db"
+            report = asyncio.run(run(args))
+    write_report(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
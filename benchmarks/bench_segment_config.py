@@ -0,0 +1,130 @@
+"""
+Benchmark de lectura de configuraciones de segmento.
+
+Compara, por petición, el camino anterior (parsear el JSON almacenado, validarlo y
+volver a serializarlo en la respuesta) con el cuerpo real de GET /segments/{id}/config:
+búsqueda en la instantánea del catálogo, ETag del contenido y construcción del
+`Response` con los bytes precompilados al guardar el segmento. Ambos caminos terminan
+en una respuesta HTTP lista para enviarse; no se incluyen la autenticación ni el
+resto de dependencias, comunes a los dos.
+
+Uso:
+    python -m benchmarks.bench_segment_config --iterations 20000
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+SAMPLE_CONFIGS = [
+    {"type": "instruction", "content": "Las variables guardan valores.", "duration": 300},
+    {
+        "type": "exercise",
+        "complexity": "medium",
+        "expected_time": 600,
+        "hints": ["Usa un bucle for", "Recuerda inicializar el acumulador"],
+        "starter_code": "def suma(lista):\n    pass\n",
+        "properties": {"grid": [[0, 1, 0], [1, 0, 1]], "tiles": list(range(50))},
+    },
+    {"type": "evaluation", "questions": 10, "passing_score": 70, "time_limit": 900},
+]
+
+
+class _StaticCatalog:
+    """Sustituye a CatalogService: entrega siempre la misma instantánea, como un acierto de caché."""
+
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+
+    async def get_snapshot(self):
+        return self.snapshot
+
+
+def _build_snapshot():
+    from src.services.catalog_service import CatalogSnapshot
+    from src.services.segment_config_registry import segment_config_registry
+
+    segments = [
+        {"id": segment_id, "level_id": 1, "segment_type": config["type"], "config": config}
+        for segment_id, config in enumerate(SAMPLE_CONFIGS, start=1)
+    ]
+    compiled = {segment["id"]: segment_config_registry.compile(segment["config"]).payload for segment in segments}
+    return CatalogSnapshot(1, [], [], segments, compiled)
+
+
+def _per_request_endpoint(stored: Dict[int, str]) -> Callable[[int], Awaitable[Any]]:
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.responses import JSONResponse
+
+    from src.services.segment_config_registry import segment_config_registry
+
+    async def get_segment_config(segment_id: int):
+        # Columna JSON leída como texto, validada y devuelta como dict (serialización de FastAPI)
+        config = json.loads(stored[segment_id])
+        compiled = segment_config_registry.compile(config)
+        return JSONResponse(content=jsonable_encoder(compiled.normalized))
+
+    return get_segment_config
+
+
+def _precompiled_endpoint(snapshot) -> Callable[[int], Awaitable[Any]]:
+    from src.api.v1.endpoints.segment_level import get_segment_config
+
+    catalog = _StaticCatalog(snapshot)
+
+    async def call(segment_id: int):
+        return await get_segment_config(segment_id, token_data=None, if_none_match=None, catalog=catalog)
+
+    return call
+
+
+async def _measure(endpoint: Callable[[int], Awaitable[Any]], segment_ids: List[int], iterations: int) -> float:
+    start = time.perf_counter()
+    for i in range(iterations):
+        response = await endpoint(segment_ids[i % len(segment_ids)])
+        assert response.status_code == 200 and response.body
+    return time.perf_counter() - start
+
+
+async def _run(iterations: int) -> Dict[str, Any]:
+    snapshot = _build_snapshot()
+    stored = {
+        segment["id"]: json.dumps(segment["config"])
+        for segments in snapshot.segments_by_level.values()
+        for segment in segments
+    }
+    segment_ids = sorted(stored)
+
+    per_request = _per_request_endpoint(stored)
+    precompiled = _precompiled_endpoint(snapshot)
+    # Calentamiento: importaciones diferidas y cachés de pydantic
+    await _measure(per_request, segment_ids, len(segment_ids))
+    await _measure(precompiled, segment_ids, len(segment_ids))
+
+    per_request_seconds = await _measure(per_request, segment_ids, iterations)
+    precompiled_seconds = await _measure(precompiled, segment_ids, iterations)
+    return {
+        "benchmark": "segment_config_read",
+        "iterations": iterations,
+        "per_request_us": round(per_request_seconds / iterations * 1e6, 3),
+        "precompiled_us": round(precompiled_seconds / iterations * 1e6, 3),
+        "speedup": round(per_request_seconds / precompiled_seconds, 1) if precompiled_seconds else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    # La configuración se lee al importar los endpoints
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+    os.environ.setdefault("DATABASE_ECHO", "false")
+
+    print(json.dumps(asyncio.run(_run(args.iterations)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
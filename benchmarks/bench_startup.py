@@ -0,0 +1,106 @@
+"""
+Benchmark de arranque en frío por worker.
+
+Lanza N procesos a la vez (como uvicorn/gunicorn con N workers) que importan la
+aplicación y ejecutan su evento de startup contra la misma base de datos, y mide en
+cada uno el tiempo de importación y de arranque. Se ejecuta dos veces: con la base de
+datos vacía (primer despliegue) y con la base de datos ya preparada (reinicio).
+
+Uso:
+    python -m benchmarks.bench_startup --workers 8 --mode migrate
+    python -m benchmarks.bench_startup --workers 8 --mode create_all
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def _worker() -> None:
+    started = time.perf_counter()
+    from main import app
+    imported = time.perf_counter()
+
+    async def startup() -> float:
+        begin = time.perf_counter()
+        await app.router.startup()
+        elapsed = time.perf_counter() - begin
+        await app.router.shutdown()
+        return elapsed
+
+    startup_seconds = asyncio.run(startup())
+    print(json.dumps({
+        "pid": os.getpid(),
+        "import_ms": round((imported - started) * 1000, 1),
+        "startup_ms": round(startup_seconds * 1000, 1),
+    }))
+
+
+def _launch(workers: int, env: dict) -> dict:
+    processes = [
+        subprocess.Popen(
+            [sys.executable, "-m", "benchmarks.bench_startup", "--worker"],
+            env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+        )
+        for _ in range(workers)
+    ]
+    results, failures = [], []
+    for process in processes:
+        stdout, stderr = process.communicate()
+        if process.returncode == 0 and stdout.strip():
+            results.append(json.loads(stdout.strip().splitlines()[-1]))
+        else:
+            errors = [line for line in stderr.splitlines() if "Error" in line or "Exception" in line]
+            failures.append(errors[-1].strip() if errors else f"exit {process.returncode}")
+
+    startup = sorted(result["startup_ms"] for result in results)
+    imports = sorted(result["import_ms"] for result in results)
+    return {
+        "ok": len(results),
+        "failed": len(failures),
+        "failures": sorted(set(failures)),
+        "startup_ms": {
+            "median": statistics.median(startup) if startup else None,
+            "max": startup[-1] if startup else None,
+        },
+        "import_ms": {"median": statistics.median(imports) if imports else None},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--mode", default="migrate", help="STARTUP_SCHEMA_MODE a medir")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        _worker()
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {
+            **os.environ,
+            "DATABASE_URL": f"sqlite+aiosqlite:///{tmp}/startup.db",
+            "SECRET_KEY": os.environ.get("SECRET_KEY", "benchmark-secret-key"),
+            "DATABASE_ECHO": "false",
+            "STARTUP_SCHEMA_MODE": args.mode,
+            "SCHEDULER_ENABLED": "false",
+            "LOOP_WATCHDOG_ENABLED": "false",
+        }
+        report = {
+            "mode": args.mode,
+            "workers": args.workers,
+            "fresh_database": _launch(args.workers, env),
+            "ready_database": _launch(args.workers, env),
+        }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
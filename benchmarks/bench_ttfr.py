@@ -0,0 +1,107 @@
+"""
+Benchmark de tiempo hasta la primera respuesta (TTFR).
+
+Arranca uvicorn en un proceso nuevo y mide, desde el lanzamiento, cuánto tarda en
+responder la primera petición a `--path` y después la primera petición autenticada
+(login + endpoint protegido), que es la que paga la carga perezosa de JWT y bcrypt.
+La base de datos se migra en una ejecución previa que no se mide y se carga con el
+dataset sintético pequeño para disponer de un usuario real.
+
+Uso:
+    python -m benchmarks.bench_ttfr --runs 5
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Optional
+
+import httpx
+
+from src.db.seed.synthetic import SCALES, seed_dataset
+
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _measure(env: dict, path: str, timeout: float, credentials: Optional[dict] = None) -> dict:
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        with httpx.Client(base_url=base_url, timeout=timeout) as client:
+            deadline = started + timeout
+            while True:
+                try:
+                    response = client.get(path)
+                    break
+                except httpx.TransportError:
+                    if time.perf_counter() > deadline or process.poll() is not None:
+                        raise RuntimeError("El servidor no respondió")
+                    time.sleep(0.005)
+            first = time.perf_counter() - started
+
+            if credentials is None:
+                return {"ttfr_ms": round(first * 1000, 1), "status": response.status_code}
+            begin = time.perf_counter()
+            login = client.post("/api/v1/auth/login", json=credentials)
+            token = login.json().get("access_token") if login.status_code == 200 else None
+            protected = client.get("/api/v1/games/", headers={"Authorization": f"Bearer {token}"})
+            authenticated = time.perf_counter() - begin
+        return {
+            "ttfr_ms": round(first * 1000, 1),
+            "status": response.status_code,
+            "first_authenticated_ms": round(authenticated * 1000, 1),
+            "auth_status": [login.status_code, protected.status_code],
+        }
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--path", default="/")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {
+            **os.environ,
+            "DATABASE_URL": f"sqlite+aiosqlite:///{tmp}/ttfr.db",
+            "SECRET_KEY": os.environ.get("SECRET_KEY", "benchmark-secret-key"),
+            "DATABASE_ECHO": "false",
+        }
+        # Ejecución previa sin medir: migra la base de datos; después se carga el dataset pequeño
+        _measure(env, args.path, args.timeout)
+        manifest = asyncio.run(seed_dataset(env["DATABASE_URL"], SCALES["small"]))
+        credentials = {**manifest["students"][0], "password": manifest["password"]}
+        runs = [_measure(env, args.path, args.timeout, credentials) for _ in range(args.runs)]
+
+    print(json.dumps({
+        "runs": runs,
+        "ttfr_ms": {
+            "median": statistics.median(run["ttfr_ms"] for run in runs),
+            "min": min(run["ttfr_ms"] for run in runs),
+        },
+        "first_authenticated_ms": {"median": statistics.median(run["first_authenticated_ms"] for run in runs)},
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+"""
+Dataset sintético para benchmarks.
+
+Delegado en `src.db.seed.synthetic`, que genera datos para todos los modelos; se
+mantiene este punto de entrada para los scripts de benchmark.
+
+Uso:
+    python -m benchmarks.dataset --database-url sqlite+aiosqlite:///./bench.db \\
+        --scale medium --manifest bench-manifest.json
+"""
+from src.db.seed.synthetic import (  # noqa: F401
+    PASSWORD,
+    SCALES,
+    DatasetScale,
+    add_scale_arguments,
+    main,
+    resolve_scale,
+    scale_from_args,
+    seed_dataset,
+)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Informe de tiempo de importación de la aplicación.
+
+Ejecuta `python -X importtime -c "import main"` en un proceso limpio y agrega el
+resultado: tiempo acumulado de los paquetes importados directamente por el código
+de la aplicación, tiempo propio por paquete y los módulos de `src` más costosos.
+
+Uso:
+    python -m benchmarks.import_report
+    python -m benchmarks.import_report --module src.core.security --top 15 --json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
+
+Entry = Tuple[int, int, int, str]  # (nivel, propio µs, acumulado µs, módulo)
+
+
+def collect(module: str) -> List[Entry]:
+    env = {**os.environ, "SECRET_KEY": os.environ.get("SECRET_KEY", "import-report")}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise SystemExit(result.stderr)
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        # La indentación del nombre indica la profundidad en el árbol de importación
+        level = (len(name) - len(name.lstrip())) // 2
+        entries.append((level, int(own), int(cumulative), name.strip()))
+    return entries
+
+
+def build_report(entries: List[Entry], top: int) -> Dict[str, Any]:
+    own_by_package: Dict[str, int] = defaultdict(int)
+    for _, own, _, name in entries:
+        own_by_package[name.split(".")[0]] += own
+
+    # Coste de cada dependencia la primera vez que la importa un módulo de src
+    first_party: Dict[str, int] = {}
+    parents: List[str] = []
+    for level, _, cumulative, name in reversed(entries):
+        del parents[level:]
+        parents.append(name)
+        root = name.split(".")[0]
+        if root not in ("src", "main") and level > 0 and parents[level - 1].split(".")[0] in ("src", "main"):
+            first_party[root] = first_party.get(root, 0) + cumulative
+
+    src_modules = sorted(
+        ((own, name) for _, own, _, name in entries if name.startswith("src.") or name == "main"),
+        reverse=True,
+    )
+    total = max((cumulative for level, _, cumulative, _ in entries if level == 0), default=0)
+    return {
+        "total_ms": round(total / 1000, 1),
+        "modules": len(entries),
+        "dependencies_imported_by_app_ms": {
+            name: round(us / 1000, 1) for name, us in sorted(first_party.items(), key=lambda kv: -kv[1])[:top]
+        },
+        "self_by_package_ms": {
+            name: round(us / 1000, 1) for name, us in sorted(own_by_package.items(), key=lambda kv: -kv[1])[:top]
+        },
+        "slowest_app_modules_ms": {name: round(own / 1000, 1) for own, name in src_modules[:top]},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="main", help="Módulo a importar")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="Salida JSON")
+    args = parser.parse_args()
+
+    report = build_report(collect(args.module), args.top)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    print(f"import {args.module}: {report['total_ms']} ms, {report['modules']} módulos")
+    for title, key in (
+        ("Dependencias importadas desde la aplicación (acumulado)", "dependencies_imported_by_app_ms"),
+        ("Tiempo propio por paquete", "self_by_package_ms"),
+        ("Módulos de la aplicación más lentos (tiempo propio)", "slowest_app_modules_ms"),
+    ):
+        print(f"\n{title}:")
+        for name, ms in report[key].items():
+            print(f"  {ms:8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Generador de carga HTTP contra un servidor ya desplegado.
+
+Ejecuta los mismos escenarios que `benchmarks.run`, pero por red, de modo que incluye
+el servidor ASGI, los workers y la base de datos reales. El dataset debe haberse
+generado antes con `benchmarks.dataset` sobre la base de datos del servidor.
+
+Uso:
+    python -m benchmarks.dataset --database-url postgresql+asyncpg://... --scale medium \\
+        --manifest bench-manifest.json
+    python -m benchmarks.loadgen --base-url http://localhost:8000 --manifest bench-manifest.json \\
+        --concurrency 200 --duration 60 --output bench-report.json
+"""
+import argparse
+import asyncio
+import json
+
+import httpx
+
+from benchmarks.report import Recorder, build_report, write_report
+from benchmarks.scenarios import add_run_arguments, run_scenario, selected_scenarios
+
+
+async def run(args: argparse.Namespace) -> None:
+    with open(args.manifest, encoding="utf-8") as fh:
+        manifest = json.load(fh)
+
+    recorder = Recorder()
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+        for scenario in selected_scenarios(args.scenarios):
+            await run_scenario(
+                scenario, client, recorder, manifest,
+                concurrency=args.concurrency,
+                iterations=args.iterations,
+                duration=args.duration,
+                seed=args.seed,
+            )
+
+    options = {
+        "base_url": args.base_url,
+        "scenarios": args.scenarios,
+        "concurrency": args.concurrency,
+        "iterations": args.iterations,
+        "duration": args.duration,
+    }
+    write_report(build_report(recorder, "http", manifest, options), args.output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", required=True)
+    parser.add_argument("--manifest", required=True, help="Manifiesto generado por benchmarks.dataset")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=42)
+    add_run_arguments(parser)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
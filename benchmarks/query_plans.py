@@ -0,0 +1,484 @@
+"""
+Regresiones de planes de consulta de los métodos de repositorio.
+
+Los repositorios de `src/db/repositories` son el único punto de acceso a la base de
+datos. Este script ejecuta cada método público de cada repositorio contra un dataset
+sintético, captura las sentencias que emite y obtiene su plan (`EXPLAIN QUERY PLAN` en
+SQLite, `EXPLAIN` en PostgreSQL). Con `--check`:
+
+- falla si algún plan recorre completa una tabla grande (`LARGE_TABLES`) y el método
+  no está en `ALLOWED_FULL_SCANS` con su motivo;
+- falla si algún método lanza una excepción y no está en `KNOWN_ERRORS` con su motivo;
+- falla si algún plan difiere de la instantánea guardada en
+  `benchmarks/snapshots/query_plans.<dialecto>.json`.
+
+tests/test_query_plans.py ejecuta la misma comprobación en la suite de pruebas.
+
+Tras un cambio intencionado de esquema o de consultas se regenera la instantánea con
+`--update` y se revisa su diff junto con el cambio. Los planes se obtienen sin ANALYZE,
+así que dependen solo del esquema y de las consultas, no del volumen de datos.
+
+Uso:
+    python -m benchmarks.query_plans --check
+    python -m benchmarks.query_plans --update
+    # Contra una base migrada con `alembic upgrade head` y recién poblada con
+    # benchmarks.dataset (el script modifica datos: reutilizarla cambia las muestras)
+    python -m benchmarks.query_plans --database-url sqlite+aiosqlite:///./plans.db --check
+"""
+import argparse
+import asyncio
+import difflib
+import importlib
+import inspect
+import json
+import os
+import pkgutil
+import re
+import sys
+import tempfile
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from benchmarks.dataset import add_scale_arguments, scale_from_args, seed_dataset
+
+SNAPSHOT_DIR = os.path.join(os.path.dirname(__file__), "snapshots")
+
+# Tablas que crecen con el uso: un recorrido completo sobre ellas es una regresión
+LARGE_TABLES = {
+    "users",
+    "students",
+    "professors",
+    "game_instances",
+    "progresses",
+    "feedbacks",
+    "sync_sessions",
+    "sync_events",
+    "lms_credentials",
+}
+
+# Métodos cuyo recorrido completo es conocido, con el motivo
+ALLOWED_FULL_SCANS: Dict[str, str] = {
+    "FeedbackRepository.get_by_user_id": "filtra por `user_id`, que feedbacks no tiene (ver src.db.index_audit)",
+    "FeedbackRepository.get_by_game_instance_id": "filtra por `game_instance_id`, que feedbacks no tiene",
+    "FeedbackRepository.get_by_rating": "columna de baja cardinalidad; sin índice a propósito",
+    "GameInstanceRepository.get_by_user_id": "filtra por `user_id`, que game_instances no tiene",
+    "GameInstanceRepository.get_by_status": "columna de baja cardinalidad; sin índice a propósito",
+    "LMSCredentialRepository.get_by_user_id": "filtra por `user_id`, que lms_credentials no tiene",
+    "LMSCredentialRepository.get_by_platform_name": "tabla de configuración por plataforma",
+    "ProfessorRepository.get_by_professor_id": "filtra por `professor_id`, que professors no tiene",
+    "ProgressRepository.get_by_user_id": "filtra por `user_id`, que progresses no tiene",
+    "ProgressRepository.get_by_user_and_level": "filtra por `user_id`/`level_id`, que progresses no tiene",
+    "ProgressRepository.get_by_level_id": "filtra por `level_id`, que progresses no tiene",
+    "StudentRepository.get_by_student_id": "filtra por `student_id`, que students no tiene",
+    "SyncEventRepository.get_by_session_id": "filtra por `session_id`, que sync_events no tiene",
+    "SyncEventRepository.get_by_user_id": "filtra por `user_id`, que sync_events no tiene",
+    "SyncEventRepository.get_by_event_type": "columna de baja cardinalidad; sin índice a propósito",
+    "SyncSessionRepository.get_by_user_id": "filtra por `user_id`, que sync_sessions no tiene",
+    "SyncSessionRepository.get_by_status": "columna de baja cardinalidad; sin índice a propósito",
+    "SyncSessionRepository.get_by_user_id_and_status": "filtra por `user_id`, que sync_sessions no tiene",
+    "SyncSessionRepository.get_latest_session_by_user": "filtra por `user_id`, que sync_sessions no tiene",
+}
+
+# Métodos que fallan con los datos de muestra, con el motivo. Casi todos filtran por una
+# columna que el modelo no tiene: get_one_by_filters la ignora, la consulta devuelve
+# todas las filas del tenant y scalar_one_or_none lanza MultipleResultsFound
+KNOWN_ERRORS: Dict[str, str] = {
+    "GameInstanceRepository.get_by_game_and_user": "filtra por `user_id`, que game_instances no tiene",
+    "GameRepository.get_by_name": "filtra por `name`, que games no tiene; usa `title`",
+    "GameRepository.get_by_slug": "filtra por `slug`, que games no tiene",
+    "LMSCredentialRepository.get_by_platform_name": "filtra por `platform_name`, que lms_credentials no tiene",
+    "LMSCredentialRepository.get_by_user_id": "filtra por `user_id`, que lms_credentials no tiene",
+    "LevelRepository.get_by_name": "filtra por `name`, que levels no tiene; usa `title`",
+    "MetricTypeRepository.get_by_code": "filtra por `code`, que metric_types no tiene",
+    "ProfessorRepository.get_by_professor_id": "filtra por `professor_id`, que professors no tiene",
+    "ProgressRepository.get_by_user_and_level": "filtra por `user_id`/`level_id`, que progresses no tiene",
+    "SegmentLevelRepository.get_by_segment_name": "filtra por `segment_name`, que segment_levels no tiene",
+    "StudentRepository.get_by_student_id": "filtra por `student_id`, que students no tiene",
+    "UserRepository.authenticate": "la contraseña de muestra no es la del usuario",
+}
+
+# Métodos que no se ejecutan: necesitan datos de entrada completos o destruyen filas
+SKIPPED_METHODS = {"create", "hard_delete"}
+
+# Tabla de la que se toma el valor de cada parámetro `*_id`
+ID_PARAMETERS = {
+    "user_id": "users",
+    "owner_id": "users",
+    "game_id": "games",
+    "level_id": "levels",
+    "student_id": "students",
+    "professor_id": "professors",
+    "session_id": "sync_sessions",
+    "instance_id": "game_instances",
+    "game_instance_id": "game_instances",
+}
+
+# Valores fijos por nombre de parámetro
+LITERAL_PARAMETERS: Dict[str, Any] = {
+    "password": "query-plans",
+    "name": "query-plans",
+    "slug": "query-plans",
+    "code": "query-plans",
+    "platform_name": "query-plans",
+    "segment_name": "query-plans",
+    "status": "active",
+    "event_type": "progress",
+    "rating": 5,
+    "level_number": 1,
+    "owner": "query-plans",
+    "ttl_seconds": 60,
+    "sessions": [],
+    "idle_since": datetime(2000, 1, 1),
+    "deleted_before": datetime(2000, 1, 1),
+    # update(): sin cambios efectivos sobre la fila
+    "obj_in": {"is_deleted": False},
+    # update_with_retry(): los mismos cambios vacíos, calculados desde la fila leída
+    "changes": lambda current: {"is_deleted": False},
+}
+
+# En SQLite, SCAN es un recorrido completo (de la tabla o de un índice entero); SEARCH usa
+# el índice, pero buscar solo por `tenant_id` recorre todas las filas del tenant
+_SQLITE_SCAN = re.compile(r"^(?:SCAN (\w+)\b|SEARCH (\w+) USING (?:COVERING )?INDEX \w+ \(tenant_id=\?\)$)")
+_POSTGRES_SCAN = re.compile(r"Seq Scan on (\w+)")
+_SQLITE_SEARCH = re.compile(r"^SEARCH (\w+) USING (COVERING )?INDEX (\w+) \((.*)\)")
+_CONSTRAINT_COLUMN = re.compile(r"(\w+)[=<>]")
+
+
+class MethodPlan(NamedTuple):
+    name: str
+    # [{"sql": forma normalizada, "plan": [líneas]}]
+    statements: List[Dict[str, Any]]
+    full_scans: List[str]
+    # Excepción del método, si la hubo: las sentencias emitidas antes se analizan igual
+    # (p. ej. MultipleResultsFound cuando el filtro usa una columna que el modelo no tiene)
+    error: Optional[str]
+
+
+def _repository_classes() -> List[type]:
+    # Importación diferida: los repositorios leen la configuración al importarse
+    from src.db import repositories
+    from src.db.repositories.base_repository import BaseRepository
+
+    classes = []
+    for module_info in pkgutil.iter_modules(repositories.__path__):
+        module = importlib.import_module(f"{repositories.__name__}.{module_info.name}")
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            if issubclass(cls, BaseRepository) and cls is not BaseRepository and cls.__module__ == module.__name__:
+                classes.append(cls)
+    return sorted(classes, key=lambda cls: (cls.__name__, cls.__module__))
+
+
+def _qualified_name(cls: type) -> str:
+    # Hay dos UserRepository (el específico y el genérico); se distinguen por módulo
+    if cls.__name__ == "UserRepository" and cls.__module__.endswith("_generic"):
+        return "UserRepositoryGeneric"
+    return cls.__name__
+
+
+def _public_methods(cls: type) -> List[str]:
+    return [
+        name
+        for name, member in inspect.getmembers(cls, inspect.iscoroutinefunction)
+        if not name.startswith("_") and name not in SKIPPED_METHODS
+    ]
+
+
+async def _samples(db: AsyncSession) -> Dict[str, Any]:
+    """Valores de muestra del tenant por defecto: un ID por tabla y un usuario."""
+    from src.db.base import Base
+
+    samples: Dict[str, Any] = {}
+    for table in Base.metadata.sorted_tables:
+        if "id" not in table.c or "deleted_at" not in table.c:
+            continue
+        conditions = "deleted_at IS NULL" + (" AND tenant_id = 1" if "tenant_id" in table.c else "")
+        row = (await db.execute(text(f"SELECT id FROM {table.name} WHERE {conditions} ORDER BY id LIMIT 1"))).first()
+        samples[table.name] = row[0] if row else 0
+    user = (await db.execute(text("SELECT email, username FROM users WHERE id = :id"), {"id": samples["users"]})).first()
+    samples["email"], samples["username"] = (user[0], user[1]) if user else ("", "")
+    return samples
+
+
+def _arguments(method, table: str, samples: Dict[str, Any]) -> Dict[str, Any]:
+    """Argumentos de una llamada a partir de los nombres de sus parámetros."""
+    arguments: Dict[str, Any] = {}
+    for parameter in list(inspect.signature(method).parameters.values())[1:]:
+        name = parameter.name
+        if parameter.kind is inspect.Parameter.VAR_KEYWORD:
+            # p. ej. los contadores de `increment_counters`: sin ellos la llamada es una lectura
+            continue
+        if name == "id":
+            arguments[name] = samples.get(table, 0)
+        elif name == "deltas":
+            arguments[name] = {samples.get(table, 0): {}}
+        elif name == "ids":
+            arguments[name] = [samples.get(table, 0)]
+        elif name in ID_PARAMETERS:
+            arguments[name] = samples.get(ID_PARAMETERS[name], 0)
+        elif name in ("email", "username"):
+            arguments[name] = samples[name]
+        elif name == "filters":
+            # Un filtro selectivo realista; sin filtro el plan sería siempre un recorrido
+            arguments[name] = {"id": samples.get(table, 0)}
+        elif name in LITERAL_PARAMETERS:
+            arguments[name] = LITERAL_PARAMETERS[name]
+        elif parameter.default is not inspect.Parameter.empty:
+            continue
+        elif inspect.isclass(parameter.annotation) and hasattr(parameter.annotation, "__fields__"):
+            # Esquema pydantic con todos los campos opcionales (p. ej. UserUpdate)
+            arguments[name] = parameter.annotation()
+        else:
+            arguments[name] = str(name)
+    return arguments
+
+
+def _canonical_index(detail: str) -> str:
+    """
+    Sustituye el índice de un paso SEARCH por el primero (por nombre) de los que sirven
+    igual a la búsqueda.
+
+    Entre índices con el mismo prefijo (p. ej. los compuestos que empiezan por
+    `tenant_id` cuando solo se filtra por tenant) SQLite elige según el orden de
+    creación, que create_all no garantiza; sin esto el plan cambiaría entre ejecuciones.
+    """
+    from src.db.base import Base
+
+    match = _SQLITE_SEARCH.match(detail)
+    if not match or match.group(1) not in Base.metadata.tables:
+        return detail
+    table, index_name, constraint = match.group(1), match.group(3), match.group(4)
+    used = [column for column in _CONSTRAINT_COLUMN.findall(constraint) if column != "rowid"]
+    candidates = sorted(
+        index.name
+        for index in Base.metadata.tables[table].indexes
+        if sorted(column.name for column in list(index.columns)[:len(used)]) == sorted(used)
+    )
+    if index_name not in candidates:
+        return detail
+    return detail.replace(f"INDEX {index_name} (", f"INDEX {candidates[0]} (", 1)
+
+
+def _plan_lines(dialect: str, rows: List[Tuple]) -> List[str]:
+    if dialect != "sqlite":
+        return [row[0] for row in rows]
+    # (id, parent, notused, detail): se sangra cada paso según su profundidad
+    depth = {0: -1}
+    lines = []
+    for row_id, parent, _, detail in rows:
+        depth[row_id] = depth.get(parent, -1) + 1
+        lines.append("  " * depth[row_id] + _canonical_index(detail))
+    return lines
+
+
+def full_scans(dialect: str, plan: List[str]) -> List[str]:
+    """
+    Tablas grandes recorridas completas en un plan.
+
+    Args:
+        dialect: Nombre del dialecto ("sqlite" o "postgresql")
+        plan: Líneas del plan
+
+    Returns:
+        List[str]: Tablas de `LARGE_TABLES` recorridas completas (o completas para el tenant)
+    """
+    pattern = _SQLITE_SCAN if dialect == "sqlite" else _POSTGRES_SCAN
+    tables = []
+    for line in plan:
+        match = pattern.search(line.strip())
+        table = match and next(group for group in match.groups() if group)
+        if table in LARGE_TABLES and table not in tables:
+            tables.append(table)
+    return tables
+
+
+async def _explain(engine, statements: List[Tuple[str, Any]]) -> List[Dict[str, Any]]:
+    from src.db.query_tracker import statement_shape
+
+    dialect = engine.dialect.name
+    prefix = "EXPLAIN QUERY PLAN " if dialect == "sqlite" else "EXPLAIN "
+    explained: List[Dict[str, Any]] = []
+    seen = set()
+    async with engine.connect() as conn:
+        for statement, parameters in statements:
+            shape = statement_shape(statement)
+            if shape in seen or not shape.split(" ", 1)[0].upper() in ("SELECT", "UPDATE", "DELETE", "INSERT"):
+                continue
+            seen.add(shape)
+            if isinstance(parameters, list):
+                # executemany: basta con el primer juego de parámetros
+                parameters = parameters[0] if parameters else ()
+            result = await conn.exec_driver_sql(prefix + statement, parameters)
+            explained.append({"sql": shape, "plan": _plan_lines(dialect, [tuple(row) for row in result.all()])})
+    return explained
+
+
+async def capture(engine) -> List[MethodPlan]:
+    """
+    Ejecuta los métodos de todos los repositorios y obtiene el plan de cada sentencia.
+
+    Args:
+        engine: Motor asíncrono sobre una base de datos con el dataset sintético
+
+    Returns:
+        List[MethodPlan]: Un resultado por método, ordenado por nombre
+    """
+    from src.core.tenancy import DEFAULT_TENANT_ID, tenant_scope
+    # Registra el filtro por tenant de la sesión, como en la aplicación (src/db/session.py)
+    from src.db import tenancy  # noqa: F401
+
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    dialect = engine.dialect.name
+    captured: List[Tuple[str, Any]] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    async with sessions() as db:
+        samples = await _samples(db)
+
+    results: List[MethodPlan] = []
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        with tenant_scope(DEFAULT_TENANT_ID):
+            for cls in _repository_classes():
+                for method_name in _public_methods(cls):
+                    name = f"{_qualified_name(cls)}.{method_name}"
+                    async with sessions() as db:
+                        repo = cls(db)
+                        method = getattr(repo, method_name)
+                        captured.clear()
+                        error = None
+                        try:
+                            await method(**_arguments(getattr(cls, method_name), repo.model.__tablename__, samples))
+                        except Exception as exc:
+                            await db.rollback()
+                            error = f"{type(exc).__name__}: {exc}"
+                    statements = await _explain(engine, list(captured))
+                    scans = [table for statement in statements for table in full_scans(dialect, statement["plan"])]
+                    results.append(MethodPlan(name, statements, sorted(set(scans)), error))
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    return sorted(results, key=lambda result: result.name)
+
+
+def snapshot_path(dialect: str) -> str:
+    return os.path.join(SNAPSHOT_DIR, f"query_plans.{dialect}.json")
+
+
+def _snapshot(results: List[MethodPlan]) -> Dict[str, Any]:
+    # Los errores dependen de los datos de muestra: se comprueban contra KNOWN_ERRORS, no aquí
+    return {result.name: {"statements": result.statements} for result in results}
+
+
+def _render(entry: Dict[str, Any]) -> List[str]:
+    lines = []
+    for statement in entry["statements"]:
+        lines.append(statement["sql"])
+        lines.extend("    " + line for line in statement["plan"])
+    return lines
+
+
+def check(results: List[MethodPlan], snapshot: Dict[str, Any]) -> List[str]:
+    """
+    Compara los planes capturados con la instantánea, con la política de recorridos y
+    con los errores conocidos.
+
+    Args:
+        results: Planes capturados por `capture`
+        snapshot: Contenido de la instantánea guardada
+
+    Returns:
+        List[str]: Problemas encontrados; vacía si todo coincide
+    """
+    problems = []
+    current = _snapshot(results)
+    for result in results:
+        if result.full_scans and result.name not in ALLOWED_FULL_SCANS:
+            problems.append(f"{result.name}: recorrido completo de {', '.join(result.full_scans)}")
+        elif not result.full_scans and result.name in ALLOWED_FULL_SCANS:
+            problems.append(f"{result.name}: ya no recorre tablas completas; quítalo de ALLOWED_FULL_SCANS")
+        if result.error and result.name not in KNOWN_ERRORS:
+            problems.append(f"{result.name}: {result.error}")
+        elif not result.error and result.name in KNOWN_ERRORS:
+            problems.append(f"{result.name}: ya no falla; quítalo de KNOWN_ERRORS")
+    for name in sorted(set(current) | set(snapshot)):
+        if name not in snapshot:
+            problems.append(f"{name}: método nuevo sin plan en la instantánea")
+        elif name not in current:
+            problems.append(f"{name}: el método ya no existe")
+        elif current[name] != snapshot[name]:
+            diff = difflib.unified_diff(_render(snapshot[name]), _render(current[name]), "snapshot", "actual", lineterm="")
+            problems.append(f"{name}: el plan ha cambiado\n" + "\n".join("    " + line for line in diff))
+    return problems
+
+
+async def run(args: argparse.Namespace) -> int:
+    if not args.database_url_given:
+        await seed_dataset(args.database_url, scale_from_args(args), args.seed, args.chunk_size)
+
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+    os.environ.setdefault("DATABASE_ECHO", "false")
+
+    engine = create_async_engine(args.database_url)
+    try:
+        results = await capture(engine)
+        dialect = engine.dialect.name
+    finally:
+        await engine.dispose()
+
+    path = args.snapshot or snapshot_path(dialect)
+    if args.update:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(_snapshot(results), fh, indent=2, ensure_ascii=False)
+            fh.write("\n")
+        print(f"Instantánea escrita en {path} ({len(results)} métodos)")
+
+    for result in results:
+        if result.error:
+            reason = KNOWN_ERRORS.get(result.name)
+            label = "KNOWN" if reason else "ERROR"
+            print(f"{label} {result.name}: {result.error}" + (f" ({reason})" if reason else ""))
+        if result.full_scans:
+            reason = ALLOWED_FULL_SCANS.get(result.name)
+            label = "ALLOW" if reason else "SCAN "
+            print(f"{label} {result.name}: {', '.join(result.full_scans)}" + (f" ({reason})" if reason else ""))
+
+    if not args.check:
+        return 0
+    if not os.path.exists(path):
+        print(f"No existe la instantánea {path}; genérala con --update")
+        return 1
+    with open(path, encoding="utf-8") as fh:
+        problems = check(results, json.load(fh))
+    for problem in problems:
+        print(f"FAIL  {problem}")
+    known = sum(1 for result in results if result.error and result.name in KNOWN_ERRORS)
+    print(f"{len(results)} métodos ({known} con error conocido), {len(problems)} problemas")
+    return 1 if problems else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=None, help="Base ya poblada; por defecto, SQLite temporal")
+    parser.add_argument("--snapshot", default=None, help="Ruta de la instantánea (por defecto, según el dialecto)")
+    parser.add_argument("--check", action="store_true", help="Falla ante recorridos completos o planes distintos")
+    parser.add_argument("--update", action="store_true", help="Reescribe la instantánea con los planes actuales")
+    add_scale_arguments(parser)
+    args = parser.parse_args()
+    args.database_url_given = bool(args.database_url)
+
+    if args.database_url:
+        sys.exit(asyncio.run(run(args)))
+    with tempfile.TemporaryDirectory() as tmp:
+        args.database_url = f"sqlite+aiosqlite:///{tmp}/query-plans.db"
+        code = asyncio.run(run(args))
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
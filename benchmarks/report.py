@@ -0,0 +1,139 @@
+"""
+Registro de latencias y generación del informe JSON de los benchmarks.
+
+El informe incluye metadatos de la ejecución (commit, versión de Python, escala y
+semilla del dataset) para poder comparar ejecuciones a lo largo del tiempo.
+"""
+import json
+import platform
+import subprocess
+import sys
+import time
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Percentil por el método del rango más cercano sobre una lista ya ordenada."""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(round(pct / 100 * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Recorder:
+    """
+    Acumula la latencia y el código de estado de cada petición, agrupadas por
+    escenario y endpoint (plantilla de ruta, no URL concreta).
+    """
+
+    def __init__(self):
+        self._latencies: Dict[Tuple[str, str], List[float]] = defaultdict(list)
+        self._statuses: Dict[Tuple[str, str], Counter] = defaultdict(Counter)
+        self._windows: Dict[str, List[float]] = {}
+
+    def record(self, scenario: str, endpoint: str, status: int, seconds: float) -> None:
+        key = (scenario, endpoint)
+        self._latencies[key].append(seconds)
+        self._statuses[key][str(status)] += 1
+
+    def start(self, scenario: str) -> None:
+        self._windows[scenario] = [time.perf_counter(), 0.0]
+
+    def stop(self, scenario: str) -> None:
+        self._windows[scenario][1] = time.perf_counter()
+
+    @staticmethod
+    def _summary(latencies: List[float], statuses: Counter, elapsed: float) -> Dict[str, Any]:
+        values = sorted(latencies)
+        count = len(values)
+        errors = sum(n for status, n in statuses.items() if not status.startswith(("2", "3")))
+        summary = {
+            "requests": count,
+            "errors": errors,
+            "throughput_rps": round(count / elapsed, 2) if elapsed else 0.0,
+            "status": dict(sorted(statuses.items())),
+            "mean_ms": round(sum(values) / count * 1000, 3) if count else 0.0,
+            "max_ms": round(values[-1] * 1000, 3) if count else 0.0,
+        }
+        for pct in PERCENTILES:
+            summary[f"p{pct}_ms"] = round(percentile(values, pct) * 1000, 3)
+        return summary
+
+    def scenarios(self) -> Dict[str, Any]:
+        result: Dict[str, Any] = {}
+        for scenario, (started, stopped) in self._windows.items():
+            elapsed = (stopped or time.perf_counter()) - started
+            keys = [key for key in self._latencies if key[0] == scenario]
+            latencies = [value for key in keys for value in self._latencies[key]]
+            statuses = sum((self._statuses[key] for key in keys), Counter())
+            result[scenario] = {
+                "duration_seconds": round(elapsed, 3),
+                **self._summary(latencies, statuses, elapsed),
+                "endpoints": {
+                    key[1]: self._summary(self._latencies[key], self._statuses[key], elapsed)
+                    for key in sorted(keys)
+                },
+            }
+        return result
+
+
+def build_report(
+    recorder: Recorder,
+    mode: str,
+    manifest: Dict[str, Any],
+    options: Dict[str, Any],
+    extra: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Informe completo de una ejecución.
+
+    Args:
+        recorder: Latencias registradas
+        mode: "in-process" o "http"
+        manifest: Manifiesto del dataset utilizado
+        options: Parámetros de la ejecución (concurrencia, peticiones...)
+        extra: Datos adicionales (p. ej. métricas del servidor)
+
+    Returns:
+        Dict[str, Any]: Informe serializable a JSON
+    """
+    return {
+        "run": {
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "mode": mode,
+            "git_commit": _git_commit(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "dataset": {
+                "seed": manifest.get("seed"),
+                "scale": manifest.get("scale"),
+                "counts": manifest.get("counts"),
+            },
+            "options": options,
+        },
+        "scenarios": recorder.scenarios(),
+        **(extra or {}),
+    }
+
+
+def write_report(report: Dict[str, Any], output: Optional[str]) -> None:
+    """Escribe el informe en `output` o, si es None, en la salida estándar."""
+    content = json.dumps(report, indent=2, default=str)
+    if output:
+        with open(output, "w", encoding="utf-8") as fh:
+            fh.write(content)
+    else:
+        print(content)
@@ -0,0 +1,77 @@
+"""
+Benchmark en proceso de la API completa.
+
+Genera (o reutiliza) un dataset sintético, arranca la aplicación en el mismo proceso
+y ejecuta los escenarios con un cliente ASGI, sin red ni servidor. Mide la pila
+completa de la aplicación (middlewares, dependencias, servicios y base de datos) y
+emite un informe JSON con percentiles y throughput por escenario y endpoint.
+
+Uso:
+    python -m benchmarks.run --database-url sqlite+aiosqlite:///./bench.db --scale small \\
+        --concurrency 20 --iterations 500 --output bench-report.json
+
+    # Reutilizando un dataset ya generado con benchmarks.dataset
+    python -m benchmarks.run --database-url sqlite+aiosqlite:///./bench.db --manifest bench-manifest.json
+"""
+import argparse
+import asyncio
+import json
+import os
+
+from benchmarks.dataset import add_scale_arguments, scale_from_args, seed_dataset
+from benchmarks.report import Recorder, build_report, write_report
+from benchmarks.scenarios import add_run_arguments, run_scenario, selected_scenarios
+
+
+async def run(args: argparse.Namespace) -> None:
+    if args.manifest:
+        with open(args.manifest, encoding="utf-8") as fh:
+            manifest = json.load(fh)
+    else:
+        manifest = await seed_dataset(args.database_url, scale_from_args(args), args.seed, args.chunk_size)
+
+    # La configuración se lee al importar la aplicación
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+    os.environ.setdefault("DATABASE_ECHO", "false")
+
+    import httpx
+    from main import app
+    from src.core.loop_watchdog import loop_watchdog
+
+    recorder = Recorder()
+    await app.router.startup()
+    try:
+        async with httpx.AsyncClient(app=app, base_url="http://benchmark", timeout=None) as client:
+            for scenario in selected_scenarios(args.scenarios):
+                await run_scenario(
+                    scenario, client, recorder, manifest,
+                    concurrency=args.concurrency,
+                    iterations=args.iterations,
+                    duration=args.duration,
+                    seed=args.seed,
+                )
+    finally:
+        await app.router.shutdown()
+
+    options = {
+        "scenarios": args.scenarios,
+        "concurrency": args.concurrency,
+        "iterations": args.iterations,
+        "duration": args.duration,
+    }
+    extra = {"event_loop": loop_watchdog.get_stats()} if loop_watchdog.stats["ticks"] else None
+    write_report(build_report(recorder, "in-process", manifest, options, extra), args.output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--manifest", help="Manifiesto de un dataset existente; si se omite se genera uno")
+    add_scale_arguments(parser)
+    add_run_arguments(parser)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
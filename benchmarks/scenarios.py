@@ -0,0 +1,223 @@
+"""
+Escenarios de carga realistas, comunes al runner en proceso y al generador HTTP.
+
+- login_storm: una clase entera inicia sesión a la vez (bcrypt en cada petición).
+- gameplay_stream: estudiantes jugando; descargan el nivel y envían eventos continuamente.
+- dashboard_polling: profesores refrescando el panel (catálogo con ETag, niveles, usuarios).
+
+Cada escenario lanza `concurrency` usuarios virtuales que ejecutan iteraciones hasta
+completar `iterations` en total o agotar `duration` segundos.
+"""
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+from benchmarks.report import Recorder
+
+API = "/api/v1"
+
+
+class VirtualUser:
+    """Usuario simulado: cliente HTTP compartido, credenciales, token y estado propio."""
+
+    def __init__(
+        self,
+        scenario: str,
+        client: httpx.AsyncClient,
+        recorder: Recorder,
+        manifest: Dict[str, Any],
+        credentials: Dict[str, str],
+        rng: random.Random,
+    ):
+        self.scenario = scenario
+        self.client = client
+        self.recorder = recorder
+        self.manifest = manifest
+        self.credentials = credentials
+        self.rng = rng
+        self.token: Optional[str] = None
+        self.etags: Dict[str, str] = {}
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.token}"} if self.token else {}
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        url: str,
+        record: bool = True,
+        conditional: bool = False,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Ejecuta una petición y registra su latencia bajo `endpoint` (plantilla de ruta).
+
+        Con `conditional` reenvía el último ETag recibido para esa URL, como haría un navegador.
+        """
+        headers = {**self.headers, **kwargs.pop("headers", {})}
+        if conditional and url in self.etags:
+            headers["If-None-Match"] = self.etags[url]
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, headers=headers, **kwargs)
+            status = response.status_code
+        except httpx.HTTPError:
+            response = None
+            status = 599
+        if record:
+            self.recorder.record(self.scenario, f"{method} {endpoint}", status, time.perf_counter() - start)
+        if response is None:
+            raise RuntimeError(f"{method} {url} falló sin respuesta")
+        if conditional and "etag" in response.headers:
+            self.etags[url] = response.headers["etag"]
+        return response
+
+    def pick(self, table: str) -> int:
+        """ID aleatorio de una tabla del dataset (los IDs generados son contiguos)."""
+        first, last = self.manifest["id_ranges"][table]
+        return self.rng.randint(first, last)
+
+    async def login(self, record: bool = True) -> None:
+        response = await self.request(
+            "POST",
+            f"{API}/auth/login",
+            f"{API}/auth/login",
+            record=record,
+            json={**self.credentials, "password": self.manifest["password"]},
+        )
+        if response.status_code == 200:
+            self.token = response.json()["access_token"]
+
+
+async def login_storm(user: VirtualUser) -> None:
+    await user.login()
+
+
+async def gameplay_stream(user: VirtualUser) -> None:
+    level_id = user.pick("levels")
+    await user.request(
+        "GET", f"{API}/levels/{{level_id}}/bundle", f"{API}/levels/{level_id}/bundle",
+        conditional=True, headers={"Accept-Encoding": "gzip"},
+    )
+    session_id = user.pick("sync_sessions")
+    for step in range(5):
+        await user.request(
+            "POST", f"{API}/sync-events/", f"{API}/sync-events/",
+            json={
+                "session_id": session_id,
+                "event_type": user.rng.choice(("move", "run_code", "hint", "error")),
+                "event_data": {"level_id": level_id, "step": step, "x": user.rng.randint(0, 20)},
+            },
+        )
+    segment_id = user.pick("segment_levels")
+    await user.request("GET", f"{API}/segments/{{segment_id}}/config", f"{API}/segments/{segment_id}/config")
+
+
+async def dashboard_polling(user: VirtualUser) -> None:
+    await user.request("GET", f"{API}/games/", f"{API}/games/", conditional=True)
+    game_id = user.pick("games")
+    await user.request("GET", f"{API}/games/{{game_id}}/levels/", f"{API}/games/{game_id}/levels/")
+    await user.request("GET", f"{API}/users/", f"{API}/users/", params={"limit": 50})
+
+
+class Scenario:
+    def __init__(self, name: str, step: Callable[[VirtualUser], Awaitable[None]], population: str, needs_login: bool):
+        self.name = name
+        self.step = step
+        # Clave del manifiesto con las credenciales de los usuarios simulados
+        self.population = population
+        self.needs_login = needs_login
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario("login_storm", login_storm, "students", needs_login=False),
+        Scenario("gameplay_stream", gameplay_stream, "students", needs_login=True),
+        Scenario("dashboard_polling", dashboard_polling, "professors", needs_login=True),
+    )
+}
+
+
+async def run_scenario(
+    scenario: Scenario,
+    client: httpx.AsyncClient,
+    recorder: Recorder,
+    manifest: Dict[str, Any],
+    concurrency: int,
+    iterations: int,
+    duration: Optional[float] = None,
+    seed: int = 42,
+) -> None:
+    """
+    Ejecuta un escenario con `concurrency` usuarios virtuales.
+
+    El inicio de sesión previo de los escenarios autenticados no se mide: se hace
+    antes de abrir la ventana de medición.
+
+    Args:
+        scenario: Escenario a ejecutar
+        client: Cliente HTTP (ASGI en proceso o red)
+        recorder: Registro de latencias
+        manifest: Manifiesto del dataset
+        concurrency: Usuarios virtuales simultáneos
+        iterations: Iteraciones totales del escenario
+        duration: Si se indica, límite de tiempo en segundos en lugar de iteraciones
+        seed: Semilla de las decisiones de los usuarios virtuales
+    """
+    population: List[Dict[str, str]] = manifest[scenario.population]
+    if not population:
+        raise ValueError(f"El dataset no tiene usuarios para {scenario.name} ({scenario.population})")
+
+    users = [
+        VirtualUser(
+            scenario.name, client, recorder, manifest,
+            population[i % len(population)], random.Random(seed * 1000 + i),
+        )
+        for i in range(concurrency)
+    ]
+    if scenario.needs_login:
+        await asyncio.gather(*(user.login(record=False) for user in users))
+
+    issued = 0
+    deadline = time.perf_counter() + duration if duration else None
+
+    async def worker(user: VirtualUser) -> None:
+        nonlocal issued
+        while (time.perf_counter() < deadline) if deadline is not None else (issued < iterations):
+            if not scenario.needs_login:
+                # Sin sesión previa cada iteración es un usuario distinto (la clase entera entrando)
+                user.credentials = population[issued % len(population)]
+            issued += 1
+            await scenario.step(user)
+
+    recorder.start(scenario.name)
+    try:
+        await asyncio.gather(*(worker(user) for user in users))
+    finally:
+        recorder.stop(scenario.name)
+
+
+def add_run_arguments(parser) -> None:
+    parser.add_argument(
+        "--scenarios", default=",".join(SCENARIOS),
+        help=f"Escenarios separados por comas ({', '.join(SCENARIOS)})",
+    )
+    parser.add_argument("--concurrency", type=int, default=20, help="Usuarios virtuales simultáneos")
+    parser.add_argument("--iterations", type=int, default=200, help="Iteraciones por escenario")
+    parser.add_argument("--duration", type=float, default=None, help="Segundos por escenario (ignora --iterations)")
+    parser.add_argument("--output", help="Fichero JSON del informe (por defecto, salida estándar)")
+
+
+def selected_scenarios(names: str) -> List[Scenario]:
+    selected = []
+    for name in filter(None, (n.strip() for n in names.split(","))):
+        if name not in SCENARIOS:
+            raise SystemExit(f"Escenario desconocido: {name}. Disponibles: {', '.join(SCENARIOS)}")
+        selected.append(SCENARIOS[name])
+    return selected
@@ -1,13 +1,27 @@
-from fastapi import FastAPI
-from src.api.v1.routers import api_router
+import logging
+import os
+import time
+
+from fastapi import FastAPI, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from src.api.v1.routers import include_api_routers
 from src.core.config import settings
-from src.db.base import Base
-from src.db.seed.run_seed import run_all_seeds
+from src.core import metrics
+from src.core.loop_watchdog import loop_watchdog
+from src.core.middleware import (
+    LoopWatchdogMiddleware, ProfilerMiddleware, PrometheusMiddleware, QueryTrackerMiddleware, TenantContextMiddleware,
+)
+from src.core.scheduler import PeriodicJob, scheduler
+from src.db import query_tracker
+from src.db.bootstrap import bootstrap_database
 from src.db.session import engine
+from src.services.progress_counter_buffer import progress_counter_buffer
+from src.services.soft_delete_archiver import soft_delete_archiver
+from src.services.sync_session_reaper import sync_session_reaper
+from src.services.warmup import warm_up, warmup_state
 
-async def create_tables():
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+logger = logging.getLogger(__name__)
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -22,10 +36,96 @@ app = FastAPI(
 
 @app.on_event("startup")
 async def on_startup():
-    await create_tables()
-    await run_all_seeds()
+    started = time.perf_counter()
+    if settings.LOOP_WATCHDOG_ENABLED:
+        await loop_watchdog.start()
+    database_started = time.perf_counter()
+    database_status = await bootstrap_database(engine)
+    database_seconds = time.perf_counter() - database_started
+    if settings.SCHEDULER_ENABLED:
+        if settings.SYNC_SESSION_REAPER_ENABLED:
+            scheduler.add_job(PeriodicJob(
+                name="sync_session_reaper",
+                func=sync_session_reaper.run_once,
+                interval_seconds=settings.SYNC_SESSION_REAPER_INTERVAL_SECONDS,
+                use_lease=True,
+            ))
+        if settings.SOFT_DELETE_ARCHIVER_ENABLED:
+            scheduler.add_job(PeriodicJob(
+                name="soft_delete_archiver",
+                func=soft_delete_archiver.run_once,
+                interval_seconds=settings.SOFT_DELETE_ARCHIVER_INTERVAL_SECONDS,
+                use_lease=True,
+            ))
+        if settings.PROGRESS_COUNTER_BUFFER_ENABLED:
+            # Sin lease: cada worker vuelca sus propios incrementos acumulados. Solo tiene
+            # sentido con una vía de ingesta que llame a ProgressService.record_activity
+            await progress_counter_buffer.start()
+            scheduler.add_job(PeriodicJob(
+                name="progress_counter_flush",
+                func=progress_counter_buffer.flush,
+                interval_seconds=settings.PROGRESS_COUNTER_FLUSH_INTERVAL_SECONDS,
+            ))
+        await scheduler.start()
+    warmup_started = time.perf_counter()
+    await warm_up(app, engine)
+    warmup_seconds = time.perf_counter() - warmup_started
+    total_seconds = time.perf_counter() - started
+    metrics.APP_STARTUP_DURATION.labels("database").set(database_seconds)
+    metrics.APP_STARTUP_DURATION.labels("warmup").set(warmup_seconds)
+    metrics.APP_STARTUP_DURATION.labels("total").set(total_seconds)
+    logger.info(
+        "Worker %d arrancado en %.0f ms (base de datos %s en %.0f ms, calentamiento %s)",
+        os.getpid(), total_seconds * 1000, database_status, database_seconds * 1000, warmup_state.phases_ms,
+    )
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    # Deja de anunciarse como listo para que el balanceador no envíe más tráfico
+    warmup_state.ready = False
+    await scheduler.stop()
+    await progress_counter_buffer.stop()
+    await loop_watchdog.stop()
+    metrics.mark_process_dead()
+
+if settings.SQL_INSTRUMENTATION_ENABLED or settings.DEBUG:
+    query_tracker.install(engine)
+    app.add_middleware(
+        QueryTrackerMiddleware,
+        threshold=settings.SQL_N_PLUS_ONE_THRESHOLD,
+        budget=settings.SQL_QUERY_BUDGET,
+        budget_mode=settings.SQL_QUERY_BUDGET_MODE,
+        expose_headers=settings.DEBUG,
+    )
+
+if settings.PROFILER_ENABLED:
+    app.add_middleware(ProfilerMiddleware)
+
+if settings.LOOP_WATCHDOG_ENABLED:
+    app.add_middleware(
+        LoopWatchdogMiddleware,
+        watchdog=loop_watchdog,
+        fail_on_block=settings.LOOP_WATCHDOG_FAIL_ON_BLOCK,
+    )
+
+app.add_middleware(TenantContextMiddleware)
+
+if settings.METRICS_ENABLED:
+    metrics.instrument_pool(engine)
+    app.add_middleware(PrometheusMiddleware)
+
+include_api_routers(app)
+
+@app.get("/metrics", include_in_schema=False)
+def read_metrics():
+    body, content_type = metrics.render_metrics()
+    return Response(content=body, media_type=content_type)
 
-app.include_router(api_router, prefix="/api/v1")
+@app.get("/ready", include_in_schema=False)
+def read_ready():
+    """Readiness del worker: 200 cuando ha terminado el calentamiento, 503 mientras tanto."""
+    status_code = status.HTTP_200_OK if warmup_state.ready else status.HTTP_503_SERVICE_UNAVAILABLE
+    return JSONResponse(jsonable_encoder(warmup_state.as_dict()), status_code=status_code)
 
 @app.get("/")
 def read_root():
@@ -24,7 +24,8 @@ config.set_main_option('sqlalchemy.url', database_url)
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
-if config.config_file_name is not None:
+# Al migrar desde la aplicación (src/db/bootstrap.py) se conserva su configuración de logging
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
     fileConfig(config.config_file_name)
 
 # add your model's MetaData object here
@@ -68,6 +69,15 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
+    # Conexión abierta por la aplicación (src/db/bootstrap.py): sirve con cualquier
+    # driver asíncrono, incluido asyncpg, y comparte el lock de arranque
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        context.configure(connection=connection, target_metadata=target_metadata)
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
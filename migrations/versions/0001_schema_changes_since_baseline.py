@@ -0,0 +1,86 @@
+"""startup markers, scheduler leases and schema changes since the baseline
+
+Revision ID: 0001
+Revises: 0000
+Create Date: 2026-10-18 23:01:58.179818
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = '0000'
+branch_labels = None
+depends_on = None
+
+# Columnas añadidas a los modelos antes de usar Alembic: (tabla, columna)
+COLUMNS = [
+    ('segment_levels', sa.Column('compiled_configuration', sa.LargeBinary(), nullable=True)),
+    ('segment_levels', sa.Column('segment_type', sa.String(length=50), nullable=True)),
+    ('sync_sessions', sa.Column('duration_seconds', sa.Integer(), nullable=True)),
+]
+
+# Índices añadidos a los modelos antes de usar Alembic: (tabla, nombre, columnas)
+INDEXES = [
+    ('sync_sessions', 'ix_sync_sessions_end_time_id', ['end_time', 'id']),
+    ('sync_events', 'ix_sync_events_session_timestamp', ['sync_session_id', 'timestamp']),
+]
+
+
+def _base_columns():
+    return [
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('is_deleted', sa.Boolean(), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    # Una base de datos creada con create_all entre el esquema inicial y esta revisión
+    # puede tener ya parte de estos cambios: cada paso comprueba antes si existe
+    if not inspector.has_table('scheduler_leases'):
+        op.create_table('scheduler_leases',
+        sa.Column('name', sa.String(length=255), nullable=False),
+        sa.Column('owner', sa.String(length=255), nullable=False),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        *_base_columns(),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_scheduler_leases_id'), 'scheduler_leases', ['id'], unique=False)
+        op.create_index(op.f('ix_scheduler_leases_name'), 'scheduler_leases', ['name'], unique=True)
+    if not inspector.has_table('startup_markers'):
+        op.create_table('startup_markers',
+        sa.Column('name', sa.String(length=255), nullable=False),
+        sa.Column('version', sa.String(length=255), nullable=False),
+        *_base_columns(),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_startup_markers_id'), 'startup_markers', ['id'], unique=False)
+        op.create_index(op.f('ix_startup_markers_name'), 'startup_markers', ['name'], unique=True)
+
+    for table, column in COLUMNS:
+        if column.name not in {existing['name'] for existing in inspector.get_columns(table)}:
+            op.add_column(table, column)
+    for table, name, columns in INDEXES:
+        if name not in {index['name'] for index in inspector.get_indexes(table)}:
+            op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    for table, name, columns in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
+    for table, column in reversed(COLUMNS):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column(column.name)
+    op.drop_index(op.f('ix_startup_markers_name'), table_name='startup_markers')
+    op.drop_index(op.f('ix_startup_markers_id'), table_name='startup_markers')
+    op.drop_table('startup_markers')
+    op.drop_index(op.f('ix_scheduler_leases_name'), table_name='scheduler_leases')
+    op.drop_index(op.f('ix_scheduler_leases_id'), table_name='scheduler_leases')
+    op.drop_table('scheduler_leases')
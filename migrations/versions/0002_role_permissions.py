@@ -0,0 +1,44 @@
+"""role permissions bitset
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 23:40:12.503114
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+# Valores de src.core.permissions.ROLE_PERMISSIONS en el momento de la migración
+ROLE_PERMISSIONS = {
+    "admin": 127,
+    "professor": 63,
+    "student": 5,
+}
+
+
+def upgrade() -> None:
+    # Bases de datos creadas con create_all a partir de los modelos actuales ya la tienen
+    columns = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("roles")}
+    if "permissions" not in columns:
+        op.add_column('roles', sa.Column('permissions', sa.Integer(), server_default='0', nullable=False))
+
+    roles = sa.table('roles', sa.column('role_name', sa.String), sa.column('permissions', sa.Integer))
+    for role_name, permissions in ROLE_PERMISSIONS.items():
+        op.execute(
+            roles.update()
+            .where(roles.c.role_name == role_name)
+            .where(roles.c.permissions == 0)
+            .values(permissions=permissions)
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('roles') as batch_op:
+        batch_op.drop_column('permissions')
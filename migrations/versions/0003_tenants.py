@@ -0,0 +1,83 @@
+"""tenants and tenant_id on tenant-scoped tables
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 00:41:37.902215
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+# Valor de src.core.tenancy.DEFAULT_TENANT_ID: los datos existentes pasan a este tenant
+DEFAULT_TENANT_ID = 1
+
+# Índices compuestos por tabla, con tenant_id como primera columna
+TENANT_INDEXES = {
+    'users': {'ix_users_tenant_id_id': ['tenant_id', 'id']},
+    'students': {'ix_students_tenant_id_id': ['tenant_id', 'id']},
+    'professors': {'ix_professors_tenant_id_user_id': ['tenant_id', 'user_id']},
+    'games': {'ix_games_tenant_id_id': ['tenant_id', 'id']},
+    'levels': {'ix_levels_tenant_id_game_id_level_number': ['tenant_id', 'game_id', 'level_number']},
+    'segment_levels': {'ix_segment_levels_tenant_id_level_number_id': ['tenant_id', 'level_number_id']},
+    'game_instances': {
+        'ix_game_instances_tenant_id_game_id': ['tenant_id', 'game_id'],
+        'ix_game_instances_tenant_id_student_id': ['tenant_id', 'student_id'],
+    },
+    'sync_sessions': {'ix_sync_sessions_tenant_id_instance_id': ['tenant_id', 'instance_id']},
+    'sync_events': {
+        'ix_sync_events_tenant_id_session_timestamp': ['tenant_id', 'sync_session_id', 'timestamp'],
+    },
+}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    # Bases de datos creadas con create_all a partir de los modelos actuales ya tienen
+    # la tabla, las columnas y los índices: cada paso comprueba antes si existe
+    if not inspector.has_table('tenants'):
+        op.create_table('tenants',
+        sa.Column('name', sa.String(length=255), nullable=False),
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('is_deleted', sa.Boolean(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('name')
+        )
+        op.create_index(op.f('ix_tenants_id'), 'tenants', ['id'], unique=False)
+
+    tenants = sa.table('tenants', sa.column('id', sa.Integer), sa.column('name', sa.String), sa.column('is_deleted', sa.Boolean))
+    if bind.execute(sa.select(tenants.c.id).where(tenants.c.id == DEFAULT_TENANT_ID)).first() is None:
+        op.execute(tenants.insert().values(id=DEFAULT_TENANT_ID, name='default', is_deleted=False))
+
+    for table, indexes in TENANT_INDEXES.items():
+        columns = {column['name'] for column in inspector.get_columns(table)}
+        if 'tenant_id' not in columns:
+            op.add_column(table, sa.Column('tenant_id', sa.Integer(), server_default=str(DEFAULT_TENANT_ID), nullable=False))
+            # SQLite no admite añadir claves foráneas sin recrear la tabla
+            if bind.dialect.name != 'sqlite':
+                op.create_foreign_key(f'fk_{table}_tenant_id_tenants', table, 'tenants', ['tenant_id'], ['id'])
+        existing = {index['name'] for index in inspector.get_indexes(table)}
+        for name, index_columns in indexes.items():
+            if name not in existing:
+                op.create_index(name, table, index_columns, unique=False)
+
+
+def downgrade() -> None:
+    for table, indexes in TENANT_INDEXES.items():
+        for name in indexes:
+            op.drop_index(name, table_name=table)
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column('tenant_id')
+    op.drop_index(op.f('ix_tenants_id'), table_name='tenants')
+    op.drop_table('tenants')
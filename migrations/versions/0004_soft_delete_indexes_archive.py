@@ -0,0 +1,64 @@
+"""user_id indexes, partial deleted_at indexes and archive tables
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 01:27:04.615380
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+DELETED = sa.text('deleted_at IS NOT NULL')
+
+# Índices completos (no parciales) de user_id: el archivado de usuarios comprueba también
+# los estudiantes y profesores eliminados que aún no se han archivado
+USER_ID_INDEXES = [
+    ('students', 'ix_students_user_id'),
+    ('professors', 'ix_professors_user_id'),
+]
+
+# Valor de src.models.archive.ARCHIVED_MODELS en el momento de la migración
+ARCHIVED_TABLES = [
+    'sync_events', 'sync_sessions', 'game_instances', 'progresses', 'segment_levels', 'levels',
+    'games', 'feedbacks', 'students', 'professors', 'teacher_settings', 'users',
+]
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    # Bases de datos creadas con create_all a partir de los modelos actuales ya tienen
+    # los índices y las tablas de archivo: cada paso comprueba antes si existe
+    for table, name in USER_ID_INDEXES:
+        if name not in {index['name'] for index in inspector.get_indexes(table)}:
+            op.create_index(name, table, ['user_id'], unique=False)
+
+    for table in ARCHIVED_TABLES:
+        name = f'ix_{table}_deleted_at'
+        if name not in {index['name'] for index in inspector.get_indexes(table)}:
+            op.create_index(name, table, ['deleted_at'], unique=False, sqlite_where=DELETED, postgresql_where=DELETED)
+
+        archive = f'{table}_archive'
+        if inspector.has_table(archive):
+            continue
+        # Mismas columnas que la tabla principal, sin claves foráneas ni valores por defecto
+        columns = [
+            sa.Column(column['name'], column['type'], primary_key=column['name'] == 'id', nullable=column['name'] != 'id')
+            for column in inspector.get_columns(table)
+        ]
+        op.create_table(archive, *columns, sa.Column('archived_at', sa.DateTime(timezone=True), nullable=False))
+
+
+def downgrade() -> None:
+    for table in reversed(ARCHIVED_TABLES):
+        op.drop_table(f'{table}_archive')
+        op.drop_index(f'ix_{table}_deleted_at', table_name=table)
+    for table, name in reversed(USER_ID_INDEXES):
+        op.drop_index(name, table_name=table)
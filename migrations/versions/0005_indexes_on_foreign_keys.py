@@ -0,0 +1,43 @@
+"""indexes on foreign keys
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 23:34:01.098298
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+# Generado con `python -m src.db.index_audit --write-migration`: (tabla, índice, columna)
+INDEXES = [
+    ('feedbacks', 'ix_feedbacks_student_id', 'student_id'),  # feedbacks.student_id -> students
+    ('game_instances', 'ix_game_instances_game_id', 'game_id'),  # game_instances.game_id -> games
+    ('game_instances', 'ix_game_instances_student_id', 'student_id'),  # game_instances.student_id -> students
+    ('levels', 'ix_levels_game_id', 'game_id'),  # levels.game_id -> games
+    ('progresses', 'ix_progresses_segment_level_id', 'segment_level_id'),  # progresses.segment_level_id -> segment_levels
+    ('segment_levels', 'ix_segment_levels_level_number_id', 'level_number_id'),  # segment_levels.level_number_id -> levels
+    ('sync_sessions', 'ix_sync_sessions_instance_id', 'instance_id'),  # sync_sessions.instance_id -> game_instances
+    ('teacher_settings', 'ix_teacher_settings_user_id', 'user_id'),  # teacher_settings.user_id -> users
+    ('users', 'ix_users_lms_id', 'lms_id'),  # users.lms_id -> lms_credentials
+    ('users', 'ix_users_role_id', 'role_id'),  # users.role_id -> roles
+]
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    # Bases de datos creadas con create_all a partir de los modelos actuales ya los tienen
+    for table, name, column in INDEXES:
+        if name not in {index['name'] for index in inspector.get_indexes(table)}:
+            op.create_index(name, table, [column], unique=False)
+
+
+def downgrade() -> None:
+    for table, name, column in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,34 @@
+"""version column on progresses
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19 12:40:18.562031
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+# La tabla de archivo replica las columnas de la principal, todas admiten NULL salvo
+# `id` (src/models/archive.py); el valor por defecto da versión 1 a las filas ya archivadas
+TABLES = [('progresses', False), ('progresses_archive', True)]
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    existing = set(inspector.get_table_names())
+    for table, nullable in TABLES:
+        if table in existing and 'version' not in {column['name'] for column in inspector.get_columns(table)}:
+            op.add_column(table, sa.Column('version', sa.Integer(), nullable=nullable, server_default='1'))
+
+
+def downgrade() -> None:
+    for table, _ in reversed(TABLES):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column('version')
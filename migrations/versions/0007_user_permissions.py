@@ -0,0 +1,46 @@
+"""users permissions
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19 18:05:41.220917
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+# Bits de src.core.permissions.Permission en el momento de la migración
+USERS_READ = 1 << 7
+USERS_WRITE = 1 << 8
+
+# Permisos nuevos de los roles sembrados (ROLE_PERMISSIONS)
+ROLE_PERMISSIONS = {
+    "admin": USERS_READ | USERS_WRITE,
+    "professor": USERS_READ,
+}
+
+
+def _roles() -> sa.Table:
+    return sa.table('roles', sa.column('role_name', sa.String), sa.column('permissions', sa.Integer))
+
+
+def upgrade() -> None:
+    roles = _roles()
+    for role_name, permissions in ROLE_PERMISSIONS.items():
+        op.execute(
+            roles.update()
+            .where(roles.c.role_name == role_name)
+            .values(permissions=roles.c.permissions.op('|')(permissions))
+        )
+
+
+def downgrade() -> None:
+    roles = _roles()
+    # Se conservan solo los bits que existían antes (hasta ADMIN = 1 << 6)
+    op.execute(roles.update().values(permissions=roles.c.permissions.op('&')(USERS_READ - 1)))
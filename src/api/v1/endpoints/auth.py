@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.core.config import settings
 from src.core.security import create_access_token, verify_password
 from src.core.deps import get_current_user
+from src.core.tenancy import tenant_scope
 from src.db.session import get_db
 from src.db.repositories.user_repository import UserRepository
 from src.schemas.auth import Token
@@ -21,10 +22,12 @@ async def login_for_access_token(form_data: UserLogin, db: AsyncSession = Depend
     """Authenticate user and return access token"""
     user_repo = UserRepository(db)
     try:
-        user = await user_repo.authenticate(form_data.email, form_data.password)
+        # El tenant del usuario aún no se conoce: la búsqueda por email ve todos los tenants
+        with tenant_scope(None):
+            user = await user_repo.authenticate(form_data.email, form_data.password)
         access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = create_access_token(
-            data={"sub": user.username}, expires_delta=access_token_expires
+            data={"sub": user.username, "rid": user.role_id or 0, "tid": user.tenant_id}, expires_delta=access_token_expires
         )
         return UserLoginResponse(
             access_token=access_token,
@@ -44,7 +47,10 @@ async def register_user(user_data: UserCreate, db: AsyncSession = Depends(get_db
     """Register a new user"""
     user_service = UserService(db)
     try:
-        user = await user_service.create_user(user_data)
+        # Registro anónimo: comprueba duplicados en todos los tenants y crea el usuario
+        # en el tenant inicial (tenant_default)
+        with tenant_scope(None):
+            user = await user_service.create_user(user_data)
         return SingleUserResponse(message="User registered successfully", data=user)
     except DuplicateEntryException as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
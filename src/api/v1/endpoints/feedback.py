@@ -1,4 +1,7 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from src.core.deps import require_permissions
+from src.core.permissions import Permission
+from src.schemas.auth import TokenData
 from typing import List
 from src.schemas.feedback import FeedbackCreate, FeedbackSchema
 import datetime
@@ -8,7 +11,8 @@ router = APIRouter(prefix="/feedback", tags=["Feedback"])
 
 @router.post("/", response_model=FeedbackSchema)
 async def submit_feedback(
-    feedback: FeedbackCreate
+    feedback: FeedbackCreate,
+    token_data: TokenData = Depends(require_permissions(Permission.GAMEPLAY))
 ):
     """
     Enviar retroalimentación de un estudiante.
@@ -28,7 +32,8 @@ async def submit_feedback(
 
 @router.get("/{student_id}", response_model=List[FeedbackSchema])
 async def get_student_feedback_history(
-    student_id: int
+    student_id: int,
+    token_data: TokenData = Depends(require_permissions(Permission.STUDENTS_READ))
 ):
     """
     Obtener feedback histórico del estudiante.
@@ -1,121 +1,108 @@
-from fastapi import APIRouter, Depends, Query
-from src.core.deps import get_current_user
-from src.models.user import User
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from typing import Optional
+from src.core.deps import require_permissions
+from src.core.permissions import Permission
+from src.schemas.auth import TokenData
 from src.schemas.game import GameCreateSchema, GameUpdateSchema, GameSchema
-from src.schemas.level import LevelCreateSchema, LevelUpdateSchema, LevelSchema
+from src.services.catalog_service import CatalogService, catalog_cache
+from src.services.game_service import GameService
+from src.core.exceptions import NotFoundException
+from src.core.conditional import ConditionalRequest
 
 
 router = APIRouter(prefix="/games", tags=["Games"])
 
 @router.get("/", response_model=list[GameSchema])
 async def get_games(
-    current_user: User = Depends(get_current_user),
+    response: Response,
+    token_data: TokenData = Depends(require_permissions(Permission.CATALOG_READ)),
     skip: int = Query(0, ge=0, description="Número de registros a saltar"),
-    limit: int = Query(10, ge=1, le=100, description="Número de registros a devolver")
+    limit: int = Query(10, ge=1, le=100, description="Número de registros a devolver"),
+    if_none_match: Optional[str] = Header(None),
+    catalog: CatalogService = Depends()
 ):
     """
     Lista todos los juegos.
     """
-    # Datos de prueba
-    mock_games = [
-        {
-            "id": 1,
-            "name": "Juego de Matemáticas Básicas",
-            "description": "Un juego para aprender matemáticas básicas",
-            "version": "1.0.0",
-            "is_active": True,
-            "created_at": "2023-01-15T10:30:00",
-            "updated_at": "2023-01-15T10:30:00"
-        },
-        {
-            "id": 2,
-            "name": "Aventura de Programación",
-            "description": "Un juego para aprender conceptos de programación",
-            "version": "2.1.0",
-            "is_active": True,
-            "created_at": "2023-02-20T14:45:00",
-            "updated_at": "2023-02-21T09:15:00"
-        }
-    ]
-    
-    # Aplicar paginación
-    start = skip
-    end = skip + limit
-    paginated_games = mock_games[start:end]
-    
-    return paginated_games
+    snapshot = await catalog.get_snapshot()
+    if snapshot.matches(if_none_match):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=snapshot.headers())
+    response.headers.update(snapshot.headers())
+    return snapshot.list_games(skip=skip, limit=limit)
 
-@router.post("/", response_model=GameSchema)
+@router.get("/catalog/stats")
+async def get_catalog_stats(token_data: TokenData = Depends(require_permissions(Permission.ADMIN))):
+    """
+    Estadísticas de la caché del catálogo (aciertos, fallos, versión) en este worker.
+    """
+    return catalog_cache.get_stats()
+
+@router.post("/", response_model=GameSchema, status_code=status.HTTP_201_CREATED)
 async def create_game(
     game: GameCreateSchema,
-    current_user: User = Depends(get_current_user)
+    token_data: TokenData = Depends(require_permissions(Permission.CATALOG_WRITE)),
+    game_service: GameService = Depends()
 ):
     """
     Crea un nuevo juego.
     """
-    # Datos de prueba
-    mock_new_game = {
-        "id": 999,  # ID simulado para el nuevo juego
-        "name": game.name,
-        "description": game.description,
-        "version": game.version or "1.0.0",
-        "is_active": game.is_active if game.is_active is not None else True,
-        "created_at": "2023-01-15T10:30:00",
-        "updated_at": "2023-01-15T10:30:00"
-    }
-    
-    return mock_new_game
+    return await game_service.create_game(game)
 
 @router.get("/{game_id}", response_model=GameSchema)
 async def get_game(
     game_id: int,
-    current_user: User = Depends(get_current_user)
+    token_data: TokenData = Depends(require_permissions(Permission.CATALOG_READ)),
+    conditional: ConditionalRequest = Depends(),
+    catalog: CatalogService = Depends()
 ):
     """
     Detalles de un juego específico.
     """
-    # Datos de prueba
-    mock_game = {
-        "id": game_id,
-        "name": f"Juego de ejemplo {game_id}",
-        "description": f"Descripción del juego {game_id}",
-        "version": "1.0.0",
-        "is_active": True,
-        "created_at": "2023-01-15T10:30:00",
-        "updated_at": "2023-01-15T10:30:00"
-    }
-    
-    return mock_game
+    snapshot = await catalog.get_snapshot()
+    game = snapshot.games_by_id.get(game_id)
+    if not game:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Juego no encontrado")
+    not_modified = conditional.not_modified_resource("games", game)
+    if not_modified:
+        return not_modified
+    return game
 
 @router.put("/{game_id}", response_model=GameSchema)
 async def update_game(
     game_id: int,
     game: GameUpdateSchema,
-    current_user: User = Depends(get_current_user)
+    token_data: TokenData = Depends(require_permissions(Permission.CATALOG_WRITE)),
+    conditional: ConditionalRequest = Depends(),
+    game_service: GameService = Depends()
 ):
     """
     Actualiza un juego.
+
+    Si se envía If-Match, solo se actualiza cuando coincide con el ETag actual y nadie lo
+    modifica entre la comprobación y la escritura (412 en otro caso).
     """
-    # Datos de prueba
-    mock_updated_game = {
-        "id": game_id,
-        "name": game.name or f"Juego de ejemplo {game_id}",
-        "description": game.description or f"Descripción del juego {game_id}",
-        "version": game.version or "1.0.0",
-        "is_active": game.is_active if game.is_active is not None else True,
-        "created_at": "2023-01-15T10:30:00",
-        "updated_at": "2023-01-15T15:45:00"  # Fecha actualizada
-    }
-    
-    return mock_updated_game
+    try:
+        current = await game_service.get_game_by_id(game_id)
+        if not current:
+            raise NotFoundException("Juego no encontrado")
+        checked = conditional.require_match("games", current)
+        updated = await game_service.update_game(game_id, game, unchanged_from=checked)
+        conditional.set_resource_headers("games", updated)
+        return updated
+    except NotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e.detail))
 
 @router.delete("/{game_id}")
 async def delete_game(
     game_id: int,
-    current_user: User = Depends(get_current_user)
+    token_data: TokenData = Depends(require_permissions(Permission.CATALOG_WRITE)),
+    game_service: GameService = Depends()
 ):
     """
     Elimina un juego.
     """
-    # Simulación de eliminación
-    return {"message": f"Juego con ID {game_id} eliminado exitosamente"}
\ No newline at end of file
+    try:
+        await game_service.delete_game(game_id)
+    except NotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e.detail))
+    return {"message": f"Juego con ID {game_id} eliminado exitosamente"}
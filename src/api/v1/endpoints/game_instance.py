@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, Query
-from src.core.deps import get_current_user
-from src.models.user import User
+from src.core.deps import require_permissions
+from src.core.permissions import Permission
+from src.schemas.auth import TokenData
 from src.schemas.game_instance import GameInstanceCreate, GameInstanceUpdate, GameInstance as GameInstanceSchema
 
 router = APIRouter(prefix="/game-instances", tags=["Game Instances"])
@@ -9,7 +10,7 @@ router = APIRouter(prefix="/game-instances", tags=["Game Instances"])
 async def create_game_instance(
     game_id: int,
     instance_data: GameInstanceCreate,
-    current_user: User = Depends(get_current_user)
+    token_data: TokenData = Depends(require_permissions(Permission.GAMEPLAY))
 ):
     """
     Crea una instancia del juego para un estudiante.
@@ -31,7 +32,7 @@ async def create_game_instance(
 @router.get("/{game_id}/instances", response_model=list[GameInstanceSchema])
 async def list_game_instances(
     game_id: int,
-    current_user: User = Depends(get_current_user),
+    token_data: TokenData = Depends(require_permissions(Permission.GAMEPLAY)),
     skip: int = Query(0, ge=0, description="Número de registros a saltar"),
     limit: int = Query(10, ge=1, le=100, description="Número de registros a devolver"),
     status: str = Query("active", description="Filtrar por estado (active, completed, abandoned)")
@@ -73,7 +74,7 @@ async def list_game_instances(
 @router.get("/{instance_id}", response_model=GameInstanceSchema)
 async def get_instance(
     instance_id: int,
-    current_user: User = Depends(get_current_user)
+    token_data: TokenData = Depends(require_permissions(Permission.GAMEPLAY))
 ):
     """
     Obtiene información de una instancia.
@@ -95,7 +96,7 @@ async def get_instance(
 @router.put("/{instance_id}/end", response_model=GameInstanceSchema)
 async def end_instance(
     instance_id: int,
-    current_user: User = Depends(get_current_user)
+    token_data: TokenData = Depends(require_permissions(Permission.GAMEPLAY))
 ):
     """
     Marca la instancia como finalizada.
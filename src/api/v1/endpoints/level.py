@@ -1,64 +1,103 @@
-from fastapi import APIRouter, Depends, Query
-from src.core.deps import get_current_user
-from src.models.user import User
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from typing import Optional
+from src.core.deps import require_permissions
+from src.core.permissions import Permission
+from src.schemas.auth import TokenData
 from src.schemas.level import LevelCreateSchema, LevelUpdateSchema, LevelSchema
+from src.services.catalog_service import CatalogService
+from src.services.level_bundle_service import LevelBundleService
+from src.services.level_service import LevelService
+from src.core.exceptions import NotFoundException
+from src.core.conditional import ConditionalRequest, etag_matches
+from src.core.config import settings
 
 router = APIRouter(prefix="/levels", tags=["Levels"])
 
 @router.get("/{level_id}", response_model=LevelSchema)
 async def get_level(
     level_id: int,
-    current_user: User = Depends(get_current_user)
+    token_data: TokenData = Depends(require_permissions(Permission.CATALOG_READ)),
+    conditional: ConditionalRequest = Depends(),
+    catalog: CatalogService = Depends()
 ):
     """
     Detalles de un nivel.
     """
-    # Datos de prueba
-    mock_level = {
-        "id": level_id,
-        "game_id": 1,
-        "name": f"Nivel {level_id}",
-        "description": f"Descripción del nivel {level_id}",
-        "order": level_id,
-        "is_active": True,
-        "created_at": "2023-01-15T10:30:00",
-        "updated_at": "2023-01-15T10:30:00"
+    snapshot = await catalog.get_snapshot()
+    level = snapshot.levels_by_id.get(level_id)
+    if not level:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Nivel no encontrado")
+    not_modified = conditional.not_modified_resource("levels", level)
+    if not_modified:
+        return not_modified
+    return level
+
+@router.get("/{level_id}/bundle")
+async def get_level_bundle(
+    level_id: int,
+    token_data: TokenData = Depends(require_permissions(Permission.CATALOG_READ)),
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+    bundle_service: LevelBundleService = Depends()
+):
+    """
+    Nivel completo en una sola petición: el nivel, sus segmentos ordenados y sus configuraciones.
+
+    El cuerpo está precalculado y comprimido; se envía en gzip si el cliente lo acepta.
+    """
+    bundle = await bundle_service.get_bundle(level_id)
+    if not bundle:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Nivel no encontrado")
+    headers = {
+        **bundle.headers(),
+        "Cache-Control": f"private, max-age={settings.LEVEL_BUNDLE_MAX_AGE_SECONDS}, must-revalidate",
+        "Vary": "Accept-Encoding",
     }
-    
-    return mock_level
+    if etag_matches(if_none_match, bundle.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if accept_encoding and "gzip" in accept_encoding.lower():
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=bundle.gzip_payload, media_type="application/json", headers=headers)
+    return Response(content=bundle.payload, media_type="application/json", headers=headers)
 
 @router.put("/{level_id}", response_model=LevelSchema)
 async def update_level(
     level_id: int,
     level: LevelUpdateSchema,
-    current_user: User = Depends(get_current_user)
+    token_data: TokenData = Depends(require_permissions(Permission.CATALOG_WRITE)),
+    conditional: ConditionalRequest = Depends(),
+    level_service: LevelService = Depends()
 ):
     """
     Edita un nivel.
+
+    Si se envía If-Match, solo se actualiza cuando coincide con el ETag actual y nadie lo
+    modifica entre la comprobación y la escritura (412 en otro caso).
     """
-    # Datos de prueba
-    mock_updated_level = {
-        "id": level_id,
-        "game_id": 1,
-        "name": level.name or f"Nivel {level_id}",
-        "description": level.description or f"Descripción del nivel {level_id}",
-        "order": level.order or level_id,
-        "is_active": level.is_active if level.is_active is not None else True,
-        "created_at": "2023-01-15T10:30:00",
-        "updated_at": "2023-01-15T15:45:00"  # Fecha actualizada
-    }
-    
-    return mock_updated_level
+    try:
+        current = await level_service.get_level_by_id(level_id)
+        if not current:
+            raise NotFoundException("Nivel no encontrado")
+        checked = conditional.require_match("levels", current)
+        updated = await level_service.update_level(level_id, level, unchanged_from=checked)
+        conditional.set_resource_headers("levels", updated)
+        return updated
+    except NotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e.detail))
 
 @router.delete("/{level_id}")
 async def delete_level(
     level_id: int,
-    current_user: User = Depends(get_current_user)
+    token_data: TokenData = Depends(require_permissions(Permission.CATALOG_WRITE)),
+    level_service: LevelService = Depends()
 ):
     """
     Elimina un nivel.
     """
-    # Simulación de eliminación
+    try:
+        await level_service.delete_level(level_id)
+    except NotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e.detail))
     return {"message": f"Nivel con ID {level_id} eliminado exitosamente"}
 
 
@@ -68,77 +107,30 @@ game_level_router = APIRouter(prefix="/games/{game_id}/levels", tags=["Game Leve
 @game_level_router.get("/", response_model=list[LevelSchema])
 async def get_game_levels(
     game_id: int,
-    current_user: User = Depends(get_current_user),
+    response: Response,
+    token_data: TokenData = Depends(require_permissions(Permission.CATALOG_READ)),
     skip: int = Query(0, ge=0, description="Número de registros a saltar"),
-    limit: int = Query(10, ge=1, le=100, description="Número de registros a devolver")
+    limit: int = Query(10, ge=1, le=100, description="Número de registros a devolver"),
+    if_none_match: Optional[str] = Header(None),
+    catalog: CatalogService = Depends()
 ):
     """
     Lista los niveles de un juego.
     """
-    # Datos de prueba
-    mock_levels = [
-        {
-            "id": 1,
-            "game_id": game_id,
-            "name": "Nivel 1: Introducción",
-            "description": "Nivel introductorio para familiarizarse con el juego",
-            "order": 1,
-            "is_active": True,
-            "created_at": "2023-01-15T10:30:00",
-            "updated_at": "2023-01-15T10:30:00"
-        },
-        {
-            "id": 2,
-            "game_id": game_id,
-            "name": "Nivel 2: Básico",
-            "description": "Nivel básico con conceptos fundamentales",
-            "order": 2,
-            "is_active": True,
-            "created_at": "2023-01-16T11:45:00",
-            "updated_at": "2023-01-16T11:45:00"
-        },
-        {
-            "id": 3,
-            "game_id": game_id,
-            "name": "Nivel 3: Intermedio",
-            "description": "Nivel intermedio con desafíos más complejos",
-            "order": 3,
-            "is_active": True,
-            "created_at": "2023-01-17T09:30:00",
-            "updated_at": "2023-01-17T09:30:00"
-        }
-    ]
-    
-    # Aplicar paginación
-    start = skip
-    end = skip + limit
-    paginated_levels = mock_levels[start:end]
-    
-    return paginated_levels
+    snapshot = await catalog.get_snapshot()
+    if snapshot.matches(if_none_match):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=snapshot.headers())
+    response.headers.update(snapshot.headers())
+    return snapshot.list_game_levels(game_id, skip=skip, limit=limit)
 
-@game_level_router.post("/", response_model=LevelSchema)
+@game_level_router.post("/", response_model=LevelSchema, status_code=status.HTTP_201_CREATED)
 async def create_game_level(
     game_id: int,
     level: LevelCreateSchema,
-    current_user: User = Depends(get_current_user)
+    token_data: TokenData = Depends(require_permissions(Permission.CATALOG_WRITE)),
+    level_service: LevelService = Depends()
 ):
     """
     Crea un nuevo nivel en un juego.
     """
-    # Datos de prueba
-    mock_new_level = {
-        "id": 999,  # ID simulado para el nuevo nivel
-        "game_id": game_id,
-        "name": level.name,
-        "description": level.description,
-        "order": level.order or 1,
-        "is_active": level.is_active if level.is_active is not None else True,
-        "created_at": "2023-01-15T10:30:00",
-        "updated_at": "2023-01-15T10:30:00"
-    }
-    
-    return mock_new_level
-
-
-# Agregar el router de niveles de juego al router principal
-router.include_router(game_level_router)
\ No newline at end of file
+    return await level_service.create_level(game_id, level)
@@ -1,5 +1,8 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from datetime import datetime, timedelta
+from src.core.deps import require_permissions
+from src.core.permissions import Permission
+from src.schemas.auth import TokenData
 from src.schemas.lms_credential import LMSCredentialCreate, LMSCredentialUpdate, LMSCredentialSchema
 
 router = APIRouter(prefix="/lms/credentials", tags=["LMS Credentials"])
@@ -7,7 +10,8 @@ router = APIRouter(prefix="/lms/credentials", tags=["LMS Credentials"])
 
 @router.post("/", response_model=LMSCredentialSchema)
 async def register_lms_credentials(
-    credentials: LMSCredentialCreate
+    credentials: LMSCredentialCreate,
+    token_data: TokenData = Depends(require_permissions(Permission.TEACHER_PROFILE))
 ):
     """
     Registrar credenciales del LMS.
@@ -29,7 +33,8 @@ async def register_lms_credentials(
 
 @router.get("/{user_id}", response_model=LMSCredentialSchema)
 async def get_user_credentials(
-    user_id: int
+    user_id: int,
+    token_data: TokenData = Depends(require_permissions(Permission.TEACHER_PROFILE))
 ):
     """
     Ver credenciales del usuario.
@@ -52,7 +57,8 @@ async def get_user_credentials(
 @router.put("/{user_id}", response_model=LMSCredentialSchema)
 async def update_credentials(
     user_id: int,
-    credentials_update: LMSCredentialUpdate
+    credentials_update: LMSCredentialUpdate,
+    token_data: TokenData = Depends(require_permissions(Permission.TEACHER_PROFILE))
 ):
     """
     Actualizar credenciales.
@@ -73,7 +79,9 @@ async def update_credentials(
 
 
 @router.post("/sync", summary="Sincronizar datos entre LMS y plataforma")
-async def sync_lms_data():
+async def sync_lms_data(
+    token_data: TokenData = Depends(require_permissions(Permission.TEACHER_PROFILE))
+):
     """
     Sincronizar datos entre LMS y plataforma.
     """
@@ -1,3 +1,10 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from src.core.deps import require_permissions
+from src.core.permissions import Permission
 
-router = APIRouter(prefix="/metric-types", tags=["metric-types"])
\ No newline at end of file
+# Aún sin rutas: el permiso del router protege las que se añadan
+router = APIRouter(
+    prefix="/metric-types",
+    tags=["metric-types"],
+    dependencies=[Depends(require_permissions(Permission.CATALOG_READ))],
+)
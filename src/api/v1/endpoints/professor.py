@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.core.deps import get_current_user
+from src.core.deps import get_current_user, require_permissions
+from src.core.permissions import Permission
 from src.db.session import get_db
 from src.models.user import User
 from src.services.teacher_service import TeacherService
@@ -12,7 +13,11 @@ from src.schemas.teacher import (
     TeacherUpdateResponseSchema
 )
 
-router = APIRouter(prefix='/professors',tags=["Professors"])
+router = APIRouter(
+    prefix='/professors',
+    tags=["Professors"],
+    dependencies=[Depends(require_permissions(Permission.TEACHER_PROFILE))],
+)
 
 @router.get("/me", response_model=TeacherProfileResponseSchema)
 async def get_teacher_profile(
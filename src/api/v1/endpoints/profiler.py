@@ -0,0 +1,83 @@
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from src.core.config import settings
+from src.core.deps import get_current_admin
+from src.core.exceptions import ConflictException, NotFoundException
+from src.core.loop_watchdog import loop_watchdog
+from src.core.profiler import FORMAT_COLLAPSED, FORMATS, Profile, profiler_registry
+from src.models.user import User
+
+router = APIRouter(prefix="/admin/profiler", tags=["Admin Profiler"])
+
+
+def _profile_response(profile: Profile, fmt: str) -> Response:
+    content, media_type, filename = profile.render(fmt)
+    return Response(
+        content=content,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"', "X-Profile-Id": profile.id},
+    )
+
+
+def _check_format(fmt: str) -> None:
+    if fmt not in FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Formato no soportado: {fmt}. Formatos válidos: {', '.join(FORMATS)}",
+        )
+
+
+@router.post("/sample")
+async def sample_event_loop(
+    seconds: float = Query(5, gt=0, le=settings.PROFILER_MAX_SECONDS, description="Duración del muestreo"),
+    interval_ms: float = Query(settings.PROFILER_DEFAULT_INTERVAL_MS, ge=1, le=1000, description="Milisegundos entre muestras"),
+    route: Optional[str] = Query(None, description="Expresión regular de rutas a perfilar (p. ej. ^/api/v1/games)"),
+    format: str = Query(FORMAT_COLLAPSED, description="collapsed o speedscope"),
+    current_admin: User = Depends(get_current_admin)
+):
+    """
+    Muestrea el event loop durante N segundos y devuelve el perfil (pilas colapsadas o speedscope).
+
+    Con `route` solo se cuentan las muestras de las peticiones cuya ruta coincide.
+    """
+    _check_format(format)
+    if not settings.PROFILER_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profiler deshabilitado")
+    try:
+        profile = await profiler_registry.sample(seconds, interval_ms / 1000, route=route)
+    except ConflictException as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e.detail))
+    return _profile_response(profile, format)
+
+
+@router.get("/profiles", response_model=List[Dict[str, Any]])
+async def list_profiles(current_admin: User = Depends(get_current_admin)):
+    """
+    Lista los últimos perfiles capturados en este proceso (muestreos y cabecera X-Profile).
+    """
+    return profiler_registry.list_profiles()
+
+
+@router.get("/profiles/{profile_id}")
+async def get_profile(
+    profile_id: str,
+    format: str = Query(FORMAT_COLLAPSED, description="collapsed o speedscope"),
+    current_admin: User = Depends(get_current_admin)
+):
+    """
+    Descarga un perfil capturado.
+    """
+    _check_format(format)
+    try:
+        profile = profiler_registry.get_profile(profile_id)
+    except NotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e.detail))
+    return _profile_response(profile, format)
+
+
+@router.get("/loop", response_model=Dict[str, Any])
+async def get_loop_watchdog(current_admin: User = Depends(get_current_admin)):
+    """
+    Estado del watchdog del event loop y últimos bloqueos detectados, con su pila.
+    """
+    return {"stats": loop_watchdog.get_stats(), "recent_blocks": loop_watchdog.get_recent_blocks()}
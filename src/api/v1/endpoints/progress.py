@@ -1,3 +1,10 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from src.core.deps import require_permissions
+from src.core.permissions import Permission
 
-router = APIRouter(prefix="/progress", tags=["progress"])
\ No newline at end of file
+# Aún sin rutas: el permiso del router protege las que se añadan
+router = APIRouter(
+    prefix="/progress",
+    tags=["progress"],
+    dependencies=[Depends(require_permissions(Permission.STUDENTS_READ))],
+)
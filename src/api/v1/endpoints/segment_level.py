@@ -1,119 +1,104 @@
-from fastapi import APIRouter, Depends, Query
-from src.core.deps import get_current_user
-from src.models.user import User
+import hashlib
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from typing import Optional
+from src.core.deps import require_permissions
+from src.core.permissions import Permission
+from src.schemas.auth import TokenData
 from src.schemas.segment_level import SegmentLevelCreate, SegmentLevelUpdate, SegmentLevel as SegmentLevelSchema
+from src.services.catalog_service import CatalogService
+from src.services.segment_level_service import SegmentLevelService
+from src.core.exceptions import NotFoundException
+from src.core.conditional import etag_matches
 
 router = APIRouter(prefix="/segments", tags=["Segments"])
 
+def _to_schema(segment) -> dict:
+    return {
+        "id": segment.id,
+        "level_id": segment.level_number_id,
+        "config": segment.configuration,
+        "created_at": segment.created_at,
+        "updated_at": segment.updated_at,
+    }
+
 @router.get("/{level_id}/segments", response_model=list[SegmentLevelSchema])
 async def get_level_segments(
     level_id: int,
-    current_user: User = Depends(get_current_user),
+    response: Response,
+    token_data: TokenData = Depends(require_permissions(Permission.CATALOG_READ)),
     skip: int = Query(0, ge=0, description="Número de registros a saltar"),
-    limit: int = Query(10, ge=1, le=100, description="Número de registros a devolver")
+    limit: int = Query(10, ge=1, le=100, description="Número de registros a devolver"),
+    if_none_match: Optional[str] = Header(None),
+    catalog: CatalogService = Depends()
 ):
     """
     Lista los segmentos de un nivel.
     """
-    # Datos de prueba
-    mock_segments = [
-        {
-            "id": 1,
-            "level_id": level_id,
-            "name": "Segmento 1: Conceptos básicos",
-            "description": "Introducción a los conceptos básicos del nivel",
-            "config": {"type": "instruction", "duration": 300},
-            "order": 1,
-            "is_active": True,
-            "created_at": "2023-01-15T10:30:00",
-            "updated_at": "2023-01-15T10:30:00"
-        },
-        {
-            "id": 2,
-            "level_id": level_id,
-            "name": "Segmento 2: Ejercicio práctico",
-            "description": "Ejercicio práctico para aplicar conceptos",
-            "config": {"type": "exercise", "complexity": "easy", "expected_time": 600},
-            "order": 2,
-            "is_active": True,
-            "created_at": "2023-01-16T11:45:00",
-            "updated_at": "2023-01-16T11:45:00"
-        },
-        {
-            "id": 3,
-            "level_id": level_id,
-            "name": "Segmento 3: Evaluación",
-            "description": "Evaluación para verificar comprensión",
-            "config": {"type": "evaluation", "questions": 5, "passing_score": 80},
-            "order": 3,
-            "is_active": True,
-            "created_at": "2023-01-17T09:30:00",
-            "updated_at": "2023-01-17T09:30:00"
-        }
-    ]
-    
-    # Aplicar paginación
-    start = skip
-    end = skip + limit
-    paginated_segments = mock_segments[start:end]
-    
-    return paginated_segments
+    snapshot = await catalog.get_snapshot()
+    if snapshot.matches(if_none_match):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=snapshot.headers())
+    response.headers.update(snapshot.headers())
+    return snapshot.list_level_segments(level_id, skip=skip, limit=limit)
+
+@router.get("/{segment_id}/config")
+async def get_segment_config(
+    segment_id: int,
+    token_data: TokenData = Depends(require_permissions(Permission.CATALOG_READ)),
+    if_none_match: Optional[str] = Header(None),
+    catalog: CatalogService = Depends()
+):
+    """
+    Configuración de ejecución del segmento, precompilada al guardarla.
+
+    Devuelve los bytes almacenados sin parsear ni volver a validar el JSON.
+    """
+    snapshot = await catalog.get_snapshot()
+    payload = snapshot.compiled_configs.get(segment_id)
+    if payload is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Segmento no encontrado")
+    headers = {"ETag": f'W/"{hashlib.sha1(payload).hexdigest()[:16]}"'}
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
 
-@router.post("/{level_id}/segments", response_model=SegmentLevelSchema)
+@router.post("/{level_id}/segments", response_model=SegmentLevelSchema, status_code=status.HTTP_201_CREATED)
 async def create_level_segment(
     level_id: int,
     segment: SegmentLevelCreate,
-    current_user: User = Depends(get_current_user)
+    token_data: TokenData = Depends(require_permissions(Permission.CATALOG_WRITE)),
+    segment_service: SegmentLevelService = Depends()
 ):
     """
     Agrega un segmento a un nivel.
     """
-    # Datos de prueba
-    mock_new_segment = {
-        "id": 999,  # ID simulado para el nuevo segmento
-        "level_id": level_id,
-        "name": segment.name,
-        "description": segment.description or f"Descripción para {segment.name}",
-        "config": segment.config or {"type": "default", "properties": {}},
-        "order": segment.order or 1,
-        "is_active": segment.is_active if segment.is_active is not None else True,
-        "created_at": "2023-01-15T10:30:00",
-        "updated_at": "2023-01-15T10:30:00"
-    }
-    
-    return mock_new_segment
+    return _to_schema(await segment_service.create_segment_level(level_id, segment))
 
 @router.put("/{segment_id}", response_model=SegmentLevelSchema)
 async def update_segment(
     segment_id: int,
     segment: SegmentLevelUpdate,
-    current_user: User = Depends(get_current_user)
+    token_data: TokenData = Depends(require_permissions(Permission.CATALOG_WRITE)),
+    segment_service: SegmentLevelService = Depends()
 ):
     """
     Actualiza configuración JSON del segmento.
     """
-    # Datos de prueba
-    mock_updated_segment = {
-        "id": segment_id,
-        "level_id": 1,  # Valor simulado
-        "name": segment.name or f"Segmento {segment_id}",
-        "description": segment.description or f"Descripción del segmento {segment_id}",
-        "config": segment.config or {"type": "default", "properties": {}},
-        "order": segment.order or 1,
-        "is_active": segment.is_active if segment.is_active is not None else True,
-        "created_at": "2023-01-15T10:30:00",
-        "updated_at": "2023-01-15T15:45:00"  # Fecha actualizada
-    }
-    
-    return mock_updated_segment
+    try:
+        return _to_schema(await segment_service.update_segment_level(segment_id, segment))
+    except NotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e.detail))
 
 @router.delete("/{segment_id}")
 async def delete_segment(
     segment_id: int,
-    current_user: User = Depends(get_current_user)
+    token_data: TokenData = Depends(require_permissions(Permission.CATALOG_WRITE)),
+    segment_service: SegmentLevelService = Depends()
 ):
     """
     Elimina un segmento.
     """
-    # Simulación de eliminación
-    return {"message": f"Segmento con ID {segment_id} eliminado exitosamente"}
\ No newline at end of file
+    try:
+        await segment_service.delete_segment_level(segment_id)
+    except NotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e.detail))
+    return {"message": f"Segmento con ID {segment_id} eliminado exitosamente"}
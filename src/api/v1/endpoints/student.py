@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, Query
-from src.core.deps import get_current_user
-from src.models.user import User
+from src.core.deps import require_permissions
+from src.core.permissions import Permission
+from src.schemas.auth import TokenData
 from src.schemas.student import (
     StudentListResponse,
     StudentResponse,
@@ -14,7 +15,7 @@ router = APIRouter(prefix='/students', tags=["Students"])
 
 @router.get("/", response_model=StudentListResponse)
 async def list_students(
-    current_user: User = Depends(get_current_user),
+    token_data: TokenData = Depends(require_permissions(Permission.STUDENTS_READ)),
     skip: int = Query(0, ge=0, description="Número de registros a saltar"),
     limit: int = Query(10, ge=1, le=100, description="Número de registros a devolver"),
     search: str = Query(None, description="Búsqueda por nombre o email"),
@@ -56,7 +57,7 @@ async def list_students(
 @router.get("/{id}", response_model=StudentResponse)
 async def get_student(
     id: int,
-    current_user: User = Depends(get_current_user)
+    token_data: TokenData = Depends(require_permissions(Permission.STUDENTS_READ))
 ):
     """
     Obtener detalle de un estudiante
@@ -82,7 +83,7 @@ async def get_student(
 @router.post("/", response_model=StudentResponse)
 async def create_student(
     student_data: StudentCreate,
-    current_user: User = Depends(get_current_user)
+    token_data: TokenData = Depends(require_permissions(Permission.STUDENTS_WRITE))
 ):
     """
     Registrar un nuevo estudiante
@@ -109,7 +110,7 @@ async def create_student(
 async def update_student(
     id: int,
     student_data: StudentUpdate,
-    current_user: User = Depends(get_current_user)
+    token_data: TokenData = Depends(require_permissions(Permission.STUDENTS_WRITE))
 ):
     """
     Actualizar información del estudiante
@@ -135,7 +136,7 @@ async def update_student(
 @router.delete("/{id}")
 async def delete_student(
     id: int,
-    current_user: User = Depends(get_current_user)
+    token_data: TokenData = Depends(require_permissions(Permission.STUDENTS_WRITE))
 ):
     """
     Eliminar estudiante
@@ -146,7 +147,7 @@ async def delete_student(
 @router.get("/{id}/progress", response_model=StudentProgressResponse)
 async def get_student_progress(
     id: int,
-    current_user: User = Depends(get_current_user)
+    token_data: TokenData = Depends(require_permissions(Permission.STUDENTS_READ))
 ):
     """
     Obtener progreso del estudiante
@@ -171,7 +172,7 @@ async def get_student_progress(
 @router.get("/{id}/reports", response_model=StudentReportsResponse)
 async def get_student_reports(
     id: int,
-    current_user: User = Depends(get_current_user)
+    token_data: TokenData = Depends(require_permissions(Permission.STUDENTS_READ))
 ):
     """
     Obtener reportes individuales (desempeño, actividad, etc.)
@@ -1,4 +1,7 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from src.core.deps import require_permissions
+from src.core.permissions import Permission
+from src.schemas.auth import TokenData
 from typing import List
 from src.schemas.sync_event import SyncEventCreate, SyncEventSchema
 import datetime
@@ -8,7 +11,8 @@ router = APIRouter(prefix="/sync-events", tags=["Sync Events"])
 
 @router.post("/", response_model=SyncEventSchema)
 async def register_sync_event(
-    sync_event: SyncEventCreate
+    sync_event: SyncEventCreate,
+    token_data: TokenData = Depends(require_permissions(Permission.GAMEPLAY))
 ):
     """
     Registra un evento (acción del jugador).
@@ -27,7 +31,8 @@ async def register_sync_event(
 
 @router.get("/{session_id}", response_model=List[SyncEventSchema])
 async def list_sync_events(
-    session_id: int
+    session_id: int,
+    token_data: TokenData = Depends(require_permissions(Permission.GAMEPLAY))
 ):
     """
     Lista eventos asociados a una sesión.
@@ -1,6 +1,11 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
+from src.core.deps import require_permissions
+from src.core.permissions import Permission
+from src.schemas.auth import TokenData
 from typing import List
 from src.schemas.sync_session import SyncSessionCreate, SyncSessionUpdate, SyncSessionSchema
+from src.core.scheduler import scheduler
+from src.services.sync_session_reaper import sync_session_reaper
 import datetime
 
 router = APIRouter(prefix="/sync-sessions", tags=["Sync Sessions"])
@@ -8,7 +13,8 @@ router = APIRouter(prefix="/sync-sessions", tags=["Sync Sessions"])
 
 @router.post("/", response_model=SyncSessionSchema)
 async def start_sync_session(
-    sync_session: SyncSessionCreate
+    sync_session: SyncSessionCreate,
+    token_data: TokenData = Depends(require_permissions(Permission.GAMEPLAY))
 ):
     """
     Inicia una sesión de sincronización.
@@ -27,7 +33,8 @@ async def start_sync_session(
 
 @router.put("/{session_id}/end", response_model=SyncSessionSchema)
 async def end_sync_session(
-    session_id: int
+    session_id: int,
+    token_data: TokenData = Depends(require_permissions(Permission.GAMEPLAY))
 ):
     """
     Finaliza la sesión.
@@ -44,9 +51,23 @@ async def end_sync_session(
     return mock_ended_session
 
 
+@router.get("/reaper/stats")
+async def get_reaper_stats(token_data: TokenData = Depends(require_permissions(Permission.ADMIN))):
+    """
+    Estado del cierre automático de sesiones inactivas en este worker (solo administradores).
+    """
+    job = scheduler.get_job("sync_session_reaper")
+    return {
+        "owner_id": scheduler.owner_id,
+        "reaper": sync_session_reaper.stats,
+        "job": job.stats if job else None,
+    }
+
+
 @router.get("/{instance_id}", response_model=List[SyncSessionSchema])
 async def get_sessions_by_instance(
-    instance_id: int
+    instance_id: int,
+    token_data: TokenData = Depends(require_permissions(Permission.GAMEPLAY))
 ):
     """
     Obtiene sesiones de una instancia.
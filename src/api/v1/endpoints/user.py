@@ -4,12 +4,20 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from src.services.user_service import UserService
 from src.schemas.user import UserCreate, UserUpdate, UserResponse, UserListResponse, SingleUserResponse
 from src.core.exceptions import NotFoundException, DuplicateEntryException
+from src.core.conditional import ConditionalRequest, collection_etag
+from src.core.deps import require_permissions
+from src.core.permissions import Permission
+from src.schemas.auth import TokenData
 
 router = APIRouter(tags=["Users"])
 
 
 @router.post("/", response_model=SingleUserResponse, status_code=status.HTTP_201_CREATED, summary="Crear un nuevo usuario")
-async def create_user(user_data: UserCreate, user_service: UserService = Depends()):
+async def create_user(
+    user_data: UserCreate,
+    token_data: TokenData = Depends(require_permissions(Permission.USERS_WRITE)),
+    user_service: UserService = Depends(),
+):
     """
     Crea un nuevo usuario en la base de datos con la información proporcionada.
     - **email**: El correo electrónico del usuario (debe ser único).
@@ -25,41 +33,81 @@ async def create_user(user_data: UserCreate, user_service: UserService = Depends
 
 
 @router.get("/{user_id}", response_model=SingleUserResponse, summary="Obtener un usuario por ID")
-async def get_user(user_id: int, user_service: UserService = Depends()):
+async def get_user(
+    user_id: int,
+    token_data: TokenData = Depends(require_permissions(Permission.USERS_READ)),
+    user_service: UserService = Depends(),
+    conditional: ConditionalRequest = Depends(),
+):
     """
     Busca y devuelve un usuario por su ID único.
+
+    Admite If-None-Match / If-Modified-Since y responde 304 si el usuario no ha cambiado.
     """
     user = await user_service.get_user_by_id(user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Usuario no encontrado")
+    not_modified = conditional.not_modified_resource("users", user)
+    if not_modified:
+        return not_modified
     return SingleUserResponse(message="Usuario obtenido con éxito", data=user)
 
 
 @router.get("/", response_model=UserListResponse, summary="Obtener todos los usuarios")
-async def get_all_users(skip: int = 0, limit: int = 100, user_service: UserService = Depends()):
+async def get_all_users(
+    skip: int = 0,
+    limit: int = 100,
+    token_data: TokenData = Depends(require_permissions(Permission.USERS_READ)),
+    user_service: UserService = Depends(),
+    conditional: ConditionalRequest = Depends(),
+):
     """
     Obtiene una lista paginada de todos los usuarios registrados en el sistema.
+
+    El ETag del listado se calcula con max(updated_at) y el total de usuarios, antes de cargarlos.
     """
+    last_modified, count = await user_service.get_users_stamp()
+    not_modified = conditional.not_modified(collection_etag(last_modified, count), last_modified)
+    if not_modified:
+        return not_modified
     users = await user_service.get_all_users(skip=skip, limit=limit)
     return UserListResponse(message="Usuarios obtenidos con éxito", data=users)
 
 
 @router.put("/{user_id}", response_model=SingleUserResponse, summary="Actualizar un usuario")
-async def update_user(user_id: int, user_data: UserUpdate, user_service: UserService = Depends()):
+async def update_user(
+    user_id: int,
+    user_data: UserUpdate,
+    token_data: TokenData = Depends(require_permissions(Permission.USERS_WRITE)),
+    user_service: UserService = Depends(),
+    conditional: ConditionalRequest = Depends(),
+):
     """
     Actualiza la información de un usuario existente, identificado por su ID.
+
+    Si se envía If-Match, solo se actualiza cuando coincide con el ETag actual y nadie lo
+    modifica entre la comprobación y la escritura (412 en otro caso).
     """
     try:
-        user = await user_service.update_user(user_id, user_data)
+        current = await user_service.get_user_by_id(user_id)
+        if not current:
+            raise NotFoundException("Usuario no encontrado")
+        checked = conditional.require_match("users", current)
+        user = await user_service.update_user(user_id, user_data, unchanged_from=checked)
+        conditional.set_resource_headers("users", user)
         return SingleUserResponse(message="Usuario actualizado con éxito", data=user)
     except NotFoundException as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e.detail))
     except DuplicateEntryException as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Eliminar un usuario")
-async def delete_user(user_id: int, user_service: UserService = Depends()):
+async def delete_user(
+    user_id: int,
+    token_data: TokenData = Depends(require_permissions(Permission.USERS_WRITE)),
+    user_service: UserService = Depends(),
+):
     """
     Realiza un "soft delete" de un usuario, marcándolo como eliminado en la base de datos.
     """
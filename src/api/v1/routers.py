@@ -1,18 +1,48 @@
-from fastapi import APIRouter
-from src.api.v1.endpoints import user, auth, lms_credential, student, professor, sync_event, sync_session, progress, segment_level, level, game, game_instance, metric_type, feedback
+import importlib
+from typing import Iterable, Optional, Tuple
+from fastapi import Depends, FastAPI
+from src.core.deps import profile_request
 
-api_router = APIRouter()
-api_router.include_router(user.router, prefix="/users")
-api_router.include_router(auth.router)
-api_router.include_router(lms_credential.router)
-api_router.include_router(student.router)
-api_router.include_router(professor.router)
-api_router.include_router(sync_event.router)
-api_router.include_router(sync_session.router)
-api_router.include_router(progress.router)
-api_router.include_router(segment_level.router)
-api_router.include_router(level.router)
-api_router.include_router(game.router)
-api_router.include_router(game_instance.router)
-api_router.include_router(metric_type.router)
-api_router.include_router(feedback.router)
+ENDPOINTS_PACKAGE = "src.api.v1.endpoints"
+
+# (módulo de src/api/v1/endpoints, atributo del router, prefijo), en orden de registro
+API_ROUTERS: Tuple[Tuple[str, str, str], ...] = (
+    ("user", "router", "/users"),
+    ("auth", "router", ""),
+    ("lms_credential", "router", ""),
+    ("student", "router", ""),
+    ("professor", "router", ""),
+    ("sync_event", "router", ""),
+    ("sync_session", "router", ""),
+    ("progress", "router", ""),
+    ("segment_level", "router", ""),
+    ("level", "router", ""),
+    ("level", "game_level_router", ""),
+    ("game", "router", ""),
+    ("game_instance", "router", ""),
+    ("metric_type", "router", ""),
+    ("feedback", "router", ""),
+    ("profiler", "router", ""),
+)
+
+
+def include_api_routers(app: FastAPI, prefix: str = "/api/v1", modules: Optional[Iterable[str]] = None) -> None:
+    """
+    Registra los routers de la API en la aplicación.
+
+    Cada router se incluye directamente en `app` en lugar de pasar por un APIRouter
+    intermedio: `include_router` reconstruye cada ruta (dependencias, modelos de
+    respuesta) en cada nivel de anidamiento, y un nivel menos reduce el arranque.
+
+    Args:
+        app: Aplicación FastAPI
+        prefix: Prefijo común de la API
+        modules: Si se indica, solo se importan y registran esos módulos de endpoints
+    """
+    selected = set(modules) if modules is not None else None
+    dependencies = [Depends(profile_request)]
+    for module_name, attribute, router_prefix in API_ROUTERS:
+        if selected is not None and module_name not in selected:
+            continue
+        module = importlib.import_module(f"{ENDPOINTS_PACKAGE}.{module_name}")
+        app.include_router(getattr(module, attribute), prefix=prefix + router_prefix, dependencies=dependencies)
@@ -0,0 +1,182 @@
+# app/core/conditional.py
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+from fastapi import Header, Response, status
+
+from src.core.exceptions import PreconditionFailedException
+
+
+def _attr(obj: Any, name: str) -> Any:
+    """Lee un atributo tanto de un modelo SQLAlchemy como de un diccionario."""
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def modified_at(obj: Any) -> Optional[datetime]:
+    """Instante de la última modificación: `updated_at` o, si nunca se actualizó, `created_at`."""
+    return _as_utc(_attr(obj, "updated_at") or _attr(obj, "created_at"))
+
+
+def resource_etag(resource: str, obj: Any) -> str:
+    """
+    Calcula el ETag débil de un recurso a partir de `(tipo, id, updated_at)`.
+
+    El tipo evita que recursos distintos con el mismo ID y fecha (p. ej. el juego 1 y el
+    usuario 1 creados en el mismo instante) compartan ETag.
+
+    Args:
+        resource: Tipo del recurso, p. ej. el nombre de su tabla ("games")
+        obj: Modelo o diccionario con `id`, `updated_at` y `created_at`
+
+    Returns:
+        str: ETag débil, p. ej. W/"1a2b3c..."
+    """
+    stamp = modified_at(obj)
+    seed = f"{resource}:{_attr(obj, 'id')}:{stamp.isoformat() if stamp else ''}"
+    return f'W/"{hashlib.sha1(seed.encode("utf-8")).hexdigest()[:16]}"'
+
+
+def collection_etag(last_modified: Optional[datetime], count: int) -> str:
+    """
+    Calcula el ETag débil de una colección a partir de `max(updated_at)` y el número de filas.
+
+    Args:
+        last_modified: Mayor instante de modificación de la colección
+        count: Número de elementos de la colección
+
+    Returns:
+        str: ETag débil de la colección
+    """
+    stamp = _as_utc(last_modified)
+    seed = f"{stamp.isoformat() if stamp else ''}:{count}"
+    return f'W/"c-{hashlib.sha1(seed.encode("utf-8")).hexdigest()[:16]}"'
+
+
+def etag_matches(header: Optional[str], etag: str) -> bool:
+    """
+    Comparación débil (RFC 9110) entre una cabecera If-None-Match/If-Match y un ETag.
+
+    Args:
+        header: Valor de la cabecera del cliente, con una o varias etiquetas separadas por comas
+        etag: ETag actual del recurso
+
+    Returns:
+        bool: True si alguna etiqueta coincide o la cabecera es `*`
+    """
+    if not header:
+        return False
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if (tag[2:] if tag.startswith("W/") else tag) == opaque:
+            return True
+    return False
+
+
+class ConditionalRequest:
+    """
+    Dependencia que resuelve peticiones condicionales HTTP.
+
+    - GET: `not_modified()` devuelve una respuesta 304 vacía si el cliente ya tiene
+      la representación (If-None-Match, o If-Modified-Since si no hay ETag), evitando
+      serializar el cuerpo. Si no, añade ETag/Last-Modified a la respuesta.
+    - Escrituras: `require_match()` lanza 412 si If-Match no coincide con el recurso
+      actual y devuelve el estado comprobado, que el repositorio usa como condición del
+      UPDATE (`updated_at` sin cambios) para no perder escrituras concurrentes.
+    """
+
+    def __init__(
+        self,
+        response: Response,
+        if_none_match: Optional[str] = Header(None),
+        if_modified_since: Optional[str] = Header(None),
+        if_match: Optional[str] = Header(None),
+    ):
+        self.response = response
+        self.if_none_match = if_none_match
+        self.if_modified_since = if_modified_since
+        self.if_match = if_match
+
+    @staticmethod
+    def headers_for(etag: str, last_modified: Optional[datetime] = None) -> Dict[str, str]:
+        """Cabeceras de validación para un ETag y una fecha de modificación."""
+        headers = {"ETag": etag}
+        last_modified = _as_utc(last_modified)
+        if last_modified is not None:
+            headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+        return headers
+
+    def not_modified(self, etag: str, last_modified: Optional[datetime] = None) -> Optional[Response]:
+        """
+        Evalúa la petición condicional de lectura.
+
+        Args:
+            etag: ETag actual del recurso o colección
+            last_modified: Instante de la última modificación, si se conoce
+
+        Returns:
+            Response: Respuesta 304 si la representación del cliente sigue vigente, None si no
+        """
+        headers = self.headers_for(etag, last_modified)
+        if self._is_fresh(etag, last_modified):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        self.response.headers.update(headers)
+        return None
+
+    def not_modified_resource(self, resource: str, obj: Any) -> Optional[Response]:
+        """Atajo de `not_modified` para un recurso con `id` y `updated_at`."""
+        return self.not_modified(resource_etag(resource, obj), modified_at(obj))
+
+    def require_match(self, resource: str, obj: Any) -> Optional[Any]:
+        """
+        Comprueba la precondición If-Match antes de modificar un recurso.
+
+        La comprobación sola no basta: otra petición puede escribir entre la lectura y el
+        UPDATE. El estado devuelto se pasa al repositorio (`unchanged_from`), que solo
+        actualiza si `updated_at` sigue siendo el comprobado.
+
+        Args:
+            resource: Tipo del recurso (ver `resource_etag`)
+            obj: Estado actual del recurso (modelo o diccionario)
+
+        Returns:
+            Any: `obj` si se envió If-Match, None si la escritura es incondicional
+
+        Raises:
+            PreconditionFailedException: Si If-Match no coincide con el ETag actual
+        """
+        if self.if_match is None:
+            return None
+        if not etag_matches(self.if_match, resource_etag(resource, obj)):
+            raise PreconditionFailedException()
+        return obj
+
+    def set_resource_headers(self, resource: str, obj: Any) -> None:
+        """Añade ETag y Last-Modified del recurso a la respuesta (p. ej. tras actualizarlo)."""
+        self.response.headers.update(self.headers_for(resource_etag(resource, obj), modified_at(obj)))
+
+    def _is_fresh(self, etag: str, last_modified: Optional[datetime]) -> bool:
+        if self.if_none_match is not None:
+            return etag_matches(self.if_none_match, etag)
+        if self.if_modified_since and last_modified is not None:
+            try:
+                since = _as_utc(parsedate_to_datetime(self.if_modified_since))
+            except (TypeError, ValueError):
+                return False
+            # Las fechas HTTP tienen resolución de segundos
+            return _as_utc(last_modified).replace(microsecond=0) <= since
+        return False
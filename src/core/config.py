@@ -1,13 +1,105 @@
+from typing import Optional
+
 from pydantic import BaseSettings
 
 class Settings(BaseSettings):
     PROJECT_NAME: str = "Hello World Backend"
     DATABASE_URL: str = "sqlite+aiosqlite:///./test.db"
+    DATABASE_ECHO: bool = True
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    DEBUG: bool = False
+
+    # Arranque: "migrate" aplica migraciones de Alembic y seeds una sola vez bajo un lock
+    # entre procesos (el resto de workers solo comprueba la marca de versión),
+    # "create_all" mantiene el comportamiento anterior y "skip" no toca la base de datos
+    STARTUP_SCHEMA_MODE: str = "migrate"
+    STARTUP_LOCK_TIMEOUT_SECONDS: int = 120
+
+    # Calentamiento antes de aceptar tráfico (mappers, esquemas, pool, autenticación y
+    # cachés); /ready responde 503 hasta que termina
+    WARMUP_ENABLED: bool = True
+    WARMUP_POOL_CONNECTIONS: int = 2
+    # Bundles de nivel precalculados en el arranque (limitado por LEVEL_BUNDLE_CACHE_SIZE)
+    WARMUP_LEVEL_BUNDLES: int = 64
+
+    # Métricas Prometheus en /metrics (multiproceso con PROMETHEUS_MULTIPROC_DIR)
+    METRICS_ENABLED: bool = True
+
+    # Profiler de muestreo (solo administradores)
+    PROFILER_ENABLED: bool = True
+    PROFILER_MAX_SECONDS: int = 60
+    PROFILER_DEFAULT_INTERVAL_MS: int = 5
+    PROFILER_MAX_STORED: int = 20
+    PROFILER_MAX_CONCURRENT_REQUESTS: int = 2
+
+    # Watchdog del event loop: latido cada INTERVAL y aviso si el loop se bloquea más
+    # de THRESHOLD. Con FAIL_ON_BLOCK (tests) la petición que lo bloquea falla
+    LOOP_WATCHDOG_ENABLED: bool = True
+    LOOP_WATCHDOG_INTERVAL_MS: int = 20
+    LOOP_WATCHDOG_THRESHOLD_MS: int = 100
+    LOOP_WATCHDOG_FAIL_ON_BLOCK: bool = False
+
+    # Instrumentación SQL por petición. Las cabeceras X-Query-* y la detección de N+1
+    # (repeticiones de una misma sentencia) solo se activan con DEBUG
+    SQL_INSTRUMENTATION_ENABLED: bool = True
+    SQL_N_PLUS_ONE_THRESHOLD: int = 3
+    # Máximo de sentencias por petición (0 sin límite); modo "warn" o "raise" (tests)
+    SQL_QUERY_BUDGET: int = 0
+    SQL_QUERY_BUDGET_MODE: str = "warn"
+
+    # Tareas programadas
+    SCHEDULER_ENABLED: bool = True
+    SCHEDULER_LEASE_TTL_SECONDS: int = 120
+
+    # Cierre automático de sesiones de sincronización inactivas
+    SYNC_SESSION_REAPER_ENABLED: bool = True
+    SYNC_SESSION_IDLE_MINUTES: int = 30
+    SYNC_SESSION_REAPER_INTERVAL_SECONDS: int = 60
+    SYNC_SESSION_REAPER_BATCH_SIZE: int = 500
+
+    # Archivado de filas con soft delete antiguo en las tablas `<tabla>_archive`
+    SOFT_DELETE_ARCHIVER_ENABLED: bool = True
+    SOFT_DELETE_RETENTION_DAYS: int = 30
+    SOFT_DELETE_ARCHIVER_INTERVAL_SECONDS: int = 3600
+    SOFT_DELETE_ARCHIVER_BATCH_SIZE: int = 1000
+
+    # Reintentos de las actualizaciones de progreso con control de versión ante conflictos
+    PROGRESS_UPDATE_MAX_ATTEMPTS: int = 5
+
+    # Acumulación en memoria de incrementos de contadores de progreso, volcada por lotes
+    # cada PROGRESS_COUNTER_FLUSH_INTERVAL_SECONDS (requiere el scheduler). El diario local
+    # permite recuperar los pendientes tras una caída; con FSYNC también tras un corte de luz.
+    # Desactivado por defecto: aún no hay ningún endpoint que ingiera actividad de progreso,
+    # y el diario usa flock (solo POSIX)
+    PROGRESS_COUNTER_BUFFER_ENABLED: bool = False
+    PROGRESS_COUNTER_FLUSH_INTERVAL_SECONDS: int = 5
+    PROGRESS_COUNTER_JOURNAL_DIR: str = "var/progress_counters"
+    PROGRESS_COUNTER_JOURNAL_FSYNC: bool = False
+
+    # Registro de roles y permisos en memoria (recarga tras el TTL o al cambiar un rol)
+    ROLE_CACHE_TTL_SECONDS: int = 300
+
+    # Caché de lectura por ID de los repositorios con CachedRepositoryMixin. Sin Redis cada
+    # worker tiene un LRU por tabla y el TTL acota la desactualización frente a escrituras
+    # de otros workers; con REPOSITORY_CACHE_REDIS_URL la caché es compartida
+    REPOSITORY_CACHE_ENABLED: bool = True
+    REPOSITORY_CACHE_TTL_SECONDS: int = 60
+    REPOSITORY_CACHE_NEGATIVE_TTL_SECONDS: int = 5
+    REPOSITORY_CACHE_SIZE: int = 2048
+    REPOSITORY_CACHE_REDIS_URL: Optional[str] = None
+
+    # Cargas por ID agrupadas por petición (src/db/batch_loader.py): IDs por consulta IN
+    BATCH_LOADER_MAX_BATCH_SIZE: int = 500
+
+    # Caché del catálogo de juegos (juegos, niveles y segmentos)
+    CATALOG_CACHE_TTL_SECONDS: int = 300
+    # Bundles de nivel (nivel + segmentos + configuraciones) precalculados
+    LEVEL_BUNDLE_CACHE_SIZE: int = 256
+    LEVEL_BUNDLE_MAX_AGE_SECONDS: int = 0
 
     class Config:
         env_file = ".env"
 
-settings = Settings()
\ No newline at end of file
+settings = Settings()
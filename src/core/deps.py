@@ -1,8 +1,16 @@
-from fastapi import Depends, HTTPException, status
+import functools
+import operator
+from typing import AsyncIterator, Awaitable, Callable, Optional
+from fastapi import Depends, Header, HTTPException, Request, Response, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.core.config import settings
+from src.core.exceptions import UnauthorizedException
+from src.core.permissions import Permission, role_registry
+from src.core.profiler import profiler_registry
+from src.core.security import decode_access_token
+from src.core.singleflight import SingleFlight
+from src.core.tenancy import set_current_tenant
 from src.db.session import get_db
 from src.db.repositories.user_repository import UserRepository
 from src.models.user import User
@@ -12,27 +20,124 @@ from src.schemas.auth import TokenData
 # OAuth2 scheme for token extraction
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/auth/login")
 
-async def get_current_user(
-    db: AsyncSession = Depends(get_db),
-    token: str = Depends(oauth2_scheme)
-) -> User:
-    """Get current user from JWT token"""
-    credentials_exception = HTTPException(
+# Búsquedas del usuario del token: las peticiones simultáneas de un mismo usuario
+# (p. ej. el arranque de un cliente) comparten una sola consulta
+_current_user_lookups = SingleFlight("current_user")
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-        token_data = TokenData(username=username)
-    except JWTError:
-        raise credentials_exception
-    
+
+
+async def get_token_data(token: str = Depends(oauth2_scheme)) -> TokenData:
+    """
+    Valida el JWT y devuelve sus claims, sin acceder a la base de datos.
+
+    Fija además el tenant de la petición: desde aquí las consultas sobre modelos con
+    tenant solo ven los datos de su colegio.
+    """
+    payload = decode_access_token(token)
+    username: Optional[str] = payload.get("sub") if payload else None
+    if username is None:
+        raise _credentials_exception()
+    token_data = TokenData(username=username, role_id=payload.get("rid"), tenant_id=payload.get("tid"))
+    set_current_tenant(token_data.tenant_id)
+    return token_data
+
+
+async def get_current_user(
+    db: AsyncSession = Depends(get_db),
+    token_data: TokenData = Depends(get_token_data)
+) -> User:
+    """Get current user from JWT token"""
     user_repo = UserRepository(db)
-    user = await user_repo.get_by_username(token_data.username)
+    user = await _current_user_lookups.do(user_repo.get_by_username, token_data.username)
     if user is None:
-        raise credentials_exception
-    return user
\ No newline at end of file
+        raise _credentials_exception()
+    if user not in db:
+        # Resultado de una búsqueda agrupada, cargado en la sesión de otra petición
+        user = await db.merge(user, load=False)
+    return user
+
+
+async def has_permissions(role_id: Optional[int], required: Permission) -> bool:
+    """Indica si el rol tiene todos los permisos de `required` (según role_registry)"""
+    return required in await role_registry.permissions(role_id)
+
+
+def require_permissions(*required: Permission) -> Callable[..., Awaitable[TokenData]]:
+    """
+    Dependencia que exige los permisos indicados al rol del token.
+
+    La comprobación usa el claim `rid` y el registro de roles en memoria: no consulta
+    la base de datos salvo para recargar el registro. Los endpoints que no necesitan
+    el usuario completo pueden depender solo de ella.
+
+    Args:
+        required: Permisos exigidos (todos)
+
+    Returns:
+        Callable: Dependencia que devuelve los datos del token
+
+    Raises:
+        HTTPException: 401 si el token no es válido o no incluye el rol
+        UnauthorizedException: Si el rol no tiene alguno de los permisos
+    """
+    needed = functools.reduce(operator.or_, required, Permission.NONE)
+
+    async def dependency(token_data: TokenData = Depends(get_token_data)) -> TokenData:
+        # Tokens anteriores a incluir el rol: se pide volver a iniciar sesión
+        if token_data.role_id is None:
+            raise _credentials_exception()
+        if not await has_permissions(token_data.role_id, needed):
+            raise UnauthorizedException("Permisos insuficientes")
+        return token_data
+
+    return dependency
+
+
+async def get_current_admin(current_user: User = Depends(get_current_user)) -> User:
+    """Get current user and require the admin permission"""
+    if not await has_permissions(current_user.role_id, Permission.ADMIN):
+        raise UnauthorizedException("Se requiere el rol de administrador")
+    return current_user
+
+
+async def profile_request(
+    request: Request,
+    response: Response,
+    x_profile: Optional[str] = Header(None),
+) -> AsyncIterator[None]:
+    """
+    Perfilado opcional de una petición con la cabecera `X-Profile` (solo administradores).
+
+    Sin la cabecera no hace nada. Con ella, autentica al usuario, muestrea la tarea de
+    la petición hasta que termina y devuelve el ID del perfil en `X-Profile-Id`; el
+    perfil se descarga después desde /admin/profiler/profiles/{id}.
+    """
+    if not x_profile or not settings.PROFILER_ENABLED:
+        yield
+        return
+
+    token_data = await get_token_data(await oauth2_scheme(request))
+    if not await has_permissions(token_data.role_id, Permission.ADMIN):
+        raise UnauthorizedException("Se requiere el rol de administrador para perfilar peticiones")
+
+    profiler = profiler_registry.start_request(
+        f"{request.method} {request.url.path}",
+        settings.PROFILER_DEFAULT_INTERVAL_MS / 1000,
+    )
+    if profiler is None:
+        response.headers["X-Profile"] = "busy"
+        yield
+        return
+
+    response.headers["X-Profile-Id"] = profiler.profile_id
+    try:
+        yield
+    finally:
+        profiler_registry.finish_request(profiler)
@@ -39,6 +39,15 @@ class InvalidCredentialsException(AppException):
             headers={"WWW-Authenticate": "Bearer"}
         )
 
+class TenantRequiredException(AppException):
+    """Acceso a datos de un tenant en una petición sin tenant (anónima o con token sin `tid`)"""
+    def __init__(self, detail: str = "Se requiere autenticación para acceder a estos datos"):
+        super().__init__(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=detail,
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+
 class UnauthorizedException(AppException):
     """Excepción cuando el usuario no tiene permisos"""
     def __init__(self, detail: str = "No autorizado"):
@@ -47,6 +56,46 @@ class UnauthorizedException(AppException):
             detail=detail
         )
 
+class ConflictException(AppException):
+    """Excepción cuando la operación entra en conflicto con el estado actual del recurso"""
+    def __init__(self, detail: str = "Conflicto con el estado actual del recurso"):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=detail
+        )
+
+class InvalidDataException(AppException):
+    """Excepción cuando los datos enviados no superan la validación de negocio"""
+    def __init__(self, detail: str = "Datos inválidos"):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=detail
+        )
+
+class PreconditionFailedException(AppException):
+    """Excepción cuando no se cumple una precondición HTTP (If-Match)"""
+    def __init__(self, detail: str = "El recurso fue modificado por otra petición"):
+        super().__init__(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=detail
+        )
+
+class QueryBudgetExceededException(AppException):
+    """Excepción cuando una petición supera el presupuesto de sentencias SQL"""
+    def __init__(self, detail: str = "Se superó el presupuesto de sentencias SQL"):
+        super().__init__(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=detail
+        )
+
+class EventLoopBlockedException(AppException):
+    """Excepción cuando una petición bloquea el event loop más de lo permitido"""
+    def __init__(self, detail: str = "La petición bloqueó el event loop"):
+        super().__init__(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=detail
+        )
+
 class DatabaseException(AppException):
     """Excepción para errores de base de datos"""
     def __init__(self, detail: str = "Error en la base de datos"):
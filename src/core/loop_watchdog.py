@@ -0,0 +1,163 @@
+# app/core/loop_watchdog.py
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+import weakref
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, MutableMapping, Optional
+
+from src.core import metrics
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LoopWatchdog:
+    """
+    Vigilante del event loop: mide el retraso (lag) continuamente y detecta bloqueos.
+
+    Una corutina "latido" duerme `interval` y mide cuánto tarda de más en despertar.
+    Un hilo aparte comprueba el último latido: si el loop lleva más de `threshold`
+    sin latir, está ejecutando código bloqueante (bcrypt, E/S síncrona, validaciones
+    pesadas...) y en ese momento se captura la pila del hilo del loop y la tarea que
+    lo ocupa. Cada bloqueo se registra una sola vez, en métricas y en el log.
+    """
+
+    def __init__(
+        self,
+        interval: Optional[float] = None,
+        threshold: Optional[float] = None,
+        max_recent: int = 50,
+    ):
+        self.interval = interval or settings.LOOP_WATCHDOG_INTERVAL_MS / 1000
+        self.threshold = threshold or settings.LOOP_WATCHDOG_THRESHOLD_MS / 1000
+        self.recent_blocks: Deque[Dict[str, Any]] = deque(maxlen=max_recent)
+        self.stats: Dict[str, Any] = {"ticks": 0, "blocks": 0, "max_lag_ms": 0.0, "last_lag_ms": 0.0}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread_id: Optional[int] = None
+        self._last_tick = time.monotonic()
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._monitor_thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        # Bloqueo máximo (segundos) atribuido a cada tarea, hasta que su petición lo consulta.
+        # Con referencias débiles: las tareas de fondo (scheduler, warm-up...) nunca lo
+        # consultan y su entrada desaparece al liberarse la tarea
+        self._task_blocks: MutableMapping[asyncio.Task, float] = weakref.WeakKeyDictionary()
+        self._task_lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._heartbeat_task is not None and not self._heartbeat_task.done()
+
+    async def start(self) -> None:
+        """Arranca el latido en el loop actual y el hilo monitor."""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._thread_id = threading.get_ident()
+        self._last_tick = time.monotonic()
+        self._stop.clear()
+        self._heartbeat_task = asyncio.create_task(self._heartbeat(), name="loop-watchdog")
+        self._monitor_thread = threading.Thread(target=self._monitor, name="loop-watchdog", daemon=True)
+        self._monitor_thread.start()
+
+    async def stop(self) -> None:
+        """Detiene el latido y el hilo monitor."""
+        self._stop.set()
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat_task = None
+        if self._monitor_thread is not None:
+            self._monitor_thread.join(timeout=self.interval * 2)
+            self._monitor_thread = None
+
+    def pop_task_block(self, task: Optional[asyncio.Task]) -> float:
+        """
+        Devuelve y olvida el bloqueo más largo (segundos) causado por una tarea.
+
+        Args:
+            task: Tarea de la petición
+
+        Returns:
+            float: Duración del bloqueo más largo detectado, 0 si no hubo
+        """
+        if task is None:
+            return 0.0
+        with self._task_lock:
+            return self._task_blocks.pop(task, 0.0)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "running": self.running,
+            "interval_ms": self.interval * 1000,
+            "threshold_ms": self.threshold * 1000,
+        }
+
+    def get_recent_blocks(self) -> List[Dict[str, Any]]:
+        return list(reversed(self.recent_blocks))
+
+    async def _heartbeat(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            self._last_tick = time.monotonic()
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(loop.time() - expected, 0.0)
+            self.stats["ticks"] += 1
+            self.stats["last_lag_ms"] = round(lag * 1000, 3)
+            self.stats["max_lag_ms"] = max(self.stats["max_lag_ms"], self.stats["last_lag_ms"])
+            metrics.EVENT_LOOP_LAG.observe(lag)
+
+    def _monitor(self) -> None:
+        reported_tick = None
+        while not self._stop.wait(self.interval):
+            tick = self._last_tick
+            blocked = time.monotonic() - tick
+            if blocked < self.threshold:
+                continue
+            # En un método aparte: la tarea y la pila capturadas no quedan referenciadas
+            # desde este bucle hasta el siguiente bloqueo
+            self._record_block(blocked, report=tick != reported_tick)
+            reported_tick = tick
+
+    def _record_block(self, blocked: float, report: bool) -> None:
+        task = self._current_task()
+        if task is not None:
+            with self._task_lock:
+                self._task_blocks[task] = max(self._task_blocks.get(task, 0.0), blocked)
+        if not report:
+            return
+
+        frame = sys._current_frames().get(self._thread_id)
+        stack = "".join(traceback.format_stack(frame)) if frame is not None else ""
+        task_name = task.get_name() if task is not None else None
+        self.stats["blocks"] += 1
+        self.recent_blocks.append({
+            "detected_at": datetime.utcnow(),
+            "blocked_ms": round(blocked * 1000, 1),
+            "task": task_name,
+            "stack": stack,
+        })
+        metrics.EVENT_LOOP_BLOCKS.inc()
+        logger.warning(
+            "Event loop bloqueado %.0f ms (tarea %s). Pila:\n%s",
+            blocked * 1000, task_name, stack,
+        )
+
+    def _current_task(self) -> Optional[asyncio.Task]:
+        try:
+            return asyncio.current_task(self._loop)
+        except RuntimeError:
+            return None
+
+
+loop_watchdog = LoopWatchdog()
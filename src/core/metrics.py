@@ -0,0 +1,217 @@
+# app/core/metrics.py
+"""
+Métricas Prometheus de la aplicación.
+
+Con varios workers de uvicorn hay que definir PROMETHEUS_MULTIPROC_DIR (directorio
+vacío y escribible) antes de arrancar: cada proceso escribe sus valores en ficheros
+mmap y `/metrics` los agrega con MultiProcessCollector, sea cual sea el worker que
+atienda la petición.
+"""
+import functools
+import os
+import time
+from typing import Any, Callable, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    REGISTRY,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+from sqlalchemy import event
+
+MULTIPROCESS_ENABLED = bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+# HTTP, etiquetado con la plantilla de ruta (no la URL concreta) para acotar la cardinalidad
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Latencia de las peticiones HTTP",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "Peticiones HTTP en curso",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+# Métricas SQL por petición
+DB_STATEMENTS_PER_REQUEST = Histogram(
+    "db_statements_per_request",
+    "Sentencias SQL ejecutadas por petición",
+    ["method", "route"],
+    buckets=(1, 2, 3, 5, 8, 13, 21, 34, 55, 89),
+)
+DB_TIME_PER_REQUEST = Histogram(
+    "db_time_per_request_seconds",
+    "Tiempo total en base de datos por petición",
+    ["method", "route"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+DB_ROWS_PER_REQUEST = Histogram(
+    "db_rows_per_request",
+    "Filas leídas o afectadas por petición",
+    ["method", "route"],
+    buckets=(1, 10, 50, 100, 500, 1000, 5000, 10000),
+)
+DB_SLOWEST_STATEMENT = Histogram(
+    "db_slowest_statement_seconds",
+    "Duración de la sentencia SQL más lenta de cada petición",
+    ["method", "route"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+DB_QUERY_BUDGET_EXCEEDED = Counter(
+    "db_query_budget_exceeded_total",
+    "Peticiones que superaron el presupuesto de sentencias SQL",
+    ["method", "route"],
+)
+
+# Pool de conexiones
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Tiempo de espera para obtener una conexión del pool",
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0),
+)
+DB_POOL_SIZE = Gauge("db_pool_size", "Tamaño configurado del pool", multiprocess_mode="livesum")
+DB_POOL_CHECKED_OUT = Gauge("db_pool_checked_out", "Conexiones del pool en uso", multiprocess_mode="livesum")
+DB_POOL_OVERFLOW = Gauge("db_pool_overflow", "Conexiones abiertas por encima del tamaño del pool", multiprocess_mode="livesum")
+
+# Repositorios y servicios
+REPOSITORY_METHOD_DURATION = Histogram(
+    "repository_method_duration_seconds",
+    "Duración de los métodos de los repositorios",
+    ["repository", "method"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+BCRYPT_DURATION = Histogram(
+    "bcrypt_duration_seconds",
+    "Duración de las operaciones bcrypt",
+    ["operation"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 1.0),
+)
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "Consultas a las cachés en memoria",
+    ["cache", "result"],
+)
+SINGLEFLIGHT_CALLS = Counter(
+    "singleflight_calls_total",
+    "Llamadas a funciones con single-flight: ejecutadas o agrupadas en una ya en curso",
+    ["group", "result"],
+)
+OPTIMISTIC_UPDATE_CONFLICTS = Counter(
+    "optimistic_update_conflicts_total",
+    "Actualizaciones condicionadas a una versión que ya había cambiado",
+    ["table"],
+)
+INGEST_QUEUE_DEPTH = Gauge(
+    "ingest_queue_depth",
+    "Elementos pendientes en las colas de ingesta de eventos",
+    ["queue"],
+    multiprocess_mode="livesum",
+)
+EVENT_LOOP_LAG = Histogram(
+    "event_loop_lag_seconds",
+    "Retraso del event loop medido por el latido del watchdog",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+EVENT_LOOP_BLOCKS = Counter(
+    "event_loop_blocks_total",
+    "Bloqueos del event loop que superaron el umbral del watchdog",
+)
+APP_STARTUP_DURATION = Gauge(
+    "app_startup_duration_seconds",
+    "Duración del arranque de cada worker por fase",
+    ["phase"],
+    multiprocess_mode="liveall",
+)
+SYNC_SESSIONS_REAPED = Counter(
+    "sync_sessions_reaped_total",
+    "Sesiones de sincronización cerradas por inactividad",
+)
+SOFT_DELETED_ROWS_ARCHIVED = Counter(
+    "soft_deleted_rows_archived_total",
+    "Filas eliminadas movidas a su tabla de archivo",
+    ["table"],
+)
+
+
+def timed_repository_method(method: Callable) -> Callable:
+    """
+    Envuelve un método asíncrono de repositorio para medir su duración,
+    etiquetada con la clase concreta del repositorio y el nombre del método.
+    """
+    if getattr(method, "__metrics_timed__", False):
+        return method
+
+    @functools.wraps(method)
+    async def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            REPOSITORY_METHOD_DURATION.labels(type(self).__name__, method.__name__).observe(
+                time.perf_counter() - start
+            )
+
+    wrapper.__metrics_timed__ = True
+    return wrapper
+
+
+def instrument_pool(engine) -> None:
+    """
+    Instrumenta el pool de conexiones del engine: tiempo de espera al obtener una
+    conexión y tamaño/uso del pool tras cada checkout y checkin (idempotente).
+
+    Args:
+        engine: Engine síncrono o AsyncEngine
+    """
+    pool = getattr(engine, "sync_engine", engine).pool
+    if getattr(pool, "_metrics_instrumented", False):
+        return
+
+    connect = pool.connect
+
+    def timed_connect():
+        start = time.perf_counter()
+        try:
+            return connect()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - start)
+
+    def update_gauges(*_):
+        # NullPool/StaticPool no exponen estos contadores
+        if hasattr(pool, "size"):
+            DB_POOL_SIZE.set(pool.size())
+            DB_POOL_CHECKED_OUT.set(pool.checkedout())
+            DB_POOL_OVERFLOW.set(max(pool.overflow(), 0))
+
+    pool.connect = timed_connect
+    event.listen(pool, "checkout", update_gauges)
+    event.listen(pool, "checkin", update_gauges)
+    pool._metrics_instrumented = True
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """
+    Genera la exposición de métricas en formato de texto Prometheus.
+
+    Returns:
+        Tuple[bytes, str]: Cuerpo y content type de la respuesta
+    """
+    if MULTIPROCESS_ENABLED:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    """Elimina los ficheros de gauges del proceso actual al terminar (modo multiproceso)."""
+    if MULTIPROCESS_ENABLED:
+        multiprocess.mark_process_dead(os.getpid())
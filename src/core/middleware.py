@@ -0,0 +1,244 @@
+# app/core/middleware.py
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core import metrics
+from src.core.exceptions import EventLoopBlockedException
+from src.core.loop_watchdog import LoopWatchdog
+from src.core.profiler import profiler_registry
+from src.core.security import decode_access_token
+from src.core.tenancy import tenant_scope
+from src.db.query_tracker import BUDGET_WARN, QueryTracker, track_queries
+
+logger = logging.getLogger(__name__)
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+def route_template(scope: Scope) -> str:
+    """
+    Plantilla de la ruta que atiende la petición, p. ej. "/api/v1/users/{user_id}".
+
+    Se usa como etiqueta de métricas en lugar de la URL para acotar la cardinalidad.
+    """
+    app = scope.get("app")
+    router = getattr(app, "router", None)
+    for route in getattr(router, "routes", ()):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return getattr(route, "path", UNMATCHED_ROUTE)
+    return UNMATCHED_ROUTE
+
+
+class QueryTrackerMiddleware:
+    """
+    Middleware que instrumenta las sentencias SQL de cada petición.
+
+    Registra número de sentencias, tiempo en base de datos, filas y sentencia más
+    lenta en histogramas por ruta. Con `expose_headers` (desarrollo) añade además las
+    cabeceras X-Query-*, agrupa las sentencias por forma y avisa de posibles N+1.
+    Si se supera `budget` se registra un aviso o, en modo "raise", la petición falla.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        threshold: int = 3,
+        budget: int = 0,
+        budget_mode: str = BUDGET_WARN,
+        expose_headers: bool = False,
+    ):
+        self.app = app
+        self.threshold = threshold
+        self.budget = budget
+        self.budget_mode = budget_mode
+        self.expose_headers = expose_headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        label = f"{scope['method']} {scope['path']}"
+        with track_queries(
+            label,
+            budget=self.budget,
+            budget_mode=self.budget_mode,
+            track_shapes=self.expose_headers,
+        ) as tracker:
+            send_wrapper = send
+            if self.expose_headers:
+                async def send_wrapper(message: Message) -> None:
+                    if message["type"] == "http.response.start":
+                        self._add_headers(MutableHeaders(scope=message), tracker)
+                    await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                self._observe(scope, tracker)
+
+    def _add_headers(self, headers: MutableHeaders, tracker: QueryTracker) -> None:
+        headers["X-Query-Count"] = str(tracker.statements)
+        headers["X-Query-Time-Ms"] = f"{tracker.db_time * 1000:.2f}"
+        headers["X-Query-Rows"] = str(tracker.rows)
+        headers["X-Query-Slowest-Ms"] = f"{tracker.slowest_time * 1000:.2f}"
+        headers["X-Query-Repeated"] = str(len(tracker.repeated(self.threshold)))
+
+    def _observe(self, scope: Scope, tracker: QueryTracker) -> None:
+        method = scope["method"]
+        route = route_template(scope)
+        if tracker.statements:
+            metrics.DB_STATEMENTS_PER_REQUEST.labels(method, route).observe(tracker.statements)
+            metrics.DB_TIME_PER_REQUEST.labels(method, route).observe(tracker.db_time)
+            metrics.DB_ROWS_PER_REQUEST.labels(method, route).observe(tracker.rows)
+            metrics.DB_SLOWEST_STATEMENT.labels(method, route).observe(tracker.slowest_time)
+
+        if tracker.over_budget:
+            metrics.DB_QUERY_BUDGET_EXCEEDED.labels(method, route).inc()
+            logger.warning(
+                "%s %s ejecutó %d sentencias SQL (presupuesto %d)",
+                method, route, tracker.statements, tracker.budget,
+            )
+
+        for shape, count in tracker.repeated(self.threshold):
+            logger.warning("Posible N+1 en %s: %d ejecuciones de %s", tracker.label, count, shape)
+
+
+class PrometheusMiddleware:
+    """
+    Middleware que mide la latencia de cada petición por ruta y estado, y el número
+    de peticiones en curso.
+    """
+
+    def __init__(self, app: ASGIApp, exclude_paths: tuple = ("/metrics",)):
+        self.app = app
+        self.exclude_paths = exclude_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_flight = metrics.HTTP_REQUESTS_IN_FLIGHT.labels(method)
+        in_flight.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_flight.dec()
+            metrics.HTTP_REQUEST_DURATION.labels(method, route_template(scope), str(status_code)).observe(
+                time.perf_counter() - start
+            )
+
+
+class ProfilerMiddleware:
+    """
+    Etiqueta las peticiones cuya ruta coincide con la sesión de muestreo activa para
+    que el profiler solo cuente sus muestras. Sin sesión activa solo comprueba un atributo.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or profiler_registry.route_pattern is None:
+            await self.app(scope, receive, send)
+            return
+
+        task = profiler_registry.track_request(scope["path"])
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            if task is not None:
+                profiler_registry.untrack_request(task)
+
+
+class LoopWatchdogMiddleware:
+    """
+    Asocia los bloqueos del event loop detectados por el watchdog a la petición que los causó.
+
+    Nombra la tarea de la petición con su método y ruta (aparece en los avisos del
+    watchdog). Con `fail_on_block`, si la tarea bloqueó el loop más del umbral, la
+    respuesta se sustituye por un error: en tests la petición falla en lugar de pasar
+    desapercibida.
+    """
+
+    def __init__(self, app: ASGIApp, watchdog: LoopWatchdog, fail_on_block: bool = False):
+        self.app = app
+        self.watchdog = watchdog
+        self.fail_on_block = fail_on_block
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        task = asyncio.current_task()
+        if scope["type"] != "http" or task is None:
+            await self.app(scope, receive, send)
+            return
+
+        label = f"{scope['method']} {scope['path']}"
+        task.set_name(label)
+
+        async def send_checked(message: Message) -> None:
+            if self.fail_on_block and message["type"] == "http.response.start":
+                blocked = self.watchdog.pop_task_block(task)
+                if blocked:
+                    raise EventLoopBlockedException(
+                        f"{label} bloqueó el event loop {blocked * 1000:.0f} ms "
+                        f"(umbral {self.watchdog.threshold * 1000:.0f} ms)"
+                    )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_checked)
+        finally:
+            self.watchdog.pop_task_block(task)
+
+
+class TenantContextMiddleware:
+    """
+    Fija el tenant de cada petición a partir del token de acceso.
+
+    El tenant sale del claim `tid` del token Bearer (si es válido), también en las rutas
+    que no dependen de la autenticación, y queda aislado en la petición: un cliente ASGI
+    en proceso (tests, benchmarks) que reutiliza la tarea no conserva el de la anterior.
+    Sin tenant, el acceso a datos de tenant falla en lugar de ver todos los colegios
+    (ver src/core/tenancy.py).
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    @staticmethod
+    def _token_tenant(scope: Scope) -> Optional[int]:
+        for name, value in scope.get("headers", ()):
+            if name != b"authorization":
+                continue
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() != "bearer" or not token:
+                return None
+            payload = decode_access_token(token.strip())
+            tenant_id = payload.get("tid") if payload else None
+            return tenant_id if isinstance(tenant_id, int) else None
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with tenant_scope(self._token_tenant(scope), required=True):
+            await self.app(scope, receive, send)
@@ -0,0 +1,185 @@
+# app/core/permissions.py
+"""
+Permisos como bitsets enteros y registro de roles en memoria.
+
+Cada rol guarda en `roles.permissions` un entero con sus permisos. El token de acceso
+lleva el ID del rol (claim `rid`), así que comprobar un permiso es buscar el rol en
+`role_registry` y hacer un AND de bits, sin consultar la base de datos.
+"""
+import asyncio
+import time
+from enum import IntFlag
+from typing import Dict, NamedTuple, Optional
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.core.metrics import CACHE_REQUESTS
+from src.models.role import Role
+
+
+class Permission(IntFlag):
+    NONE = 0
+    # Consultar juegos, niveles y segmentos
+    CATALOG_READ = 1 << 0
+    # Crear, modificar y borrar juegos, niveles y segmentos
+    CATALOG_WRITE = 1 << 1
+    # Iniciar, consultar y terminar instancias de juego
+    GAMEPLAY = 1 << 2
+    # Consultar estudiantes, su progreso e informes
+    STUDENTS_READ = 1 << 3
+    # Dar de alta, modificar y borrar estudiantes
+    STUDENTS_WRITE = 1 << 4
+    # Perfil y ajustes del profesor
+    TEACHER_PROFILE = 1 << 5
+    # Diagnóstico (profiler, watchdog, estadísticas internas)
+    ADMIN = 1 << 6
+    # Consultar las cuentas de usuario
+    USERS_READ = 1 << 7
+    # Crear, modificar y borrar cuentas de usuario
+    USERS_WRITE = 1 << 8
+
+    ALL = (1 << 9) - 1
+
+
+# Permisos iniciales de los roles sembrados en src/db/seed/seed_roles.py
+ROLE_PERMISSIONS: Dict[str, Permission] = {
+    "admin": Permission.ALL,
+    "professor": (
+        Permission.CATALOG_READ | Permission.CATALOG_WRITE | Permission.GAMEPLAY
+        | Permission.STUDENTS_READ | Permission.STUDENTS_WRITE | Permission.TEACHER_PROFILE
+        | Permission.USERS_READ
+    ),
+    "student": Permission.CATALOG_READ | Permission.GAMEPLAY,
+}
+
+
+class RoleInfo(NamedTuple):
+    id: int
+    name: str
+    permissions: Permission
+
+
+class RoleRegistry:
+    """
+    Copia en memoria del proceso de la tabla `roles`.
+
+    Se carga entera (son pocas filas) y se invalida al escribir un rol a través del
+    ORM en este proceso. El TTL acota la desactualización frente a cambios hechos en
+    otros workers o con SQL directo.
+    """
+
+    def __init__(self, ttl_seconds: Optional[int] = None):
+        self._ttl_seconds = ttl_seconds
+        self.version = 0
+        self._roles: Optional[Dict[int, RoleInfo]] = None
+        self._loaded_version = -1
+        self._loaded_at = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def ttl_seconds(self) -> int:
+        # La configuración se lee en el primer uso: este módulo no la carga al importarse
+        # (los seeds lo importan antes de que los benchmarks fijen el entorno)
+        if self._ttl_seconds is None:
+            from src.core.config import settings
+
+            self._ttl_seconds = settings.ROLE_CACHE_TTL_SECONDS
+        return self._ttl_seconds
+
+    def invalidate(self) -> int:
+        """
+        Descarta los roles cargados; se recargarán en la siguiente consulta.
+
+        Returns:
+            int: Nueva versión del registro
+        """
+        self.version += 1
+        self._roles = None
+        return self.version
+
+    def peek(self) -> Optional[Dict[int, RoleInfo]]:
+        """Roles cargados si siguen vigentes, sin acceder a la base de datos."""
+        roles = self._roles
+        if roles is None or self._loaded_version != self.version:
+            return None
+        if self.ttl_seconds and time.monotonic() - self._loaded_at > self.ttl_seconds:
+            return None
+        return roles
+
+    async def get_all(self, db: Optional[AsyncSession] = None) -> Dict[int, RoleInfo]:
+        """
+        Roles vigentes por ID, cargándolos si hace falta.
+
+        Args:
+            db: Sesión para la carga; sin ella se abre una propia
+
+        Returns:
+            Dict[int, RoleInfo]: Roles no eliminados indexados por ID
+        """
+        roles = self.peek()
+        if roles is not None:
+            CACHE_REQUESTS.labels("roles", "hit").inc()
+            return roles
+
+        CACHE_REQUESTS.labels("roles", "miss").inc()
+        async with self._lock:
+            roles = self.peek()
+            if roles is not None:
+                return roles
+            version = self.version
+            if db is None:
+                from src.db.session import SessionLocal
+
+                async with SessionLocal() as session:
+                    roles = await self._load(session)
+            else:
+                roles = await self._load(db)
+            # Si un rol cambió durante la carga, no se guarda el resultado
+            if version == self.version:
+                self._roles = roles
+                self._loaded_version = version
+                self._loaded_at = time.monotonic()
+            return roles
+
+    async def get(self, role_id: Optional[int]) -> Optional[RoleInfo]:
+        """Rol por ID, None si no existe o fue eliminado."""
+        if role_id is None:
+            return None
+        return (await self.get_all()).get(role_id)
+
+    async def permissions(self, role_id: Optional[int]) -> Permission:
+        """Permisos del rol; sin rol, ninguno."""
+        role = await self.get(role_id)
+        return role.permissions if role else Permission.NONE
+
+    async def _load(self, db: AsyncSession) -> Dict[int, RoleInfo]:
+        query = select(Role.id, Role.role_name, Role.permissions).where(Role.deleted_at.is_(None))
+        result = await db.execute(query)
+        return {
+            role_id: RoleInfo(role_id, name, Permission(permissions or 0) & Permission.ALL)
+            for role_id, name, permissions in result.all()
+        }
+
+
+role_registry = RoleRegistry()
+
+
+def _role_changed(mapper, connection, target) -> None:
+    role_registry.invalidate()
+    # Se invalida otra vez al confirmar: una carga concurrente entre el flush y el
+    # commit habría leído todavía los datos anteriores
+    session = Session.object_session(target)
+    if session is not None:
+        session.info["roles_changed"] = True
+
+
+def _after_commit(session: Session) -> None:
+    if session.info.pop("roles_changed", False):
+        role_registry.invalidate()
+
+
+for _event in ("after_insert", "after_update", "after_delete"):
+    event.listen(Role, _event, _role_changed)
+event.listen(Session, "after_commit", _after_commit)
@@ -0,0 +1,299 @@
+# app/core/profiler.py
+import asyncio
+import json
+import os
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Pattern, Set, Tuple
+
+from src.core.config import settings
+from src.core.exceptions import ConflictException, NotFoundException
+
+FORMAT_COLLAPSED = "collapsed"
+FORMAT_SPEEDSCOPE = "speedscope"
+FORMATS = (FORMAT_COLLAPSED, FORMAT_SPEEDSCOPE)
+
+_CWD = os.getcwd()
+
+Frame = Tuple[str, str, int]
+
+
+def _frame_key(frame) -> Frame:
+    code = frame.f_code
+    filename = code.co_filename
+    if filename.startswith(_CWD):
+        filename = os.path.relpath(filename, _CWD)
+    return code.co_name, filename, code.co_firstlineno
+
+
+def _current_task(loop: asyncio.AbstractEventLoop) -> Optional[asyncio.Task]:
+    try:
+        return asyncio.current_task(loop)
+    except RuntimeError:
+        return None
+
+
+class Profile:
+    """
+    Resultado de una sesión de muestreo: pilas de llamadas agregadas y su número de muestras.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        interval: float,
+        samples: Counter,
+        started_at: datetime,
+        duration: float,
+        profile_id: Optional[str] = None,
+    ):
+        self.id = profile_id or uuid.uuid4().hex
+        self.name = name
+        self.interval = interval
+        self.samples = samples
+        self.started_at = started_at
+        self.duration = duration
+
+    @property
+    def sample_count(self) -> int:
+        return sum(self.samples.values())
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "started_at": self.started_at,
+            "duration_seconds": round(self.duration, 3),
+            "interval_ms": round(self.interval * 1000, 3),
+            "samples": self.sample_count,
+        }
+
+    def to_collapsed(self) -> str:
+        """Formato de pilas colapsadas (flamegraph.pl, speedscope, inferno)."""
+        lines = []
+        for stack, count in self.samples.most_common():
+            frames = ";".join(f"{name} ({filename}:{line})" for name, filename, line in stack)
+            lines.append(f"{frames} {count}")
+        return "\n".join(lines) + "\n"
+
+    def to_speedscope(self) -> str:
+        """Formato de perfil muestreado de speedscope (https://www.speedscope.app)."""
+        frames: List[Dict[str, Any]] = []
+        index: Dict[Frame, int] = {}
+        samples: List[List[int]] = []
+        weights: List[float] = []
+        for stack, count in self.samples.items():
+            sample = []
+            for frame in stack:
+                if frame not in index:
+                    index[frame] = len(frames)
+                    frames.append({"name": frame[0], "file": frame[1], "line": frame[2]})
+                sample.append(index[frame])
+            samples.append(sample)
+            weights.append(count * self.interval)
+        return json.dumps({
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": self.name,
+            "exporter": settings.PROJECT_NAME,
+            "shared": {"frames": frames},
+            "profiles": [{
+                "type": "sampled",
+                "name": self.name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }],
+        })
+
+    def render(self, fmt: str) -> Tuple[str, str, str]:
+        """
+        Serializa el perfil.
+
+        Returns:
+            Tuple[str, str, str]: Contenido, media type y nombre de fichero
+        """
+        if fmt == FORMAT_SPEEDSCOPE:
+            return self.to_speedscope(), "application/json", f"profile-{self.id}.speedscope.json"
+        return self.to_collapsed(), "text/plain", f"profile-{self.id}.collapsed.txt"
+
+
+class SamplingProfiler:
+    """
+    Profiler de muestreo del hilo del event loop.
+
+    Un hilo aparte lee periódicamente la pila del hilo objetivo con
+    `sys._current_frames()`; el código perfilado no se instrumenta, así que el coste
+    solo existe mientras hay una sesión activa. Con `tasks` solo se cuentan las
+    muestras tomadas mientras el loop ejecuta una de esas tareas (p. ej. las de las
+    peticiones que coinciden con una ruta).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        interval: float,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        thread_id: Optional[int] = None,
+        tasks: Optional[Set[asyncio.Task]] = None,
+    ):
+        self.name = name
+        self.interval = interval
+        self.loop = loop or asyncio.get_running_loop()
+        self.thread_id = thread_id or threading.get_ident()
+        self.tasks = tasks
+        # El ID se conoce desde el inicio para poder anunciarlo antes de terminar
+        self.profile_id = uuid.uuid4().hex
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started_at = datetime.utcnow()
+        self._start = 0.0
+
+    def start(self) -> None:
+        self._started_at = datetime.utcnow()
+        self._start = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name=f"profiler-{self.name}", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Profile:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return Profile(
+            self.name,
+            self.interval,
+            self.samples,
+            self._started_at,
+            time.perf_counter() - self._start,
+            profile_id=self.profile_id,
+        )
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            if self.tasks is not None and _current_task(self.loop) not in self.tasks:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(_frame_key(frame))
+                frame = frame.f_back
+            stack.reverse()
+            self.samples[tuple(stack)] += 1
+
+
+class ProfilerRegistry:
+    """
+    Coordina las sesiones de perfilado del proceso y guarda los últimos perfiles.
+
+    - Sesión de muestreo: una sola a la vez, opcionalmente limitada a las peticiones
+      cuya ruta coincide con un patrón (las etiqueta ProfilerMiddleware).
+    - Perfilado por petición: lo activa la cabecera X-Profile (solo administradores).
+    """
+
+    def __init__(self, max_stored: Optional[int] = None, max_concurrent_requests: Optional[int] = None):
+        self.max_stored = max_stored or settings.PROFILER_MAX_STORED
+        self.max_concurrent_requests = max_concurrent_requests or settings.PROFILER_MAX_CONCURRENT_REQUESTS
+        self._profiles: "OrderedDict[str, Profile]" = OrderedDict()
+        self._session_lock = asyncio.Lock()
+        self._active_requests = 0
+        # Patrón de ruta de la sesión activa y tareas de las peticiones que coinciden
+        self.route_pattern: Optional[Pattern] = None
+        self.route_tasks: Set[asyncio.Task] = set()
+
+    def store(self, profile: Profile) -> Profile:
+        self._profiles[profile.id] = profile
+        while len(self._profiles) > self.max_stored:
+            self._profiles.popitem(last=False)
+        return profile
+
+    def list_profiles(self) -> List[Dict[str, Any]]:
+        return [profile.summary() for profile in reversed(self._profiles.values())]
+
+    def get_profile(self, profile_id: str) -> Profile:
+        """
+        Raises:
+            NotFoundException: Si el perfil no existe o ya se descartó
+        """
+        profile = self._profiles.get(profile_id)
+        if profile is None:
+            raise NotFoundException("Perfil no encontrado")
+        return profile
+
+    def track_request(self, path: str) -> Optional[asyncio.Task]:
+        """Etiqueta la tarea actual si su ruta coincide con la sesión activa."""
+        pattern = self.route_pattern
+        if pattern is None or not pattern.search(path):
+            return None
+        task = asyncio.current_task()
+        if task is not None:
+            self.route_tasks.add(task)
+        return task
+
+    def untrack_request(self, task: asyncio.Task) -> None:
+        self.route_tasks.discard(task)
+
+    async def sample(self, seconds: float, interval: float, route: Optional[str] = None) -> Profile:
+        """
+        Muestrea el event loop durante `seconds` segundos.
+
+        Args:
+            seconds: Duración de la sesión
+            interval: Segundos entre muestras
+            route: Expresión regular de rutas a perfilar; None perfila todo el loop
+
+        Returns:
+            Profile: Perfil almacenado
+
+        Raises:
+            ConflictException: Si ya hay otra sesión de muestreo en curso
+        """
+        if self._session_lock.locked():
+            raise ConflictException("Ya hay una sesión de perfilado en curso")
+        async with self._session_lock:
+            tasks = None
+            if route:
+                self.route_tasks = set()
+                self.route_pattern = re.compile(route)
+                tasks = self.route_tasks
+            profiler = SamplingProfiler(f"sample {route or '*'}", interval, tasks=tasks)
+            profiler.start()
+            try:
+                await asyncio.sleep(seconds)
+            finally:
+                profile = profiler.stop()
+                self.route_pattern = None
+                self.route_tasks = set()
+            return self.store(profile)
+
+    def start_request(self, name: str, interval: float) -> Optional[SamplingProfiler]:
+        """
+        Inicia el perfilado de la petición en curso (solo su tarea).
+
+        Returns:
+            SamplingProfiler: Profiler iniciado, None si se alcanzó el máximo concurrente
+        """
+        if self._active_requests >= self.max_concurrent_requests:
+            return None
+        task = asyncio.current_task()
+        profiler = SamplingProfiler(name, interval, tasks={task} if task else None)
+        self._active_requests += 1
+        profiler.start()
+        return profiler
+
+    def finish_request(self, profiler: SamplingProfiler) -> Profile:
+        try:
+            return self.store(profiler.stop())
+        finally:
+            self._active_requests -= 1
+
+
+profiler_registry = ProfilerRegistry()
@@ -0,0 +1,154 @@
+# app/core/scheduler.py
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from src.core.config import settings
+from src.db.session import SessionLocal
+from src.db.repositories.scheduler_lease_repository import SchedulerLeaseRepository
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicJob:
+    """
+    Tarea asíncrona que se ejecuta cada `interval_seconds`.
+
+    Si `use_lease` es True, antes de cada ejecución se adquiere un lease en base de
+    datos con el nombre de la tarea, de modo que con varios workers solo uno la ejecuta.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[Any]],
+        interval_seconds: float,
+        use_lease: bool = False,
+        lease_ttl_seconds: Optional[int] = None,
+    ):
+        """
+        Args:
+            name: Nombre único de la tarea (también es el nombre del lease)
+            func: Corrutina sin argumentos a ejecutar
+            interval_seconds: Segundos entre ejecuciones
+            use_lease: Si True, la ejecución requiere adquirir el lease
+            lease_ttl_seconds: Validez del lease; por defecto SCHEDULER_LEASE_TTL_SECONDS
+        """
+        self.name = name
+        self.func = func
+        self.interval_seconds = interval_seconds
+        self.use_lease = use_lease
+        self.lease_ttl_seconds = lease_ttl_seconds or max(
+            settings.SCHEDULER_LEASE_TTL_SECONDS, int(interval_seconds * 2)
+        )
+        self.stats: Dict[str, Any] = {
+            "runs": 0,
+            "failures": 0,
+            "skipped_without_lease": 0,
+            "last_run_at": None,
+            "last_duration_seconds": None,
+            "last_error": None,
+        }
+
+
+class Scheduler:
+    """
+    Planificador mínimo de tareas periódicas que corre dentro del event loop de la app.
+
+    Se arranca en el evento `startup` de FastAPI y se detiene en `shutdown`.
+    """
+
+    def __init__(self):
+        self.owner_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._jobs: Dict[str, PeriodicJob] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._stopping = asyncio.Event()
+
+    def add_job(self, job: PeriodicJob) -> None:
+        """Registra una tarea. Debe llamarse antes de `start()`."""
+        self._jobs[job.name] = job
+
+    def get_job(self, name: str) -> Optional[PeriodicJob]:
+        """Obtiene una tarea registrada por nombre."""
+        return self._jobs.get(name)
+
+    @property
+    def jobs(self) -> List[PeriodicJob]:
+        return list(self._jobs.values())
+
+    async def start(self) -> None:
+        """Lanza un task por cada tarea registrada."""
+        self._stopping = asyncio.Event()
+        for job in self._jobs.values():
+            self._tasks.append(asyncio.create_task(self._run_forever(job), name=f"scheduler:{job.name}"))
+        logger.info("Scheduler iniciado (%s) con %d tareas", self.owner_id, len(self._tasks))
+
+    async def stop(self) -> None:
+        """Detiene las tareas y libera los leases que tuviera este proceso."""
+        self._stopping.set()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        for job in self._jobs.values():
+            if job.use_lease:
+                try:
+                    async with SessionLocal() as db:
+                        await SchedulerLeaseRepository(db).release(job.name, self.owner_id)
+                except Exception:
+                    logger.exception("No se pudo liberar el lease de %s", job.name)
+
+    async def run_job(self, job: PeriodicJob) -> bool:
+        """
+        Ejecuta una vez la tarea, respetando su lease.
+
+        Returns:
+            bool: True si la tarea se ejecutó, False si otro worker tiene el lease
+        """
+        if job.use_lease:
+            async with SessionLocal() as db:
+                acquired = await SchedulerLeaseRepository(db).acquire(
+                    job.name, self.owner_id, job.lease_ttl_seconds
+                )
+            if not acquired:
+                job.stats["skipped_without_lease"] += 1
+                return False
+
+        started = datetime.utcnow()
+        loop = asyncio.get_running_loop()
+        t0 = loop.time()
+        try:
+            await job.func()
+            job.stats["last_error"] = None
+        except Exception as e:
+            job.stats["failures"] += 1
+            job.stats["last_error"] = repr(e)
+            logger.exception("La tarea programada %s falló", job.name)
+        finally:
+            job.stats["runs"] += 1
+            job.stats["last_run_at"] = started
+            job.stats["last_duration_seconds"] = loop.time() - t0
+        return True
+
+    async def _run_forever(self, job: PeriodicJob) -> None:
+        while not self._stopping.is_set():
+            try:
+                await self.run_job(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Fallo al adquirir el lease (p. ej. base de datos no disponible)
+                job.stats["failures"] += 1
+                logger.exception("No se pudo ejecutar la tarea programada %s", job.name)
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=job.interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+
+scheduler = Scheduler()
@@ -1,26 +1,58 @@
+import functools
+import time
 from datetime import datetime, timedelta
-from jose import jwt
-from passlib.context import CryptContext
-import bcrypt
+from typing import Optional
 from src.core.config import settings
+from src.core.metrics import BCRYPT_DURATION
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# jose y passlib (con bcrypt/cryptography) se importan en el primer uso y no al
+# importar la aplicación: así no cuentan en el arranque de cada worker.
+
+@functools.lru_cache(maxsize=None)
+def _pwd_context():
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 def get_password_hash(password: str) -> str:
     """Genera un hash para la contraseña."""
-    return pwd_context.hash(password)
+    start = time.perf_counter()
+    try:
+        return _pwd_context().hash(password)
+    finally:
+        BCRYPT_DURATION.labels("hash").observe(time.perf_counter() - start)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verifica la contraseña contra el hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    start = time.perf_counter()
+    try:
+        return _pwd_context().verify(plain_password, hashed_password)
+    finally:
+        BCRYPT_DURATION.labels("verify").observe(time.perf_counter() - start)
+
+def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
+    from jose import jwt
 
-def create_access_token(data: dict):
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(
-        to_encode, 
-        settings.SECRET_KEY, 
+        to_encode,
+        settings.SECRET_KEY,
         algorithm=settings.ALGORITHM
     )
-    return encoded_jwt
\ No newline at end of file
+    return encoded_jwt
+
+def decode_access_token(token: str) -> Optional[dict]:
+    """
+    Decodifica y valida un token de acceso.
+
+    Returns:
+        Optional[dict]: Claims del token, None si la firma no es válida o ha expirado
+    """
+    from jose import JWTError, jwt
+
+    try:
+        return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    except JWTError:
+        return None
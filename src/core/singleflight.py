@@ -0,0 +1,101 @@
+# app/core/singleflight.py
+"""
+Agrupación de llamadas asíncronas idénticas y simultáneas (single-flight).
+
+Cuando varias peticiones piden a la vez lo mismo (p. ej. una clase entera abriendo el
+mismo nivel), solo la primera ejecuta la función; las demás esperan a esa ejecución y
+reciben su resultado o su excepción. No es una caché: en cuanto la llamada termina, la
+siguiente vuelve a ejecutarse.
+
+Las llamadas se identifican por función y argumentos, y siempre por el tenant de la
+petición: peticiones de tenants distintos nunca comparten resultado. Los argumentos que
+no forman parte de la identidad (sesiones de base de datos, `self`) se excluyen con
+`key=`. El resultado se comparte tal cual entre peticiones: debe ser inmutable o
+copiarse a la sesión de cada una (p. ej. con `session.merge(obj, load=False)`).
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+from src.core.metrics import SINGLEFLIGHT_CALLS
+from src.core.tenancy import get_current_tenant
+
+_DEFAULT_KEY: Any = object()
+
+
+def call_key(fn: Callable[..., Any], args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Hashable:
+    """
+    Identidad de una llamada: función (sin `self` en métodos ligados) y argumentos.
+
+    Args:
+        fn: Función o método ligado
+        args: Argumentos posicionales (hashables)
+        kwargs: Argumentos con nombre (hashables)
+
+    Returns:
+        Hashable: Clave de la llamada
+    """
+    func = getattr(fn, "__func__", fn)
+    return (func.__module__, func.__qualname__, args, tuple(sorted(kwargs.items())))
+
+
+class SingleFlight:
+    """
+    Grupo de llamadas con single-flight, con sus propios contadores.
+
+    La ejecución corre en una tarea propia que espera la primera llamada: si esa
+    petición se cancela, la tarea se cancela con ella y las llamadas agrupadas la
+    repiten por su cuenta en lugar de fallar.
+    """
+
+    def __init__(self, name: str):
+        """
+        Args:
+            name: Nombre del grupo (etiqueta de métricas)
+        """
+        self.name = name
+        self._calls: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self.stats: Dict[str, int] = {"executions": 0, "coalesced": 0}
+
+    async def do(self, fn: Callable[..., Awaitable[Any]], *args: Any, key: Hashable = _DEFAULT_KEY, **kwargs: Any) -> Any:
+        """
+        Ejecuta `fn(*args, **kwargs)` o se une a una ejecución idéntica en curso.
+
+        Args:
+            fn: Función asíncrona
+            args: Argumentos posicionales de `fn`
+            key: Identidad de la llamada; por defecto, `call_key(fn, args, kwargs)`
+            kwargs: Argumentos con nombre de `fn`
+
+        Returns:
+            Any: Resultado de `fn`, compartido con las llamadas agrupadas
+        """
+        if key is _DEFAULT_KEY:
+            key = call_key(fn, args, kwargs)
+        key = (get_current_tenant(), key)
+
+        task = self._calls.get(key)
+        if task is not None:
+            self.stats["coalesced"] += 1
+            SINGLEFLIGHT_CALLS.labels(self.name, "coalesced").inc()
+            try:
+                return await asyncio.shield(task)
+            except asyncio.CancelledError:
+                # Se canceló la petición que la ejecutaba, no esta: se repite la llamada
+                if not task.cancelled():
+                    raise
+                return await self.do(fn, *args, key=key[1], **kwargs)
+
+        self.stats["executions"] += 1
+        SINGLEFLIGHT_CALLS.labels(self.name, "executed").inc()
+        task = asyncio.ensure_future(fn(*args, **kwargs))
+        self._calls[key] = task
+        task.add_done_callback(lambda done: self._forget(key, done))
+        return await task
+
+    def _forget(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Contadores del grupo y llamadas en curso."""
+        return {**self.stats, "in_flight": len(self._calls)}
@@ -0,0 +1,73 @@
+# app/core/tenancy.py
+"""
+Tenant (colegio) de la petición en curso.
+
+El tenant se toma del claim `tid` del token de acceso y se guarda en una ContextVar
+durante la petición. Las consultas ORM sobre modelos con `TenantMixin` se filtran por
+él automáticamente (ver src/db/tenancy.py) y las filas nuevas lo heredan.
+
+Dentro de una petición HTTP el tenant es obligatorio: sin él (petición anónima o token
+sin `tid`) el acceso a datos de un tenant falla con TenantRequiredException en lugar de
+ver todos los tenants. Fuera de las peticiones (tareas programadas, seeds, scripts) no
+se filtra nada; el código de una petición que deba ver todos los tenants (p. ej. el
+login, que busca al usuario antes de conocer su tenant) lo declara con `tenant_scope(None)`.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from src.core.exceptions import TenantRequiredException
+
+# Tenant al que pertenecen los datos anteriores a la multi-tenencia
+DEFAULT_TENANT_ID = 1
+
+_current_tenant: ContextVar[Optional[int]] = ContextVar("current_tenant", default=None)
+_tenant_required: ContextVar[bool] = ContextVar("tenant_required", default=False)
+
+
+def get_current_tenant() -> Optional[int]:
+    """Tenant de la petición en curso, None fuera de una petición autenticada."""
+    return _current_tenant.get()
+
+
+def set_current_tenant(tenant_id: Optional[int]) -> None:
+    """Fija el tenant del contexto actual (lo restablece TenantContextMiddleware)."""
+    _current_tenant.set(tenant_id)
+
+
+def tenant_required() -> bool:
+    """Indica si el contexto actual exige un tenant para acceder a datos de tenant."""
+    return _tenant_required.get() and _current_tenant.get() is None
+
+
+@contextmanager
+def tenant_scope(tenant_id: Optional[int], required: bool = False) -> Iterator[None]:
+    """
+    Ejecuta un bloque con el tenant indicado (peticiones, tareas programadas, scripts, tests).
+
+    Args:
+        tenant_id: Tenant a aplicar; None desactiva el filtrado dentro del bloque
+        required: Si True y no hay tenant, el acceso a datos de tenant falla (peticiones HTTP)
+    """
+    tenant_token = _current_tenant.set(tenant_id)
+    required_token = _tenant_required.set(required)
+    try:
+        yield
+    finally:
+        _tenant_required.reset(required_token)
+        _current_tenant.reset(tenant_token)
+
+
+def tenant_default() -> int:
+    """
+    Valor por defecto de `tenant_id` en inserciones: el tenant actual o el inicial.
+
+    Raises:
+        TenantRequiredException: Si el contexto exige un tenant y no lo hay
+    """
+    tenant_id = _current_tenant.get()
+    if tenant_id is not None:
+        return tenant_id
+    if _tenant_required.get():
+        raise TenantRequiredException()
+    return DEFAULT_TENANT_ID
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, Boolean, DateTime
+from sqlalchemy import Column, Integer, Boolean, DateTime, ForeignKey
 from sqlalchemy.sql import func
 from sqlalchemy.ext.declarative import as_declarative, declared_attr
 from typing import Any, Dict
+from src.core.tenancy import DEFAULT_TENANT_ID, tenant_default
 
 
 @as_declarative()
@@ -35,4 +36,25 @@ class Base:
             f"{key}={value}"
             for key, value in self.to_dict().items()
         )
-        return f"<{self.__class__.__name__}({params})>"
\ No newline at end of file
+        return f"<{self.__class__.__name__}({params})>"
+
+
+class TenantMixin:
+    """
+    Modelos cuyos datos pertenecen a un tenant (colegio).
+
+    Las consultas ORM se filtran por el tenant de la petición (src/db/tenancy.py) y las
+    filas nuevas toman ese tenant. Cada modelo declara índices compuestos que empiezan
+    por `tenant_id` para que las consultas recorran solo el rango de su colegio.
+    """
+
+    @declared_attr
+    def tenant_id(cls):
+        return Column(
+            Integer,
+            ForeignKey("tenants.id"),
+            nullable=False,
+            default=tenant_default,
+            server_default=str(DEFAULT_TENANT_ID),
+        )
+
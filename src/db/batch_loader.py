@@ -0,0 +1,161 @@
+# app/db/batch_loader.py
+"""
+Cargas por ID agrupadas por petición (patrón DataLoader).
+
+Un servicio que resuelve una lista de IDs relacionados (los estudiantes de una clase,
+los niveles de un juego, las sesiones de una instancia) no hace una consulta por ID:
+pide cada uno al `BatchLoader` del repositorio, y los IDs pedidos en la misma vuelta
+del bucle de eventos se cargan juntos con un único `WHERE id IN (...)`:
+
+    loader = batch_loader(StudentRepository(db))
+    students = await loader.load_many(student_ids)          # una consulta
+    game, level = await asyncio.gather(games.load(g), levels.load(l))
+
+Cada sesión (es decir, cada petición) tiene sus propios loaders en `session.info`, y
+cada loader memoriza sus resultados: pedir dos veces el mismo ID no vuelve a consultar.
+La memoria se descarta al confirmar o deshacer la transacción, así que tras una
+escritura las cargas vuelven a la base de datos.
+
+Los lotes de todos los loaders de una sesión se consultan de uno en uno: una
+AsyncSession no admite sentencias concurrentes.
+"""
+import asyncio
+from typing import Any, Dict, Generic, List, Optional, Sequence, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.db.repositories.base_repository import BaseRepository, ModelType
+
+_LOADERS_KEY = "batch_loaders"
+_LOCK_KEY = "batch_loaders_lock"
+
+
+class BatchLoader(Generic[ModelType]):
+    """
+    Cargador por ID de un repositorio, con agrupación por vuelta del bucle y memoria.
+    """
+
+    def __init__(self, repository: BaseRepository[ModelType], include_deleted: bool = False):
+        """
+        Args:
+            repository: Repositorio cuyo `get_by_ids` hace las consultas
+            include_deleted: Si True, también carga entidades marcadas como eliminadas
+        """
+        self.repository = repository
+        self.include_deleted = include_deleted
+        self._memo: Dict[int, "asyncio.Future[Optional[ModelType]]"] = {}
+        self._queue: Dict[int, "asyncio.Future[Optional[ModelType]]"] = {}
+        self._query_lock: asyncio.Lock = repository.db.info.setdefault(_LOCK_KEY, asyncio.Lock())
+        # El bucle solo guarda referencias débiles a las tareas: sin esta, un lote con
+        # cargas esperándolo podría recolectarse antes de terminar
+        self._batches: Set["asyncio.Task[None]"] = set()
+        self.stats: Dict[str, int] = {"loads": 0, "memoized": 0, "batches": 0}
+
+    def _enqueue(self, id: int) -> "asyncio.Future[Optional[ModelType]]":
+        self.stats["loads"] += 1
+        future = self._memo.get(id)
+        if future is not None:
+            self.stats["memoized"] += 1
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = self._memo[id] = self._queue[id] = loop.create_future()
+        if len(self._queue) == 1:
+            # El lote se cierra cuando terminan los pasos ya programados en esta vuelta
+            loop.call_soon(self._dispatch)
+        return future
+
+    def _dispatch(self) -> None:
+        batch, self._queue = self._queue, {}
+        task = asyncio.ensure_future(self._load_batch(batch))
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+
+    async def _load_batch(self, batch: Dict[int, "asyncio.Future[Optional[ModelType]]"]) -> None:
+        ids = list(batch)
+        size = max(settings.BATCH_LOADER_MAX_BATCH_SIZE, 1)
+        async with self._query_lock:
+            for start in range(0, len(ids), size):
+                chunk = ids[start:start + size]
+                self.stats["batches"] += 1
+                try:
+                    found = await self.repository.get_by_ids(chunk, include_deleted=self.include_deleted)
+                except BaseException as exc:
+                    # Los errores no se memorizan: la próxima carga de estos IDs reintenta
+                    for id in ids[start:]:
+                        if self._memo.get(id) is batch[id]:
+                            del self._memo[id]
+                        if isinstance(exc, Exception):
+                            batch[id].set_exception(exc)
+                        else:
+                            batch[id].cancel()
+                    if not isinstance(exc, Exception):
+                        raise
+                    return
+                for id, obj in zip(chunk, found):
+                    batch[id].set_result(obj)
+
+    async def load(self, id: int) -> Optional[ModelType]:
+        """
+        Carga una entidad por ID, agrupada con las demás cargas de esta vuelta.
+
+        Args:
+            id: ID de la entidad
+
+        Returns:
+            ModelType: Instancia del modelo si se encuentra, None en caso contrario
+        """
+        # shield: cancelar a quien espera no cancela la carga compartida ni su memoria
+        return await asyncio.shield(self._enqueue(id))
+
+    async def load_many(self, ids: Sequence[int]) -> List[Optional[ModelType]]:
+        """
+        Carga varias entidades por ID en una sola consulta (salvo las ya memorizadas).
+
+        Args:
+            ids: IDs a cargar; pueden repetirse
+
+        Returns:
+            List[Optional[ModelType]]: Una entrada por ID, en el mismo orden, None si no se encuentra
+        """
+        return list(await asyncio.gather(*(asyncio.shield(self._enqueue(id)) for id in ids)))
+
+    def clear(self) -> None:
+        """Descarta los resultados memorizados (las cargas en curso terminan igualmente)."""
+        self._memo.clear()
+
+
+def batch_loader(repository: BaseRepository[ModelType], include_deleted: bool = False) -> BatchLoader[ModelType]:
+    """
+    Loader de un repositorio para la petición en curso (uno por sesión y modelo).
+
+    Args:
+        repository: Repositorio del modelo; su sesión delimita la petición
+        include_deleted: Si True, también carga entidades marcadas como eliminadas
+
+    Returns:
+        BatchLoader: Loader compartido por todos los repositorios del modelo en la sesión
+    """
+    loaders: Dict[Any, BatchLoader] = repository.db.info.setdefault(_LOADERS_KEY, {})
+    key = (repository.model, include_deleted)
+    loader = loaders.get(key)
+    if loader is None:
+        loader = loaders[key] = BatchLoader(repository, include_deleted)
+    return loader
+
+
+def _forget_results(session: Session) -> None:
+    for loader in session.info.get(_LOADERS_KEY, {}).values():
+        loader.clear()
+
+
+@event.listens_for(Session, "after_commit")
+def _clear_committed(session: Session) -> None:
+    _forget_results(session)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _clear_rolled_back(session: Session, previous_transaction: Any) -> None:
+    _forget_results(session)
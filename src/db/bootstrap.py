@@ -0,0 +1,252 @@
+# app/db/bootstrap.py
+"""
+Preparación de la base de datos al arrancar cada worker.
+
+En modo "migrate" el esquema se gestiona con Alembic y una marca de versión
+(`startup_markers`) registra la revisión aplicada y la versión de los seeds:
+
+1. Camino rápido: una sola consulta; si la marca coincide, no se hace nada más.
+2. Si no coincide, se toma un lock entre procesos (fichero en SQLite, advisory lock
+   en PostgreSQL), se vuelve a comprobar la marca (otro worker pudo adelantarse), se
+   aplican las migraciones y los seeds y se actualiza la marca.
+
+Así, con N workers solo uno migra y siembra; el resto espera al lock o sale por el
+camino rápido.
+"""
+import asyncio
+import functools
+import logging
+import os
+import re
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, FrozenSet, Optional, Tuple
+
+from sqlalchemy import delete, inspect, insert, select, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.config import settings
+from src.db.base import Base
+from src.db.seed.run_seed import run_all_seeds
+from src.models.startup_marker import StartupMarker
+
+logger = logging.getLogger(__name__)
+
+MODE_MIGRATE = "migrate"
+MODE_CREATE_ALL = "create_all"
+MODE_SKIP = "skip"
+MODES = (MODE_MIGRATE, MODE_CREATE_ALL, MODE_SKIP)
+
+MARKER_NAME = "database"
+# Incrementar al cambiar los datos de src/db/seed para que se vuelvan a aplicar
+SEED_VERSION = 1
+# Clave del advisory lock de PostgreSQL (cualquier bigint fijo y exclusivo de la aplicación)
+ADVISORY_LOCK_KEY = 0x5EED0001
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+ALEMBIC_INI = os.path.join(PROJECT_ROOT, "alembic.ini")
+VERSIONS_DIR = os.path.join(PROJECT_ROOT, "migrations", "versions")
+# Revisión equivalente a un esquema creado con create_all antes de usar Alembic: el de
+# los modelos de entonces; todo lo añadido después llega con las migraciones desde 0001
+BASELINE_REVISION = "0000"
+_REVISION_RE = re.compile(r"^revision\s*=\s*['\"]([^'\"]+)['\"]", re.MULTILINE)
+_DOWN_REVISION_RE = re.compile(r"^down_revision\s*=\s*(.+)$", re.MULTILINE)
+_QUOTED_RE = re.compile(r"['\"]([^'\"]+)['\"]")
+
+# Resultados de bootstrap_database
+CURRENT = "current"
+MIGRATED = "migrated"
+CREATED = "created"
+SKIPPED = "skipped"
+
+
+def _alembic_config():
+    from alembic.config import Config
+
+    config = Config(ALEMBIC_INI)
+    # No reconfigurar el logging de la aplicación desde migrations/env.py
+    config.attributes["configure_logger"] = False
+    return config
+
+
+@functools.lru_cache(maxsize=None)
+def _scan_revisions() -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """
+    Revisiones de migrations/versions y las que alguna otra revisión tiene como padre.
+
+    Se leen `revision`/`down_revision` de los ficheros en lugar de cargar Alembic: el
+    camino rápido del arranque no debe pagar su importación.
+    """
+    revisions, parents = set(), set()
+    for filename in os.listdir(VERSIONS_DIR):
+        if not filename.endswith(".py"):
+            continue
+        with open(os.path.join(VERSIONS_DIR, filename), encoding="utf-8") as fh:
+            source = fh.read()
+        revision = _REVISION_RE.search(source)
+        if revision:
+            revisions.add(revision.group(1))
+            down = _DOWN_REVISION_RE.search(source)
+            if down:
+                parents.update(_QUOTED_RE.findall(down.group(1)))
+    return frozenset(revisions), frozenset(parents)
+
+
+def head_revision() -> str:
+    """Revisión más reciente de migrations/versions."""
+    revisions, parents = _scan_revisions()
+    heads = revisions - parents
+    if len(heads) != 1:
+        raise RuntimeError(f"Se esperaba una única revisión head en {VERSIONS_DIR}: {sorted(heads)}")
+    return next(iter(heads))
+
+
+def target_version() -> str:
+    return f"{head_revision()}+seed{SEED_VERSION}"
+
+
+async def read_marker(engine: AsyncEngine) -> Optional[str]:
+    """
+    Versión registrada en la marca de arranque.
+
+    Returns:
+        Optional[str]: Versión, None si la base de datos aún no tiene marca o ni siquiera la tabla
+    """
+    try:
+        async with engine.connect() as conn:
+            query = select(StartupMarker.version).where(StartupMarker.name == MARKER_NAME)
+            return (await conn.execute(query)).scalar()
+    except DBAPIError:
+        return None
+
+
+async def _write_marker(engine: AsyncEngine, version: str) -> None:
+    table = StartupMarker.__table__
+    async with engine.begin() as conn:
+        await conn.execute(delete(table).where(table.c.name == MARKER_NAME))
+        await conn.execute(insert(table).values(name=MARKER_NAME, version=version, is_deleted=False))
+
+
+async def _poll(acquire, description: str, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while not await acquire():
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"No se obtuvo el lock de arranque ({description}) en {timeout:.0f} s")
+        await asyncio.sleep(0.05)
+
+
+@asynccontextmanager
+async def startup_lock(engine: AsyncEngine, timeout: Optional[float] = None) -> AsyncIterator[None]:
+    """
+    Lock entre procesos para migrar y sembrar la base de datos.
+
+    - SQLite: `flock` sobre un fichero junto a la base de datos (sin lock en memoria).
+    - PostgreSQL: advisory lock de sesión sobre una conexión dedicada.
+    - Otros dialectos: sin lock.
+
+    Raises:
+        TimeoutError: Si el lock no se obtiene en `timeout` segundos
+    """
+    timeout = timeout if timeout is not None else settings.STARTUP_LOCK_TIMEOUT_SECONDS
+    dialect = engine.dialect.name
+    database = engine.url.database
+
+    if dialect == "sqlite" and database and database != ":memory:":
+        import fcntl
+
+        path = f"{database}.startup.lock"
+        with open(path, "a") as fh:
+            async def acquire() -> bool:
+                try:
+                    fcntl.flock(fh, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    return True
+                except BlockingIOError:
+                    return False
+
+            await _poll(acquire, path, timeout)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+    elif dialect == "postgresql":
+        async with engine.connect() as conn:
+            async def acquire() -> bool:
+                result = await conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": ADVISORY_LOCK_KEY})
+                await conn.commit()
+                return bool(result.scalar())
+
+            await _poll(acquire, f"advisory {ADVISORY_LOCK_KEY}", timeout)
+            try:
+                yield
+            finally:
+                await conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": ADVISORY_LOCK_KEY})
+                await conn.commit()
+
+    else:
+        yield
+
+
+def _upgrade(connection) -> None:
+    from alembic import command
+    from alembic.runtime.migration import MigrationContext
+
+    config = _alembic_config()
+    config.attributes["connection"] = connection
+    current = MigrationContext.configure(connection).get_current_revision()
+    known = current in _scan_revisions()[0]
+    if not known and inspect(connection).has_table("users"):
+        # Base de datos creada con create_all (sin versión o con una revisión ajena a
+        # migrations/versions): se marca con el esquema anterior a Alembic y las
+        # migraciones añaden las tablas, columnas e índices posteriores (comprobando
+        # antes si ya existen), también en las tablas de archivo que derivan de ellas
+        logger.warning(
+            "Base de datos con revisión %s desconocida: se marca como %s", current, BASELINE_REVISION
+        )
+        command.stamp(config, BASELINE_REVISION, purge=True)
+    command.upgrade(config, "head")
+
+
+async def bootstrap_database(engine: AsyncEngine, mode: Optional[str] = None) -> str:
+    """
+    Deja el esquema y los datos iniciales al día según el modo de arranque.
+
+    Args:
+        engine: Engine de la aplicación
+        mode: "migrate", "create_all" o "skip" (por defecto STARTUP_SCHEMA_MODE)
+
+    Returns:
+        str: "current" si ya estaba al día, "migrated", "created" o "skipped"
+
+    Raises:
+        ValueError: Si el modo no es válido
+        TimeoutError: Si otro proceso retiene el lock de arranque demasiado tiempo
+    """
+    mode = mode or settings.STARTUP_SCHEMA_MODE
+    if mode not in MODES:
+        raise ValueError(f"STARTUP_SCHEMA_MODE no válido: {mode!r}. Valores: {', '.join(MODES)}")
+
+    if mode == MODE_SKIP:
+        return SKIPPED
+
+    if mode == MODE_CREATE_ALL:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        await run_all_seeds()
+        return CREATED
+
+    target = target_version()
+    if await read_marker(engine) == target:
+        return CURRENT
+
+    async with startup_lock(engine):
+        # Otro worker pudo completar el arranque mientras esperábamos el lock
+        if await read_marker(engine) == target:
+            return CURRENT
+        async with engine.begin() as conn:
+            await conn.run_sync(_upgrade)
+        # Sin marca, el siguiente arranque reintentará los seeds
+        if await run_all_seeds():
+            await _write_marker(engine, target)
+        logger.info("Base de datos en la versión %s", target)
+    return MIGRATED
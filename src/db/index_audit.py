@@ -0,0 +1,380 @@
+"""
+Auditoría de índices: claves foráneas y columnas filtradas por los repositorios.
+
+Detecta dos tipos de columna sin índice que la cubra:
+
+- Claves foráneas: joins, cargas de relaciones y comprobaciones de integridad al
+  borrar el padre las recorren.
+- Columnas que los repositorios de `src/db/repositories` filtran, obtenidas del código
+  fuente: claves de los diccionarios `filters` y comparaciones `Modelo.columna == ...`.
+
+Una columna está cubierta si es la primera columna de un índice, de la clave primaria
+o de una restricción única. Para los filtros de repositorio vale también la segunda
+columna tras `tenant_id` (las consultas con tenant filtran por ambas); las claves
+foráneas no, porque los joins sin tenant, las comprobaciones de integridad y el
+archivado no filtran por él. Un índice parcial cuenta, pero se señala. También se
+informan los filtros sobre columnas que no existen en el modelo, que BaseRepository
+ignora en silencio.
+
+El esquema se toma de los modelos o, con `--database-url`, de una base de datos real.
+
+Uso:
+    python -m src.db.index_audit
+    python -m src.db.index_audit --database-url sqlite+aiosqlite:///./test.db --json
+    python -m src.db.index_audit --write-migration
+"""
+import argparse
+import ast
+import asyncio
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy import MetaData, UniqueConstraint, inspect
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src import models  # noqa: F401  (registra todas las tablas en Base.metadata)
+from src.db.base import Base
+
+REPOSITORIES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "repositories")
+TENANT_COLUMN = "tenant_id"
+# Métodos de BaseRepository que reciben el diccionario de filtros
+_FILTER_METHODS = {"get_all", "get_by_filters", "get_one_by_filters", "get_collection_stamp"}
+
+
+class IndexEntry(NamedTuple):
+    name: str
+    columns: Tuple[str, ...]
+    partial: bool
+
+
+class ForeignKeyRef(NamedTuple):
+    table: str
+    column: str
+    referred: str
+
+
+class SchemaInfo(NamedTuple):
+    # Tabla → columnas, índices (incluidas PK y restricciones únicas) y claves foráneas
+    columns: Dict[str, Set[str]]
+    indexes: Dict[str, List[IndexEntry]]
+    foreign_keys: List[ForeignKeyRef]
+
+
+class RepositoryFilter(NamedTuple):
+    repository: str
+    method: str
+    table: str
+    column: str
+
+
+class Finding(NamedTuple):
+    table: str
+    column: str
+    # "foreign_key", "repository_filter" o "unknown_column"
+    kind: str
+    sources: Tuple[str, ...]
+    covered_by: Optional[str]
+
+    @property
+    def index_name(self) -> str:
+        return f"ix_{self.table}_{self.column}"
+
+
+def schema_from_metadata(metadata: MetaData = Base.metadata) -> SchemaInfo:
+    """Esquema declarado por los modelos."""
+    columns: Dict[str, Set[str]] = {}
+    indexes: Dict[str, List[IndexEntry]] = {}
+    foreign_keys: List[ForeignKeyRef] = []
+    for table in metadata.tables.values():
+        columns[table.name] = {column.name for column in table.columns}
+        entries = [IndexEntry("primary key", tuple(column.name for column in table.primary_key.columns), False)]
+        for index in table.indexes:
+            partial = any(index.dialect_options[dialect]["where"] is not None for dialect in ("sqlite", "postgresql"))
+            entries.append(IndexEntry(index.name, tuple(column.name for column in index.columns), partial))
+        for constraint in table.constraints:
+            if isinstance(constraint, UniqueConstraint):
+                entries.append(IndexEntry(constraint.name or "unique", tuple(column.name for column in constraint.columns), False))
+        indexes[table.name] = entries
+        for foreign_key in table.foreign_keys:
+            foreign_keys.append(ForeignKeyRef(table.name, foreign_key.parent.name, foreign_key.column.table.name))
+    return SchemaInfo(columns, indexes, foreign_keys)
+
+
+def schema_from_connection(connection) -> SchemaInfo:
+    """Esquema reflejado de una conexión síncrona (usar con `run_sync`)."""
+    inspector = inspect(connection)
+    columns: Dict[str, Set[str]] = {}
+    indexes: Dict[str, List[IndexEntry]] = {}
+    foreign_keys: List[ForeignKeyRef] = []
+    for table in inspector.get_table_names():
+        if table == "alembic_version":
+            continue
+        columns[table] = {column["name"] for column in inspector.get_columns(table)}
+        pk = inspector.get_pk_constraint(table)
+        entries = [IndexEntry("primary key", tuple(pk.get("constrained_columns") or ()), False)]
+        for index in inspector.get_indexes(table):
+            options = index.get("dialect_options", {})
+            partial = bool(options.get("sqlite_where") is not None or options.get("postgresql_where") is not None)
+            entries.append(IndexEntry(index["name"], tuple(index["column_names"]), partial))
+        for constraint in inspector.get_unique_constraints(table):
+            entries.append(IndexEntry(constraint["name"] or "unique", tuple(constraint["column_names"]), False))
+        indexes[table] = entries
+        for foreign_key in inspector.get_foreign_keys(table):
+            for column in foreign_key["constrained_columns"]:
+                foreign_keys.append(ForeignKeyRef(table, column, foreign_key["referred_table"]))
+    return SchemaInfo(columns, indexes, foreign_keys)
+
+
+async def schema_from_database(database_url: str) -> SchemaInfo:
+    engine = create_async_engine(database_url)
+    try:
+        async with engine.connect() as conn:
+            return await conn.run_sync(schema_from_connection)
+    finally:
+        await engine.dispose()
+
+
+def covering_index(schema: SchemaInfo, table: str, column: str, tenant_prefix: bool = False) -> Optional[str]:
+    """
+    Nombre del índice que cubre búsquedas por `column`, None si no hay ninguno.
+
+    Args:
+        schema: Esquema auditado
+        table: Tabla
+        column: Columna buscada
+        tenant_prefix: Si True, vale también un índice (tenant_id, column, ...)
+    """
+    for entry in schema.indexes.get(table, ()):
+        if entry.columns[:1] == (column,) or (tenant_prefix and entry.columns[:2] == (TENANT_COLUMN, column)):
+            return f"{entry.name} (parcial)" if entry.partial else entry.name
+    return None
+
+
+def _model_tables() -> Dict[str, str]:
+    return {mapper.class_.__name__: mapper.local_table.name for mapper in Base.registry.mappers}
+
+
+class _RepositoryVisitor(ast.NodeVisitor):
+    """Recoge las columnas filtradas por los métodos de una clase repositorio."""
+
+    def __init__(self, repository: str, model_tables: Dict[str, str]):
+        self.repository = repository
+        self.model_tables = model_tables
+        self.table: Optional[str] = None
+        self.method = ""
+        self.found: List[Tuple[str, str, str]] = []
+
+    def visit_FunctionDef(self, node) -> None:
+        self.method = node.name
+        self.generic_visit(node)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_Call(self, node: ast.Call) -> None:
+        func = node.func
+        # super().__init__(db, Modelo): modelo del repositorio
+        if isinstance(func, ast.Attribute) and func.attr == "__init__" and len(node.args) >= 2:
+            model = node.args[1]
+            if isinstance(model, ast.Name) and model.id in self.model_tables:
+                self.table = self.model_tables[model.id]
+        if isinstance(func, ast.Attribute) and func.attr in _FILTER_METHODS:
+            arguments = list(node.args[:1]) + [keyword.value for keyword in node.keywords if keyword.arg == "filters"]
+            for argument in arguments:
+                if isinstance(argument, ast.Dict):
+                    self._add_keys(argument)
+        self.generic_visit(node)
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        if isinstance(node.value, ast.Dict) and any(
+            isinstance(target, ast.Name) and target.id == "filters" for target in node.targets
+        ):
+            self._add_keys(node.value)
+        self.generic_visit(node)
+
+    def visit_Compare(self, node: ast.Compare) -> None:
+        for operand in [node.left, *node.comparators]:
+            if not isinstance(operand, ast.Attribute):
+                continue
+            owner = operand.value
+            if isinstance(owner, ast.Name) and owner.id in self.model_tables:
+                self.found.append((self.method, self.model_tables[owner.id], operand.attr))
+            elif isinstance(owner, ast.Attribute) and owner.attr == "model" and self.table:
+                self.found.append((self.method, self.table, operand.attr))
+        self.generic_visit(node)
+
+    def _add_keys(self, node: ast.Dict) -> None:
+        for key in node.keys:
+            if isinstance(key, ast.Constant) and isinstance(key.value, str):
+                # La tabla se resuelve al terminar la clase (el __init__ puede ir después)
+                self.found.append((self.method, "", key.value))
+
+
+def repository_filters(directory: str = REPOSITORIES_DIR) -> List[RepositoryFilter]:
+    """Columnas filtradas por los repositorios, extraídas de su código fuente."""
+    model_tables = _model_tables()
+    filters: List[RepositoryFilter] = []
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith(".py") or filename in ("__init__.py", "base_repository.py"):
+            continue
+        with open(os.path.join(directory, filename), encoding="utf-8") as fh:
+            tree = ast.parse(fh.read(), filename)
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            visitor = _RepositoryVisitor(node.name, model_tables)
+            visitor.visit(node)
+            for method, table, column in visitor.found:
+                table = table or visitor.table
+                if table and column not in ("id", "deleted_at"):
+                    filters.append(RepositoryFilter(node.name, method, table, column))
+    return filters
+
+
+def audit(schema: SchemaInfo, filters: Optional[Iterable[RepositoryFilter]] = None) -> List[Finding]:
+    """
+    Columnas de claves foráneas y filtros de repositorio, con el índice que las cubre.
+
+    Args:
+        schema: Esquema auditado (modelos o base de datos)
+        filters: Filtros de los repositorios; por defecto se extraen del código fuente
+
+    Returns:
+        List[Finding]: Una entrada por (tabla, columna, tipo), ordenadas por tabla y columna
+    """
+    sources: Dict[Tuple[str, str, str], List[str]] = {}
+    for foreign_key in schema.foreign_keys:
+        sources.setdefault((foreign_key.table, foreign_key.column, "foreign_key"), []).append(
+            f"{foreign_key.table}.{foreign_key.column} -> {foreign_key.referred}"
+        )
+    for item in repository_filters() if filters is None else filters:
+        kind = "repository_filter" if item.column in schema.columns.get(item.table, ()) else "unknown_column"
+        sources.setdefault((item.table, item.column, kind), []).append(f"{item.repository}.{item.method}")
+
+    return [
+        Finding(
+            table, column, kind, tuple(dict.fromkeys(origin)),
+            covering_index(schema, table, column, tenant_prefix=kind == "repository_filter"),
+        )
+        for (table, column, kind), origin in sorted(sources.items())
+    ]
+
+
+def missing_indexes(findings: Iterable[Finding], include_filters: bool = False) -> List[Finding]:
+    """Claves foráneas (y, opcionalmente, filtros) sin índice, sin repetir columnas."""
+    kinds = {"foreign_key", "repository_filter"} if include_filters else {"foreign_key"}
+    missing: Dict[Tuple[str, str], Finding] = {}
+    for finding in findings:
+        if finding.kind in kinds and finding.covered_by is None:
+            missing.setdefault((finding.table, finding.column), finding)
+    return list(missing.values())
+
+
+_MIGRATION_TEMPLATE = '''"""{message}
+
+Revision ID: {revision}
+Revises: {down_revision}
+Create Date: {create_date}
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '{revision}'
+down_revision = '{down_revision}'
+branch_labels = None
+depends_on = None
+
+# Generado con `python -m src.db.index_audit --write-migration`: (tabla, índice, columna)
+INDEXES = [
+{indexes}
+]
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    # Bases de datos creadas con create_all a partir de los modelos actuales ya los tienen
+    for table, name, column in INDEXES:
+        if name not in {{index['name'] for index in inspector.get_indexes(table)}}:
+            op.create_index(name, table, [column], unique=False)
+
+
+def downgrade() -> None:
+    for table, name, column in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
+'''
+
+
+def render_migration(missing: List[Finding], revision: str, down_revision: str, message: str) -> str:
+    """Código de una revisión de Alembic que crea los índices de `missing`."""
+    indexes = "\n".join(
+        f"    ('{finding.table}', '{finding.index_name}', '{finding.column}'),  # {', '.join(finding.sources)}"
+        for finding in missing
+    )
+    return _MIGRATION_TEMPLATE.format(
+        message=message,
+        revision=revision,
+        down_revision=down_revision,
+        create_date=datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f"),
+        indexes=indexes,
+    )
+
+
+def write_migration(missing: List[Finding], message: str = "indexes on foreign keys") -> str:
+    """
+    Escribe en migrations/versions la revisión siguiente a la head actual.
+
+    Returns:
+        str: Ruta del fichero creado
+    """
+    from src.db.bootstrap import VERSIONS_DIR, head_revision
+
+    down_revision = head_revision()
+    revision = f"{int(down_revision) + 1:04d}"
+    slug = "_".join(message.lower().split())
+    path = os.path.join(VERSIONS_DIR, f"{revision}_{slug}.py")
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write(render_migration(missing, revision, down_revision, message))
+    return path
+
+
+def _print_report(findings: List[Finding]) -> None:
+    for finding in findings:
+        if finding.kind == "unknown_column":
+            status = "columna inexistente"
+        else:
+            status = finding.covered_by or "SIN ÍNDICE"
+        print(f"{finding.kind:<18} {finding.table + '.' + finding.column:<40} {status:<45} {'; '.join(finding.sources)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=None, help="Auditar una base de datos en lugar de los modelos")
+    parser.add_argument("--json", action="store_true", help="Salida en JSON")
+    parser.add_argument("--include-filters", action="store_true", help="Indexar también los filtros de repositorio")
+    parser.add_argument("--write-migration", action="store_true", help="Generar la migración con los índices que faltan")
+    args = parser.parse_args()
+
+    schema = asyncio.run(schema_from_database(args.database_url)) if args.database_url else schema_from_metadata()
+    findings = audit(schema)
+    missing = missing_indexes(findings, include_filters=args.include_filters)
+
+    if args.json:
+        report: Dict[str, Any] = {
+            "findings": [{**finding._asdict(), "sources": list(finding.sources)} for finding in findings],
+            "missing": [finding.index_name for finding in missing],
+        }
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        _print_report(findings)
+        print(f"\n{len(missing)} índices por crear: {', '.join(finding.index_name for finding in missing) or '-'}")
+
+    if args.write_migration and missing:
+        print(f"Migración escrita en {write_migration(missing)}")
+
+
+if __name__ == "__main__":
+    main()
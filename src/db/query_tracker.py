@@ -0,0 +1,189 @@
+# app/db/query_tracker.py
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+
+from src.core.exceptions import QueryBudgetExceededException
+from src.db.base import Base
+
+# Listas de parámetros de IN (?, ?, ?) y literales numéricos se colapsan para que dos
+# consultas que solo difieren en sus valores compartan la misma forma
+_IN_LIST = re.compile(r"\(\s*(?:\?|%s|%\(\w+\)s|:\w+|\$\d+)(?:\s*,\s*(?:\?|%s|%\(\w+\)s|:\w+|\$\d+))+\s*\)")
+_NUMBER = re.compile(r"\b\d+\b")
+_WHITESPACE = re.compile(r"\s+")
+
+_START_KEY = "query_tracker_start"
+
+BUDGET_WARN = "warn"
+BUDGET_RAISE = "raise"
+
+
+def statement_shape(statement: str) -> str:
+    """
+    Normaliza una sentencia SQL a su forma, independiente de los valores.
+
+    Args:
+        statement: SQL tal como se envía al cursor
+
+    Returns:
+        str: Sentencia normalizada
+    """
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    shape = _IN_LIST.sub("(?)", shape)
+    return _NUMBER.sub("N", shape)
+
+
+class QueryTracker:
+    """
+    Registro de las sentencias SQL ejecutadas dentro de un contexto (normalmente una petición).
+
+    Acumula número de sentencias, tiempo total en base de datos, filas (entidades ORM
+    cargadas más filas afectadas por escrituras) y la sentencia más lenta. Con
+    `track_shapes` agrupa además las sentencias por forma; una misma forma repetida
+    muchas veces en una petición es la huella típica de un N+1.
+
+    Si se define `budget`, superar ese número de sentencias se marca en `over_budget`
+    y, en modo "raise", la sentencia que lo excede lanza QueryBudgetExceededException.
+    """
+
+    def __init__(
+        self,
+        label: str = "",
+        budget: int = 0,
+        budget_mode: str = BUDGET_WARN,
+        track_shapes: bool = True,
+    ):
+        self.label = label
+        self.budget = budget
+        self.budget_mode = budget_mode
+        self.track_shapes = track_shapes
+        self.statements = 0
+        self.db_time = 0.0
+        self.rows = 0
+        self.slowest_time = 0.0
+        self.slowest_statement: Optional[str] = None
+        self.shapes: Counter = Counter()
+
+    @property
+    def over_budget(self) -> bool:
+        return bool(self.budget) and self.statements > self.budget
+
+    def record(self, statement: str) -> None:
+        """
+        Registra el inicio de una sentencia.
+
+        Raises:
+            QueryBudgetExceededException: Si se supera el presupuesto en modo "raise"
+        """
+        self.statements += 1
+        if self.track_shapes:
+            self.shapes[statement_shape(statement)] += 1
+        if self.over_budget and self.budget_mode == BUDGET_RAISE:
+            raise QueryBudgetExceededException(
+                f"{self.label or 'La operación'} superó el presupuesto de {self.budget} sentencias SQL"
+            )
+
+    def record_result(self, statement: str, duration: float, rows: int = 0) -> None:
+        """Registra la duración y las filas afectadas de una sentencia ya ejecutada."""
+        self.db_time += duration
+        if rows > 0:
+            self.rows += rows
+        if duration > self.slowest_time:
+            self.slowest_time = duration
+            self.slowest_statement = statement
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """
+        Formas de sentencia ejecutadas al menos `threshold` veces.
+
+        Args:
+            threshold: Número mínimo de repeticiones para señalar una forma
+
+        Returns:
+            List[Tuple[str, int]]: Pares (forma, repeticiones) de mayor a menor
+        """
+        return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+
+_current_tracker: ContextVar[Optional[QueryTracker]] = ContextVar("query_tracker", default=None)
+
+
+def current_tracker() -> Optional[QueryTracker]:
+    """Tracker activo en el contexto actual, si lo hay."""
+    return _current_tracker.get()
+
+
+@contextmanager
+def track_queries(
+    label: str = "",
+    budget: int = 0,
+    budget_mode: str = BUDGET_WARN,
+    track_shapes: bool = True,
+) -> Iterator[QueryTracker]:
+    """
+    Activa un QueryTracker para el bloque. Las sentencias que se ejecuten dentro
+    (incluidas las de AsyncSession, que heredan el contexto) quedan registradas.
+
+    Args:
+        label: Identificador del contexto, p. ej. "GET /api/v1/users/"
+        budget: Máximo de sentencias permitidas (0 sin límite)
+        budget_mode: "warn" solo marca el exceso; "raise" lanza una excepción
+        track_shapes: Si True, agrupa las sentencias por forma (detección de N+1)
+    """
+    tracker = QueryTracker(label, budget=budget, budget_mode=budget_mode, track_shapes=track_shapes)
+    token = _current_tracker.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _current_tracker.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    tracker = _current_tracker.get()
+    if tracker is not None:
+        tracker.record(statement)
+        conn.info.setdefault(_START_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    tracker = _current_tracker.get()
+    starts = conn.info.get(_START_KEY)
+    if tracker is None or not starts:
+        return
+    duration = time.perf_counter() - starts.pop()
+    # En SELECT el rowcount no es fiable; las filas leídas se cuentan al cargar entidades
+    rows = cursor.rowcount if context is not None and (context.isinsert or context.isupdate or context.isdelete) else 0
+    tracker.record_result(statement, duration, rows)
+
+
+def _handle_error(exception_context):
+    starts = exception_context.connection.info.get(_START_KEY) if exception_context.connection else None
+    if starts:
+        starts.pop()
+
+
+def _on_load(target, context):
+    tracker = _current_tracker.get()
+    if tracker is not None:
+        tracker.rows += 1
+
+
+def install(engine) -> None:
+    """
+    Registra los hooks de seguimiento en el engine y en los modelos (idempotente).
+
+    Args:
+        engine: Engine síncrono o AsyncEngine
+    """
+    sync_engine = getattr(engine, "sync_engine", engine)
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(sync_engine, "handle_error", _handle_error)
+    if not event.contains(Base, "load", _on_load):
+        event.listen(Base, "load", _on_load, propagate=True)
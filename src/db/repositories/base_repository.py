@@ -1,16 +1,26 @@
+import inspect
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import Any, ClassVar, Dict, Generic, List, Optional, Sequence, Tuple, Type, TypeVar, Union
 from datetime import datetime
 
-from sqlalchemy import and_, or_, select, update, delete
+from sqlalchemy import String, and_, or_, select, update, delete, func, insert, exists, literal, type_coerce
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import DeclarativeBase
-from src.core.exceptions import NotFoundException, DuplicateEntryException
+from sqlalchemy.sql import Select
+from src.core.exceptions import (
+    NotFoundException, DuplicateEntryException, PreconditionFailedException, TenantRequiredException,
+)
+from src.core.metrics import timed_repository_method
+from src.core.tenancy import get_current_tenant, tenant_required
+from src.models.archive import ARCHIVE_TABLES, referencing_foreign_keys
 
 # Define the generic type variable for the model
 ModelType = TypeVar("ModelType", bound=DeclarativeBase)
 
+# Nombre de perfil de carga o lista de perfiles a combinar
+LoadProfile = Union[str, Sequence[str], None]
+
 
 class BaseRepository(ABC, Generic[ModelType]):
     """
@@ -21,7 +31,23 @@ class BaseRepository(ABC, Generic[ModelType]):
     - Leer entidades (con y sin filtros)
     - Actualizar entidades
     - Eliminar lógico (soft delete)
+    - Archivar las filas eliminadas hace tiempo y restaurarlas desde el archivo
+
+    Las relaciones de los modelos son perezosas y con AsyncSession un acceso perezoso
+    falla. Cada repositorio declara en `loader_profiles` perfiles de carga con nombre
+    (árboles de selectinload/joinedload) que los métodos de lectura aplican con `load=`,
+    p. ej. `get_by_id(id, load="with_role")` o `get_all(load="deep")`.
+
+    Las consultas sobre modelos con `TenantMixin` se filtran por el tenant de la
+    petición en la propia sesión (src/db/tenancy.py), sin condiciones explícitas aquí;
+    la opción de ejecución `ALL_TENANTS` desactiva el filtro en una sentencia.
     """
+
+    loader_profiles: ClassVar[Dict[str, Tuple[Any, ...]]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _instrument_methods(cls)
     
     def __init__(self, db: AsyncSession, model: Type[ModelType]):
         """
@@ -34,6 +60,34 @@ class BaseRepository(ABC, Generic[ModelType]):
         self.db = db
         self.model = model
 
+    def _apply_load(self, query: Select, load: LoadProfile) -> Select:
+        """
+        Añade a la consulta las opciones de carga de uno o varios perfiles.
+
+        Args:
+            query: Consulta SELECT sobre el modelo
+            load: Nombre de perfil, lista de nombres o None
+
+        Returns:
+            Select: Consulta con las opciones de carga aplicadas
+
+        Raises:
+            ValueError: Si algún perfil no está declarado en el repositorio
+        """
+        if not load:
+            return query
+        names = [load] if isinstance(load, str) else list(load)
+        options = []
+        for name in names:
+            profile = self.loader_profiles.get(name)
+            if profile is None:
+                raise ValueError(
+                    f"Perfil de carga desconocido para {self.model.__name__}: {name!r}. "
+                    f"Disponibles: {', '.join(self.loader_profiles) or 'ninguno'}"
+                )
+            options.extend(profile)
+        return query.options(*options)
+
     async def create(self, obj_in: Dict[str, Any]) -> ModelType:
         """
         Crea una nueva entidad en la base de datos.
@@ -57,13 +111,14 @@ class BaseRepository(ABC, Generic[ModelType]):
             await self.db.rollback()
             raise DuplicateEntryException(f"Ya existe una entrada con los mismos valores únicos para {self.model.__name__}")
 
-    async def get_by_id(self, id: int, include_deleted: bool = False) -> Optional[ModelType]:
+    async def get_by_id(self, id: int, include_deleted: bool = False, load: LoadProfile = None) -> Optional[ModelType]:
         """
         Obtiene una entidad por su ID.
         
         Args:
             id: ID de la entidad a buscar
             include_deleted: Si True, incluye entidades marcadas como eliminadas
+            load: Perfil(es) de carga de relaciones declarados en `loader_profiles`
             
         Returns:
             ModelType: Instancia del modelo si se encuentra, None en caso contrario
@@ -71,10 +126,34 @@ class BaseRepository(ABC, Generic[ModelType]):
         query = select(self.model).where(self.model.id == id)
         if not include_deleted:
             query = query.where(self.model.deleted_at.is_(None))
+        query = self._apply_load(query, load)
         
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_by_ids(self, ids: Sequence[int], include_deleted: bool = False, load: LoadProfile = None) -> List[Optional[ModelType]]:
+        """
+        Obtiene varias entidades por ID en una sola consulta (`WHERE id IN (...)`).
+
+        Args:
+            ids: IDs a buscar; pueden repetirse
+            include_deleted: Si True, incluye entidades marcadas como eliminadas
+            load: Perfil(es) de carga de relaciones declarados en `loader_profiles`
+
+        Returns:
+            List[Optional[ModelType]]: Una entrada por ID, en el mismo orden, None si no se encuentra
+        """
+        if not ids:
+            return []
+        query = select(self.model).where(self.model.id.in_(set(ids)))
+        if not include_deleted:
+            query = query.where(self.model.deleted_at.is_(None))
+        query = self._apply_load(query, load)
+
+        result = await self.db.execute(query)
+        found = {obj.id: obj for obj in result.scalars()}
+        return [found.get(id) for id in ids]
+
     async def get_all(
         self, 
         skip: int = 0, 
@@ -82,7 +161,8 @@ class BaseRepository(ABC, Generic[ModelType]):
         include_deleted: bool = False,
         filters: Optional[Dict[str, Any]] = None,
         order_by: Optional[str] = None,
-        descending: bool = False
+        descending: bool = False,
+        load: LoadProfile = None
     ) -> List[ModelType]:
         """
         Obtiene todas las entidades con opciones de paginación y filtrado.
@@ -94,6 +174,7 @@ class BaseRepository(ABC, Generic[ModelType]):
             filters: Diccionario con condiciones de filtrado
             order_by: Nombre del campo por el cual ordenar
             descending: Si True, ordena en forma descendente
+            load: Perfil(es) de carga de relaciones declarados en `loader_profiles`
             
         Returns:
             List[ModelType]: Lista de instancias del modelo
@@ -128,6 +209,7 @@ class BaseRepository(ABC, Generic[ModelType]):
         
         # Aplicar paginación
         query = query.offset(skip).limit(limit)
+        query = self._apply_load(query, load)
         
         result = await self.db.execute(query)
         return result.scalars().all()
@@ -137,7 +219,8 @@ class BaseRepository(ABC, Generic[ModelType]):
         filters: Dict[str, Any],
         include_deleted: bool = False,
         order_by: Optional[str] = None,
-        descending: bool = False
+        descending: bool = False,
+        load: LoadProfile = None
     ) -> List[ModelType]:
         """
         Obtiene entidades que coinciden con los filtros especificados.
@@ -147,6 +230,7 @@ class BaseRepository(ABC, Generic[ModelType]):
             include_deleted: Si True, incluye entidades marcadas como eliminadas
             order_by: Nombre del campo por el cual ordenar
             descending: Si True, ordena en forma descendente
+            load: Perfil(es) de carga de relaciones declarados en `loader_profiles`
             
         Returns:
             List[ModelType]: Lista de instancias del modelo que cumplen con los filtros
@@ -177,6 +261,7 @@ class BaseRepository(ABC, Generic[ModelType]):
                 query = query.order_by(order_field.desc())
             else:
                 query = query.order_by(order_field)
+        query = self._apply_load(query, load)
         
         result = await self.db.execute(query)
         return result.scalars().all()
@@ -184,7 +269,8 @@ class BaseRepository(ABC, Generic[ModelType]):
     async def get_one_by_filters(
         self,
         filters: Dict[str, Any], 
-        include_deleted: bool = False
+        include_deleted: bool = False,
+        load: LoadProfile = None
     ) -> Optional[ModelType]:
         """
         Obtiene una entidad que coincida con los filtros especificados.
@@ -192,6 +278,7 @@ class BaseRepository(ABC, Generic[ModelType]):
         Args:
             filters: Diccionario con condiciones de filtrado
             include_deleted: Si True, incluye entidades marcadas como eliminadas
+            load: Perfil(es) de carga de relaciones declarados en `loader_profiles`
             
         Returns:
             ModelType: Instancia del modelo si se encuentra, None en caso contrario
@@ -210,23 +297,70 @@ class BaseRepository(ABC, Generic[ModelType]):
         # Aplicar soft delete si no se incluyen eliminados
         if not include_deleted:
             query = query.where(self.model.deleted_at.is_(None))
+        query = self._apply_load(query, load)
         
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
-    async def update(self, id: int, obj_in: Dict[str, Any]) -> Optional[ModelType]:
+    async def get_collection_stamp(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        include_deleted: bool = False
+    ) -> Tuple[Optional[datetime], int]:
+        """
+        Obtiene la marca de versión de una colección: última modificación y número de filas.
+
+        Se usa para calcular ETags de colecciones con una sola consulta agregada,
+        sin cargar las entidades.
+
+        Args:
+            filters: Diccionario con condiciones de filtrado
+            include_deleted: Si True, incluye entidades marcadas como eliminadas
+
+        Returns:
+            Tuple[Optional[datetime], int]: max(updated_at/created_at) y número de entidades
+        """
+        query = select(
+            func.max(func.coalesce(self.model.updated_at, self.model.created_at)),
+            func.count(self.model.id),
+        )
+
+        if filters:
+            conditions = []
+            for field, value in filters.items():
+                if hasattr(self.model, field):
+                    if isinstance(value, list):
+                        conditions.append(getattr(self.model, field).in_(value))
+                    else:
+                        conditions.append(getattr(self.model, field) == value)
+            if conditions:
+                query = query.where(and_(*conditions))
+
+        if not include_deleted:
+            query = query.where(self.model.deleted_at.is_(None))
+
+        result = await self.db.execute(query)
+        last_modified, count = result.one()
+        return last_modified, count
+
+    async def update(
+        self, id: int, obj_in: Dict[str, Any], unchanged_from: Optional[Any] = None
+    ) -> Optional[ModelType]:
         """
         Actualiza una entidad existente.
         
         Args:
             id: ID de la entidad a actualizar
             obj_in: Diccionario con los campos a actualizar
+            unchanged_from: Estado leído antes (modelo o diccionario, p. ej. el comprobado con
+                If-Match); si se indica, solo se actualiza si `updated_at` no ha cambiado
             
         Returns:
             ModelType: Instancia del objeto actualizado, None si no se encuentra
             
         Raises:
             DuplicateEntryException: Si hay una violación de unicidad
+            PreconditionFailedException: Si la entidad cambió desde `unchanged_from`
         """
         try:
             # Filtrar para no actualizar campos con valores None si no es intencional
@@ -236,22 +370,46 @@ class BaseRepository(ABC, Generic[ModelType]):
                 # Si no hay datos para actualizar, devolver el objeto actual
                 return await self.get_by_id(id)
             
+            # Marca explícita con microsegundos: los ETags derivan de updated_at y
+            # CURRENT_TIMESTAMP en SQLite solo tiene resolución de segundos
+            update_data.setdefault("updated_at", datetime.utcnow())
+
+            conditions = [self.model.id == id, self.model.deleted_at.is_(None)]
+            if unchanged_from is not None:
+                conditions.append(self._same_updated_at(unchanged_from))
             result = await self.db.execute(
                 update(self.model)
-                .where(and_(self.model.id == id, self.model.deleted_at.is_(None)))
+                .where(and_(*conditions))
                 .values(**update_data)
                 .returning(self.model)
             )
             await self.db.commit()
             
             updated_obj = result.scalar_one_or_none()
-            if updated_obj:
-                await self.db.refresh(updated_obj)
-            return updated_obj
         except IntegrityError:
             await self.db.rollback()
             raise DuplicateEntryException(f"No se puede actualizar. Valores únicos duplicados para {self.model.__name__}")
 
+        if updated_obj is None:
+            if unchanged_from is not None and await self.get_by_id(id) is not None:
+                raise PreconditionFailedException()
+            return None
+        await self.db.refresh(updated_obj)
+        return updated_obj
+
+    def _same_updated_at(self, state: Any) -> Any:
+        """Condición `updated_at` igual al de un estado leído (modelo o diccionario)."""
+        value = state.get("updated_at") if isinstance(state, dict) else state.updated_at
+        column = self.model.updated_at
+        if value is None:
+            return column.is_(None)
+        condition = column == value
+        if value.microsecond == 0 and self.db.bind.dialect.name == "sqlite":
+            # SQLite guarda func.now() (onupdate) como texto sin fracción de segundo y la
+            # comparación con el valor leído, que se enlaza con microsegundos, fallaría
+            condition = or_(condition, column == type_coerce(value.strftime("%Y-%m-%d %H:%M:%S"), String))
+        return condition
+
     async def delete(self, id: int) -> bool:
         """
         Realiza un soft delete de la entidad (marca como eliminada con timestamp).
@@ -290,12 +448,18 @@ class BaseRepository(ABC, Generic[ModelType]):
     async def restore(self, id: int) -> Optional[ModelType]:
         """
         Restaura una entidad previamente marcada como eliminada.
+
+        Si el archivado ya la movió a la tabla de archivo, se devuelve a la tabla principal
+        (su padre debe seguir en la tabla principal o haberse restaurado antes).
         
         Args:
             id: ID de la entidad a restaurar
             
         Returns:
             ModelType: Instancia del objeto restaurado, None si no se encontró o ya estaba activo
+
+        Raises:
+            DuplicateEntryException: Si la entidad archivada choca con valores únicos ya en uso
         """
         result = await self.db.execute(
             update(self.model)
@@ -304,9 +468,95 @@ class BaseRepository(ABC, Generic[ModelType]):
             .returning(self.model)
         )
         updated_obj = result.scalar_one_or_none()
+        if updated_obj is None and await self._unarchive(id):
+            updated_obj = await self.get_by_id(id)
+        await self.db.commit()
         if updated_obj:
-            await self.db.commit()
             await self.db.refresh(updated_obj)
-        else:
-            await self.db.commit()
-        return updated_obj
\ No newline at end of file
+        return updated_obj
+
+    async def archive_deleted(self, deleted_before: datetime, limit: int = 1000) -> int:
+        """
+        Mueve a la tabla de archivo un lote de entidades eliminadas antes de una fecha.
+
+        Solo se archivan filas a las que ya no apunta ninguna otra fila de las tablas
+        principales; las tablas hijas se archivan antes (ver `ARCHIVED_MODELS`).
+
+        Args:
+            deleted_before: Se archivan las entidades con `deleted_at` anterior
+            limit: Máximo de entidades a mover en este lote
+
+        Returns:
+            int: Número de entidades archivadas (0 si el modelo no tiene tabla de archivo)
+        """
+        archive = ARCHIVE_TABLES.get(self.model.__tablename__)
+        if archive is None:
+            return 0
+        table = self.model.__table__
+
+        query = select(table.c.id).where(table.c.deleted_at < deleted_before)
+        for foreign_key in referencing_foreign_keys(table):
+            query = query.where(~exists().where(foreign_key.parent == table.c[foreign_key.column.name]))
+        # Por antigüedad del borrado: el orden del índice parcial `ix_<tabla>_deleted_at`
+        result = await self.db.execute(query.order_by(table.c.deleted_at).limit(limit))
+        ids = result.scalars().all()
+        if not ids:
+            return 0
+
+        archived_at = literal(datetime.utcnow(), archive.c.archived_at.type)
+        await self.db.execute(
+            insert(archive).from_select(
+                [column.name for column in table.columns] + ["archived_at"],
+                select(*table.columns, archived_at).where(table.c.id.in_(ids)),
+            )
+        )
+        await self.db.execute(delete(table).where(table.c.id.in_(ids)))
+        await self.db.commit()
+        return len(ids)
+
+    async def _unarchive(self, id: int) -> bool:
+        """
+        Devuelve una entidad archivada a la tabla principal, sin confirmar la transacción.
+
+        Raises:
+            DuplicateEntryException: Si choca con valores únicos ya en uso (deshace la transacción)
+            TenantRequiredException: Si la petición no tiene tenant
+        """
+        archive = ARCHIVE_TABLES.get(self.model.__tablename__)
+        if archive is None:
+            return False
+
+        query = select(archive).where(archive.c.id == id)
+        # Las tablas de archivo no son modelos ORM: el filtro por tenant se aplica aquí
+        tenant_id = get_current_tenant()
+        if "tenant_id" in archive.c:
+            if tenant_id is not None:
+                query = query.where(archive.c.tenant_id == tenant_id)
+            elif tenant_required():
+                raise TenantRequiredException()
+        row = (await self.db.execute(query)).mappings().first()
+        if row is None:
+            return False
+
+        values = {name: value for name, value in row.items() if name != "archived_at"}
+        values.update(deleted_at=None, is_deleted=False, updated_at=datetime.utcnow())
+        try:
+            await self.db.execute(insert(self.model.__table__).values(**values))
+        except IntegrityError:
+            # Mientras estaba archivada, otra entidad pudo tomar su email, nombre de usuario...
+            await self.db.rollback()
+            raise DuplicateEntryException(
+                f"No se puede restaurar. Valores únicos duplicados para {self.model.__name__}"
+            )
+        await self.db.execute(delete(archive).where(archive.c.id == id))
+        return True
+
+
+def _instrument_methods(cls: type) -> None:
+    """Mide la duración de los métodos asíncronos públicos declarados en la clase."""
+    for name, value in list(vars(cls).items()):
+        if not name.startswith("_") and inspect.iscoroutinefunction(value):
+            setattr(cls, name, timed_repository_method(value))
+
+
+_instrument_methods(BaseRepository)
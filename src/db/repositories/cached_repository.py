@@ -0,0 +1,107 @@
+# app/db/repositories/cached_repository.py
+import copy
+from typing import Any, Dict, Optional
+
+from sqlalchemy import inspect as sa_inspect, select
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from src.core.config import settings
+from src.core.exceptions import TenantRequiredException
+from src.core.tenancy import get_current_tenant, tenant_required
+from src.db.base import TenantMixin
+from src.db.repository_cache import RepositoryCache, cache_for
+from src.db.tenancy import ALL_TENANTS
+from .base_repository import LoadProfile
+
+
+class CachedRepositoryMixin:
+    """
+    Caché de lectura de `get_by_id` para un repositorio, activada al heredar de este
+    mixin antes que de BaseRepository:
+
+        class GameRepository(CachedRepositoryMixin, BaseRepository[Game]): ...
+
+    La caché guarda la fila completa sin filtrar (cualquier tenant, eliminada o no) y
+    los filtros de tenant y de borrado se aplican al leerla, así que una misma entrada
+    sirve a todas las peticiones. Las lecturas con perfil de carga (`load=`) van siempre
+    a la base de datos. `update`, `delete`, `hard_delete` y `restore` invalidan la fila
+    tras el commit (ver src/db/repository_cache.py).
+    """
+
+    @property
+    def cache(self) -> RepositoryCache:
+        return cache_for(self.model.__tablename__)
+
+    async def get_by_id(self, id: int, include_deleted: bool = False, load: LoadProfile = None):
+        """
+        Obtiene una entidad por su ID, desde la caché si está disponible.
+
+        Args:
+            id: ID de la entidad a buscar
+            include_deleted: Si True, incluye entidades marcadas como eliminadas
+            load: Perfil(es) de carga de relaciones; con perfil no se usa la caché
+
+        Returns:
+            ModelType: Instancia del modelo si se encuentra, None en caso contrario
+        """
+        if load or not settings.REPOSITORY_CACHE_ENABLED:
+            return await super().get_by_id(id, include_deleted=include_deleted, load=load)
+        # Una instancia que ya está en la sesión puede tener cambios sin confirmar: no se
+        # cachea ni se sirve desde la caché
+        identity = sa_inspect(self.model).identity_key_from_primary_key((id,))
+        if identity in self.db.identity_map:
+            return await super().get_by_id(id, include_deleted=include_deleted)
+
+        # La carga de la caché ve todos los tenants: sin tenant en una petición no se sirve
+        if tenant_required() and issubclass(self.model, TenantMixin):
+            raise TenantRequiredException()
+
+        loaded: Dict[str, Any] = {}
+
+        async def load_row() -> Optional[Dict[str, Any]]:
+            query = select(self.model).where(self.model.id == id)
+            result = await self.db.execute(query, execution_options={ALL_TENANTS: True})
+            obj = loaded["obj"] = result.scalar_one_or_none()
+            if obj is None:
+                return None
+            return {attr.key: getattr(obj, attr.key) for attr in sa_inspect(self.model).column_attrs}
+
+        values = await self.cache.get_or_load(id, load_row)
+        if values is None:
+            return None
+        if not include_deleted and values["deleted_at"] is not None:
+            return None
+        tenant_id = get_current_tenant()
+        if tenant_id is not None and values.get("tenant_id", tenant_id) != tenant_id:
+            return None
+        return loaded.get("obj") or await self._attach(values)
+
+    async def _attach(self, values: Dict[str, Any]):
+        """Instancia persistente en la sesión a partir de los valores cacheados, sin consulta."""
+        obj = sa_inspect(self.model).class_manager.new_instance()
+        for key, value in values.items():
+            # Copia: columnas JSON mutables no deben compartirse entre peticiones
+            set_committed_value(obj, key, copy.deepcopy(value))
+        make_transient_to_detached(obj)
+        return await self.db.merge(obj, load=False)
+
+    async def update(self, id: int, obj_in: Dict[str, Any], unchanged_from: Optional[Any] = None):
+        updated = await super().update(id, obj_in, unchanged_from=unchanged_from)
+        await self.cache.invalidate(id)
+        return updated
+
+    async def delete(self, id: int) -> bool:
+        deleted = await super().delete(id)
+        await self.cache.invalidate(id)
+        return deleted
+
+    async def hard_delete(self, id: int) -> bool:
+        deleted = await super().hard_delete(id)
+        await self.cache.invalidate(id)
+        return deleted
+
+    async def restore(self, id: int):
+        restored = await super().restore(id)
+        await self.cache.invalidate(id)
+        return restored
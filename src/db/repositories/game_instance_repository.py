@@ -1,5 +1,6 @@
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
 from .base_repository import BaseRepository
 from src.models.game_instance import GameInstance
 
@@ -11,6 +12,15 @@ class GameInstanceRepository(BaseRepository[GameInstance]):
     Hereda todas las operaciones CRUD del BaseRepository.
     """
 
+    loader_profiles = {
+        "with_sessions": (selectinload(GameInstance.sync_sessions),),
+        "deep": (
+            joinedload(GameInstance.student),
+            joinedload(GameInstance.game),
+            selectinload(GameInstance.sync_sessions),
+        ),
+    }
+
     def __init__(self, db: AsyncSession):
         super().__init__(db, GameInstance)
 
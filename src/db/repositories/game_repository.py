@@ -1,16 +1,25 @@
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from .base_repository import BaseRepository
+from .cached_repository import CachedRepositoryMixin
 from src.models.game import Game
+from src.models.level import Level
 
 
-class GameRepository(BaseRepository[Game]):
+class GameRepository(CachedRepositoryMixin, BaseRepository[Game]):
     """
     Repositorio específico para el modelo Game.
     
     Hereda todas las operaciones CRUD del BaseRepository.
+    `get_by_id` se sirve desde la caché de repositorio (CachedRepositoryMixin).
     """
 
+    loader_profiles = {
+        "with_levels": (selectinload(Game.levels),),
+        "deep": (selectinload(Game.levels).selectinload(Level.segments),),
+    }
+
     def __init__(self, db: AsyncSession):
         super().__init__(db, Game)
 
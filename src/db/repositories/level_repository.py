@@ -1,16 +1,28 @@
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
 from .base_repository import BaseRepository
+from .cached_repository import CachedRepositoryMixin
 from src.models.level import Level
+from src.models.segment_level import SegmentLevel
 
 
-class LevelRepository(BaseRepository[Level]):
+class LevelRepository(CachedRepositoryMixin, BaseRepository[Level]):
     """
     Repositorio específico para el modelo Level.
     
     Hereda todas las operaciones CRUD del BaseRepository.
+    `get_by_id` se sirve desde la caché de repositorio (CachedRepositoryMixin).
     """
 
+    loader_profiles = {
+        "with_segments": (selectinload(Level.segments),),
+        "deep": (
+            joinedload(Level.game),
+            selectinload(Level.segments).selectinload(SegmentLevel.progresses),
+        ),
+    }
+
     def __init__(self, db: AsyncSession):
         super().__init__(db, Level)
 
@@ -1,7 +1,9 @@
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 from .base_repository import BaseRepository
 from src.models.professor import Professor
+from src.models.user import User
 
 
 class ProfessorRepository(BaseRepository[Professor]):
@@ -11,6 +13,11 @@ class ProfessorRepository(BaseRepository[Professor]):
     Hereda todas las operaciones CRUD del BaseRepository.
     """
 
+    loader_profiles = {
+        "with_user": (joinedload(Professor.user),),
+        "deep": (joinedload(Professor.user).joinedload(User.role),),
+    }
+
     def __init__(self, db: AsyncSession):
         super().__init__(db, Professor)
 
@@ -1,19 +1,182 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+from sqlalchemy import and_, bindparam, func, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from .base_repository import BaseRepository
+from src.core.config import settings
+from src.core.exceptions import ConflictException, DuplicateEntryException
+from src.core.metrics import OPTIMISTIC_UPDATE_CONFLICTS
 from src.models.progress import Progress
 
+# Contadores que admiten incremento atómico (`increment_counters`)
+COUNTERS = ("attempt_count", "error_count", "hints_used_count")
+
 
 class ProgressRepository(BaseRepository[Progress]):
     """
     Repositorio específico para el modelo Progress.
     
-    Hereda todas las operaciones CRUD del BaseRepository.
+    Hereda las operaciones CRUD del BaseRepository, con control de concurrencia
+    optimista: cada escritura incrementa `version`.
+
+    - Contadores: `increment_counters` suma en la propia sentencia UPDATE
+      (`attempt_count = attempt_count + :n`), sin leer antes ni bloquear, así que
+      los incrementos simultáneos de una misma partida no se pierden.
+    - Resto de campos: `update(..., expected_version=)` solo escribe si la fila sigue
+      en esa versión, y `update_with_retry` repite lectura y escritura ante conflictos.
     """
 
     def __init__(self, db: AsyncSession):
         super().__init__(db, Progress)
 
+    async def update(self, id: int, obj_in: Dict[str, Any], expected_version: Optional[int] = None) -> Optional[Progress]:
+        """
+        Actualiza un progreso e incrementa su versión.
+
+        Args:
+            id: ID del progreso a actualizar
+            obj_in: Diccionario con los campos a actualizar
+            expected_version: Si se indica, solo se escribe si la fila sigue en esta versión
+
+        Returns:
+            Progress: Progreso actualizado, None si no se encuentra
+
+        Raises:
+            ConflictException: Si la versión de la fila no es `expected_version`
+            DuplicateEntryException: Si hay una violación de unicidad
+        """
+        update_data = {k: v for k, v in obj_in.items() if v is not None and k != "version"}
+        if not update_data and expected_version is None:
+            return await self.get_by_id(id)
+        update_data.setdefault("updated_at", datetime.utcnow())
+        return await self._versioned_update(id, update_data, expected_version)
+
+    async def update_with_retry(
+        self,
+        id: int,
+        changes: Callable[[Progress], Dict[str, Any]],
+        max_attempts: Optional[int] = None,
+    ) -> Optional[Progress]:
+        """
+        Lectura-modificación-escritura con reintentos ante escrituras concurrentes.
+
+        Cada intento lee la fila actual, calcula los cambios a partir de ella y los
+        escribe condicionados a la versión leída; si otra escritura se adelantó, se
+        vuelve a leer. Para contadores es preferible `increment_counters`.
+
+        Args:
+            id: ID del progreso a actualizar
+            changes: Función que recibe el progreso actual y devuelve los campos a escribir
+            max_attempts: Intentos como máximo (por defecto PROGRESS_UPDATE_MAX_ATTEMPTS)
+
+        Returns:
+            Progress: Progreso actualizado, None si no se encuentra
+
+        Raises:
+            ConflictException: Si todos los intentos encontraron la fila modificada
+        """
+        attempts = max(max_attempts or settings.PROGRESS_UPDATE_MAX_ATTEMPTS, 1)
+        for attempt in range(attempts):
+            # populate_existing: la instancia del identity map puede tener valores antiguos
+            query = select(Progress).where(and_(Progress.id == id, Progress.deleted_at.is_(None)))
+            result = await self.db.execute(query.execution_options(populate_existing=True))
+            current = result.scalar_one_or_none()
+            if current is None:
+                return None
+            try:
+                return await self.update(id, changes(current), expected_version=current.version)
+            except ConflictException:
+                if attempt == attempts - 1:
+                    raise
+        return None
+
+    async def increment_counters(self, id: int, **amounts: int) -> Optional[Progress]:
+        """
+        Incrementa contadores de un progreso de forma atómica.
+
+        Args:
+            id: ID del progreso
+            amounts: Incremento por contador, p. ej. `attempt_count=1, error_count=2`
+
+        Returns:
+            Progress: Progreso con los contadores actualizados, None si no se encuentra
+
+        Raises:
+            ValueError: Si algún nombre no está en COUNTERS
+        """
+        unknown = set(amounts) - set(COUNTERS)
+        if unknown:
+            raise ValueError(f"Contadores desconocidos para Progress: {', '.join(sorted(unknown))}")
+        values: Dict[str, Any] = {
+            name: func.coalesce(getattr(Progress, name), 0) + amount
+            for name, amount in amounts.items()
+            if amount
+        }
+        if not values:
+            return await self.get_by_id(id)
+        values["updated_at"] = datetime.utcnow()
+        return await self._versioned_update(id, values)
+
+    async def apply_counter_deltas(self, deltas: Dict[int, Dict[str, int]]) -> int:
+        """
+        Suma incrementos acumulados a varios progresos con una sola sentencia por lotes.
+
+        Cada progreso recibe un `UPDATE ... SET attempt_count = attempt_count + :delta`
+        (executemany), todos en la misma transacción.
+
+        Args:
+            deltas: Incrementos por ID de progreso y contador
+
+        Returns:
+            int: Número de progresos actualizados (los eliminados se ignoran)
+        """
+        if not deltas:
+            return 0
+        table = Progress.__table__
+        values = {name: func.coalesce(table.c[name], 0) + bindparam(f"delta_{name}") for name in COUNTERS}
+        statement = (
+            update(table)
+            .where(and_(table.c.id == bindparam("progress_id"), table.c.deleted_at.is_(None)))
+            .values(**values, version=table.c.version + 1, updated_at=bindparam("now"))
+        )
+        now = datetime.utcnow()
+        params = [
+            {"progress_id": id, "now": now, **{f"delta_{name}": amounts.get(name, 0) for name in COUNTERS}}
+            for id, amounts in deltas.items()
+        ]
+        result = await self.db.execute(statement, params)
+        await self.db.commit()
+        return result.rowcount
+
+    async def _versioned_update(self, id: int, values: Dict[str, Any], expected_version: Optional[int] = None) -> Optional[Progress]:
+        conditions = [Progress.id == id, Progress.deleted_at.is_(None)]
+        if expected_version is not None:
+            conditions.append(Progress.version == expected_version)
+        try:
+            result = await self.db.execute(
+                update(Progress)
+                .where(and_(*conditions))
+                .values(**values, version=Progress.version + 1)
+                .returning(Progress)
+            )
+            updated_obj = result.scalar_one_or_none()
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            raise DuplicateEntryException("No se puede actualizar. Valores únicos duplicados para Progress")
+
+        if updated_obj is None:
+            if expected_version is not None and await self.get_by_id(id) is not None:
+                OPTIMISTIC_UPDATE_CONFLICTS.labels(Progress.__tablename__).inc()
+                raise ConflictException("El progreso ha sido modificado por otra petición")
+            return None
+        # RETURNING no sobrescribe una instancia que ya estaba en el identity map: sin
+        # refrescarla conservaría la versión anterior y el siguiente `expected_version` o
+        # flush de la unidad de trabajo fallaría con un conflicto falso
+        await self.db.refresh(updated_obj)
+        return updated_obj
+
     async def get_by_user_id(self, user_id: int, include_deleted: bool = False) -> List[Progress]:
         """
         Obtiene progresos por ID de usuario.
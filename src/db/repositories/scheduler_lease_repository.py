@@ -0,0 +1,75 @@
+from datetime import datetime, timedelta
+from sqlalchemy import and_, or_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from .base_repository import BaseRepository
+from src.models.scheduler_lease import SchedulerLease
+from src.core.exceptions import DuplicateEntryException
+
+
+class SchedulerLeaseRepository(BaseRepository[SchedulerLease]):
+    """
+    Repositorio específico para el modelo SchedulerLease.
+
+    Implementa un lease con expiración sobre la tabla `scheduler_leases` para que
+    una tarea programada se ejecute en un solo worker aunque haya varios procesos.
+    """
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(db, SchedulerLease)
+
+    async def acquire(self, name: str, owner: str, ttl_seconds: int) -> bool:
+        """
+        Intenta adquirir (o renovar) el lease indicado.
+
+        El lease se concede si no existe, si ya pertenece a `owner` o si ha expirado.
+
+        Args:
+            name: Nombre del lease (normalmente el nombre de la tarea)
+            owner: Identificador del proceso que solicita el lease
+            ttl_seconds: Segundos de validez del lease
+
+        Returns:
+            bool: True si el lease quedó en manos de `owner`, False en caso contrario
+        """
+        now = datetime.utcnow()
+        expires_at = now + timedelta(seconds=ttl_seconds)
+
+        result = await self.db.execute(
+            update(SchedulerLease)
+            .where(
+                and_(
+                    SchedulerLease.name == name,
+                    or_(SchedulerLease.owner == owner, SchedulerLease.expires_at < now),
+                )
+            )
+            .values(owner=owner, expires_at=expires_at)
+        )
+        await self.db.commit()
+        if result.rowcount > 0:
+            return True
+
+        # No existe el lease o pertenece a otro proceso: la restricción única decide
+        try:
+            await self.create({"name": name, "owner": owner, "expires_at": expires_at})
+        except DuplicateEntryException:
+            return False
+        return True
+
+    async def release(self, name: str, owner: str) -> bool:
+        """
+        Libera el lease si pertenece a `owner`, marcándolo como expirado.
+
+        Args:
+            name: Nombre del lease
+            owner: Identificador del proceso propietario
+
+        Returns:
+            bool: True si se liberó, False si el lease no pertenecía a `owner`
+        """
+        result = await self.db.execute(
+            update(SchedulerLease)
+            .where(and_(SchedulerLease.name == name, SchedulerLease.owner == owner))
+            .values(expires_at=datetime.utcnow())
+        )
+        await self.db.commit()
+        return result.rowcount > 0
@@ -1,5 +1,6 @@
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
 from .base_repository import BaseRepository
 from src.models.segment_level import SegmentLevel
 
@@ -11,6 +12,14 @@ class SegmentLevelRepository(BaseRepository[SegmentLevel]):
     Hereda todas las operaciones CRUD del BaseRepository.
     """
 
+    loader_profiles = {
+        "with_progresses": (selectinload(SegmentLevel.progresses),),
+        "deep": (
+            joinedload(SegmentLevel.level),
+            selectinload(SegmentLevel.progresses),
+        ),
+    }
+
     def __init__(self, db: AsyncSession):
         super().__init__(db, SegmentLevel)
 
@@ -25,7 +34,7 @@ class SegmentLevelRepository(BaseRepository[SegmentLevel]):
         Returns:
             List[SegmentLevel]: Lista de segmentos de nivel
         """
-        filters = {"level_id": level_id}
+        filters = {"level_number_id": level_id}
         return await self.get_by_filters(filters, include_deleted=include_deleted)
 
     async def get_by_segment_name(self, segment_name: str, include_deleted: bool = False) -> Optional[SegmentLevel]:
@@ -1,7 +1,10 @@
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
 from .base_repository import BaseRepository
 from src.models.student import Student
+from src.models.game_instance import GameInstance
+from src.models.user import User
 
 
 class StudentRepository(BaseRepository[Student]):
@@ -11,6 +14,16 @@ class StudentRepository(BaseRepository[Student]):
     Hereda todas las operaciones CRUD del BaseRepository.
     """
 
+    loader_profiles = {
+        "with_user": (joinedload(Student.user),),
+        "with_instances": (selectinload(Student.game_instances),),
+        "deep": (
+            joinedload(Student.user).joinedload(User.role),
+            selectinload(Student.game_instances).selectinload(GameInstance.sync_sessions),
+            selectinload(Student.feedbacks),
+        ),
+    }
+
     def __init__(self, db: AsyncSession):
         super().__init__(db, Student)
 
@@ -1,7 +1,11 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from sqlalchemy import and_, bindparam, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
 from .base_repository import BaseRepository
 from src.models.sync_session import SyncSession
+from src.models.sync_event import SyncEvent
 
 
 class SyncSessionRepository(BaseRepository[SyncSession]):
@@ -11,6 +15,14 @@ class SyncSessionRepository(BaseRepository[SyncSession]):
     Hereda todas las operaciones CRUD del BaseRepository.
     """
 
+    loader_profiles = {
+        "with_events": (selectinload(SyncSession.events),),
+        "deep": (
+            joinedload(SyncSession.game_instance),
+            selectinload(SyncSession.events),
+        ),
+    }
+
     def __init__(self, db: AsyncSession):
         super().__init__(db, SyncSession)
 
@@ -75,4 +87,89 @@ class SyncSessionRepository(BaseRepository[SyncSession]):
             order_by="created_at", 
             descending=True
         )
-        return sessions[0] if sessions else None
\ No newline at end of file
+        return sessions[0] if sessions else None
+
+    async def get_idle_sessions(self, idle_since: datetime, after_id: int = 0, limit: int = 500) -> List[Dict[str, Any]]:
+        """
+        Obtiene un lote de sesiones abiertas sin actividad desde `idle_since`.
+
+        La última actividad es el timestamp del evento más reciente de la sesión o,
+        si no tiene eventos, su `start_time`. El recorrido es por keyset sobre `id`
+        para que cada lote use los índices de sesiones abiertas y eventos por sesión.
+
+        Args:
+            idle_since: Instante límite; las sesiones sin actividad posterior se consideran inactivas
+            after_id: Último ID procesado en el lote anterior
+            limit: Tamaño máximo del lote
+
+        Returns:
+            List[Dict[str, Any]]: Filas con `id`, `start_time` y `last_activity`
+        """
+        last_event = (
+            select(func.max(SyncEvent.timestamp))
+            .where(SyncEvent.sync_session_id == SyncSession.id)
+            .correlate(SyncSession)
+            .scalar_subquery()
+        )
+        last_activity = func.coalesce(last_event, SyncSession.start_time)
+
+        query = (
+            select(SyncSession.id, SyncSession.start_time, last_activity.label("last_activity"))
+            .where(
+                and_(
+                    SyncSession.end_time.is_(None),
+                    SyncSession.deleted_at.is_(None),
+                    SyncSession.id > after_id,
+                    last_activity < idle_since,
+                )
+            )
+            .order_by(SyncSession.id)
+            .limit(limit)
+        )
+        result = await self.db.execute(query)
+        return [dict(row) for row in result.mappings().all()]
+
+    async def close_sessions(self, sessions: List[Dict[str, Any]], status: str = "closed") -> int:
+        """
+        Cierra en bloque las sesiones indicadas registrando su fin y duración.
+
+        Cada sesión se cierra en el instante de su última actividad. Se emite un único
+        UPDATE por primary key (executemany) y solo afecta a sesiones que siguen abiertas.
+
+        Args:
+            sessions: Filas devueltas por `get_idle_sessions`
+            status: Estado con el que se marcan las sesiones cerradas
+
+        Returns:
+            int: Número de sesiones cerradas
+        """
+        if not sessions:
+            return 0
+
+        values = [
+            {
+                "session_id": session["id"],
+                "closed_at": session["last_activity"],
+                "duration": max(int((session["last_activity"] - session["start_time"]).total_seconds()), 0),
+                "closed_status": status,
+            }
+            for session in sessions
+        ]
+        result = await self.db.execute(
+            update(SyncSession.__table__)
+            .where(
+                and_(
+                    SyncSession.__table__.c.id == bindparam("session_id"),
+                    SyncSession.__table__.c.end_time.is_(None),
+                )
+            )
+            .values(
+                end_time=bindparam("closed_at"),
+                duration_seconds=bindparam("duration"),
+                status=bindparam("closed_status"),
+            ),
+            values,
+        )
+        await self.db.commit()
+        # Algunos drivers no informan rowcount en executemany
+        return result.rowcount if result.rowcount >= 0 else len(values)
\ No newline at end of file
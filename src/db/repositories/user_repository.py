@@ -3,6 +3,7 @@ from typing import Optional, List, Dict, Any
 from datetime import datetime
 from sqlalchemy import select, update, and_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
 from sqlalchemy.exc import IntegrityError
 from src.models.user import User
 from src.schemas.user import UserCreate, UserUpdate
@@ -12,44 +13,60 @@ from src.core.exceptions import (
     DuplicateEntryException,
     InvalidCredentialsException
 )
-from .base_repository import BaseRepository
+from .base_repository import BaseRepository, LoadProfile
+from .cached_repository import CachedRepositoryMixin
 
 
-class UserRepository(BaseRepository[User]):
+class UserRepository(CachedRepositoryMixin, BaseRepository[User]):
     """Repositorio para operaciones de base de datos relacionadas con usuarios.
     
     Hereda del BaseRepository y provee métodos CRUD con validaciones y manejo de errores específicos.
     También incluye métodos adicionales específicos para la autenticación de usuarios.
+    `get_by_id` se sirve desde la caché de repositorio (CachedRepositoryMixin).
     """
 
+    loader_profiles = {
+        "with_role": (joinedload(User.role),),
+        "with_profile": (selectinload(User.student), selectinload(User.professor)),
+        "deep": (
+            joinedload(User.role),
+            selectinload(User.student),
+            selectinload(User.professor),
+            selectinload(User.teacher_settings),
+            selectinload(User.lms_credential),
+        ),
+    }
+
     def __init__(self, db: AsyncSession):
         super().__init__(db, User)
 
-    async def get_by_email(self, email: str, include_deleted: bool = False) -> Optional[User]:
+    async def get_by_email(self, email: str, include_deleted: bool = False, load: LoadProfile = None) -> Optional[User]:
         """Busca un usuario por email.
         
         Args:
             email: Email del usuario a buscar
             include_deleted: Si True, incluye usuarios marcados como eliminados
+            load: Perfil(es) de carga de relaciones, p. ej. "with_role"
             
         Returns:
             User: Instancia del modelo User si se encuentra, None en caso contrario
         """
         filters = {"email": email}
-        return await self.get_one_by_filters(filters, include_deleted=include_deleted)
+        return await self.get_one_by_filters(filters, include_deleted=include_deleted, load=load)
 
-    async def get_by_username(self, username: str, include_deleted: bool = False) -> Optional[User]:
+    async def get_by_username(self, username: str, include_deleted: bool = False, load: LoadProfile = None) -> Optional[User]:
         """Busca un usuario por nombre de usuario.
         
         Args:
             username: Nombre de usuario a buscar
             include_deleted: Si True, incluye usuarios marcados como eliminados
+            load: Perfil(es) de carga de relaciones, p. ej. "with_role"
             
         Returns:
             User: Instancia del modelo User si se encuentra, None en caso contrario
         """
         filters = {"username": username}
-        return await self.get_one_by_filters(filters, include_deleted=include_deleted)
+        return await self.get_one_by_filters(filters, include_deleted=include_deleted, load=load)
 
     async def create(self, user_data: UserCreate) -> User:
         """Crea un nuevo usuario en la base de datos.
@@ -82,7 +99,7 @@ class UserRepository(BaseRepository[User]):
         # Crear el usuario usando el método del BaseRepository
         return await super().create(user_dict)
 
-    async def update(self, user_id: int, user_data: UserUpdate) -> Optional[User]:
+    async def update(self, user_id: int, user_data: UserUpdate, unchanged_from: Optional[User] = None) -> Optional[User]:
         """Actualiza un usuario existente.
         
         Solo actualiza los campos que no son None en user_data.
@@ -91,15 +108,17 @@ class UserRepository(BaseRepository[User]):
         Args:
             user_id: ID del usuario a actualizar
             user_data: Datos validados para la actualización
+            unchanged_from: Estado leído antes; si se indica, solo se actualiza si no ha cambiado
             
         Returns:
             User: Instancia del usuario actualizado, None si no se encuentra
             
         Raises:
             DuplicateEntryException: Si el nuevo email o username ya existen
+            PreconditionFailedException: Si el usuario cambió desde `unchanged_from`
         """
         # Obtener datos no nulos para actualizar
-        update_data = user_data.model_dump(exclude_unset=True)
+        update_data = user_data.dict(exclude_unset=True)
         
         if not update_data:
             return await self.get_by_id(user_id)
@@ -125,7 +144,7 @@ class UserRepository(BaseRepository[User]):
             update_data.pop('password', None)
         
         # Usar el método del BaseRepository para actualizar
-        return await super().update(user_id, update_data)
+        return await super().update(user_id, update_data, unchanged_from=unchanged_from)
 
     async def authenticate(self, email: str, password: str) -> Optional[User]:
         """Autentica un usuario verificando email y contraseña.
@@ -140,11 +159,11 @@ class UserRepository(BaseRepository[User]):
         Raises:
             InvalidCredentialsException: Si las credenciales son inválidas
         """
-        user = await self.get_by_email(email, include_deleted=True)
+        user = await self.get_by_email(email, include_deleted=True, load="with_role")
         if not user or user.is_deleted:
             raise InvalidCredentialsException("Credenciales inválidas")
             
-        if not verify_password(password, user.hashed_password):
+        if not verify_password(password, user.password):
             raise InvalidCredentialsException("Credenciales inválidas")
             
         return user
\ No newline at end of file
@@ -0,0 +1,286 @@
+# app/db/repository_cache.py
+"""
+Caché de lectura por ID de los repositorios que la activan (CachedRepositoryMixin).
+
+Cada modelo cacheado tiene su `RepositoryCache`: guarda los valores de columna de la
+fila (nunca instancias ORM, que pertenecen a una sesión) con TTL, también los IDs
+inexistentes (caché negativa, con un TTL más corto). Los fallos concurrentes de una
+misma clave se agrupan en una sola consulta.
+
+El almacenamiento es intercambiable (`CacheBackend`):
+
+- `MemoryCacheBackend`: LRU acotado en memoria, uno por modelo y proceso. Cada worker
+  tiene el suyo; una escritura en otro worker se ve al expirar el TTL.
+- `RedisCacheBackend`: compartido entre workers (REPOSITORY_CACHE_REDIS_URL o
+  `configure_backend`); las invalidaciones se ven en todos a la vez.
+
+Las escrituras invalidan la entrada tras el commit: las de BaseRepository (sentencias
+UPDATE/DELETE) desde el mixin, y los cambios de la unidad de trabajo (instancias
+añadidas, modificadas o eliminadas en la sesión) desde los eventos de sesión de este
+módulo. Las sentencias masivas escritas a mano solo se ven al expirar el TTL.
+"""
+import asyncio
+import logging
+import pickle
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from itertools import chain
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.core.metrics import CACHE_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+# Valor ausente en el backend (None es una entrada negativa válida)
+MISSING = object()
+
+_PENDING_KEY = "repository_cache_pending"
+
+
+class CacheBackend(ABC):
+    """Almacenamiento clave/valor con TTL de las cachés de repositorio."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Any:
+        """Valor de la clave o MISSING si no está o ha expirado."""
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        """Guarda el valor durante `ttl_seconds`."""
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """Elimina las claves indicadas."""
+
+    def delete_nowait(self, *keys: str) -> None:
+        """Elimina las claves desde código síncrono (eventos de sesión)."""
+        asyncio.get_running_loop().create_task(self.delete(*keys))
+
+
+class MemoryCacheBackend(CacheBackend):
+    """LRU en memoria del proceso con caducidad por entrada."""
+
+    def __init__(self, max_size: Optional[int] = None):
+        self.max_size = max_size or settings.REPOSITORY_CACHE_SIZE
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    async def get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        self.delete_nowait(*keys)
+
+    def delete_nowait(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Backend compartido sobre un cliente `redis.asyncio` (o compatible: get, set con
+    `ex` y delete). Los valores se serializan con pickle: solo contiene filas propias.
+    """
+
+    def __init__(self, client: Any, prefix: str = "repository-cache:"):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisCacheBackend":
+        # Dependencia opcional: solo se necesita con REPOSITORY_CACHE_REDIS_URL
+        import redis.asyncio as redis
+
+        return cls(redis.from_url(url))
+
+    async def get(self, key: str) -> Any:
+        raw = await self.client.get(self.prefix + key)
+        return MISSING if raw is None else pickle.loads(raw)
+
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        await self.client.set(self.prefix + key, pickle.dumps(value), ex=max(int(ttl_seconds), 1))
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.client.delete(*(self.prefix + key for key in keys))
+
+
+class RepositoryCache:
+    """
+    Caché por ID de las filas de una tabla sobre un `CacheBackend`.
+
+    Mantiene una versión que se incrementa con cada invalidación: una carga que empezó
+    antes de una escritura no guarda su resultado (como CatalogCache).
+    """
+
+    def __init__(
+        self,
+        table: str,
+        backend: CacheBackend,
+        ttl_seconds: Optional[float] = None,
+        negative_ttl_seconds: Optional[float] = None,
+    ):
+        """
+        Args:
+            table: Nombre de la tabla (prefijo de las claves y etiqueta de métricas)
+            backend: Almacenamiento de las entradas
+            ttl_seconds: Vida de una fila cacheada
+            negative_ttl_seconds: Vida de una entrada "no existe"
+        """
+        self.table = table
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds or settings.REPOSITORY_CACHE_TTL_SECONDS
+        self.negative_ttl_seconds = negative_ttl_seconds or settings.REPOSITORY_CACHE_NEGATIVE_TTL_SECONDS
+        self.version = 0
+        self._inflight: Dict[int, "asyncio.Future[Any]"] = {}
+        self._metric = f"repository_{table}"
+        self.stats: Dict[str, int] = {"hits": 0, "negative_hits": 0, "misses": 0, "coalesced": 0, "invalidations": 0}
+
+    def _key(self, id: int) -> str:
+        return f"{self.table}:{id}"
+
+    async def get_or_load(
+        self, id: int, loader: Callable[[], Awaitable[Optional[Dict[str, Any]]]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Obtiene los valores de la fila, cargándolos con `loader` si no están en caché.
+
+        Si otra corrutina ya está cargando la misma fila, se espera a su resultado en
+        lugar de lanzar otra consulta. Si esa carga falla, cada espera usa su `loader`.
+
+        Args:
+            id: ID de la fila
+            loader: Corrutina que lee la fila (sin filtro de tenant ni de borrado)
+
+        Returns:
+            Optional[Dict[str, Any]]: Valores de columna, None si la fila no existe
+        """
+        key = self._key(id)
+        value = await self.backend.get(key)
+        if value is not MISSING:
+            self.stats["hits" if value is not None else "negative_hits"] += 1
+            CACHE_REQUESTS.labels(self._metric, "hit").inc()
+            return value
+
+        pending = self._inflight.get(id)
+        if pending is not None:
+            self.stats["coalesced"] += 1
+            CACHE_REQUESTS.labels(self._metric, "coalesced").inc()
+            value = await asyncio.shield(pending)
+            return await loader() if value is MISSING else value
+
+        self.stats["misses"] += 1
+        CACHE_REQUESTS.labels(self._metric, "miss").inc()
+        future: "asyncio.Future[Any]" = asyncio.get_running_loop().create_future()
+        self._inflight[id] = future
+        version = self.version
+        value = MISSING
+        try:
+            value = await loader()
+            if version == self.version:
+                await self.backend.set(key, value, self.ttl_seconds if value is not None else self.negative_ttl_seconds)
+            return value
+        finally:
+            # Si la carga falló, las esperas reciben MISSING y repiten la consulta
+            self._inflight.pop(id, None)
+            future.set_result(value)
+
+    async def invalidate(self, *ids: int) -> None:
+        """Elimina las filas indicadas de la caché."""
+        self.version += 1
+        self.stats["invalidations"] += len(ids)
+        await self.backend.delete(*(self._key(id) for id in ids))
+
+    def invalidate_nowait(self, *ids: int) -> None:
+        """Como `invalidate`, desde código síncrono."""
+        self.version += 1
+        self.stats["invalidations"] += len(ids)
+        self.backend.delete_nowait(*(self._key(id) for id in ids))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Estadísticas de uso de la caché para observabilidad."""
+        lookups = self.stats["hits"] + self.stats["negative_hits"] + self.stats["misses"] + self.stats["coalesced"]
+        hits = self.stats["hits"] + self.stats["negative_hits"]
+        stats: Dict[str, Any] = {**self.stats, "hit_ratio": round(hits / lookups, 4) if lookups else 0.0}
+        if isinstance(self.backend, MemoryCacheBackend):
+            stats["entries"] = len(self.backend)
+        return stats
+
+
+# Backend común a todas las tablas (p. ej. Redis); None para un LRU en memoria por tabla
+_shared_backend: Optional[CacheBackend] = None
+_caches: Dict[str, RepositoryCache] = {}
+
+
+def configure_backend(backend: Optional[CacheBackend]) -> None:
+    """
+    Define el backend compartido de las cachés de repositorio y descarta las existentes.
+
+    Args:
+        backend: Backend común a todas las tablas; None vuelve al LRU en memoria
+    """
+    global _shared_backend
+    _shared_backend = backend
+    _caches.clear()
+
+
+def cache_for(table: str) -> RepositoryCache:
+    """
+    Caché de una tabla, creada en el primer uso.
+
+    Args:
+        table: Nombre de la tabla del modelo
+
+    Returns:
+        RepositoryCache: Caché de la tabla
+    """
+    cache = _caches.get(table)
+    if cache is None:
+        if _shared_backend is None and settings.REPOSITORY_CACHE_REDIS_URL:
+            configure_backend(RedisCacheBackend.from_url(settings.REPOSITORY_CACHE_REDIS_URL))
+        cache = _caches[table] = RepositoryCache(table, _shared_backend or MemoryCacheBackend())
+    return cache
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session: Session, flush_context: Any) -> None:
+    # Instancias escritas por la unidad de trabajo en tablas con caché (los IDs de las
+    # nuevas ya están asignados): se invalidan cuando la transacción se confirma
+    for obj in chain(session.new, session.dirty, session.deleted):
+        table = getattr(obj, "__tablename__", None)
+        if table in _caches and getattr(obj, "id", None) is not None:
+            session.info.setdefault(_PENDING_KEY, set()).add((table, obj.id))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    for table, id in session.info.pop(_PENDING_KEY, ()):
+        cache = _caches.get(table)
+        if cache is not None:
+            cache.invalidate_nowait(id)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_rolled_back(session: Session, previous_transaction: Any) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -1,19 +1,34 @@
+import asyncio
+import logging
+
 from src.db.session import SessionLocal
+from src.db.seed.seed_tenants import seed_tenant
 from src.db.seed.seed_roles import seed_role
 from src.db.seed.seed_admin import seed_admin
-async def run_all_seeds():
+
+logger = logging.getLogger(__name__)
+
+async def run_all_seeds() -> bool:
+    """
+    Inserta los datos iniciales que falten (tenant inicial, roles y administrador).
+
+    Returns:
+        bool: True si los seeds se aplicaron correctamente
+    """
     db = SessionLocal()
     try:
-        print("Seeding database...")
+        await seed_tenant(db)
         await seed_role(db)
         await seed_admin(db)
         await db.commit()
-        print("Seeding completed.")
-    except Exception as e:
+        logger.info("Seeding completed.")
+        return True
+    except Exception:
         await db.rollback()
-        print(f"Seeding failed: {e}")
+        logger.exception("Seeding failed")
+        return False
     finally:
         await db.close()
 
 if __name__ == "__main__":
-    run_all_seeds()
\ No newline at end of file
+    asyncio.run(run_all_seeds())
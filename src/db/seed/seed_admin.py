@@ -1,19 +1,26 @@
+import logging
+
+from src.models.role import Role
 from src.models.user import User
 from src.db.session import AsyncSession
 from sqlalchemy import select
 
+logger = logging.getLogger(__name__)
+
 async def seed_admin(db : AsyncSession):
-    query = select(User).where(User.username == 'superadmin')
+    query = select(User.id).where(User.username == 'superadmin')
     admin = (await db.execute(query)).scalars().first()
     if not admin:
-        print("Seeding admin user...")
+        # El rol puede estar pendiente de insertar en esta misma sesión (seed_role)
+        await db.flush()
+        role_id = (await db.execute(select(Role.id).where(Role.role_name == 'admin'))).scalar()
         admin = User(
             username = 'superadmin',
             name = 'Admin',
             email = 'admin@example.com',
             is_active = True,
             password = 'adminpass',  # In a real scenario, ensure to hash the password
-            role_id = 1  # Assuming 1 is the role ID for admin
+            role_id = role_id
         )
         db.add(admin)
-        print("Seeded admin user: superadmin")
\ No newline at end of file
+        logger.info("Seeded admin user: superadmin")
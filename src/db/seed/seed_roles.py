@@ -1,21 +1,29 @@
+import logging
+
+from src.core.permissions import ROLE_PERMISSIONS
 from src.models.role import Role
 from sqlalchemy import select
 from src.db.session import AsyncSession
 
+logger = logging.getLogger(__name__)
+
+ROLES = [
+    {"role_name": "admin", "description": "Administrator with full access"},
+    {"role_name": "professor", "description": "Professor with access to teaching resources" },
+    {"role_name": "student", "description": "Student with access to learning materials" },
+]
+
 async def seed_role(db : AsyncSession):
-    role = [
-        {"role_name": "admin", "description": "Administrator with full access"},
-        {"role_name": "professor", "description": "Professor with access to teaching resources" },
-        {"role_name": "student", "description": "Student with access to learning materials" },
-    ]
+    # Una sola consulta para todos los roles
+    query = select(Role.role_name).where(Role.role_name.in_([r["role_name"] for r in ROLES]))
+    existing = set((await db.execute(query)).scalars())
 
-    for r in role:
-        query = select(Role).where(Role.role_name == r["role_name"])
-        existing_role = (await db.execute(query)).scalars().first()
-        if not existing_role:
+    for r in ROLES:
+        if r["role_name"] not in existing:
             new_role = Role(
                 role_name = r["role_name"],
-                description = r["description"]
+                description = r["description"],
+                permissions = int(ROLE_PERMISSIONS[r["role_name"]])
             )
             db.add(new_role)
-            print(f"Seeded role: {r['role_name']}")
\ No newline at end of file
+            logger.info("Seeded role: %s", r["role_name"])
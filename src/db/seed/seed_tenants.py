@@ -0,0 +1,18 @@
+import logging
+
+from sqlalchemy import select
+from src.core.tenancy import DEFAULT_TENANT_ID
+from src.db.session import AsyncSession
+from src.models.tenant import Tenant
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TENANT_NAME = "default"
+
+async def seed_tenant(db: AsyncSession):
+    # Tenant al que pertenecen los datos sin colegio asignado
+    existing = (await db.execute(select(Tenant.id).where(Tenant.id == DEFAULT_TENANT_ID))).scalar()
+    if existing is None:
+        db.add(Tenant(id=DEFAULT_TENANT_ID, name=DEFAULT_TENANT_NAME))
+        await db.flush()
+        logger.info("Seeded tenant: %s", DEFAULT_TENANT_NAME)
@@ -0,0 +1,699 @@
+"""
+Generador de datos sintéticos para pruebas a gran escala.
+
+Produce datos realistas y referencialmente consistentes para todos los modelos de
+`src.models`, desde unos cientos de filas hasta 10^6 usuarios y 10^8 eventos:
+
+- Las filas se generan en streaming y se escriben por lotes de `chunk_size`: la
+  memoria no crece con el tamaño del dataset.
+- SQLite usa `executemany` del driver con `synchronous=OFF` durante la carga; PostgreSQL usa
+  `COPY` (asyncpg) y reajusta las secuencias al terminar.
+- Los IDs se asignan explícitamente a continuación de los existentes, así las claves
+  foráneas se calculan sin releer la base de datos y el dataset puede añadirse a una
+  base con datos.
+- Cada tabla usa su propio generador aleatorio derivado de la semilla: la misma
+  semilla y escala producen siempre los mismos datos.
+- Con `tenants > 1` usuarios y juegos se reparten en turno entre varios tenants, y
+  cada fila dependiente (niveles, instancias, sesiones, eventos) hereda el de su padre.
+
+Uso:
+    python -m src.db.seed.synthetic --database-url sqlite+aiosqlite:///./big.db \\
+        --scale large --manifest big-manifest.json
+"""
+import argparse
+import asyncio
+import functools
+import json
+import logging
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import bcrypt
+from pydantic import BaseModel
+from sqlalchemy import JSON, DateTime, Table, func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from src.core.permissions import ROLE_PERMISSIONS
+from src.core.tenancy import DEFAULT_TENANT_ID
+from src.db.base import Base
+from src.models import (
+    Feedback,
+    Game,
+    GameInstance,
+    Level,
+    LMSCredential,
+    MetricType,
+    Professor,
+    Progress,
+    Role,
+    SegmentLevel,
+    Student,
+    SyncEvent,
+    SyncSession,
+    TeacherSettings,
+    Tenant,
+    User,
+)
+from src.services.segment_config_registry import segment_config_registry
+
+logger = logging.getLogger(__name__)
+
+PASSWORD = "Benchmark123"
+EMAIL_DOMAIN = "bench.example.com"
+BASE_TIME = datetime(2024, 1, 8, 8, 0, 0)
+ROLE_NAMES = ("admin", "professor", "student")
+EVENT_TYPES = ("move", "run_code", "hint", "error", "checkpoint", "complete")
+METRIC_TYPES = (
+    ("attempts", "Intentos por segmento"),
+    ("errors", "Errores cometidos"),
+    ("hints", "Pistas utilizadas"),
+    ("time_on_task", "Tiempo dedicado en segundos"),
+    ("efficiency", "Eficiencia de la solución"),
+)
+FIRST_NAMES = ("Ana", "Luis", "María", "Carlos", "Lucía", "Jorge", "Sofía", "Diego", "Elena", "Pablo")
+LAST_NAMES = ("García", "Pérez", "López", "Martínez", "Rojas", "Gómez", "Díaz", "Torres", "Vargas", "Castro")
+SUBJECTS = ("Programación", "Algoritmos", "Lógica", "Estructuras de datos")
+DEPARTMENTS = ("Informática", "Matemáticas", "Física")
+LMS_PROVIDERS = ("moodle", "canvas", "classroom")
+# Credenciales de muestra que se incluyen en el manifiesto
+MANIFEST_USERS = 2000
+
+
+class DatasetScale(BaseModel):
+    """Tamaño del dataset sintético."""
+    students: int
+    professors: int
+    games: int
+    levels_per_game: int
+    segments_per_level: int
+    instances_per_student: int = 1
+    sessions_per_instance: int
+    events_per_session: int
+    progresses_per_segment: int = 2
+    feedbacks_per_student: int = 1
+    # Fracción de usuarios con credenciales de LMS vinculadas
+    lms_share: float = 0.25
+    # Tenants (colegios) entre los que se reparten usuarios y juegos
+    tenants: int = 1
+
+    @property
+    def users(self) -> int:
+        return self.students + self.professors
+
+    @property
+    def sessions(self) -> int:
+        return self.students * self.instances_per_student * self.sessions_per_instance
+
+    @property
+    def events(self) -> int:
+        return self.sessions * self.events_per_session
+
+
+SCALES: Dict[str, DatasetScale] = {
+    "small": DatasetScale(
+        students=200, professors=5, games=5, levels_per_game=5,
+        segments_per_level=4, sessions_per_instance=2, events_per_session=20,
+    ),
+    "medium": DatasetScale(
+        students=5_000, professors=50, games=20, levels_per_game=10,
+        segments_per_level=5, sessions_per_instance=4, events_per_session=50,
+    ),
+    "large": DatasetScale(
+        students=100_000, professors=1_000, games=50, levels_per_game=10,
+        segments_per_level=6, sessions_per_instance=5, events_per_session=200,
+    ),
+    # 10^6 usuarios y 10^8 eventos
+    "xlarge": DatasetScale(
+        students=990_000, professors=10_000, games=100, levels_per_game=10,
+        segments_per_level=6, sessions_per_instance=5, events_per_session=20,
+        progresses_per_segment=50,
+    ),
+}
+
+
+def _chunks(rows: Iterator[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    chunk: List[Dict[str, Any]] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _row_converter(table: Table, dialect: str) -> Callable[[Dict[str, Any]], Tuple]:
+    """
+    Convierte un dict de fila en la tupla de parámetros que espera el driver.
+
+    Se salta el procesado de parámetros de SQLAlchemy (el coste dominante en cargas
+    masivas) reproduciendo solo lo necesario: JSON serializado y, en SQLite, fechas en
+    el mismo formato de texto que usa SQLAlchemy; en PostgreSQL, fechas con zona.
+    """
+    def identity(value):
+        return value
+
+    def to_utc(value):
+        return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+    # Muchas filas comparten fecha (created_at de la sesión, BASE_TIME...)
+    @functools.lru_cache(maxsize=4096)
+    def to_sqlite_datetime(value):
+        return value.isoformat(" ", "microseconds")
+
+    converters = []
+    for column in table.columns:
+        if isinstance(column.type, JSON):
+            converters.append((column.name, json.dumps))
+        elif isinstance(column.type, DateTime):
+            if dialect == "sqlite":
+                converters.append((column.name, to_sqlite_datetime))
+            else:
+                converters.append((column.name, to_utc if column.type.timezone else identity))
+        else:
+            converters.append((column.name, identity))
+
+    def convert(row: Dict[str, Any]) -> Tuple:
+        values = []
+        for name, converter in converters:
+            value = row.get(name)
+            values.append(None if value is None else converter(value))
+        return tuple(values)
+
+    return convert
+
+
+class BulkLoader:
+    """
+    Escribe filas por lotes con el mecanismo más rápido del dialecto: `COPY` en
+    PostgreSQL con asyncpg, `executemany` del driver en SQLite y, en el resto,
+    `insert()` de SQLAlchemy con varias filas.
+
+    Cada lote se confirma por separado para que las transacciones no crezcan con el dataset.
+    """
+
+    def __init__(self, conn: AsyncConnection, chunk_size: int):
+        self.conn = conn
+        self.chunk_size = chunk_size
+        self.dialect = conn.dialect.name
+        self.use_copy = self.dialect == "postgresql" and conn.dialect.driver == "asyncpg"
+
+    async def prepare(self) -> None:
+        if self.dialect == "sqlite":
+            await self.conn.exec_driver_sql("PRAGMA synchronous=OFF")
+            await self.conn.exec_driver_sql("PRAGMA cache_size=-65536")
+
+    async def next_id(self, table: Table) -> int:
+        return ((await self.conn.execute(select(func.max(table.c.id)))).scalar() or 0) + 1
+
+    async def load(self, table: Table, rows: Iterator[Dict[str, Any]]) -> int:
+        """
+        Inserta las filas en la tabla.
+
+        Returns:
+            int: Número de filas insertadas
+        """
+        total = 0
+        started = time.perf_counter()
+        columns = [column.name for column in table.columns]
+        convert = _row_converter(table, self.dialect)
+        if self.use_copy:
+            raw = (await self.conn.get_raw_connection()).driver_connection
+        elif self.dialect == "sqlite":
+            statement = (
+                f"INSERT INTO {table.name} ({', '.join(columns)}) "
+                f"VALUES ({', '.join('?' for _ in columns)})"
+            )
+        for chunk in _chunks(rows, self.chunk_size):
+            if self.use_copy:
+                await raw.copy_records_to_table(
+                    table.name, records=[convert(row) for row in chunk], columns=columns
+                )
+            elif self.dialect == "sqlite":
+                await self.conn.exec_driver_sql(statement, [convert(row) for row in chunk])
+            else:
+                await self.conn.execute(insert(table), chunk)
+            await self.conn.commit()
+            total += len(chunk)
+        if self.use_copy and total:
+            # COPY con IDs explícitos no avanza la secuencia de la clave primaria
+            await self.conn.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                f"(SELECT MAX(id) FROM {table.name}))"
+            ))
+            await self.conn.commit()
+        elapsed = time.perf_counter() - started
+        logger.info("%s: %d filas en %.1f s (%.0f filas/s)", table.name, total, elapsed, total / elapsed if elapsed else 0)
+        return total
+
+
+class SyntheticDataset:
+    """
+    Plan de generación: IDs iniciales por tabla y generadores de filas.
+
+    Las relaciones se derivan aritméticamente de los índices (p. ej. el estudiante i
+    es el usuario `first_user + i`), de modo que ninguna fila necesita consultar otra.
+    """
+
+    def __init__(
+        self,
+        scale: DatasetScale,
+        seed: int,
+        first_ids: Dict[str, int],
+        roles: Dict[str, int],
+        tenant_ids: List[int],
+    ):
+        self.scale = scale
+        self.seed = seed
+        self.first = first_ids
+        self.roles = roles
+        self.tenant_ids = tenant_ids
+        # Prefijo único para no chocar con usuarios de ejecuciones anteriores
+        self.tag = f"s{seed}u{first_ids['users']}"
+        self.password_hash = bcrypt.hashpw(PASSWORD.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+        self.lms_count = int(scale.users * scale.lms_share)
+
+    def rng(self, table: str) -> random.Random:
+        return random.Random(f"{self.seed}:{table}")
+
+    @property
+    def segment_count(self) -> int:
+        return self.scale.games * self.scale.levels_per_game * self.scale.segments_per_level
+
+    def user_tenant(self, i: int) -> int:
+        """Tenant del usuario i (estudiantes y profesores se reparten por separado)."""
+        index = i if i < self.scale.students else i - self.scale.students
+        return self.tenant_ids[index % len(self.tenant_ids)]
+
+    def game_tenant(self, g: int) -> int:
+        return self.tenant_ids[g % len(self.tenant_ids)]
+
+    def instance_game(self, i: int, n: int) -> int:
+        """Índice del juego de la instancia n, elegido entre los del tenant del estudiante i."""
+        tenants = len(self.tenant_ids)
+        t = i % tenants
+        games_in_tenant = (self.scale.games - t + tenants - 1) // tenants
+        return t + tenants * (n % games_in_tenant)
+
+    def instance_tenant(self, n: int) -> int:
+        return self.user_tenant(n // self.scale.instances_per_student)
+
+    def username(self, i: int) -> str:
+        kind = "student" if i < self.scale.students else "prof"
+        return f"{self.tag}_{kind}_{i}"
+
+    def email(self, i: int) -> str:
+        return f"{self.tag}_{i}@{EMAIL_DOMAIN}"
+
+    def lms_credentials(self) -> Iterator[Dict[str, Any]]:
+        rng = self.rng("lms_credentials")
+        for n in range(self.lms_count):
+            yield {
+                "id": self.first["lms_credentials"] + n,
+                "lms_email": f"{self.tag}_lms_{n}@{EMAIL_DOMAIN}",
+                "lms_password": self.password_hash,
+                "lms_provider": rng.choice(LMS_PROVIDERS),
+                "acces_token": None,
+                "expire_at": None,
+                "created_at": BASE_TIME,
+                "is_deleted": False,
+            }
+
+    def users(self) -> Iterator[Dict[str, Any]]:
+        rng = self.rng("users")
+        # Uno de cada `step` usuarios tiene LMS vinculado
+        step = self.scale.users // self.lms_count if self.lms_count else 0
+        for i in range(self.scale.users):
+            is_student = i < self.scale.students
+            lms_index = i // step if step and i % step == 0 and i // step < self.lms_count else None
+            yield {
+                "id": self.first["users"] + i,
+                "username": self.username(i),
+                "password": self.password_hash,
+                "name": rng.choice(FIRST_NAMES),
+                "lastname": rng.choice(LAST_NAMES),
+                "email": self.email(i),
+                # users.lms_id es VARCHAR aunque referencia un id entero
+                "lms_id": str(self.first["lms_credentials"] + lms_index) if lms_index is not None else None,
+                "avatar_url": None,
+                "is_active": rng.random() > 0.02,
+                "last_login": BASE_TIME + timedelta(minutes=rng.randrange(60 * 24 * 30)),
+                "role_id": self.roles["student" if is_student else "professor"],
+                "tenant_id": self.user_tenant(i),
+                "created_at": BASE_TIME,
+                "is_deleted": False,
+            }
+
+    def students(self) -> Iterator[Dict[str, Any]]:
+        for i in range(self.scale.students):
+            yield {
+                "id": self.first["students"] + i,
+                "user_id": self.first["users"] + i,
+                "tenant_id": self.user_tenant(i),
+                "created_at": BASE_TIME,
+                "is_deleted": False,
+            }
+
+    def professors(self) -> Iterator[Dict[str, Any]]:
+        rng = self.rng("professors")
+        for i in range(self.scale.professors):
+            yield {
+                "id": self.first["professors"] + i,
+                "user_id": self.first["users"] + self.scale.students + i,
+                "department": rng.choice(DEPARTMENTS),
+                "contact_phone": f"+34 600 {rng.randrange(1_000_000):06d}",
+                "tenant_id": self.user_tenant(self.scale.students + i),
+                "created_at": BASE_TIME,
+                "is_deleted": False,
+            }
+
+    def teacher_settings(self) -> Iterator[Dict[str, Any]]:
+        rng = self.rng("teacher_settings")
+        for i in range(self.scale.professors):
+            yield {
+                "id": self.first["teacher_settings"] + i,
+                "user_id": self.first["users"] + self.scale.students + i,
+                "theme": rng.choice(("light", "dark")),
+                "notifications_enabled": rng.random() > 0.2,
+                "notification_frequency": rng.choice(("instant", "daily", "weekly")),
+                "interface_language": rng.choice(("es", "en")),
+                "created_at": BASE_TIME,
+                "is_deleted": False,
+            }
+
+    def games(self) -> Iterator[Dict[str, Any]]:
+        rng = self.rng("games")
+        for g in range(self.scale.games):
+            game_id = self.first["games"] + g
+            yield {
+                "id": game_id,
+                "title": f"Juego {game_id}",
+                "description": "Juego generado para pruebas de carga",
+                "creator": "synthetic",
+                "subject": rng.choice(SUBJECTS),
+                "publication_status": "published" if rng.random() > 0.1 else "draft",
+                "tenant_id": self.game_tenant(g),
+                "created_at": BASE_TIME,
+                "is_deleted": False,
+            }
+
+    def levels(self) -> Iterator[Dict[str, Any]]:
+        for g in range(self.scale.games):
+            for n in range(self.scale.levels_per_game):
+                yield {
+                    "id": self.first["levels"] + g * self.scale.levels_per_game + n,
+                    "game_id": self.first["games"] + g,
+                    "level_number": n + 1,
+                    "title": f"Nivel {n + 1}",
+                    "description": f"Nivel {n + 1} del juego {self.first['games'] + g}",
+                    "goal": "Completar los ejercicios",
+                    "tenant_id": self.game_tenant(g),
+                    "created_at": BASE_TIME,
+                    "is_deleted": False,
+                }
+
+    def segment_levels(self) -> Iterator[Dict[str, Any]]:
+        rng = self.rng("segment_levels")
+        types = segment_config_registry.types
+        level_count = self.scale.games * self.scale.levels_per_game
+        for l in range(level_count):
+            for s in range(self.scale.segments_per_level):
+                compiled = segment_config_registry.compile({
+                    "type": types[s % len(types)],
+                    "title": f"Segmento {s + 1}",
+                    "properties": {"seed": rng.randrange(10_000)},
+                })
+                yield {
+                    "id": self.first["segment_levels"] + l * self.scale.segments_per_level + s,
+                    "level_number_id": self.first["levels"] + l,
+                    "segment_type": compiled.segment_type,
+                    "configuration": compiled.normalized,
+                    "compiled_configuration": compiled.payload,
+                    "tenant_id": self.game_tenant(l // self.scale.levels_per_game),
+                    "created_at": BASE_TIME,
+                    "is_deleted": False,
+                }
+
+    def progresses(self) -> Iterator[Dict[str, Any]]:
+        rng = self.rng("progresses")
+        progress_id = self.first["progresses"]
+        for s in range(self.segment_count):
+            for _ in range(self.scale.progresses_per_segment):
+                attempts = rng.randint(1, 6)
+                errors = rng.randint(0, attempts)
+                yield {
+                    "id": progress_id,
+                    "segment_level_id": self.first["segment_levels"] + s,
+                    "attempt_count": attempts,
+                    "error_count": errors,
+                    "hints_used_count": rng.randint(0, 3),
+                    "errors_details": {"last_error": "SyntaxError"} if errors else None,
+                    "objectives_completed": rng.randint(0, 5),
+                    "efficiency_rating": rng.randint(1, 100),
+                    "version": 1,
+                    "created_at": BASE_TIME,
+                    "is_deleted": False,
+                }
+                progress_id += 1
+
+    def game_instances(self) -> Iterator[Dict[str, Any]]:
+        per_student = self.scale.instances_per_student
+        for i in range(self.scale.students):
+            for k in range(per_student):
+                n = i * per_student + k
+                yield {
+                    "id": self.first["game_instances"] + n,
+                    "student_id": self.first["students"] + i,
+                    "game_id": self.first["games"] + self.instance_game(i, n),
+                    "start_instance": BASE_TIME + timedelta(minutes=n % 600),
+                    "status": "active",
+                    "tenant_id": self.user_tenant(i),
+                    "created_at": BASE_TIME,
+                    "is_deleted": False,
+                }
+
+    def _session_start(self, s: int) -> datetime:
+        instance, k = divmod(s, self.scale.sessions_per_instance)
+        return BASE_TIME + timedelta(days=k, minutes=instance % 600)
+
+    def sync_sessions(self) -> Iterator[Dict[str, Any]]:
+        duration = self.scale.events_per_session * 15
+        for s in range(self.scale.sessions):
+            start = self._session_start(s)
+            yield {
+                "id": self.first["sync_sessions"] + s,
+                "instance_id": self.first["game_instances"] + s // self.scale.sessions_per_instance,
+                "start_time": start,
+                "end_time": start + timedelta(seconds=duration),
+                "status": "closed",
+                "duration_seconds": duration,
+                "tenant_id": self.instance_tenant(s // self.scale.sessions_per_instance),
+                "created_at": start,
+                "is_deleted": False,
+            }
+
+    def sync_events(self) -> Iterator[Dict[str, Any]]:
+        rng = self.rng("sync_events")
+        segment_count = max(self.segment_count, 1)
+        event_id = self.first["sync_events"]
+        for s in range(self.scale.sessions):
+            start = self._session_start(s)
+            session_id = self.first["sync_sessions"] + s
+            tenant_id = self.instance_tenant(s // self.scale.sessions_per_instance)
+            for e in range(self.scale.events_per_session):
+                yield {
+                    "id": event_id,
+                    "sync_session_id": session_id,
+                    "event_type": EVENT_TYPES[rng.randrange(len(EVENT_TYPES))],
+                    "payload": {"segment_id": self.first["segment_levels"] + rng.randrange(segment_count), "step": e},
+                    "timestamp": start + timedelta(seconds=e * 15),
+                    "status": "processed",
+                    "tenant_id": tenant_id,
+                    "created_at": start,
+                    "is_deleted": False,
+                }
+                event_id += 1
+
+    def feedbacks(self) -> Iterator[Dict[str, Any]]:
+        rng = self.rng("feedbacks")
+        feedback_id = self.first["feedbacks"]
+        for i in range(self.scale.students):
+            for _ in range(self.scale.feedbacks_per_student):
+                yield {
+                    "id": feedback_id,
+                    "student_id": self.first["students"] + i,
+                    "comments": rng.choice(("Buen trabajo", "Revisa los bucles", "Mejora la eficiencia")),
+                    "created_at": BASE_TIME + timedelta(days=rng.randrange(30)),
+                    "is_deleted": False,
+                }
+                feedback_id += 1
+
+    def metric_types(self, existing: set) -> Iterator[Dict[str, Any]]:
+        metric_id = self.first["metric_types"]
+        for name, description in METRIC_TYPES:
+            if name in existing:
+                continue
+            yield {"id": metric_id, "name": name, "description": description, "created_at": BASE_TIME, "is_deleted": False}
+            metric_id += 1
+
+    def manifest(self, counts: Dict[str, int]) -> Dict[str, Any]:
+        """Recuentos, rangos de IDs y una muestra de credenciales para los escenarios de carga."""
+        students = min(self.scale.students, MANIFEST_USERS)
+        professors = min(self.scale.professors, MANIFEST_USERS)
+        return {
+            "seed": self.seed,
+            "scale": self.scale.dict(),
+            "counts": counts,
+            "password": PASSWORD,
+            "tenants": self.tenant_ids,
+            "students": [
+                {"username": self.username(i), "email": self.email(i), "tenant_id": self.user_tenant(i)}
+                for i in range(students)
+            ],
+            "professors": [
+                {"username": self.username(i), "email": self.email(i), "tenant_id": self.user_tenant(i)}
+                for i in range(self.scale.students, self.scale.students + professors)
+            ],
+            # Rangos [primero, último] de IDs contiguos por tabla
+            "id_ranges": {
+                table: [self.first[table], self.first[table] + count - 1]
+                for table, count in counts.items()
+                if count and table in self.first
+            },
+        }
+
+
+# Orden de carga: cada tabla después de aquellas a las que referencia
+TABLES = (
+    LMSCredential, User, Student, Professor, TeacherSettings, Game, Level, SegmentLevel,
+    Progress, GameInstance, SyncSession, SyncEvent, Feedback, MetricType,
+)
+
+
+async def _ensure_roles(conn: AsyncConnection) -> Dict[str, int]:
+    table = Role.__table__
+    roles = dict((await conn.execute(select(table.c.role_name, table.c.id))).all())
+    missing = [name for name in ROLE_NAMES if name not in roles]
+    if missing:
+        await conn.execute(insert(table), [
+            {"role_name": name, "permissions": int(ROLE_PERMISSIONS.get(name, 0)), "is_deleted": False}
+            for name in missing
+        ])
+        roles = dict((await conn.execute(select(table.c.role_name, table.c.id))).all())
+    await conn.commit()
+    return roles
+
+
+async def _ensure_tenants(conn: AsyncConnection, count: int, tag: str) -> List[int]:
+    """IDs de los tenants del dataset: el inicial y, si hacen falta más, unos nuevos."""
+    table = Tenant.__table__
+    if (await conn.execute(select(table.c.id).where(table.c.id == DEFAULT_TENANT_ID))).scalar() is None:
+        await conn.execute(insert(table).values(id=DEFAULT_TENANT_ID, name="default", is_deleted=False))
+    names = [f"{tag}_tenant_{k}" for k in range(1, count)]
+    if names:
+        await conn.execute(insert(table), [{"name": name, "is_deleted": False} for name in names])
+    ids = dict((await conn.execute(select(table.c.name, table.c.id).where(table.c.name.in_(names)))).all())
+    await conn.commit()
+    return [DEFAULT_TENANT_ID] + [ids[name] for name in names]
+
+
+async def seed_dataset(
+    database_url: str,
+    scale: DatasetScale,
+    seed: int = 42,
+    chunk_size: int = 5000,
+) -> Dict[str, Any]:
+    """
+    Crea el esquema si hace falta y genera el dataset sintético.
+
+    Args:
+        database_url: URL asíncrona de la base de datos
+        scale: Tamaño del dataset
+        seed: Semilla del generador (mismo valor, mismos datos)
+        chunk_size: Filas por lote
+
+    Returns:
+        Dict[str, Any]: Manifiesto con recuentos, rangos de IDs y credenciales de muestra
+    """
+    started = time.perf_counter()
+    engine = create_async_engine(database_url)
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        async with engine.connect() as conn:
+            loader = BulkLoader(conn, chunk_size)
+            await loader.prepare()
+            roles = await _ensure_roles(conn)
+            first_ids = {model.__tablename__: await loader.next_id(model.__table__) for model in TABLES}
+            existing_metrics = set((await conn.execute(select(MetricType.__table__.c.name))).scalars())
+            tag = f"s{seed}u{first_ids['users']}"
+            tenant_ids = await _ensure_tenants(conn, max(min(scale.tenants, scale.games), 1), tag)
+            dataset = SyntheticDataset(scale, seed, first_ids, roles, tenant_ids)
+
+            generators = {
+                "lms_credentials": dataset.lms_credentials,
+                "users": dataset.users,
+                "students": dataset.students,
+                "professors": dataset.professors,
+                "teacher_settings": dataset.teacher_settings,
+                "games": dataset.games,
+                "levels": dataset.levels,
+                "segment_levels": dataset.segment_levels,
+                "progresses": dataset.progresses,
+                "game_instances": dataset.game_instances,
+                "sync_sessions": dataset.sync_sessions,
+                "sync_events": dataset.sync_events,
+                "feedbacks": dataset.feedbacks,
+                "metric_types": lambda: dataset.metric_types(existing_metrics),
+            }
+            counts = {}
+            for model in TABLES:
+                name = model.__tablename__
+                counts[name] = await loader.load(model.__table__, generators[name]())
+    finally:
+        await engine.dispose()
+
+    manifest = dataset.manifest(counts)
+    manifest["seed_seconds"] = round(time.perf_counter() - started, 3)
+    return manifest
+
+
+def resolve_scale(name: str, overrides: Optional[Dict[str, Any]] = None) -> DatasetScale:
+    """Escala predefinida con los valores de `overrides` que no sean None."""
+    values = SCALES[name].dict()
+    values.update({key: value for key, value in (overrides or {}).items() if value is not None})
+    return DatasetScale(**values)
+
+
+def add_scale_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--scale", choices=list(SCALES), default="small")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    for name, field in DatasetScale.__fields__.items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=field.type_, default=None, dest=name)
+
+
+def scale_from_args(args: argparse.Namespace) -> DatasetScale:
+    return resolve_scale(args.scale, {name: getattr(args, name) for name in DatasetScale.__fields__})
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--manifest", help="Fichero donde guardar el manifiesto JSON")
+    add_scale_arguments(parser)
+    args = parser.parse_args()
+
+    manifest = asyncio.run(seed_dataset(args.database_url, scale_from_args(args), args.seed, args.chunk_size))
+    if args.manifest:
+        with open(args.manifest, "w", encoding="utf-8") as fh:
+            json.dump(manifest, fh, indent=2)
+    print(json.dumps({key: manifest[key] for key in ("counts", "seed_seconds")}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
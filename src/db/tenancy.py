@@ -0,0 +1,64 @@
+# app/db/tenancy.py
+"""
+Filtrado automático por tenant de las consultas ORM.
+
+Con un tenant en el contexto (src/core/tenancy.py), cada SELECT, UPDATE y DELETE del
+ORM sobre modelos con `TenantMixin` recibe `tenant_id = :tenant`, también en joins y
+en las cargas de relaciones (selectinload/joinedload). Así lo aplican tanto los
+métodos de BaseRepository como las consultas propias de cada repositorio o servicio.
+
+En una petición sin tenant la sentencia falla (TenantRequiredException) si su entidad
+principal tiene tenant, los joins a modelos con tenant no devuelven filas y no se
+insertan filas con tenant: nunca se ejecuta sin filtrar.
+
+Para una consulta concreta que deba ver todos los tenants:
+`session.execute(query, execution_options={ALL_TENANTS: True})`.
+"""
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session, with_loader_criteria
+
+from src.core.exceptions import TenantRequiredException
+from src.core.tenancy import get_current_tenant, tenant_required
+from src.db.base import TenantMixin
+
+# Opción de ejecución para desactivar el filtrado en una sentencia
+ALL_TENANTS = "all_tenants"
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _scope_to_tenant(state: ORMExecuteState) -> None:
+    if state.execution_options.get(ALL_TENANTS):
+        return
+    # Las cargas de columnas y relaciones heredan el criterio de la sentencia original
+    if state.is_column_load or state.is_relationship_load:
+        return
+    if not (state.is_select or state.is_update or state.is_delete):
+        return
+
+    tenant_id = get_current_tenant()
+    if tenant_id is not None:
+        criteria = with_loader_criteria(
+            TenantMixin,
+            lambda cls: cls.tenant_id == tenant_id,
+            include_aliases=True,
+        )
+    elif tenant_required():
+        if any(issubclass(mapper.class_, TenantMixin) for mapper in state.all_mappers):
+            raise TenantRequiredException()
+        # tenant_id nunca es NULL: los joins a modelos con tenant quedan vacíos
+        criteria = with_loader_criteria(
+            TenantMixin,
+            lambda cls: cls.tenant_id.is_(None),
+            include_aliases=True,
+        )
+    else:
+        return
+    state.statement = state.statement.options(criteria)
+
+
+@event.listens_for(Session, "before_flush")
+def _require_tenant_on_insert(session: Session, flush_context, instances) -> None:
+    # Antes de que `tenant_default` falle dentro del INSERT (donde la excepción llegaría
+    # envuelta en un StatementError y saldría como 500)
+    if tenant_required() and any(isinstance(obj, TenantMixin) and obj.tenant_id is None for obj in session.new):
+        raise TenantRequiredException()
@@ -1,3 +1,4 @@
+from .tenant import Tenant
 from .role import Role
 from .user import User
 from .lms_credential import LMSCredential
@@ -13,8 +14,12 @@ from .sync_event import SyncEvent
 from .feedback import Feedback
 from .metric_type import MetricType
 from .teacher_settings import TeacherSettings
+from .scheduler_lease import SchedulerLease
+from .startup_marker import StartupMarker
+from .archive import ARCHIVE_TABLES, ARCHIVED_MODELS
 
 __all__ = [
+    "Tenant",
     "Role",
     "User",
     "LMSCredential",
@@ -30,4 +35,8 @@ __all__ = [
     "Feedback",
     "MetricType",
     "TeacherSettings",
+    "SchedulerLease",
+    "StartupMarker",
+    "ARCHIVE_TABLES",
+    "ARCHIVED_MODELS",
 ]
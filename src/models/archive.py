@@ -0,0 +1,75 @@
+"""
+Tablas de archivo para filas eliminadas hace tiempo.
+
+Cada modelo de `ARCHIVED_MODELS` tiene una tabla `<tabla>_archive` con sus mismas
+columnas (sin claves foráneas ni índices secundarios) más `archived_at`. El archivado
+(src/services/soft_delete_archiver.py) mueve allí las filas con soft delete antiguo y
+`BaseRepository.restore` las devuelve a la tabla principal.
+"""
+from typing import Dict, List, Type
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Table
+
+from src.db.base import Base
+from .feedback import Feedback
+from .game import Game
+from .game_instance import GameInstance
+from .level import Level
+from .professor import Professor
+from .progress import Progress
+from .segment_level import SegmentLevel
+from .student import Student
+from .sync_event import SyncEvent
+from .sync_session import SyncSession
+from .teacher_settings import TeacherSettings
+from .user import User
+
+# En orden de archivado: cada tabla antes que las tablas a las que referencia, para
+# que una fila padre solo se archive cuando ya no le quedan hijas en la tabla principal
+ARCHIVED_MODELS: List[Type[Base]] = [
+    SyncEvent,
+    SyncSession,
+    GameInstance,
+    Progress,
+    SegmentLevel,
+    Level,
+    Game,
+    Feedback,
+    Student,
+    Professor,
+    TeacherSettings,
+    User,
+]
+
+
+def _archive_table(source: Table) -> Table:
+    columns = [Column(column.name, column.type, primary_key=column.primary_key) for column in source.columns]
+    return Table(
+        f"{source.name}_archive",
+        Base.metadata,
+        *columns,
+        Column("archived_at", DateTime(timezone=True), nullable=False),
+    )
+
+
+def _deleted_at_index(source: Table) -> Index:
+    # Índice parcial con solo las filas eliminadas: el archivado las localiza sin
+    # recorrer la tabla y el índice no ocupa nada mientras no haya borrados
+    where = source.c.deleted_at.isnot(None)
+    return Index(f"ix_{source.name}_deleted_at", source.c.deleted_at, sqlite_where=where, postgresql_where=where)
+
+
+ARCHIVE_TABLES: Dict[str, Table] = {}
+for _model in ARCHIVED_MODELS:
+    ARCHIVE_TABLES[_model.__tablename__] = _archive_table(_model.__table__)
+    _deleted_at_index(_model.__table__)
+
+
+def referencing_foreign_keys(table: Table) -> List[ForeignKey]:
+    """Claves foráneas de otras tablas que apuntan a `table`."""
+    return [
+        foreign_key
+        for other in Base.metadata.tables.values()
+        for foreign_key in other.foreign_keys
+        if foreign_key.column.table is table
+    ]
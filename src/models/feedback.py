@@ -9,7 +9,7 @@ class Feedback(Base):
     created_at = Column(DateTime, nullable=False)
     comments = Column(String(255), nullable=True)
 
-    student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
+    student_id = Column(Integer, ForeignKey("students.id"), nullable=False, index=True)
 
     # Relationships
     student = relationship("Student", back_populates="feedbacks")
@@ -1,10 +1,14 @@
-from sqlalchemy import Column, String
+from sqlalchemy import Column, String, Index
 from sqlalchemy.orm import relationship
-from src.db.base import Base
+from src.db.base import Base, TenantMixin
 
 
-class Game(Base):
+class Game(Base, TenantMixin):
     __tablename__ = "games"
+    __table_args__ = (
+        # Catálogo de un colegio ordenado por ID
+        Index("ix_games_tenant_id_id", "tenant_id", "id"),
+    )
 
     title = Column(String(255), nullable=False)
     description = Column(String(255), nullable=True)
@@ -1,16 +1,22 @@
-from sqlalchemy import Column, String, DateTime, Integer, ForeignKey
+from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, Index
 from sqlalchemy.orm import relationship
-from src.db.base import Base
+from src.db.base import Base, TenantMixin
 
 
-class GameInstance(Base):
+class GameInstance(Base, TenantMixin):
     __tablename__ = "game_instances"
+    __table_args__ = (
+        # Instancias de un juego
+        Index("ix_game_instances_tenant_id_game_id", "tenant_id", "game_id"),
+        # Instancias de un estudiante
+        Index("ix_game_instances_tenant_id_student_id", "tenant_id", "student_id"),
+    )
 
     start_instance = Column(DateTime, nullable=False)
     status = Column(String(255), nullable=True)
 
-    student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
-    game_id = Column(Integer, ForeignKey("games.id"), nullable=False)
+    student_id = Column(Integer, ForeignKey("students.id"), nullable=False, index=True)
+    game_id = Column(Integer, ForeignKey("games.id"), nullable=False, index=True)
 
     # Relationships
     student = relationship("Student", back_populates="game_instances")
@@ -1,17 +1,21 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
 from sqlalchemy.orm import relationship
-from src.db.base import Base
+from src.db.base import Base, TenantMixin
 
 
-class Level(Base):
+class Level(Base, TenantMixin):
     __tablename__ = "levels"
+    __table_args__ = (
+        # Niveles de un juego ordenados por número
+        Index("ix_levels_tenant_id_game_id_level_number", "tenant_id", "game_id", "level_number"),
+    )
 
     level_number = Column(Integer, nullable=False)
     description = Column(String(255), nullable=True)
     goal = Column(String(255), nullable=True)
     title = Column(String(255), nullable=False)
 
-    game_id = Column(Integer, ForeignKey("games.id"), nullable=False)
+    game_id = Column(Integer, ForeignKey("games.id"), nullable=False, index=True)
 
     # Relationships
     game = relationship("Game", back_populates="levels")
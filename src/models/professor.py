@@ -1,10 +1,16 @@
-from sqlalchemy import Column, String, ForeignKey, Integer
+from sqlalchemy import Column, String, ForeignKey, Integer, Index
 from sqlalchemy.orm import relationship
-from src.db.base import Base
+from src.db.base import Base, TenantMixin
 
 
-class Professor(Base):
+class Professor(Base, TenantMixin):
     __tablename__ = "professors"
+    __table_args__ = (
+        # Perfil del profesor autenticado
+        Index("ix_professors_tenant_id_user_id", "tenant_id", "user_id"),
+        # Profesor de un usuario, sin tenant (p. ej. en el registro y el archivado de usuarios)
+        Index("ix_professors_user_id", "user_id"),
+    )
 
     department = Column(String(255), nullable=False)
     contact_phone = Column(String(255), nullable=True)
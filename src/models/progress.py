@@ -13,7 +13,14 @@ class Progress(Base):
     objectives_completed = Column(Integer, default=0)
     efficiency_rating = Column(Integer, default=0)
 
-    segment_level_id = Column(Integer, ForeignKey("segment_levels.id"), nullable=False)
+    segment_level_id = Column(Integer, ForeignKey("segment_levels.id"), nullable=False, index=True)
+
+    # Control de concurrencia optimista: cada escritura incrementa la versión y las
+    # escrituras condicionadas a una versión anterior fallan (ver ProgressRepository)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
 
     # Relationships
     segment_level = relationship("SegmentLevel", back_populates="progresses")
+
+    # El flush de la unidad de trabajo también comprueba e incrementa la versión
+    __mapper_args__ = {"version_id_col": version}
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String
+from sqlalchemy import Column, Integer, String
 from sqlalchemy.orm import relationship
 from src.db.base import Base
 
@@ -8,5 +8,7 @@ class Role(Base):
 
     role_name = Column(String(255), unique=True, index=True, nullable=False)
     description = Column(String(255), nullable=True)
+    # Bitset de src.core.permissions.Permission
+    permissions = Column(Integer, nullable=False, default=0, server_default="0")
 
     users = relationship("User", back_populates="role")
@@ -0,0 +1,10 @@
+from sqlalchemy import Column, String, DateTime
+from src.db.base import Base
+
+
+class SchedulerLease(Base):
+    __tablename__ = "scheduler_leases"
+
+    name = Column(String(255), unique=True, index=True, nullable=False)
+    owner = Column(String(255), nullable=False)
+    expires_at = Column(DateTime, nullable=False)
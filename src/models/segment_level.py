@@ -1,13 +1,20 @@
-from sqlalchemy import Column, Integer, ForeignKey, JSON
+from sqlalchemy import Column, Integer, ForeignKey, JSON, LargeBinary, String, Index
 from sqlalchemy.orm import relationship
-from src.db.base import Base
+from src.db.base import Base, TenantMixin
 
 
-class SegmentLevel(Base):
+class SegmentLevel(Base, TenantMixin):
     __tablename__ = "segment_levels"
+    __table_args__ = (
+        # Segmentos de un nivel
+        Index("ix_segment_levels_tenant_id_level_number_id", "tenant_id", "level_number_id"),
+    )
 
     configuration = Column(JSON, nullable=True)
-    level_number_id = Column(Integer, ForeignKey("levels.id"), nullable=False)
+    # Forma de ejecución precompilada: JSON canónico y compacto con valores por defecto resueltos
+    compiled_configuration = Column(LargeBinary, nullable=True)
+    segment_type = Column(String(50), nullable=True)
+    level_number_id = Column(Integer, ForeignKey("levels.id"), nullable=False, index=True)
 
     # Relationships
     level = relationship("Level", back_populates="segments")
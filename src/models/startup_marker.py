@@ -0,0 +1,9 @@
+from sqlalchemy import Column, String
+from src.db.base import Base
+
+
+class StartupMarker(Base):
+    __tablename__ = "startup_markers"
+
+    name = Column(String(255), unique=True, index=True, nullable=False)
+    version = Column(String(255), nullable=False)
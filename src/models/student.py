@@ -1,10 +1,17 @@
-from sqlalchemy import Column, Integer, ForeignKey
+from sqlalchemy import Column, Integer, ForeignKey, Index
 from sqlalchemy.orm import relationship
-from src.db.base import Base
+from src.db.base import Base, TenantMixin
 
 
-class Student(Base):
+class Student(Base, TenantMixin):
     __tablename__ = "students"
+    __table_args__ = (
+        # Listados de estudiantes de un colegio
+        Index("ix_students_tenant_id_id", "tenant_id", "id"),
+        # Estudiante de un usuario. Completo y no parcial: el archivado de usuarios
+        # comprueba también los estudiantes eliminados que aún no se han archivado
+        Index("ix_students_user_id", "user_id"),
+    )
 
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
 
@@ -1,10 +1,16 @@
-from sqlalchemy import Column, String, DateTime, JSON, Integer, ForeignKey
+from sqlalchemy import Column, String, DateTime, JSON, Integer, ForeignKey, Index
 from sqlalchemy.orm import relationship
-from src.db.base import Base
+from src.db.base import Base, TenantMixin
 
 
-class SyncEvent(Base):
+class SyncEvent(Base, TenantMixin):
     __tablename__ = "sync_events"
+    __table_args__ = (
+        # Eventos de una sesión del colegio en orden temporal
+        Index("ix_sync_events_tenant_id_session_timestamp", "tenant_id", "sync_session_id", "timestamp"),
+        # Último evento de una sesión: MAX(timestamp) WHERE sync_session_id = ?
+        Index("ix_sync_events_session_timestamp", "sync_session_id", "timestamp"),
+    )
 
     event_type = Column(String(255), nullable=False)
     payload = Column(JSON, nullable=True)
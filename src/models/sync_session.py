@@ -1,16 +1,23 @@
-from sqlalchemy import Column, String, DateTime, Integer, ForeignKey
+from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, Index
 from sqlalchemy.orm import relationship
-from src.db.base import Base
+from src.db.base import Base, TenantMixin
 
 
-class SyncSession(Base):
+class SyncSession(Base, TenantMixin):
     __tablename__ = "sync_sessions"
+    __table_args__ = (
+        # Sesiones de una instancia de juego
+        Index("ix_sync_sessions_tenant_id_instance_id", "tenant_id", "instance_id"),
+        # Recorrido por lotes de sesiones abiertas (end_time IS NULL) ordenadas por id
+        Index("ix_sync_sessions_end_time_id", "end_time", "id"),
+    )
 
     start_time = Column(DateTime, nullable=False)
     end_time = Column(DateTime, nullable=True)
     status = Column(String(255), nullable=True)
+    duration_seconds = Column(Integer, nullable=True)
 
-    instance_id = Column(Integer, ForeignKey("game_instances.id"), nullable=False)
+    instance_id = Column(Integer, ForeignKey("game_instances.id"), nullable=False, index=True)
 
     # Relationships
     game_instance = relationship("GameInstance", back_populates="sync_sessions")
@@ -13,7 +13,7 @@ class TeacherSettings(Base):
     interface_language = Column(String(10), default="es", nullable=False)  # es, en, etc.
     
     # Foreign key to connect with user
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
 
     # Relationship
     user = relationship("User", back_populates="teacher_settings")
\ No newline at end of file
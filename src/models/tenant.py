@@ -0,0 +1,8 @@
+from sqlalchemy import Column, String
+from src.db.base import Base
+
+
+class Tenant(Base):
+    __tablename__ = "tenants"
+
+    name = Column(String(255), unique=True, nullable=False)
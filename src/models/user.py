@@ -1,22 +1,26 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Integer
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Integer, Index
 from sqlalchemy.orm import relationship
-from src.db.base import Base
+from src.db.base import Base, TenantMixin
 
 
-class User(Base):
+class User(Base, TenantMixin):
     __tablename__ = "users"
+    __table_args__ = (
+        # Listados de usuarios de un colegio
+        Index("ix_users_tenant_id_id", "tenant_id", "id"),
+    )
 
     username = Column(String(255), unique=True, index=True, nullable=False)
     password = Column(String(255), nullable=False)
     name = Column(String(255), nullable=False)
     lastname = Column(String(255), nullable=True)
     email = Column(String(255), unique=True, index=True, nullable=False)
-    lms_id = Column(String(255), ForeignKey("lms_credentials.id"), nullable=True)
+    lms_id = Column(String(255), ForeignKey("lms_credentials.id"), nullable=True, index=True)
     avatar_url = Column(String(255), nullable=True)
     is_active = Column(Boolean, default=True, nullable=False)
     last_login = Column(DateTime, nullable=True)
 
-    role_id = Column(Integer, ForeignKey("roles.id"), nullable=True)
+    role_id = Column(Integer, ForeignKey("roles.id"), nullable=True, index=True)
 
     role = relationship("Role", back_populates="users")
     lms_credential = relationship("LMSCredential", back_populates="user")
@@ -8,6 +8,10 @@ class Token(BaseModel):
 
 class TokenData(BaseModel):
     username: Optional[str] = None
+    # Claim `rid`: ID del rol (0 sin rol); None en tokens emitidos antes de incluirlo
+    role_id: Optional[int] = None
+    # Claim `tid`: tenant (colegio) del usuario
+    tenant_id: Optional[int] = None
 
 class PasswordChange(BaseModel):
     old_password: str
@@ -1,10 +1,33 @@
 from pydantic import BaseModel, Field
+from typing import Optional
+from datetime import datetime
 
 class GameSchema(BaseModel):
-    pass
+    """Esquema para la respuesta de un juego"""
+    id: int
+    title: str
+    description: Optional[str] = None
+    creator: Optional[str] = None
+    subject: Optional[str] = None
+    publication_status: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        orm_mode = True
 
 class GameCreateSchema(BaseModel):
-    pass
+    """Esquema para crear un nuevo juego"""
+    title: str = Field(..., max_length=255, example="Aventura de Programación")
+    description: Optional[str] = Field(None, max_length=255)
+    creator: Optional[str] = Field(None, max_length=255)
+    subject: Optional[str] = Field(None, max_length=255)
+    publication_status: Optional[str] = Field(None, max_length=255, example="draft")
 
 class GameUpdateSchema(BaseModel):
-    pass
\ No newline at end of file
+    """Esquema para actualizar un juego"""
+    title: Optional[str] = Field(None, max_length=255)
+    description: Optional[str] = Field(None, max_length=255)
+    creator: Optional[str] = Field(None, max_length=255)
+    subject: Optional[str] = Field(None, max_length=255)
+    publication_status: Optional[str] = Field(None, max_length=255)
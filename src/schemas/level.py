@@ -1,11 +1,32 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+from typing import Optional
+from datetime import datetime
 
 class LevelSchema(BaseModel):
-    pass
+    """Esquema para la respuesta de un nivel"""
+    id: int
+    game_id: int
+    level_number: int
+    title: str
+    description: Optional[str] = None
+    goal: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        orm_mode = True
 
 
 class LevelCreateSchema(BaseModel):
-    pass
+    """Esquema para crear un nuevo nivel dentro de un juego"""
+    level_number: int = Field(..., ge=1, example=1)
+    title: str = Field(..., max_length=255, example="Nivel 1: Introducción")
+    description: Optional[str] = Field(None, max_length=255)
+    goal: Optional[str] = Field(None, max_length=255)
 
 class LevelUpdateSchema(BaseModel):
-    pass
\ No newline at end of file
+    """Esquema para actualizar un nivel"""
+    level_number: Optional[int] = Field(None, ge=1)
+    title: Optional[str] = Field(None, max_length=255)
+    description: Optional[str] = Field(None, max_length=255)
+    goal: Optional[str] = Field(None, max_length=255)
@@ -0,0 +1,40 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Literal, Optional
+
+# ------------------------
+# Configuraciones por tipo de segmento
+# ------------------------
+
+class SegmentConfigBase(BaseModel):
+    """Campos comunes a toda configuración de segmento"""
+    type: str
+    title: Optional[str] = Field(None, max_length=255)
+    properties: Dict[str, Any] = Field(default_factory=dict, description="Datos libres interpretados por el juego")
+
+    class Config:
+        extra = "forbid"
+
+class InstructionConfig(SegmentConfigBase):
+    """Segmento explicativo: texto o recurso que el estudiante lee o visualiza"""
+    type: Literal["instruction"] = "instruction"
+    content: Optional[str] = None
+    media_url: Optional[str] = None
+    duration: int = Field(300, ge=0, description="Duración estimada en segundos")
+    skippable: bool = True
+
+class ExerciseConfig(SegmentConfigBase):
+    """Segmento de práctica con intentos y pistas"""
+    type: Literal["exercise"] = "exercise"
+    complexity: Literal["easy", "medium", "hard"] = "easy"
+    expected_time: int = Field(600, ge=0, description="Tiempo esperado en segundos")
+    max_attempts: int = Field(3, ge=1)
+    hints: List[str] = Field(default_factory=list)
+    starter_code: Optional[str] = None
+
+class EvaluationConfig(SegmentConfigBase):
+    """Segmento evaluativo con puntuación mínima para aprobar"""
+    type: Literal["evaluation"] = "evaluation"
+    questions: int = Field(5, ge=1)
+    passing_score: int = Field(80, ge=0, le=100)
+    time_limit: Optional[int] = Field(None, ge=0, description="Límite de tiempo en segundos")
+    shuffle_questions: bool = False
@@ -78,7 +78,10 @@ class UserChangePassword(BaseModel):
 class UserRoleResponse(BaseModel):
     """Esquema para respuesta de rol"""
     id: int
-    name: str
+    role_name: str
+
+    class Config:
+        orm_mode = True
 
 class UserResponse(UserBase, DateTimeSchema):
     """Esquema para respuesta de usuario"""
@@ -87,7 +90,7 @@ class UserResponse(UserBase, DateTimeSchema):
     role: Optional[UserRoleResponse] = None
 
     class Config:
-        from_attributes = True
+        orm_mode = True
 
 class UserListResponse(ResponseSchema):
     """Respuesta para listado de usuarios"""
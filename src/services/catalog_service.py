@@ -0,0 +1,288 @@
+# app/services/catalog_service.py
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from fastapi import Depends
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from src.core.conditional import etag_matches
+from src.core.config import settings
+from src.core.exceptions import TenantRequiredException
+from src.core.metrics import CACHE_REQUESTS
+from src.core.singleflight import SingleFlight
+from src.core.tenancy import get_current_tenant, tenant_required
+from src.db.session import get_db
+from src.models.game import Game
+from src.models.level import Level
+from src.services.segment_config_registry import encode_runtime
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogSnapshot:
+    """
+    Copia inmutable del árbol de catálogo (juegos → niveles → segmentos) ya serializada.
+
+    Los elementos son diccionarios con la forma de los esquemas de respuesta, de modo
+    que los endpoints pueden devolverlos sin volver a tocar la base de datos.
+    """
+
+    def __init__(
+        self,
+        version: int,
+        games: List[Dict[str, Any]],
+        levels: List[Dict[str, Any]],
+        segments: List[Dict[str, Any]],
+        compiled_configs: Optional[Dict[int, bytes]] = None,
+    ):
+        self.version = version
+        self.loaded_at = time.monotonic()
+        self.games = games
+        self.games_by_id = {game["id"]: game for game in games}
+        self.levels_by_id = {level["id"]: level for level in levels}
+        self.levels_by_game: Dict[int, List[Dict[str, Any]]] = {}
+        for level in levels:
+            self.levels_by_game.setdefault(level["game_id"], []).append(level)
+        self.segments_by_level: Dict[int, List[Dict[str, Any]]] = {}
+        for segment in segments:
+            self.segments_by_level.setdefault(segment["level_id"], []).append(segment)
+        # Configuraciones precompiladas por ID de segmento, listas para enviarse sin parsear
+        self.compiled_configs = compiled_configs or {}
+
+        # El digest depende solo del contenido: es estable entre workers y reinicios
+        payload = json.dumps([games, levels, segments], sort_keys=True, default=str, separators=(",", ":"))
+        self.digest = hashlib.sha1(payload.encode("utf-8")).hexdigest()
+        self.etag = f'W/"catalog-{self.digest[:16]}"'
+
+    def list_games(self, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """Juegos del catálogo ordenados por ID, paginados."""
+        return self.games[skip:skip + limit]
+
+    def list_game_levels(self, game_id: int, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """Niveles de un juego ordenados por número de nivel, paginados."""
+        return self.levels_by_game.get(game_id, [])[skip:skip + limit]
+
+    def list_level_segments(self, level_id: int, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """Segmentos de un nivel ordenados por ID, paginados."""
+        return self.segments_by_level.get(level_id, [])[skip:skip + limit]
+
+    def headers(self) -> Dict[str, str]:
+        """Cabeceras de validación HTTP de la instantánea."""
+        return {"ETag": self.etag, "X-Catalog-Version": str(self.version)}
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """
+        Indica si la cabecera If-None-Match del cliente coincide con la instantánea.
+
+        Args:
+            if_none_match: Valor de la cabecera If-None-Match
+
+        Returns:
+            bool: True si el cliente ya tiene esta versión (responder 304)
+        """
+        return etag_matches(if_none_match, self.etag)
+
+
+class CatalogCache:
+    """
+    Caché en memoria del proceso para el catálogo completo de juegos.
+
+    Mantiene una versión monótona que se incrementa en cada escritura a través de
+    GameService, LevelService o SegmentLevelService. La instantánea solo es válida
+    si se construyó con la versión vigente y no ha superado CATALOG_CACHE_TTL_SECONDS
+    (el TTL acota la desactualización frente a escrituras hechas en otros workers).
+
+    Hay una instantánea por tenant (la carga ya sale filtrada por el tenant de la
+    petición); la versión es común, así que una escritura las invalida todas.
+    """
+
+    def __init__(self, ttl_seconds: Optional[int] = None):
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.CATALOG_CACHE_TTL_SECONDS
+        self.version = 0
+        self._snapshots: Dict[Optional[int], CatalogSnapshot] = {}
+        self._rebuilds = SingleFlight("catalog")
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "invalidations": 0, "rebuilds": 0}
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / lookups if lookups else 0.0
+
+    def invalidate(self) -> int:
+        """
+        Invalida la instantánea actual e incrementa la versión del catálogo.
+
+        Returns:
+            int: Nueva versión del catálogo
+        """
+        self.version += 1
+        self._snapshots = {}
+        self.stats["invalidations"] += 1
+        return self.version
+
+    def peek(self, tenant_id: Optional[int] = None) -> Optional[CatalogSnapshot]:
+        """Devuelve la instantánea del tenant si sigue vigente, sin contabilizar acceso."""
+        snapshot = self._snapshots.get(tenant_id)
+        if snapshot is None or snapshot.version != self.version:
+            return None
+        if self.ttl_seconds and time.monotonic() - snapshot.loaded_at > self.ttl_seconds:
+            return None
+        return snapshot
+
+    async def get(self, db: AsyncSession) -> CatalogSnapshot:
+        """
+        Obtiene la instantánea vigente del tenant de la petición, reconstruyéndola desde
+        la base de datos si hace falta.
+
+        Las reconstrucciones concurrentes del mismo tenant se agrupan (single-flight) para
+        que un fallo de caché con muchas peticiones simultáneas solo lance una carga; las
+        de tenants distintos no se esperan entre sí.
+
+        Args:
+            db: Sesión de base de datos usada si hay que reconstruir
+
+        Returns:
+            CatalogSnapshot: Instantánea del catálogo
+
+        Raises:
+            TenantRequiredException: En una petición sin tenant (la caché sin tenant ve todos)
+        """
+        if tenant_required():
+            raise TenantRequiredException()
+        tenant_id = get_current_tenant()
+        snapshot = self.peek(tenant_id)
+        if snapshot is not None:
+            self.stats["hits"] += 1
+            CACHE_REQUESTS.labels("catalog", "hit").inc()
+            return snapshot
+
+        self.stats["misses"] += 1
+        CACHE_REQUESTS.labels("catalog", "miss").inc()
+        # Una carga por tenant (SingleFlight ya separa por tenant); la sesión no forma parte de la clave
+        return await self._rebuilds.do(self._rebuild, db, key="snapshot")
+
+    async def _rebuild(self, db: AsyncSession) -> CatalogSnapshot:
+        tenant_id = get_current_tenant()
+        version = self.version
+        snapshot = await self._load(db, version)
+        # Si hubo una escritura durante la carga, no se guarda la instantánea
+        if version == self.version:
+            self._snapshots[tenant_id] = snapshot
+        self.stats["rebuilds"] += 1
+        return snapshot
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Estadísticas de uso de la caché para observabilidad."""
+        snapshot = self._snapshots.get(get_current_tenant())
+        return {
+            **self.stats,
+            "hit_ratio": round(self.hit_ratio, 4),
+            "version": self.version,
+            "snapshots": len(self._snapshots),
+            "rebuilds_coalesced": self._rebuilds.stats["coalesced"],
+            "etag": snapshot.etag if snapshot else None,
+        }
+
+    async def _load(self, db: AsyncSession, version: int) -> CatalogSnapshot:
+        query = (
+            select(Game)
+            .options(selectinload(Game.levels).selectinload(Level.segments))
+            .where(Game.deleted_at.is_(None))
+            .order_by(Game.id)
+        )
+        result = await db.execute(query)
+        games = result.scalars().all()
+
+        game_rows: List[Dict[str, Any]] = []
+        level_rows: List[Dict[str, Any]] = []
+        segment_rows: List[Dict[str, Any]] = []
+        compiled_configs: Dict[int, bytes] = {}
+        for game in games:
+            game_rows.append(_serialize_game(game))
+            levels = sorted(
+                (level for level in game.levels if level.deleted_at is None),
+                key=lambda level: (level.level_number, level.id),
+            )
+            for level in levels:
+                level_rows.append(_serialize_level(level))
+                for segment in sorted(level.segments, key=lambda segment: segment.id):
+                    if segment.deleted_at is None:
+                        segment_rows.append(_serialize_segment(segment))
+                        # Segmentos anteriores al registro de esquemas no tienen forma compilada
+                        compiled_configs[segment.id] = (
+                            segment.compiled_configuration or encode_runtime(segment.configuration)
+                        )
+
+        logger.info(
+            "Catálogo cargado (versión %d): %d juegos, %d niveles, %d segmentos",
+            version, len(game_rows), len(level_rows), len(segment_rows),
+        )
+        return CatalogSnapshot(version, game_rows, level_rows, segment_rows, compiled_configs)
+
+
+def _serialize_game(game: Game) -> Dict[str, Any]:
+    return {
+        "id": game.id,
+        "title": game.title,
+        "description": game.description,
+        "creator": game.creator,
+        "subject": game.subject,
+        "publication_status": game.publication_status,
+        "created_at": game.created_at,
+        "updated_at": game.updated_at,
+    }
+
+
+def _serialize_level(level: Level) -> Dict[str, Any]:
+    return {
+        "id": level.id,
+        "game_id": level.game_id,
+        "level_number": level.level_number,
+        "title": level.title,
+        "description": level.description,
+        "goal": level.goal,
+        "created_at": level.created_at,
+        "updated_at": level.updated_at,
+    }
+
+
+def _serialize_segment(segment) -> Dict[str, Any]:
+    return {
+        "id": segment.id,
+        "level_id": segment.level_number_id,
+        "config": segment.configuration,
+        "created_at": segment.created_at,
+        "updated_at": segment.updated_at,
+    }
+
+
+catalog_cache = CatalogCache()
+
+
+class CatalogService:
+    """
+    Servicio de solo lectura sobre el catálogo de juegos, niveles y segmentos.
+
+    Todas las lecturas se sirven desde `catalog_cache`; las escrituras siguen pasando
+    por GameService, LevelService y SegmentLevelService, que invalidan la caché.
+    Los endpoints obtienen la instantánea una sola vez por petición y la consultan.
+    """
+
+    def __init__(self, db: AsyncSession = Depends(get_db)):
+        """
+        Inicializa el servicio con una sesión de base de datos.
+
+        Args:
+            db: Sesión de base de datos asíncrona.
+        """
+        self.db = db
+        self.cache = catalog_cache
+
+    async def get_snapshot(self) -> CatalogSnapshot:
+        """Obtiene la instantánea vigente del catálogo."""
+        return await self.cache.get(self.db)
@@ -4,9 +4,10 @@ from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.db.session import get_db
 from src.db.repositories.game_repository import GameRepository
-from src.schemas.game import GameCreate, GameUpdate
+from src.schemas.game import GameCreateSchema, GameUpdateSchema
 from src.models.game import Game
 from src.core.exceptions import NotFoundException
+from src.services.catalog_service import catalog_cache
 
 
 class GameService:
@@ -51,7 +52,7 @@ class GameService:
         """
         return await self.game_repo.get_all(skip=skip, limit=limit)
 
-    async def create_game(self, game_data: GameCreate) -> Game:
+    async def create_game(self, game_data: GameCreateSchema) -> Game:
         """
         Crea un nuevo juego.
 
@@ -61,25 +62,33 @@ class GameService:
         Returns:
             El juego recién creado.
         """
-        return await self.game_repo.create(game_data.model_dump())
+        game = await self.game_repo.create(game_data.dict())
+        catalog_cache.invalidate()
+        return game
 
-    async def update_game(self, game_id: int, game_data: GameUpdate) -> Optional[Game]:
+    async def update_game(
+        self, game_id: int, game_data: GameUpdateSchema, unchanged_from: Optional[Game] = None
+    ) -> Optional[Game]:
         """
         Actualiza un juego existente.
 
         Args:
             game_id: ID del juego a actualizar.
             game_data: Datos para la actualización.
+            unchanged_from: Estado comprobado con If-Match; si se indica, solo se actualiza
+                si el juego no ha cambiado desde entonces.
 
         Returns:
             El juego actualizado si se encuentra, de lo contrario None.
         
         Raises:
             NotFoundException: Si el juego no se encuentra.
+            PreconditionFailedException: Si el juego cambió desde `unchanged_from`.
         """
-        game = await self.game_repo.update(game_id, game_data.model_dump(exclude_unset=True))
+        game = await self.game_repo.update(game_id, game_data.dict(exclude_unset=True), unchanged_from=unchanged_from)
         if not game:
             raise NotFoundException("Juego no encontrado")
+        catalog_cache.invalidate()
         return game
 
     async def delete_game(self, game_id: int) -> bool:
@@ -98,6 +107,7 @@ class GameService:
         success = await self.game_repo.delete(game_id)
         if not success:
             raise NotFoundException("Juego no encontrado")
+        catalog_cache.invalidate()
         return success
 
     async def get_game_by_name(self, name: str) -> Optional[Game]:
@@ -0,0 +1,205 @@
+# app/services/level_bundle_service.py
+import gzip
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import Depends
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from src.core.config import settings
+from src.core.exceptions import TenantRequiredException
+from src.core.metrics import CACHE_REQUESTS
+from src.core.singleflight import SingleFlight
+from src.core.tenancy import get_current_tenant, tenant_required
+from src.db.session import get_db
+from src.models.level import Level
+from src.services.catalog_service import CatalogCache, catalog_cache
+from src.services.segment_config_registry import encode_runtime
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Tipo no serializable: {type(value).__name__}")
+
+
+def _dumps(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=_default).encode("utf-8")
+
+
+class LevelBundle:
+    """
+    Representación precalculada de un nivel con sus segmentos y configuraciones.
+
+    Se guarda tanto el JSON como su versión gzip para servir cualquiera de las dos
+    sin trabajo adicional por petición. La versión del catálogo no forma parte del
+    cuerpo: el ETag depende solo del contenido y es estable entre workers.
+    """
+
+    __slots__ = ("level_id", "catalog_version", "loaded_at", "payload", "gzip_payload", "etag")
+
+    def __init__(self, level_id: int, catalog_version: int, payload: bytes):
+        self.level_id = level_id
+        self.catalog_version = catalog_version
+        self.loaded_at = time.monotonic()
+        self.payload = payload
+        self.gzip_payload = gzip.compress(payload, compresslevel=6)
+        self.etag = f'W/"bundle-{hashlib.sha1(payload).hexdigest()[:16]}"'
+
+    def headers(self) -> Dict[str, str]:
+        """Cabeceras de validación HTTP del bundle."""
+        return {"ETag": self.etag, "X-Catalog-Version": str(self.catalog_version)}
+
+
+class LevelBundleCache:
+    """
+    Caché LRU de bundles de nivel asociada a la versión del catálogo.
+
+    Un bundle solo es válido mientras la versión del catálogo no cambie, así que las
+    escrituras a través de GameService, LevelService y SegmentLevelService lo invalidan.
+    Esa versión es del proceso: como CatalogCache, los bundles caducan además tras
+    CATALOG_CACHE_TTL_SECONDS para recoger cambios hechos en otros workers.
+    Las entradas se indexan por (tenant, nivel): un nivel de otro tenant no se construye
+    y no se sirve desde la caché. Las construcciones simultáneas de un mismo nivel se
+    agrupan en una (single-flight); las de niveles distintos no se esperan entre sí.
+    """
+
+    def __init__(self, catalog: CatalogCache, max_size: Optional[int] = None):
+        self.catalog = catalog
+        self.max_size = max_size or settings.LEVEL_BUNDLE_CACHE_SIZE
+        self._bundles: "OrderedDict[Tuple[Optional[int], int], LevelBundle]" = OrderedDict()
+        self._builds = SingleFlight("level_bundle")
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "builds": 0}
+
+    def peek(self, level_id: int, tenant_id: Optional[int] = None) -> Optional[LevelBundle]:
+        key = (tenant_id, level_id)
+        bundle = self._bundles.get(key)
+        if bundle is None or bundle.catalog_version != self.catalog.version:
+            return None
+        ttl_seconds = self.catalog.ttl_seconds
+        if ttl_seconds and time.monotonic() - bundle.loaded_at > ttl_seconds:
+            del self._bundles[key]
+            return None
+        self._bundles.move_to_end(key)
+        return bundle
+
+    async def get(self, db: AsyncSession, level_id: int) -> Optional[LevelBundle]:
+        """
+        Obtiene el bundle de un nivel, construyéndolo si no está en caché.
+
+        Args:
+            db: Sesión de base de datos usada si hay que construirlo
+            level_id: ID del nivel
+
+        Returns:
+            LevelBundle: Bundle del nivel, None si el nivel no existe
+
+        Raises:
+            TenantRequiredException: En una petición sin tenant (la caché sin tenant ve todos)
+        """
+        if tenant_required():
+            raise TenantRequiredException()
+        tenant_id = get_current_tenant()
+        bundle = self.peek(level_id, tenant_id)
+        if bundle is not None:
+            self.stats["hits"] += 1
+            CACHE_REQUESTS.labels("level_bundle", "hit").inc()
+            return bundle
+
+        self.stats["misses"] += 1
+        CACHE_REQUESTS.labels("level_bundle", "miss").inc()
+        return await self._builds.do(self._build_and_store, db, level_id, key=level_id)
+
+    async def _build_and_store(self, db: AsyncSession, level_id: int) -> Optional[LevelBundle]:
+        version = self.catalog.version
+        bundle = await self._build(db, level_id, version)
+        self.stats["builds"] += 1
+        # Si el catálogo cambió durante la construcción, el bundle se entrega pero no se guarda
+        if bundle is not None and version == self.catalog.version:
+            key = (get_current_tenant(), level_id)
+            self._bundles[key] = bundle
+            self._bundles.move_to_end(key)
+            while len(self._bundles) > self.max_size:
+                self._bundles.popitem(last=False)
+        return bundle
+
+    def clear(self) -> None:
+        self._bundles.clear()
+
+    async def _build(self, db: AsyncSession, level_id: int, version: int) -> Optional[LevelBundle]:
+        query = (
+            select(Level)
+            .options(selectinload(Level.segments))
+            .where(and_(Level.id == level_id, Level.deleted_at.is_(None)))
+        )
+        result = await db.execute(query)
+        level = result.scalar_one_or_none()
+        if level is None:
+            return None
+
+        level_json = _dumps({
+            "id": level.id,
+            "game_id": level.game_id,
+            "level_number": level.level_number,
+            "title": level.title,
+            "description": level.description,
+            "goal": level.goal,
+            "created_at": level.created_at,
+            "updated_at": level.updated_at,
+        })
+
+        # La configuración se inserta con sus bytes precompilados, sin volver a serializarla
+        segment_parts = []
+        for segment in sorted(level.segments, key=lambda segment: segment.id):
+            if segment.deleted_at is not None:
+                continue
+            header = _dumps({
+                "id": segment.id,
+                "level_id": segment.level_number_id,
+                "segment_type": segment.segment_type,
+                "created_at": segment.created_at,
+                "updated_at": segment.updated_at,
+            })
+            config = segment.compiled_configuration or encode_runtime(segment.configuration)
+            segment_parts.append(header[:-1] + b',"config":' + config + b"}")
+
+        payload = b'{"level":' + level_json + b',"segments":[' + b",".join(segment_parts) + b"]}"
+        return LevelBundle(level.id, version, payload)
+
+
+level_bundle_cache = LevelBundleCache(catalog_cache)
+
+
+class LevelBundleService:
+    """
+    Servicio que entrega en una sola respuesta un nivel, sus segmentos ordenados
+    y sus configuraciones, para el arranque del cliente de juego.
+    """
+
+    def __init__(self, db: AsyncSession = Depends(get_db)):
+        """
+        Inicializa el servicio con una sesión de base de datos.
+
+        Args:
+            db: Sesión de base de datos asíncrona.
+        """
+        self.db = db
+        self.cache = level_bundle_cache
+
+    async def get_bundle(self, level_id: int) -> Optional[LevelBundle]:
+        """
+        Obtiene el bundle de un nivel.
+
+        Args:
+            level_id: ID del nivel.
+
+        Returns:
+            El bundle si el nivel existe, de lo contrario None.
+        """
+        return await self.cache.get(self.db, level_id)
@@ -3,10 +3,12 @@ from typing import List, Optional
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.db.session import get_db
+from src.db.batch_loader import batch_loader
 from src.db.repositories.level_repository import LevelRepository
-from src.schemas.level import LevelCreate, LevelUpdate
+from src.schemas.level import LevelCreateSchema, LevelUpdateSchema
 from src.models.level import Level
 from src.core.exceptions import NotFoundException
+from src.services.catalog_service import catalog_cache
 
 
 class LevelService:
@@ -38,6 +40,21 @@ class LevelService:
         """
         return await self.level_repo.get_by_id(level_id)
 
+    async def get_levels_by_ids(self, level_ids: List[int]) -> List[Optional[Level]]:
+        """
+        Obtiene varios niveles por ID con una sola consulta por petición.
+
+        Los IDs ya cargados en la misma petición no se vuelven a consultar
+        (ver src/db/batch_loader.py).
+
+        Args:
+            level_ids: IDs a buscar.
+
+        Returns:
+            Una entrada por ID, en el mismo orden, None si no se encuentra.
+        """
+        return await batch_loader(self.level_repo).load_many(level_ids)
+
     async def get_all_levels(self, skip: int = 0, limit: int = 100) -> List[Level]:
         """
         Obtiene una lista de todos los niveles con paginación.
@@ -51,35 +68,44 @@ class LevelService:
         """
         return await self.level_repo.get_all(skip=skip, limit=limit)
 
-    async def create_level(self, level_data: LevelCreate) -> Level:
+    async def create_level(self, game_id: int, level_data: LevelCreateSchema) -> Level:
         """
-        Crea un nuevo nivel.
+        Crea un nuevo nivel dentro de un juego.
 
         Args:
+            game_id: ID del juego al que pertenece el nivel.
             level_data: Datos para la creación del nivel.
 
         Returns:
             El nivel recién creado.
         """
-        return await self.level_repo.create(level_data.model_dump())
+        level = await self.level_repo.create({**level_data.dict(), "game_id": game_id})
+        catalog_cache.invalidate()
+        return level
 
-    async def update_level(self, level_id: int, level_data: LevelUpdate) -> Optional[Level]:
+    async def update_level(
+        self, level_id: int, level_data: LevelUpdateSchema, unchanged_from: Optional[Level] = None
+    ) -> Optional[Level]:
         """
         Actualiza un nivel existente.
 
         Args:
             level_id: ID del nivel a actualizar.
             level_data: Datos para la actualización.
+            unchanged_from: Estado comprobado con If-Match; si se indica, solo se actualiza
+                si el nivel no ha cambiado desde entonces.
 
         Returns:
             El nivel actualizado si se encuentra, de lo contrario None.
         
         Raises:
             NotFoundException: Si el nivel no se encuentra.
+            PreconditionFailedException: Si el nivel cambió desde `unchanged_from`.
         """
-        level = await self.level_repo.update(level_id, level_data.model_dump(exclude_unset=True))
+        level = await self.level_repo.update(level_id, level_data.dict(exclude_unset=True), unchanged_from=unchanged_from)
         if not level:
             raise NotFoundException("Nivel no encontrado")
+        catalog_cache.invalidate()
         return level
 
     async def delete_level(self, level_id: int) -> bool:
@@ -98,6 +124,7 @@ class LevelService:
         success = await self.level_repo.delete(level_id)
         if not success:
             raise NotFoundException("Nivel no encontrado")
+        catalog_cache.invalidate()
         return success
 
     async def get_levels_by_game_id(self, game_id: int) -> List[Level]:
@@ -0,0 +1,292 @@
+# app/services/progress_counter_buffer.py
+import json
+import logging
+import os
+import socket
+from datetime import datetime
+from typing import IO, Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event, inspect as sa_inspect
+from sqlalchemy.orm.attributes import set_committed_value
+
+from src.core.config import settings
+from src.core.metrics import INGEST_QUEUE_DEPTH
+from src.db.session import SessionLocal
+from src.db.repositories.progress_repository import COUNTERS, ProgressRepository
+from src.models.progress import Progress
+
+logger = logging.getLogger(__name__)
+
+Deltas = Dict[int, Dict[str, int]]
+
+# Incrementos pendientes ya sumados a una instancia por `overlay` (InstanceState.info)
+_APPLIED_KEY = "pending_counters"
+
+
+def _merge(target: Deltas, progress_id: int, amounts: Dict[str, int]) -> None:
+    counters = target.setdefault(progress_id, {})
+    for name, amount in amounts.items():
+        counters[name] = counters.get(name, 0) + amount
+
+
+def _flock(fh: IO[str]) -> None:
+    # Importación diferida: fcntl solo existe en POSIX y el acumulador está desactivado por defecto
+    import fcntl
+
+    fcntl.flock(fh, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+
+def _read_journal(fh: IO[str], path: str) -> Deltas:
+    deltas: Deltas = {}
+    fh.seek(0)
+    for number, line in enumerate(fh, start=1):
+        try:
+            record = json.loads(line)
+            _merge(deltas, int(record.pop("id")), {name: int(record[name]) for name in COUNTERS if name in record})
+        except (ValueError, KeyError, TypeError, AttributeError):
+            # Línea a medio escribir cuando el proceso cayó: se descarta
+            logger.warning("Línea %d ilegible en el diario de contadores %s", number, path)
+    return deltas
+
+
+class ProgressCounterBuffer:
+    """
+    Acumulador en memoria (write-behind) de los incrementos de contadores de progreso.
+
+    Los juegos envían intentos y errores muchas veces por minuto; en lugar de un UPDATE y
+    un commit por incremento, `add` suma el incremento al pendiente del progreso y el
+    volcado periódico (tarea `progress_counter_flush` del scheduler, por worker) aplica
+    todos los pendientes con una sentencia por lotes (`ProgressRepository.apply_counter_deltas`).
+    Al detener la app se vuelca lo que quede.
+
+    Cada incremento se anota antes en un diario local de solo escritura al final
+    (`<PROGRESS_COUNTER_JOURNAL_DIR>/<worker>.journal`), bloqueado con flock mientras el
+    worker vive. Al arrancar, cada worker reclama los diarios sin bloqueo (de workers
+    caídos o de ejecuciones anteriores), suma su contenido y lo vuelca. La entrega es al
+    menos una vez: si el proceso cae entre el commit de un volcado y el borrado de su
+    diario, ese lote se aplica dos veces.
+
+    Las lecturas del progreso deben pasar por `overlay` para incluir los pendientes. Los
+    pendientes son de cada worker: una lectura atendida por otro worker no ve los
+    incrementos acumulados aquí hasta el siguiente volcado (como mucho
+    PROGRESS_COUNTER_FLUSH_INTERVAL_SECONDS de retraso).
+
+    El diario se bloquea con `fcntl.flock`, así que el acumulador solo funciona en POSIX;
+    el módulo se puede importar en cualquier plataforma y `fcntl` se carga al arrancarlo.
+    """
+
+    def __init__(self, journal_dir: Optional[str] = None):
+        """
+        Args:
+            journal_dir: Directorio de los diarios; por defecto PROGRESS_COUNTER_JOURNAL_DIR
+        """
+        self.journal_dir = journal_dir or settings.PROGRESS_COUNTER_JOURNAL_DIR
+        self.name = f"{socket.gethostname()}-{os.getpid()}"
+        self._pending: Deltas = {}
+        # Lote en curso de volcado: sigue sumándose en las lecturas hasta el commit
+        self._flushing: Deltas = {}
+        self._journal: Optional[IO[str]] = None
+        self.running = False
+        self.stats: Dict[str, Any] = {
+            "increments": 0,
+            "flushes": 0,
+            "rows_flushed": 0,
+            "recovered_rows": 0,
+            "failures": 0,
+            "last_flush_at": None,
+        }
+
+    def _path(self, suffix: str) -> str:
+        return os.path.join(self.journal_dir, f"{self.name}.{suffix}")
+
+    def _open_journal(self) -> IO[str]:
+        # Se crea con otro nombre y se renombra ya bloqueado: otro worker que esté
+        # arrancando no puede reclamarlo entre la creación y el flock
+        new_path = self._path("new")
+        fh = open(new_path, "a+", encoding="utf-8")
+        _flock(fh)
+        os.replace(new_path, self._path("journal"))
+        return fh
+
+    def _write(self, records: Iterable[Dict[str, Any]]) -> None:
+        for record in records:
+            self._journal.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._journal.flush()
+        if settings.PROGRESS_COUNTER_JOURNAL_FSYNC:
+            os.fsync(self._journal.fileno())
+
+    def _update_depth(self) -> None:
+        INGEST_QUEUE_DEPTH.labels("progress_counters").set(len(self._pending))
+
+    def _claim_orphans(self) -> Tuple[Deltas, List[Tuple[str, IO[str]]]]:
+        """
+        Lee los diarios de workers que ya no existen (nadie tiene su flock).
+
+        Incluye los del propio nombre: con PIDs reutilizados (p. ej. contenedores) son de
+        una ejecución anterior. Los ficheros reclamados se devuelven abiertos y bloqueados
+        para borrarlos cuando su contenido ya esté en el diario nuevo.
+        """
+        recovered: Deltas = {}
+        claimed: List[Tuple[str, IO[str]]] = []
+        for entry in sorted(os.listdir(self.journal_dir)):
+            if not entry.endswith((".journal", ".flushing")):
+                continue
+            path = os.path.join(self.journal_dir, entry)
+            try:
+                fh = open(path, "r", encoding="utf-8")
+            except FileNotFoundError:
+                continue
+            try:
+                _flock(fh)
+                # Otro worker pudo reclamarlo y borrarlo antes de que tuviéramos el bloqueo
+                if os.stat(path).st_ino != os.fstat(fh.fileno()).st_ino:
+                    raise FileNotFoundError(path)
+            except (BlockingIOError, FileNotFoundError):
+                fh.close()
+                continue
+            for progress_id, amounts in _read_journal(fh, path).items():
+                _merge(recovered, progress_id, amounts)
+            claimed.append((path, fh))
+        return recovered, claimed
+
+    async def start(self) -> None:
+        """Recupera los diarios de workers caídos, abre el del worker y vuelca lo recuperado."""
+        os.makedirs(self.journal_dir, exist_ok=True)
+        recovered, claimed = self._claim_orphans()
+        self._journal = self._open_journal()
+        if recovered:
+            self._write({"id": progress_id, **amounts} for progress_id, amounts in recovered.items())
+            for progress_id, amounts in recovered.items():
+                _merge(self._pending, progress_id, amounts)
+            self.stats["recovered_rows"] += len(recovered)
+            logger.warning("Recuperados incrementos pendientes de %d progresos de diarios anteriores", len(recovered))
+        for path, fh in claimed:
+            os.unlink(path)
+            fh.close()
+        self._update_depth()
+        self.running = True
+        await self.flush()
+
+    async def stop(self) -> None:
+        """Vuelca los pendientes y cierra el diario (que queda vacío y se borra)."""
+        if not self.running:
+            return
+        self.running = False
+        await self.flush()
+        if not self._pending:
+            os.unlink(self._path("journal"))
+        self._journal.close()
+        self._journal = None
+
+    def add(self, progress_id: int, **amounts: int) -> None:
+        """
+        Acumula incrementos de contadores de un progreso.
+
+        Args:
+            progress_id: ID del progreso
+            amounts: Incremento por contador, p. ej. `attempt_count=1, error_count=1`
+
+        Raises:
+            ValueError: Si algún nombre no está en COUNTERS
+        """
+        unknown = set(amounts) - set(COUNTERS)
+        if unknown:
+            raise ValueError(f"Contadores desconocidos para Progress: {', '.join(sorted(unknown))}")
+        amounts = {name: amount for name, amount in amounts.items() if amount}
+        if not amounts:
+            return
+        self._write([{"id": progress_id, **amounts}])
+        _merge(self._pending, progress_id, amounts)
+        self.stats["increments"] += 1
+        self._update_depth()
+
+    def pending_for(self, progress_id: int) -> Dict[str, int]:
+        """Incrementos aún no aplicados en la base de datos de un progreso."""
+        pending: Dict[str, int] = {}
+        for source in (self._flushing, self._pending):
+            for name, amount in source.get(progress_id, {}).items():
+                pending[name] = pending.get(name, 0) + amount
+        return pending
+
+    def overlay(self, progress: Optional[Progress]) -> Optional[Progress]:
+        """
+        Suma a un progreso leído de la base de datos sus incrementos pendientes.
+
+        Solo conoce los pendientes de este worker: los acumulados en otros workers no
+        aparecen hasta que estos los vuelquen.
+
+        Los valores se fijan como ya persistidos: la instancia no queda modificada en la
+        sesión y un flush posterior no los vuelve a escribir.
+
+        Args:
+            progress: Progreso leído (o None)
+
+        Returns:
+            Progress: El mismo progreso, con los contadores al día
+        """
+        if progress is None:
+            return None
+        # Lo ya sumado en una lectura anterior de la misma instancia no se vuelve a sumar
+        applied = sa_inspect(progress).info.setdefault(_APPLIED_KEY, {})
+        pending = self.pending_for(progress.id)
+        for name in COUNTERS:
+            difference = pending.get(name, 0) - applied.get(name, 0)
+            if difference:
+                set_committed_value(progress, name, (getattr(progress, name) or 0) + difference)
+        applied.clear()
+        applied.update(pending)
+        return progress
+
+    async def flush(self) -> int:
+        """
+        Aplica los incrementos pendientes en la base de datos.
+
+        El diario actual pasa a `<worker>.flushing` y se borra tras el commit; si el
+        volcado falla, los incrementos vuelven a pendientes y al diario nuevo.
+
+        Returns:
+            int: Número de progresos actualizados
+        """
+        if not self._pending or self._flushing:
+            return 0
+        batch, self._pending = self._pending, {}
+        self._flushing = batch
+        flushing_path = self._path("flushing")
+        previous = self._journal
+        # El fichero renombrado conserva el flock: sigue sin poder reclamarse
+        os.replace(self._path("journal"), flushing_path)
+        self._journal = self._open_journal()
+        self._update_depth()
+        try:
+            async with SessionLocal() as db:
+                updated = await ProgressRepository(db).apply_counter_deltas(batch)
+        except BaseException as exc:
+            # Primero al diario nuevo y después se borra el anterior: ante una caída entre
+            # ambos pasos el lote se duplica, pero no se pierde
+            self._write({"id": progress_id, **amounts} for progress_id, amounts in batch.items())
+            for progress_id, amounts in batch.items():
+                _merge(self._pending, progress_id, amounts)
+            self._update_depth()
+            if not isinstance(exc, Exception):
+                raise
+            self.stats["failures"] += 1
+            logger.exception("No se pudieron volcar los contadores de %d progresos; se reintentará", len(batch))
+            return 0
+        finally:
+            self._flushing = {}
+            os.unlink(flushing_path)
+            previous.close()
+        self.stats["flushes"] += 1
+        self.stats["rows_flushed"] += updated
+        self.stats["last_flush_at"] = datetime.utcnow()
+        return updated
+
+
+@event.listens_for(Progress, "load")
+@event.listens_for(Progress, "refresh")
+def _forget_applied(target: Progress, *args: Any) -> None:
+    # Valores recién leídos de la base de datos: aún no incluyen ningún pendiente
+    sa_inspect(target).info.pop(_APPLIED_KEY, None)
+
+
+progress_counter_buffer = ProgressCounterBuffer()
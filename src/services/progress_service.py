@@ -7,6 +7,7 @@ from src.db.repositories.progress_repository import ProgressRepository
 from src.schemas.progress import ProgressCreate, ProgressUpdate
 from src.models.progress import Progress
 from src.core.exceptions import NotFoundException
+from src.services.progress_counter_buffer import progress_counter_buffer
 
 
 class ProgressService:
@@ -36,7 +37,7 @@ class ProgressService:
         Returns:
             El progreso si se encuentra, de lo contrario None.
         """
-        return await self.progress_repo.get_by_id(progress_id)
+        return progress_counter_buffer.overlay(await self.progress_repo.get_by_id(progress_id))
 
     async def get_all_progress(self, skip: int = 0, limit: int = 100) -> List[Progress]:
         """
@@ -49,7 +50,7 @@ class ProgressService:
         Returns:
             Una lista de progresos.
         """
-        return await self.progress_repo.get_all(skip=skip, limit=limit)
+        return [progress_counter_buffer.overlay(progress) for progress in await self.progress_repo.get_all(skip=skip, limit=limit)]
 
     async def create_progress(self, progress_data: ProgressCreate) -> Progress:
         """
@@ -61,27 +62,67 @@ class ProgressService:
         Returns:
             El progreso recién creado.
         """
-        return await self.progress_repo.create(progress_data.model_dump())
+        return await self.progress_repo.create(progress_data.dict())
 
-    async def update_progress(self, progress_id: int, progress_data: ProgressUpdate) -> Optional[Progress]:
+    async def update_progress(
+        self, progress_id: int, progress_data: ProgressUpdate, expected_version: Optional[int] = None
+    ) -> Optional[Progress]:
         """
         Actualiza un progreso existente.
 
         Args:
             progress_id: ID del progreso a actualizar.
             progress_data: Datos para la actualización.
+            expected_version: Versión leída por el cliente; si la fila cambió desde entonces no se escribe.
 
         Returns:
             El progreso actualizado si se encuentra, de lo contrario None.
         
         Raises:
             NotFoundException: Si el progreso no se encuentra.
+            ConflictException: Si el progreso ya no está en `expected_version`.
         """
-        progress = await self.progress_repo.update(progress_id, progress_data.model_dump(exclude_unset=True))
+        progress = await self.progress_repo.update(
+            progress_id, progress_data.dict(exclude_unset=True), expected_version=expected_version
+        )
         if not progress:
             raise NotFoundException("Progreso no encontrado")
         return progress
 
+    async def record_activity(self, progress_id: int, attempts: int = 0, errors: int = 0, hints_used: int = 0) -> Progress:
+        """
+        Suma intentos, errores y pistas usadas a un progreso.
+
+        Con el acumulador de contadores en marcha, los incrementos se suman en memoria y
+        se vuelcan por lotes (ver ProgressCounterBuffer); si no, se aplican directamente en
+        la base de datos. En ambos casos sin leer antes el progreso, así que las
+        actualizaciones simultáneas de una misma partida no se pierden.
+
+        Args:
+            progress_id: ID del progreso.
+            attempts: Intentos a sumar.
+            errors: Errores a sumar.
+            hints_used: Pistas usadas a sumar.
+
+        Returns:
+            El progreso con los contadores actualizados.
+
+        Raises:
+            NotFoundException: Si el progreso no se encuentra.
+        """
+        amounts = {"attempt_count": attempts, "error_count": errors, "hints_used_count": hints_used}
+        if not progress_counter_buffer.running:
+            progress = await self.progress_repo.increment_counters(progress_id, **amounts)
+            if not progress:
+                raise NotFoundException("Progreso no encontrado")
+            return progress
+
+        progress = await self.progress_repo.get_by_id(progress_id)
+        if not progress:
+            raise NotFoundException("Progreso no encontrado")
+        progress_counter_buffer.add(progress_id, **amounts)
+        return progress_counter_buffer.overlay(progress)
+
     async def delete_progress(self, progress_id: int) -> bool:
         """
         Elimina (soft delete) un progreso.
@@ -110,7 +151,7 @@ class ProgressService:
         Returns:
             Una lista de progresos.
         """
-        return await self.progress_repo.get_by_user_id(user_id)
+        return [progress_counter_buffer.overlay(progress) for progress in await self.progress_repo.get_by_user_id(user_id)]
 
     async def get_progress_by_user_and_level(self, user_id: int, level_id: int) -> Optional[Progress]:
         """
@@ -123,7 +164,7 @@ class ProgressService:
         Returns:
             El progreso si se encuentra, de lo contrario None.
         """
-        return await self.progress_repo.get_by_user_and_level(user_id, level_id)
+        return progress_counter_buffer.overlay(await self.progress_repo.get_by_user_and_level(user_id, level_id))
 
     async def get_progress_by_level_id(self, level_id: int) -> List[Progress]:
         """
@@ -135,4 +176,4 @@ class ProgressService:
         Returns:
             Una lista de progresos.
         """
-        return await self.progress_repo.get_by_level_id(level_id)
\ No newline at end of file
+        return [progress_counter_buffer.overlay(progress) for progress in await self.progress_repo.get_by_level_id(level_id)]
\ No newline at end of file
@@ -0,0 +1,105 @@
+# app/services/segment_config_registry.py
+import json
+from typing import Any, Dict, Optional, Tuple, Type
+
+from pydantic import ValidationError
+
+from src.core.exceptions import InvalidDataException
+from src.schemas.segment_config import (
+    EvaluationConfig,
+    ExerciseConfig,
+    InstructionConfig,
+    SegmentConfigBase,
+)
+
+
+class CompiledSegmentConfig:
+    """
+    Resultado de compilar una configuración de segmento.
+
+    `normalized` es la configuración validada con los valores por defecto resueltos y
+    `payload` su representación binaria lista para enviarse tal cual al cliente.
+    """
+
+    __slots__ = ("segment_type", "normalized", "payload")
+
+    def __init__(self, segment_type: str, normalized: Dict[str, Any], payload: bytes):
+        self.segment_type = segment_type
+        self.normalized = normalized
+        self.payload = payload
+
+
+def encode_runtime(config: Optional[Dict[str, Any]]) -> bytes:
+    """
+    Serializa una configuración a su forma de ejecución: JSON UTF-8 compacto y con
+    claves ordenadas, de modo que la misma configuración produce siempre los mismos bytes.
+    """
+    return json.dumps(config, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+class SegmentConfigRegistry:
+    """
+    Registro de esquemas de configuración por tipo de segmento.
+
+    La configuración se valida y compila una sola vez al escribirla (SegmentLevelService);
+    las lecturas sirven los bytes precompilados sin volver a parsear ni validar.
+    """
+
+    def __init__(self):
+        self._schemas: Dict[str, Type[SegmentConfigBase]] = {}
+
+    def register(self, segment_type: str, schema: Type[SegmentConfigBase]) -> None:
+        """
+        Registra el esquema de un tipo de segmento.
+
+        Args:
+            segment_type: Valor del campo `type` de la configuración
+            schema: Modelo Pydantic que valida ese tipo
+        """
+        self._schemas[segment_type] = schema
+
+    @property
+    def types(self) -> Tuple[str, ...]:
+        return tuple(self._schemas)
+
+    def get_schema(self, segment_type: str) -> Optional[Type[SegmentConfigBase]]:
+        return self._schemas.get(segment_type)
+
+    def compile(self, config: Optional[Dict[str, Any]]) -> CompiledSegmentConfig:
+        """
+        Valida una configuración y genera su forma normalizada y precompilada.
+
+        Args:
+            config: Configuración JSON enviada por el cliente
+
+        Returns:
+            CompiledSegmentConfig: Tipo, configuración normalizada y bytes de ejecución
+
+        Raises:
+            InvalidDataException: Si el tipo no está registrado o la configuración no es válida
+        """
+        if not isinstance(config, dict):
+            raise InvalidDataException("La configuración del segmento debe ser un objeto JSON")
+
+        segment_type = config.get("type")
+        schema = self._schemas.get(segment_type)
+        if schema is None:
+            raise InvalidDataException(
+                f"Tipo de segmento no soportado: {segment_type!r}. Tipos válidos: {', '.join(self.types)}"
+            )
+
+        try:
+            normalized = schema.parse_obj(config).dict()
+        except ValidationError as e:
+            errors = "; ".join(
+                f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}" for error in e.errors()
+            )
+            raise InvalidDataException(f"Configuración de segmento inválida ({segment_type}): {errors}")
+
+        return CompiledSegmentConfig(segment_type, normalized, encode_runtime(normalized))
+
+
+segment_config_registry = SegmentConfigRegistry()
+segment_config_registry.register("instruction", InstructionConfig)
+segment_config_registry.register("exercise", ExerciseConfig)
+segment_config_registry.register("evaluation", EvaluationConfig)
@@ -7,6 +7,8 @@ from src.db.repositories.segment_level_repository import SegmentLevelRepository
 from src.schemas.segment_level import SegmentLevelCreate, SegmentLevelUpdate
 from src.models.segment_level import SegmentLevel
 from src.core.exceptions import NotFoundException
+from src.services.catalog_service import catalog_cache
+from src.services.segment_config_registry import segment_config_registry
 
 
 class SegmentLevelService:
@@ -51,17 +53,29 @@ class SegmentLevelService:
         """
         return await self.segment_level_repo.get_all(skip=skip, limit=limit)
 
-    async def create_segment_level(self, segment_level_data: SegmentLevelCreate) -> SegmentLevel:
+    async def create_segment_level(self, level_id: int, segment_level_data: SegmentLevelCreate) -> SegmentLevel:
         """
-        Crea un nuevo segmento de nivel.
+        Crea un nuevo segmento dentro de un nivel.
 
         Args:
+            level_id: ID del nivel al que pertenece el segmento.
             segment_level_data: Datos para la creación del segmento de nivel.
 
         Returns:
             El segmento de nivel recién creado.
-        """
-        return await self.segment_level_repo.create(segment_level_data.model_dump())
+
+        Raises:
+            InvalidDataException: Si la configuración no es válida para su tipo de segmento.
+        """
+        compiled = segment_config_registry.compile(segment_level_data.config)
+        segment_level = await self.segment_level_repo.create({
+            "level_number_id": level_id,
+            "segment_type": compiled.segment_type,
+            "configuration": compiled.normalized,
+            "compiled_configuration": compiled.payload,
+        })
+        catalog_cache.invalidate()
+        return segment_level
 
     async def update_segment_level(self, segment_level_id: int, segment_level_data: SegmentLevelUpdate) -> Optional[SegmentLevel]:
         """
@@ -76,10 +90,20 @@ class SegmentLevelService:
         
         Raises:
             NotFoundException: Si el segmento de nivel no se encuentra.
-        """
-        segment_level = await self.segment_level_repo.update(segment_level_id, segment_level_data.model_dump(exclude_unset=True))
+            InvalidDataException: Si la configuración no es válida para su tipo de segmento.
+        """
+        update_data = segment_level_data.dict(exclude_unset=True)
+        if update_data.get("config") is not None:
+            compiled = segment_config_registry.compile(update_data.pop("config"))
+            update_data.update({
+                "segment_type": compiled.segment_type,
+                "configuration": compiled.normalized,
+                "compiled_configuration": compiled.payload,
+            })
+        segment_level = await self.segment_level_repo.update(segment_level_id, update_data)
         if not segment_level:
             raise NotFoundException("Segmento de nivel no encontrado")
+        catalog_cache.invalidate()
         return segment_level
 
     async def delete_segment_level(self, segment_level_id: int) -> bool:
@@ -98,6 +122,7 @@ class SegmentLevelService:
         success = await self.segment_level_repo.delete(segment_level_id)
         if not success:
             raise NotFoundException("Segmento de nivel no encontrado")
+        catalog_cache.invalidate()
         return success
 
     async def get_segment_levels_by_level_id(self, level_id: int) -> List[SegmentLevel]:
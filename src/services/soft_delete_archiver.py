@@ -0,0 +1,73 @@
+# app/services/soft_delete_archiver.py
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from src.core.config import settings
+from src.core.metrics import SOFT_DELETED_ROWS_ARCHIVED
+from src.db.session import SessionLocal
+from src.db.repositories.base_repository import BaseRepository
+from src.models.archive import ARCHIVED_MODELS
+
+logger = logging.getLogger(__name__)
+
+
+class SoftDeleteArchiver:
+    """
+    Mueve a las tablas `<tabla>_archive` las filas con soft delete antiguo.
+
+    Las filas eliminadas siguen ocupando las tablas principales y sus índices aunque
+    ninguna lectura las devuelva. Pasados `retention_days` desde su borrado se archivan
+    por lotes, recorriendo los modelos de hijos a padres; `BaseRepository.restore`
+    sigue pudiendo recuperarlas.
+    """
+
+    def __init__(self, retention_days: Optional[int] = None, batch_size: Optional[int] = None):
+        """
+        Args:
+            retention_days: Días desde el borrado antes de archivar una fila
+            batch_size: Número de filas movidas por lote (una transacción por lote)
+        """
+        self.retention_days = retention_days or settings.SOFT_DELETE_RETENTION_DAYS
+        self.batch_size = batch_size or settings.SOFT_DELETE_ARCHIVER_BATCH_SIZE
+        self.stats: Dict[str, Any] = {
+            "runs": 0,
+            "rows_archived_total": 0,
+            "last_run_archived": {},
+            "last_run_at": None,
+        }
+
+    async def run_once(self) -> int:
+        """
+        Archiva las filas eliminadas antes del periodo de retención.
+
+        Returns:
+            int: Número de filas archivadas en esta ejecución
+        """
+        deleted_before = datetime.utcnow() - timedelta(days=self.retention_days)
+        archived: Dict[str, int] = {}
+
+        async with SessionLocal() as db:
+            for model in ARCHIVED_MODELS:
+                repo = BaseRepository(db, model)
+                count = 0
+                while True:
+                    moved = await repo.archive_deleted(deleted_before, limit=self.batch_size)
+                    count += moved
+                    if moved < self.batch_size:
+                        break
+                if count:
+                    archived[model.__tablename__] = count
+                    SOFT_DELETED_ROWS_ARCHIVED.labels(model.__tablename__).inc(count)
+
+        total = sum(archived.values())
+        self.stats["runs"] += 1
+        self.stats["rows_archived_total"] += total
+        self.stats["last_run_archived"] = archived
+        self.stats["last_run_at"] = datetime.utcnow()
+        if total:
+            logger.info("Archivadas %d filas eliminadas: %s", total, archived)
+        return total
+
+
+soft_delete_archiver = SoftDeleteArchiver()
@@ -3,6 +3,7 @@ from typing import List, Optional
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.db.session import get_db
+from src.db.batch_loader import batch_loader
 from src.db.repositories.student_repository import StudentRepository
 from src.schemas.student import StudentCreate, StudentUpdate
 from src.models.student import Student
@@ -38,6 +39,21 @@ class StudentService:
         """
         return await self.student_repo.get_by_id(student_id)
 
+    async def get_students_by_ids(self, student_ids: List[int]) -> List[Optional[Student]]:
+        """
+        Obtiene varios estudiantes por ID con una sola consulta por petición.
+
+        Los IDs ya cargados en la misma petición no se vuelven a consultar
+        (ver src/db/batch_loader.py).
+
+        Args:
+            student_ids: IDs a buscar.
+
+        Returns:
+            Una entrada por ID, en el mismo orden, None si no se encuentra.
+        """
+        return await batch_loader(self.student_repo).load_many(student_ids)
+
     async def get_all_students(self, skip: int = 0, limit: int = 100) -> List[Student]:
         """
         Obtiene una lista de todos los estudiantes con paginación.
@@ -0,0 +1,76 @@
+# app/services/sync_session_reaper.py
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from src.core.config import settings
+from src.core.metrics import SYNC_SESSIONS_REAPED
+from src.db.session import SessionLocal
+from src.db.repositories.sync_session_repository import SyncSessionRepository
+
+logger = logging.getLogger(__name__)
+
+IDLE_CLOSED_STATUS = "closed"
+
+
+class SyncSessionReaper:
+    """
+    Cierra automáticamente las sesiones de sincronización abandonadas.
+
+    Una sesión se considera abandonada cuando sigue abierta (`end_time` nulo) y no
+    registra eventos desde hace `idle_minutes`. Se cierra en el instante de su último
+    evento y se guarda la duración calculada.
+    """
+
+    def __init__(self, idle_minutes: Optional[int] = None, batch_size: Optional[int] = None):
+        """
+        Args:
+            idle_minutes: Minutos sin eventos para considerar una sesión inactiva
+            batch_size: Número de sesiones procesadas por lote
+        """
+        self.idle_minutes = idle_minutes or settings.SYNC_SESSION_IDLE_MINUTES
+        self.batch_size = batch_size or settings.SYNC_SESSION_REAPER_BATCH_SIZE
+        self.stats: Dict[str, Any] = {
+            "runs": 0,
+            "sessions_closed_total": 0,
+            "last_run_closed": 0,
+            "last_run_batches": 0,
+            "last_run_at": None,
+        }
+
+    async def run_once(self) -> int:
+        """
+        Recorre por lotes las sesiones inactivas y las cierra.
+
+        Returns:
+            int: Número de sesiones cerradas en esta ejecución
+        """
+        idle_since = datetime.utcnow() - timedelta(minutes=self.idle_minutes)
+        closed = 0
+        batches = 0
+        after_id = 0
+
+        async with SessionLocal() as db:
+            repo = SyncSessionRepository(db)
+            while True:
+                sessions = await repo.get_idle_sessions(idle_since, after_id=after_id, limit=self.batch_size)
+                if not sessions:
+                    break
+                closed += await repo.close_sessions(sessions, status=IDLE_CLOSED_STATUS)
+                batches += 1
+                after_id = sessions[-1]["id"]
+                if len(sessions) < self.batch_size:
+                    break
+
+        self.stats["runs"] += 1
+        self.stats["sessions_closed_total"] += closed
+        SYNC_SESSIONS_REAPED.inc(closed)
+        self.stats["last_run_closed"] = closed
+        self.stats["last_run_batches"] = batches
+        self.stats["last_run_at"] = datetime.utcnow()
+        if closed:
+            logger.info("Cerradas %d sesiones de sincronización inactivas en %d lotes", closed, batches)
+        return closed
+
+
+sync_session_reaper = SyncSessionReaper()
@@ -3,6 +3,7 @@ from typing import List, Optional
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.db.session import get_db
+from src.db.batch_loader import batch_loader
 from src.db.repositories.sync_session_repository import SyncSessionRepository
 from src.schemas.sync_session import SyncSessionCreate, SyncSessionUpdate
 from src.models.sync_session import SyncSession
@@ -38,6 +39,21 @@ class SyncSessionService:
         """
         return await self.sync_session_repo.get_by_id(sync_session_id)
 
+    async def get_sync_sessions_by_ids(self, sync_session_ids: List[int]) -> List[Optional[SyncSession]]:
+        """
+        Obtiene varios sesiones de sincronización por ID con una sola consulta por petición.
+
+        Los IDs ya cargados en la misma petición no se vuelven a consultar
+        (ver src/db/batch_loader.py).
+
+        Args:
+            sync_session_ids: IDs a buscar.
+
+        Returns:
+            Una entrada por ID, en el mismo orden, None si no se encuentra.
+        """
+        return await batch_loader(self.sync_session_repo).load_many(sync_session_ids)
+
     async def get_all_sync_sessions(self, skip: int = 0, limit: int = 100) -> List[SyncSession]:
         """
         Obtiene una lista de todas las sesiones de sincronización con paginación.
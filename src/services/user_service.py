@@ -1,5 +1,6 @@
 # app/services/user_service.py
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.db.session import get_db
@@ -9,6 +10,9 @@ from src.models.user import User
 from src.core.exceptions import NotFoundException, InvalidCredentialsException
 from src.core.security import verify_password
 
+# Las respuestas de usuario incluyen el rol: se carga en la misma consulta
+USER_RESPONSE_LOAD = "with_role"
+
 
 class UserService:
     """
@@ -37,7 +41,7 @@ class UserService:
         Returns:
             El usuario si se encuentra, de lo contrario None.
         """
-        return await self.user_repo.get_by_id(user_id)
+        return await self.user_repo.get_by_id(user_id, load=USER_RESPONSE_LOAD)
 
     async def get_all_users(self, skip: int = 0, limit: int = 100) -> List[User]:
         """
@@ -50,7 +54,16 @@ class UserService:
         Returns:
             Una lista de usuarios.
         """
-        return await self.user_repo.get_all(skip=skip, limit=limit)
+        return await self.user_repo.get_all(skip=skip, limit=limit, load=USER_RESPONSE_LOAD)
+
+    async def get_users_stamp(self) -> Tuple[Optional[datetime], int]:
+        """
+        Obtiene la marca de versión del listado de usuarios (última modificación y total).
+
+        Returns:
+            Una tupla con la fecha de la última modificación y el número de usuarios.
+        """
+        return await self.user_repo.get_collection_stamp()
 
     async def create_user(self, user_data: UserCreate) -> User:
         """
@@ -64,24 +77,29 @@ class UserService:
         """
         return await self.user_repo.create(user_data)
 
-    async def update_user(self, user_id: int, user_data: UserUpdate) -> Optional[User]:
+    async def update_user(
+        self, user_id: int, user_data: UserUpdate, unchanged_from: Optional[User] = None
+    ) -> Optional[User]:
         """
         Actualiza un usuario existente.
 
         Args:
             user_id: ID del usuario a actualizar.
             user_data: Datos para la actualización.
+            unchanged_from: Estado comprobado con If-Match; si se indica, solo se actualiza
+                si el usuario no ha cambiado desde entonces.
 
         Returns:
             El usuario actualizado si se encuentra, de lo contrario None.
         
         Raises:
             NotFoundException: Si el usuario no se encuentra.
+            PreconditionFailedException: Si el usuario cambió desde `unchanged_from`.
         """
-        user = await self.user_repo.update(user_id, user_data)
+        user = await self.user_repo.update(user_id, user_data, unchanged_from=unchanged_from)
         if not user:
             raise NotFoundException("Usuario no encontrado")
-        return user
+        return await self.user_repo.get_by_id(user_id, load=USER_RESPONSE_LOAD)
 
     async def delete_user(self, user_id: int) -> bool:
         """
@@ -111,7 +129,7 @@ class UserService:
         Returns:
             El usuario si se encuentra, de lo contrario None.
         """
-        return await self.user_repo.get_by_email(email)
+        return await self.user_repo.get_by_email(email, load=USER_RESPONSE_LOAD)
 
     async def change_user_password(self, user_id: int, current_password: str, new_password: str) -> bool:
         """
@@ -0,0 +1,134 @@
+# app/services/warmup.py
+"""
+Calentamiento de cada worker antes de aceptar tráfico.
+
+Las primeras peticiones tras un despliegue pagan trabajo que solo se hace una vez
+por proceso: configuración de mappers, generación del esquema OpenAPI, importación
+de jose/passlib, compilación de las sentencias SQL más usadas, primeras conexiones
+y cachés vacías. `warm_up` lo hace durante el startup, y `warmup_state` indica a
+/ready cuándo el worker está listo.
+"""
+import logging
+import time
+from contextlib import AsyncExitStack
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from fastapi import FastAPI
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import configure_mappers
+
+from src.core import security
+from src.core.config import settings
+from src.core.permissions import role_registry
+from src.db.repositories.user_repository import UserRepository
+from src.db.session import SessionLocal
+from src.services.catalog_service import catalog_cache
+from src.services.level_bundle_service import level_bundle_cache
+
+logger = logging.getLogger(__name__)
+
+
+class WarmupState:
+    """Estado del calentamiento del worker, expuesto por el endpoint de readiness."""
+
+    def __init__(self):
+        self.ready = False
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.phases_ms: Dict[str, float] = {}
+        self.errors: Dict[str, str] = {}
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "status": "ready" if self.ready else "starting",
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "phases_ms": self.phases_ms,
+            "errors": self.errors,
+        }
+
+
+warmup_state = WarmupState()
+
+
+async def _warm_mappers(app: FastAPI, engine: AsyncEngine) -> None:
+    configure_mappers()
+
+
+async def _warm_schemas(app: FastAPI, engine: AsyncEngine) -> None:
+    # Genera y guarda el esquema OpenAPI (incluye el JSON schema de todos los
+    # modelos de petición y respuesta), que FastAPI construye en la primera visita a /docs
+    app.openapi()
+
+
+async def _warm_pool(app: FastAPI, engine: AsyncEngine) -> None:
+    # Conexiones abiertas a la vez para que el pool conserve las N al devolverlas
+    # (con NullPool, el caso de SQLite en fichero, solo comprueba la conectividad)
+    async with AsyncExitStack() as stack:
+        for _ in range(max(settings.WARMUP_POOL_CONNECTIONS, 1)):
+            conn = await stack.enter_async_context(engine.connect())
+            await conn.execute(text("SELECT 1"))
+
+
+async def _warm_auth(app: FastAPI, engine: AsyncEngine) -> None:
+    # Importa jose y passlib/bcrypt y compila la consulta del usuario autenticado
+    security._pwd_context()
+    security.decode_access_token("warmup")
+    async with SessionLocal() as db:
+        await UserRepository(db).get_by_username("")
+
+
+async def _warm_caches(app: FastAPI, engine: AsyncEngine) -> None:
+    async with SessionLocal() as db:
+        await role_registry.get_all(db)
+        snapshot = await catalog_cache.get(db)
+        limit = min(settings.WARMUP_LEVEL_BUNDLES, level_bundle_cache.max_size)
+        for level_id in list(snapshot.levels_by_id)[:limit]:
+            await level_bundle_cache.get(db, level_id)
+
+
+PHASES: Dict[str, Callable[[FastAPI, AsyncEngine], Awaitable[None]]] = {
+    "mappers": _warm_mappers,
+    "schemas": _warm_schemas,
+    "pool": _warm_pool,
+    "auth": _warm_auth,
+    "caches": _warm_caches,
+}
+
+
+async def warm_up(app: FastAPI, engine: AsyncEngine, state: Optional[WarmupState] = None) -> WarmupState:
+    """
+    Ejecuta las fases de calentamiento y marca el worker como listo.
+
+    Una fase que falla se registra y no impide el arranque: solo se pierde su efecto
+    y la primera petición afectada paga el coste como antes.
+
+    Args:
+        app: Aplicación FastAPI con todas las rutas registradas
+        engine: Engine de la aplicación
+        state: Estado a actualizar (por defecto `warmup_state`)
+
+    Returns:
+        WarmupState: Estado con la duración y los errores de cada fase
+    """
+    state = state or warmup_state
+    state.ready = False
+    state.started_at = datetime.utcnow()
+    state.phases_ms.clear()
+    state.errors.clear()
+
+    if settings.WARMUP_ENABLED:
+        for name, phase in PHASES.items():
+            started = time.perf_counter()
+            try:
+                await phase(app, engine)
+            except Exception as exc:
+                logger.exception("Fase de calentamiento %s fallida", name)
+                state.errors[name] = repr(exc)
+            state.phases_ms[name] = round((time.perf_counter() - started) * 1000, 1)
+
+    state.finished_at = datetime.utcnow()
+    state.ready = True
+    return state
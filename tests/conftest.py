@@ -0,0 +1,8 @@
+import os
+
+# La configuración se lee al importar src: valores mínimos para las pruebas
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("DATABASE_ECHO", "false")
+os.environ.setdefault("SCHEDULER_ENABLED", "false")
+os.environ.setdefault("LOOP_WATCHDOG_ENABLED", "false")
@@ -0,0 +1,102 @@
+import asyncio
+
+from sqlalchemy import event, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.core.config import settings
+from src.db.base import Base
+from src.db.batch_loader import batch_loader
+from src.db.repositories.game_repository import GameRepository
+from src.models.game import Game
+from src.models.tenant import Tenant
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def _sessions(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'batch-loader.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    async with sessions() as db:
+        db.add(Tenant(id=1, name="Colegio 1"))
+        db.add_all([Game(id=id, tenant_id=1, title=f"Juego {id}") for id in range(1, 6)])
+        await db.commit()
+    return engine, sessions
+
+
+def _record_selects(engine) -> list:
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    return statements
+
+
+def test_loads_in_the_same_turn_share_one_query(tmp_path):
+    async def scenario():
+        engine, sessions = await _sessions(tmp_path)
+        selects = _record_selects(engine)
+        try:
+            async with sessions() as db:
+                loader = batch_loader(GameRepository(db))
+                assert batch_loader(GameRepository(db)) is loader
+
+                games = await loader.load_many([3, 1, 99, 3])
+                assert [game and game.id for game in games] == [3, 1, None, 3]
+                assert len(selects) == 1
+
+                first, second = await asyncio.gather(loader.load(4), loader.load(5))
+                assert (first.id, second.id) == (4, 5)
+                assert len(selects) == 2
+                assert loader.stats["batches"] == 2
+        finally:
+            await engine.dispose()
+
+    run(scenario())
+
+
+def test_results_are_memoized_until_commit(tmp_path):
+    async def scenario():
+        engine, sessions = await _sessions(tmp_path)
+        selects = _record_selects(engine)
+        try:
+            async with sessions() as db:
+                loader = batch_loader(GameRepository(db))
+                game = await loader.load(1)
+                assert await loader.load(1) is game
+                assert loader.stats["memoized"] == 1
+                assert len(selects) == 1
+
+                await db.execute(update(Game).where(Game.id == 1).values(title="Renombrado"))
+                await db.commit()
+                # Tras confirmar, la carga vuelve a la base de datos
+                await loader.load(1)
+                assert len(selects) == 2
+                assert loader.stats["memoized"] == 1
+        finally:
+            await engine.dispose()
+
+    run(scenario())
+
+
+def test_large_batches_are_split(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "BATCH_LOADER_MAX_BATCH_SIZE", 2)
+
+    async def scenario():
+        engine, sessions = await _sessions(tmp_path)
+        selects = _record_selects(engine)
+        try:
+            async with sessions() as db:
+                games = await batch_loader(GameRepository(db)).load_many([1, 2, 3, 4, 5])
+            assert [game.id for game in games] == [1, 2, 3, 4, 5]
+            assert len(selects) == 3
+        finally:
+            await engine.dispose()
+
+    run(scenario())
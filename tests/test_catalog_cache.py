@@ -0,0 +1,102 @@
+import asyncio
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.db.base import Base
+from src.models.game import Game
+from src.models.level import Level
+from src.models.tenant import Tenant
+from src.services.catalog_service import CatalogCache
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def _sessions(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'catalog.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    async with sessions() as db:
+        db.add(Tenant(id=1, name="Colegio 1"))
+        db.add(Game(id=1, tenant_id=1, title="Juego"))
+        db.add(Level(id=1, tenant_id=1, game_id=1, level_number=1, title="Nivel 1"))
+        await db.commit()
+    return engine, sessions
+
+
+async def _rename_game(sessions, title):
+    async with sessions() as db:
+        await db.execute(update(Game).where(Game.id == 1).values(title=title))
+        await db.commit()
+
+
+def test_snapshot_is_reused_until_invalidated(tmp_path):
+    async def scenario():
+        engine, sessions = await _sessions(tmp_path)
+        cache = CatalogCache(ttl_seconds=300)
+        try:
+            async with sessions() as db:
+                first = await cache.get(db)
+                assert await cache.get(db) is first
+                assert (cache.stats["hits"], cache.stats["rebuilds"]) == (1, 1)
+
+                # Escritura sin cambios de contenido: nueva instantánea con el mismo ETag
+                cache.invalidate()
+                rebuilt = await cache.get(db)
+                assert rebuilt is not first
+                assert rebuilt.version == cache.version
+                assert rebuilt.etag == first.etag
+
+            await _rename_game(sessions, "Renombrado")
+            cache.invalidate()
+            async with sessions() as db:
+                renamed = await cache.get(db)
+            assert renamed.games_by_id[1]["title"] == "Renombrado"
+            assert renamed.etag != first.etag
+        finally:
+            await engine.dispose()
+
+    run(scenario())
+
+
+def test_snapshot_expires_after_ttl(tmp_path):
+    async def scenario():
+        engine, sessions = await _sessions(tmp_path)
+        cache = CatalogCache(ttl_seconds=60)
+        try:
+            async with sessions() as db:
+                first = await cache.get(db)
+
+            # Escritura de otro worker: la versión local no cambia
+            await _rename_game(sessions, "Otro worker")
+            async with sessions() as db:
+                assert await cache.get(db) is first
+                first.loaded_at -= cache.ttl_seconds + 1
+                refreshed = await cache.get(db)
+            assert refreshed.games_by_id[1]["title"] == "Otro worker"
+        finally:
+            await engine.dispose()
+
+    run(scenario())
+
+
+def test_concurrent_misses_share_one_rebuild(tmp_path):
+    async def scenario():
+        engine, sessions = await _sessions(tmp_path)
+        cache = CatalogCache(ttl_seconds=300)
+        try:
+            async def request():
+                async with sessions() as db:
+                    return await cache.get(db)
+
+            snapshots = await asyncio.gather(*(request() for _ in range(5)))
+            assert all(snapshot is snapshots[0] for snapshot in snapshots)
+            assert cache.stats["rebuilds"] == 1
+            assert cache.get_stats()["rebuilds_coalesced"] == 4
+        finally:
+            await engine.dispose()
+
+    run(scenario())
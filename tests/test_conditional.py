@@ -0,0 +1,79 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.core.conditional import resource_etag
+from src.core.exceptions import PreconditionFailedException
+from src.db.base import Base
+from src.db.repositories.game_repository import GameRepository
+from src.models.game import Game
+from src.models.tenant import Tenant
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def _sessions(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'conditional.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    async with sessions() as db:
+        db.add(Tenant(id=1, name="Colegio 1"))
+        db.add(Game(id=1, tenant_id=1, title="Original"))
+        await db.commit()
+    return engine, sessions
+
+
+def test_etag_depends_on_resource_type():
+    stamp = datetime(2024, 1, 1, 12, 0, 0)
+    game = {"id": 1, "updated_at": stamp}
+    user = {"id": 1, "updated_at": stamp}
+    assert resource_etag("games", game) != resource_etag("users", user)
+    assert resource_etag("games", game) == resource_etag("games", dict(game))
+
+
+def test_conditional_update_rejects_concurrent_write(tmp_path):
+    async def scenario():
+        engine, sessions = await _sessions(tmp_path)
+        try:
+            async with sessions() as db:
+                current = await GameRepository(db).get_by_id(1)
+
+                # Otra petición escribe entre la comprobación de If-Match y el UPDATE
+                async with sessions() as other:
+                    await GameRepository(other).update(1, {"title": "Concurrente"})
+
+                with pytest.raises(PreconditionFailedException):
+                    await GameRepository(db).update(1, {"title": "Perdida"}, unchanged_from=current)
+
+            async with sessions() as db:
+                game = await GameRepository(db).get_by_id(1)
+                assert game.title == "Concurrente"
+                updated = await GameRepository(db).update(1, {"title": "Nueva"}, unchanged_from=game)
+                assert updated.title == "Nueva"
+        finally:
+            await engine.dispose()
+
+    run(scenario())
+
+
+def test_conditional_update_matches_second_resolution_timestamps(tmp_path):
+    async def scenario():
+        engine, sessions = await _sessions(tmp_path)
+        try:
+            # Marca escrita por func.now() en SQLite: texto sin fracción de segundo
+            async with engine.begin() as conn:
+                await conn.execute(text("UPDATE games SET updated_at = '2024-01-01 12:00:00' WHERE id = 1"))
+            async with sessions() as db:
+                current = await GameRepository(db).get_by_id(1)
+                updated = await GameRepository(db).update(1, {"title": "Nueva"}, unchanged_from=current)
+                assert updated.title == "Nueva"
+        finally:
+            await engine.dispose()
+
+    run(scenario())
@@ -0,0 +1,96 @@
+import asyncio
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.db.base import Base
+from src.models.game import Game
+from src.models.level import Level
+from src.models.segment_level import SegmentLevel
+from src.models.tenant import Tenant
+from src.services.catalog_service import CatalogCache
+from src.services.level_bundle_service import LevelBundleCache
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def _sessions(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'bundle.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    async with sessions() as db:
+        db.add(Tenant(id=1, name="Colegio 1"))
+        db.add_all([Game(id=1, tenant_id=1, title="Juego"), Game(id=2, tenant_id=1, title="Otro")])
+        db.add(Level(id=1, tenant_id=1, game_id=1, level_number=1, title="Nivel 1"))
+        db.add(SegmentLevel(id=1, tenant_id=1, level_number_id=1, segment_type="code", configuration={"steps": 3}))
+        await db.commit()
+    return engine, sessions
+
+
+async def _edit_segment(sessions, configuration):
+    async with sessions() as db:
+        await db.execute(
+            update(SegmentLevel)
+            .where(SegmentLevel.id == 1)
+            .values(configuration=configuration, compiled_configuration=None)
+        )
+        await db.commit()
+
+
+def test_bundle_etag_depends_only_on_content(tmp_path):
+    async def scenario():
+        engine, sessions = await _sessions(tmp_path)
+        catalog = CatalogCache(ttl_seconds=300)
+        cache = LevelBundleCache(catalog)
+        try:
+            async with sessions() as db:
+                first = await cache.get(db, 1)
+                assert b"catalog_version" not in first.payload
+                assert first.headers()["X-Catalog-Version"] == str(catalog.version)
+
+                # Escritura ajena al nivel (otro juego): se reconstruye con el mismo ETag
+                catalog.invalidate()
+                rebuilt = await cache.get(db, 1)
+                assert rebuilt is not first
+                assert rebuilt.etag == first.etag
+
+                # Otro worker tendría la misma versión de contenido con otro contador
+                other_worker = LevelBundleCache(CatalogCache(ttl_seconds=300))
+                assert (await other_worker.get(db, 1)).etag == first.etag
+
+            await _edit_segment(sessions, {"steps": 5})
+            catalog.invalidate()
+            async with sessions() as db:
+                edited = await cache.get(db, 1)
+            assert edited.etag != first.etag
+        finally:
+            await engine.dispose()
+
+    run(scenario())
+
+
+def test_bundle_expires_after_catalog_ttl(tmp_path):
+    async def scenario():
+        engine, sessions = await _sessions(tmp_path)
+        catalog = CatalogCache(ttl_seconds=60)
+        cache = LevelBundleCache(catalog)
+        try:
+            async with sessions() as db:
+                first = await cache.get(db, 1)
+
+            # Cambio hecho en otro worker: la versión local del catálogo no cambia
+            await _edit_segment(sessions, {"steps": 8})
+            async with sessions() as db:
+                assert await cache.get(db, 1) is first
+                first.loaded_at -= catalog.ttl_seconds + 1
+                refreshed = await cache.get(db, 1)
+            assert refreshed is not first
+            assert refreshed.etag != first.etag
+            assert cache.stats["builds"] == 2
+        finally:
+            await engine.dispose()
+
+    run(scenario())
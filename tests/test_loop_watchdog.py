@@ -0,0 +1,56 @@
+import asyncio
+import gc
+import time
+import weakref
+
+from src.core.loop_watchdog import LoopWatchdog
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_blocks_of_background_tasks_are_released():
+    async def scenario():
+        watchdog = LoopWatchdog(interval=0.01, threshold=0.05)
+        await watchdog.start()
+        try:
+            async def background():
+                # Código bloqueante en una tarea que ninguna petición consultará
+                time.sleep(0.2)
+
+            task = asyncio.create_task(background(), name="background")
+            await task
+            assert dict(watchdog._task_blocks)[task] >= 0.05
+
+            released = weakref.ref(task)
+            del task
+            # El callback que reanuda esta corutina aún referencia la tarea terminada
+            await asyncio.sleep(0)
+            gc.collect()
+            assert released() is None
+            assert "background" not in {task.get_name() for task in list(watchdog._task_blocks.keys())}
+        finally:
+            await watchdog.stop()
+
+    run(scenario())
+
+
+def test_request_task_reads_its_block_once():
+    async def scenario():
+        watchdog = LoopWatchdog(interval=0.01, threshold=0.05)
+        await watchdog.start()
+        try:
+            async def request():
+                time.sleep(0.2)
+                await asyncio.sleep(0)
+                task = asyncio.current_task()
+                return watchdog.pop_task_block(task), watchdog.pop_task_block(task)
+
+            first, second = await asyncio.create_task(request())
+            assert first >= 0.05
+            assert second == 0.0
+        finally:
+            await watchdog.stop()
+
+    run(scenario())
@@ -0,0 +1,36 @@
+import shutil
+from pathlib import Path
+
+import pytest
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine
+
+import src.models.archive  # noqa: F401  (registra las tablas de archivo en Base.metadata)
+from src.db.base import Base
+from src.db.bootstrap import _upgrade
+
+LEGACY_DATABASE = Path(__file__).resolve().parent.parent / "test.db"
+
+
+def _drift(path) -> list:
+    engine = create_engine(f"sqlite:///{path}")
+    try:
+        with engine.begin() as conn:
+            _upgrade(conn)
+        with engine.connect() as conn:
+            diff = compare_metadata(MigrationContext.configure(conn), Base.metadata)
+    finally:
+        engine.dispose()
+    # SQLite no admite añadir claves foráneas sin recrear la tabla (migración 0003)
+    return [entry for entry in diff if entry[0] != "add_fk"]
+
+
+def test_migrations_match_models(tmp_path):
+    assert _drift(tmp_path / "fresh.db") == []
+
+
+@pytest.mark.skipif(not LEGACY_DATABASE.exists(), reason="sin base de datos anterior a Alembic")
+def test_legacy_database_migrates_to_models(tmp_path):
+    shutil.copy(LEGACY_DATABASE, tmp_path / "legacy.db")
+    assert _drift(tmp_path / "legacy.db") == []
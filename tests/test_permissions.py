@@ -0,0 +1,79 @@
+import asyncio
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.api.v1.routers import include_api_routers
+from src.core.permissions import ROLE_PERMISSIONS, role_registry
+from src.core.security import create_access_token
+from src.db.base import Base
+from src.models.role import Role
+
+ROLE_IDS = {"admin": 1, "professor": 2, "student": 3}
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def _load_roles(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'roles.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    try:
+        async with async_sessionmaker(engine)() as db:
+            db.add_all([
+                Role(id=role_id, role_name=name, permissions=int(ROLE_PERMISSIONS[name]))
+                for name, role_id in ROLE_IDS.items()
+            ])
+            await db.commit()
+            await role_registry.get_all(db)
+    finally:
+        await engine.dispose()
+
+
+def _headers(role: str) -> dict:
+    token = create_access_token({"sub": role, "rid": ROLE_IDS[role], "tid": 1})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_users_routes_require_users_permissions(tmp_path):
+    async def scenario():
+        await _load_roles(tmp_path)
+        app = FastAPI()
+        include_api_routers(app, modules=["user", "sync_event", "lms_credential"])
+        try:
+            async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+                student = _headers("student")
+                assert (await client.get("/api/v1/users/", headers=student)).status_code == 403
+                assert (await client.get("/api/v1/users/1", headers=student)).status_code == 403
+                assert (await client.delete("/api/v1/users/1", headers=student)).status_code == 403
+                # Los profesores consultan usuarios, pero no los modifican
+                assert (await client.delete("/api/v1/users/1", headers=_headers("professor"))).status_code == 403
+                assert (await client.get("/api/v1/users/")).status_code == 401
+
+                assert (await client.get("/api/v1/sync-events/1", headers=student)).status_code == 200
+                assert (await client.get("/api/v1/lms/credentials/1", headers=student)).status_code == 403
+        finally:
+            role_registry.invalidate()
+
+    run(scenario())
+
+
+def test_reaper_stats_require_admin(tmp_path):
+    async def scenario():
+        await _load_roles(tmp_path)
+        app = FastAPI()
+        include_api_routers(app, modules=["sync_session"])
+        url = "/api/v1/sync-sessions/reaper/stats"
+        try:
+            async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+                # El informe incluye el owner_id del scheduler (host y pid)
+                assert (await client.get(url)).status_code == 401
+                assert (await client.get(url, headers=_headers("student"))).status_code == 403
+                assert (await client.get(url, headers=_headers("admin"))).status_code == 200
+        finally:
+            role_registry.invalidate()
+
+    run(scenario())
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.core.exceptions import ConflictException
+from src.db.base import Base
+from src.db.repositories.progress_repository import ProgressRepository
+from src.models.progress import Progress
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def _sessions(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'progress.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    async with sessions() as db:
+        db.add(Progress(id=1, segment_level_id=1, attempt_count=0, efficiency_rating=0))
+        await db.commit()
+    return engine, sessions
+
+
+def test_update_returns_current_version_for_instance_in_identity_map(tmp_path):
+    async def scenario():
+        engine, sessions = await _sessions(tmp_path)
+        try:
+            async with sessions() as db:
+                repo = ProgressRepository(db)
+                loaded = await repo.get_by_id(1)
+                assert loaded.version == 1
+
+                # Otra petición incrementa el progreso mientras este sigue en la sesión
+                async with sessions() as other:
+                    await ProgressRepository(other).increment_counters(1, attempt_count=1)
+
+                updated = await repo.update(1, {"efficiency_rating": 3}, expected_version=2)
+                assert updated is loaded
+                assert updated.version == 3
+                assert updated.efficiency_rating == 3
+                assert updated.attempt_count == 1
+
+                # La versión devuelta sirve como siguiente `expected_version`...
+                again = await repo.update(1, {"efficiency_rating": 4}, expected_version=updated.version)
+                assert again.version == 4
+
+                # ...y un flush de la unidad de trabajo no ve la instancia como obsoleta
+                again.objectives_completed = 2
+                await db.commit()
+                assert again.version == 5
+
+                with pytest.raises(ConflictException):
+                    await repo.update(1, {"efficiency_rating": 5}, expected_version=4)
+        finally:
+            await engine.dispose()
+
+    run(scenario())
+
+
+def test_increment_counters_is_atomic_across_sessions(tmp_path):
+    async def scenario():
+        engine, sessions = await _sessions(tmp_path)
+        try:
+            async def increment():
+                async with sessions() as db:
+                    await ProgressRepository(db).increment_counters(1, attempt_count=1, error_count=2)
+
+            await asyncio.gather(*(increment() for _ in range(10)))
+            async with sessions() as db:
+                progress = await ProgressRepository(db).get_by_id(1)
+                assert (progress.attempt_count, progress.error_count, progress.version) == (10, 20, 11)
+        finally:
+            await engine.dispose()
+
+    run(scenario())
@@ -0,0 +1,28 @@
+import asyncio
+import json
+
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from benchmarks.dataset import resolve_scale, seed_dataset
+from benchmarks.query_plans import capture, check, snapshot_path
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_repository_plans_match_snapshot(tmp_path):
+    """Mismo criterio que `python -m benchmarks.query_plans --check` (escala y semilla por defecto)."""
+    async def scenario():
+        database_url = f"sqlite+aiosqlite:///{tmp_path / 'query-plans.db'}"
+        await seed_dataset(database_url, resolve_scale("small"), seed=42)
+        engine = create_async_engine(database_url)
+        try:
+            return await capture(engine)
+        finally:
+            await engine.dispose()
+
+    results = run(scenario())
+    with open(snapshot_path("sqlite"), encoding="utf-8") as fh:
+        problems = check(results, json.load(fh))
+    assert not problems, "\n".join(problems)
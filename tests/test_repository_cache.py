@@ -0,0 +1,115 @@
+import asyncio
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.core.tenancy import tenant_scope
+from src.db.base import Base
+from src.db.repositories.game_repository import GameRepository
+from src.db.repository_cache import cache_for, configure_backend
+from src.models.game import Game
+from src.models.tenant import Tenant
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def _sessions(tmp_path):
+    # Cachés nuevas: las de otras pruebas podrían tener los mismos IDs
+    configure_backend(None)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'repository-cache.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    async with sessions() as db:
+        db.add_all([Tenant(id=1, name="Colegio 1"), Tenant(id=2, name="Colegio 2")])
+        db.add(Game(id=1, tenant_id=1, title="Original"))
+        await db.commit()
+    return engine, sessions
+
+
+def _record_statements(engine) -> list:
+    statements = []
+    event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+def test_get_by_id_is_served_from_cache(tmp_path):
+    async def scenario():
+        engine, sessions = await _sessions(tmp_path)
+        statements = _record_statements(engine)
+        try:
+            async with sessions() as db:
+                assert (await GameRepository(db).get_by_id(1)).title == "Original"
+            loaded = len(statements)
+
+            async with sessions() as db:
+                game = await GameRepository(db).get_by_id(1)
+                assert game.title == "Original"
+                assert game in db
+                # Inexistente: se cachea la ausencia
+                assert await GameRepository(db).get_by_id(99) is None
+                assert await GameRepository(db).get_by_id(99) is None
+            assert len(statements) == loaded + 1
+            assert cache_for("games").stats["negative_hits"] == 1
+
+            # Otro tenant no ve la fila cacheada
+            with tenant_scope(2):
+                async with sessions() as db:
+                    assert await GameRepository(db).get_by_id(1) is None
+        finally:
+            await engine.dispose()
+
+    run(scenario())
+
+
+def test_writes_invalidate_after_commit(tmp_path):
+    async def scenario():
+        engine, sessions = await _sessions(tmp_path)
+        try:
+            async with sessions() as db:
+                await GameRepository(db).get_by_id(1)
+
+            # Escritura del repositorio
+            async with sessions() as db:
+                await GameRepository(db).update(1, {"title": "Repositorio"})
+            async with sessions() as db:
+                assert (await GameRepository(db).get_by_id(1)).title == "Repositorio"
+
+            # Escritura de la unidad de trabajo (instancia modificada en la sesión)
+            async with sessions() as db:
+                game = await db.get(Game, 1)
+                game.title = "Unidad de trabajo"
+                await db.commit()
+            async with sessions() as db:
+                assert (await GameRepository(db).get_by_id(1)).title == "Unidad de trabajo"
+
+            # Borrado lógico: la fila cacheada deja de servirse sin include_deleted
+            async with sessions() as db:
+                assert await GameRepository(db).delete(1)
+            async with sessions() as db:
+                assert await GameRepository(db).get_by_id(1) is None
+                assert (await GameRepository(db).get_by_id(1, include_deleted=True)).deleted_at is not None
+        finally:
+            await engine.dispose()
+
+    run(scenario())
+
+
+def test_concurrent_misses_share_one_query(tmp_path):
+    async def scenario():
+        engine, sessions = await _sessions(tmp_path)
+        statements = _record_statements(engine)
+        try:
+            async def request():
+                async with sessions() as db:
+                    return (await GameRepository(db).get_by_id(1)).title
+
+            assert await asyncio.gather(*(request() for _ in range(5))) == ["Original"] * 5
+            assert len(statements) == 1
+            assert cache_for("games").stats["coalesced"] == 4
+        finally:
+            await engine.dispose()
+
+    run(scenario())
@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from src.core.singleflight import SingleFlight
+from src.core.tenancy import tenant_scope
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class _Source:
+    """Función lenta que cuenta sus ejecuciones."""
+
+    def __init__(self):
+        self.calls = []
+        self.release = asyncio.Event()
+
+    async def fetch(self, item_id):
+        self.calls.append(item_id)
+        await self.release.wait()
+        return {"id": item_id, "call": len(self.calls)}
+
+
+def test_concurrent_identical_calls_execute_once():
+    async def scenario():
+        group = SingleFlight("test")
+        source = _Source()
+        pending = [asyncio.ensure_future(group.do(source.fetch, 1)) for _ in range(5)]
+        other = asyncio.ensure_future(group.do(source.fetch, 2))
+        await asyncio.sleep(0)
+        assert group.get_stats()["in_flight"] == 2
+
+        source.release.set()
+        results = await asyncio.gather(*pending)
+        assert all(result is results[0] for result in results)
+        assert (await other)["id"] == 2
+        assert source.calls == [1, 2]
+        assert group.stats == {"executions": 2, "coalesced": 4}
+
+        # No es una caché: terminada la llamada, la siguiente vuelve a ejecutarse
+        await group.do(source.fetch, 1)
+        assert source.calls == [1, 2, 1]
+        assert group.get_stats()["in_flight"] == 0
+
+    run(scenario())
+
+
+def test_tenants_never_share_results():
+    async def scenario():
+        group = SingleFlight("test")
+        source = _Source()
+
+        async def call(tenant_id):
+            with tenant_scope(tenant_id):
+                return await group.do(source.fetch, 1)
+
+        pending = [asyncio.ensure_future(call(tenant_id)) for tenant_id in (1, 2, 1)]
+        await asyncio.sleep(0)
+        source.release.set()
+        first, second, third = await asyncio.gather(*pending)
+        assert first is third
+        assert second is not first
+        assert group.stats == {"executions": 2, "coalesced": 1}
+
+    run(scenario())
+
+
+def test_exception_reaches_every_caller():
+    async def scenario():
+        group = SingleFlight("test")
+        executions = []
+
+        async def failing():
+            executions.append(1)
+            await asyncio.sleep(0)
+            raise ValueError("sin conexión")
+
+        results = await asyncio.gather(*(group.do(failing) for _ in range(3)), return_exceptions=True)
+        assert len(executions) == 1
+        assert all(isinstance(result, ValueError) for result in results)
+
+    run(scenario())
+
+
+def test_cancelled_leader_does_not_fail_followers():
+    async def scenario():
+        group = SingleFlight("test")
+        source = _Source()
+        leader = asyncio.ensure_future(group.do(source.fetch, 1))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(group.do(source.fetch, 1))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        source.release.set()
+        # La llamada agrupada se repite por su cuenta
+        assert (await follower)["id"] == 1
+        assert source.calls == [1, 1]
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+    run(scenario())
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.core.exceptions import TenantRequiredException
+from src.core.tenancy import tenant_scope
+from src.db.base import Base
+from src.db.tenancy import ALL_TENANTS
+from src.models.tenant import Tenant
+from src.models.user import User
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def _sessions(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'tenancy.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    async with sessions() as db:
+        db.add_all([Tenant(id=1, name="Colegio 1"), Tenant(id=2, name="Colegio 2")])
+        for tenant_id in (1, 2):
+            db.add(User(
+                id=tenant_id, tenant_id=tenant_id, username=f"user{tenant_id}",
+                email=f"user{tenant_id}@example.com", password="x", name="Usuario",
+            ))
+        await db.commit()
+    return engine, sessions
+
+
+def test_request_only_sees_its_tenant(tmp_path):
+    async def scenario():
+        engine, sessions = await _sessions(tmp_path)
+        try:
+            with tenant_scope(2, required=True):
+                async with sessions() as db:
+                    assert await db.get(User, 1) is None
+                    users = (await db.execute(select(User))).scalars().all()
+                    assert [user.id for user in users] == [2]
+        finally:
+            await engine.dispose()
+
+    run(scenario())
+
+
+def test_request_without_tenant_fails_closed(tmp_path):
+    async def scenario():
+        engine, sessions = await _sessions(tmp_path)
+        try:
+            with tenant_scope(None, required=True):
+                async with sessions() as db:
+                    with pytest.raises(TenantRequiredException):
+                        await db.execute(select(User))
+                    with pytest.raises(TenantRequiredException):
+                        db.add(User(username="anon", email="anon@example.com", password="x", name="Anónimo"))
+                        await db.flush()
+                    await db.rollback()
+                    # Excepción explícita para una sentencia, y bloque sin tenant (p. ej. login)
+                    everyone = await db.execute(select(User), execution_options={ALL_TENANTS: True})
+                    assert len(everyone.scalars().all()) == 2
+                    with tenant_scope(None):
+                        assert len((await db.execute(select(User))).scalars().all()) == 2
+        finally:
+            await engine.dispose()
+
+    run(scenario())